@@ -0,0 +1,126 @@
+"""
+Кэш ответов AI помощника.
+
+Точный уровень: ключ - SHA-256 от нормализованных (модель, история, вопрос),
+LRU-вытеснение и TTL. Необязательный уровень похожести: вопросы с той же
+историей сравниваются по косинусу векторов символьных триграмм, чтобы
+"что такое фотосинтез?" и "Что такое фотосинтез" давали один ответ.
+"""
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+
+AI_CACHE_SIZE = int(os.getenv("AI_CACHE_SIZE", "1000"))
+AI_CACHE_TTL = float(os.getenv("AI_CACHE_TTL", str(24 * 3600)))
+# Порог похожести 0..1 (0 - уровень похожести выключен)
+AI_CACHE_SIMILARITY = float(os.getenv("AI_CACHE_SIMILARITY", "0"))
+
+_PUNCT_RE = re.compile(r"[^\w\s]+", re.UNICODE)
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize(text):
+    """Нижний регистр, без пунктуации, схлопнутые пробелы"""
+    text = _PUNCT_RE.sub(" ", (text or "").lower().replace("ё", "е"))
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def _digest(value):
+    return hashlib.sha256(json.dumps(value, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _trigrams(text):
+    padded = f"  {text} "
+    vector = Counter(padded[i:i + 3] for i in range(len(padded) - 2))
+    norm = math.sqrt(sum(v * v for v in vector.values()))
+    return vector, norm
+
+
+def _cosine(a, b):
+    vec_a, norm_a = a
+    vec_b, norm_b = b
+    if not norm_a or not norm_b:
+        return 0.0
+    if len(vec_a) > len(vec_b):
+        vec_a, vec_b = vec_b, vec_a
+    dot = sum(count * vec_b.get(gram, 0) for gram, count in vec_a.items())
+    return dot / (norm_a * norm_b)
+
+
+class AIResponseCache:
+    """Потокобезопасный LRU-кэш ответов со счётчиками попаданий"""
+
+    def __init__(self, max_entries=AI_CACHE_SIZE, ttl=AI_CACHE_TTL, similarity=AI_CACHE_SIMILARITY):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._similarity = similarity
+        self._lock = threading.Lock()
+        # exact_key -> (context_key, question, vector, response, stored_at)
+        self._entries = OrderedDict()
+        self.stats = {"hits": 0, "similar_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @staticmethod
+    def _keys(model, history, message):
+        context = [(m.get("role") == "user", normalize(m.get("content", ""))) for m in history or []]
+        context_key = _digest([model, context])
+        question = normalize(message)
+        return context_key, question, _digest([context_key, question])
+
+    def _expired(self, stored_at):
+        return self._ttl > 0 and time.monotonic() - stored_at > self._ttl
+
+    def get(self, model, history, message):
+        context_key, question, exact_key = self._keys(model, history, message)
+        with self._lock:
+            entry = self._entries.get(exact_key)
+            if entry is not None and not self._expired(entry[4]):
+                self._entries.move_to_end(exact_key)
+                self.stats["hits"] += 1
+                return entry[3]
+            if entry is not None:
+                del self._entries[exact_key]
+
+            if self._similarity > 0:
+                vector = _trigrams(question)
+                best_key, best_score = None, self._similarity
+                for key, (ctx, _, other_vector, _, stored_at) in self._entries.items():
+                    if ctx != context_key or self._expired(stored_at):
+                        continue
+                    score = _cosine(vector, other_vector)
+                    if score >= best_score:
+                        best_key, best_score = key, score
+                if best_key is not None:
+                    self._entries.move_to_end(best_key)
+                    self.stats["similar_hits"] += 1
+                    return self._entries[best_key][3]
+
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, model, history, message, response):
+        if not response:
+            return
+        context_key, question, exact_key = self._keys(model, history, message)
+        vector = _trigrams(question) if self._similarity > 0 else None
+        with self._lock:
+            self._entries[exact_key] = (context_key, question, vector, response, time.monotonic())
+            self._entries.move_to_end(exact_key)
+            self.stats["stores"] += 1
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def snapshot(self):
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["similar_hits"] + self.stats["misses"]
+            hits = self.stats["hits"] + self.stats["similar_hits"]
+            return {
+                **self.stats,
+                "size": len(self._entries),
+                "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+            }
@@ -0,0 +1,136 @@
+"""
+Ограничение истории чата с AI по бюджету токенов.
+
+В запрос уходят только последние реплики, укладывающиеся в бюджет.
+Более старые реплики сворачиваются в краткое содержание, которое
+хранится на сервере по conversation_id и дополняется по мере роста
+диалога. Размер промпта остаётся почти постоянным.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from structured_log import get_logger
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("o200k_base")
+except Exception:
+    _encoding = None
+
+logger = get_logger("ai_history")
+
+# Бюджет токенов на историю (без системной инструкции и нового вопроса)
+AI_HISTORY_TOKEN_BUDGET = int(os.getenv("AI_HISTORY_TOKEN_BUDGET", "2000"))
+# При свёртке оставляем такую долю бюджета, чтобы не сворачивать на каждом запросе
+AI_HISTORY_KEEP_RATIO = float(os.getenv("AI_HISTORY_KEEP_RATIO", "0.5"))
+AI_SUMMARY_CACHE_SIZE = int(os.getenv("AI_SUMMARY_CACHE_SIZE", "500"))
+AI_SUMMARY_TTL = float(os.getenv("AI_SUMMARY_TTL", str(6 * 3600)))
+
+# Служебные токены на каждое сообщение (роль, разделители)
+_MESSAGE_OVERHEAD = 4
+
+
+def count_tokens(text):
+    """Число токенов: tiktoken, если установлен, иначе оценка по длине"""
+    if not text:
+        return 0
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    # Для русского текста в среднем ~3 символа на токен
+    return len(text) // 3 + 1
+
+
+def message_tokens(message):
+    return count_tokens(message.get("content", "")) + _MESSAGE_OVERHEAD
+
+
+def split_window(history, budget):
+    """
+    Делит историю на (старые, последние): последние - максимальный хвост,
+    укладывающийся в budget (минимум одна реплика).
+    """
+    used = 0
+    start = len(history)
+    for i in range(len(history) - 1, -1, -1):
+        cost = message_tokens(history[i])
+        if used + cost > budget and start < len(history):
+            break
+        used += cost
+        start = i
+    return history[:start], history[start:]
+
+
+class HistoryCompactor:
+    """
+    summarize(previous_summary, turns) -> str - сворачивает реплики
+    в новое краткое содержание (например, запросом к модели).
+    """
+
+    def __init__(self, summarize, budget=AI_HISTORY_TOKEN_BUDGET, keep_ratio=AI_HISTORY_KEEP_RATIO,
+                 max_conversations=AI_SUMMARY_CACHE_SIZE, ttl=AI_SUMMARY_TTL):
+        self._summarize = summarize
+        self._budget = budget
+        self._keep_budget = max(1, int(budget * keep_ratio))
+        self._max_conversations = max_conversations
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # conversation_id -> {"summary", "folded", "updated_at"}
+        self._summaries = OrderedDict()
+
+    def _get_state(self, conversation_id):
+        with self._lock:
+            state = self._summaries.get(conversation_id)
+            if state is None:
+                return None
+            if self._ttl > 0 and time.monotonic() - state["updated_at"] > self._ttl:
+                del self._summaries[conversation_id]
+                return None
+            self._summaries.move_to_end(conversation_id)
+            return state
+
+    def _set_state(self, conversation_id, summary, folded):
+        with self._lock:
+            self._summaries[conversation_id] = {
+                "summary": summary,
+                "folded": folded,
+                "updated_at": time.monotonic(),
+            }
+            self._summaries.move_to_end(conversation_id)
+            while len(self._summaries) > self._max_conversations:
+                self._summaries.popitem(last=False)
+
+    def compact(self, conversation_id, history):
+        """
+        Возвращает (summary | None, recent_history).
+        Без conversation_id или при ошибке свёртки старые реплики, не
+        влезающие в бюджет, отбрасываются (ошибка пишется в лог).
+        """
+        history = list(history or [])
+        state = self._get_state(conversation_id) if conversation_id else None
+        summary, folded = (state["summary"], state["folded"]) if state else (None, 0)
+        # Клиент начал диалог заново (история короче свёрнутой части)
+        if folded > len(history):
+            summary, folded = None, 0
+
+        unfolded = history[folded:]
+        if sum(message_tokens(m) for m in unfolded) <= self._budget:
+            return summary, unfolded
+
+        # Бюджет превышен: сворачиваем старое, оставляя хвост на keep_budget
+        older, recent = split_window(unfolded, self._keep_budget)
+        if not conversation_id:
+            # Свернуть некуда: отдаём столько последних реплик, сколько влезает в бюджет
+            return None, split_window(unfolded, self._budget)[1]
+        try:
+            summary = self._summarize(summary, older)
+        except Exception as e:
+            # Без новой свёртки реплики не теряем: прежнее содержание и
+            # несвёрнутый хвост, обрезанный уже по полному бюджету
+            dropped, recent = split_window(unfolded, self._budget)
+            logger.error("AI history summary failed: %s", e, extra={
+                "conversation_id": conversation_id, "dropped_turns": len(dropped)})
+            return summary, recent
+        self._set_state(conversation_id, summary, folded + len(older))
+        return summary, recent
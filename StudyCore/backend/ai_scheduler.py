@@ -0,0 +1,212 @@
+"""
+Планировщик запросов к OpenAI.
+
+Перед каждым вызовом запрос берёт токен из token bucket (лимит RPM нашего
+тарифа) и слот конкурентности. Если ни того ни другого нет, запрос ждёт
+в ограниченной очереди. Очередь обслуживает пользователей по кругу,
+а у каждого пользователя в ней не больше AI_QUEUE_PER_USER запросов,
+поэтому один студент не может занять ни слоты, ни саму очередь. Ошибки 429/5xx/таймаута
+повторяются с экспоненциальной задержкой и джиттером.
+"""
+import os
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+AI_RPM = float(os.getenv("AI_RPM", "60"))
+AI_BURST = int(os.getenv("AI_BURST", "10"))
+AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "8"))
+AI_QUEUE_SIZE = int(os.getenv("AI_QUEUE_SIZE", "100"))
+AI_QUEUE_PER_USER = int(os.getenv("AI_QUEUE_PER_USER", "5"))
+AI_QUEUE_TIMEOUT = float(os.getenv("AI_QUEUE_TIMEOUT", "20"))
+AI_MAX_RETRIES = int(os.getenv("AI_MAX_RETRIES", "3"))
+
+
+class SchedulerBusy(Exception):
+    """Очередь переполнена или ожидание превысило таймаут"""
+
+    status_code = 429
+
+
+def is_retryable(error):
+    status_code = getattr(error, "status_code", None)
+    if status_code in (408, 409, 429) or (status_code is not None and status_code >= 500):
+        return True
+    name = type(error).__name__
+    return name in ("APITimeoutError", "APIConnectionError", "RateLimitError", "InternalServerError")
+
+
+class _Waiter:
+    __slots__ = ("event", "granted")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.granted = False
+
+
+class AIScheduler:
+    def __init__(self, rpm=AI_RPM, burst=AI_BURST, max_concurrency=AI_MAX_CONCURRENCY,
+                 queue_size=AI_QUEUE_SIZE, queue_per_user=AI_QUEUE_PER_USER, queue_timeout=AI_QUEUE_TIMEOUT,
+                 max_retries=AI_MAX_RETRIES):
+        self._rate = rpm / 60.0
+        self._capacity = max(1, burst)
+        self._tokens = float(self._capacity)
+        self._refilled_at = time.monotonic()
+        self._max_concurrency = max(1, max_concurrency)
+        self._in_flight = 0
+        self._queue_size = queue_size
+        self._queue_per_user = queue_per_user
+        self._queue_timeout = queue_timeout
+        self._max_retries = max_retries
+        self._lock = threading.Lock()
+        # user_key -> deque[_Waiter]; порядок ключей - очередь обхода по кругу
+        self._waiting = OrderedDict()
+        self._depth = 0
+        self._timer = None
+        self.stats = {
+            "granted": 0, "rejected": 0, "timeouts": 0, "retries": 0,
+            "wait_total_ms": 0.0, "wait_max_ms": 0.0,
+        }
+
+    # --- Token bucket и выдача слотов (вызывается под self._lock) ---
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._refilled_at) * self._rate)
+        self._refilled_at = now
+
+    def _can_grant(self):
+        self._refill()
+        return self._in_flight < self._max_concurrency and self._tokens >= 1
+
+    def _take(self):
+        self._tokens -= 1
+        self._in_flight += 1
+
+    def _dispatch(self):
+        """Раздаёт свободные слоты ожидающим, по одному пользователю за раз"""
+        while self._waiting and self._can_grant():
+            user_key, waiters = next(iter(self._waiting.items()))
+            waiter = waiters.popleft()
+            # Пользователь уходит в конец круга (или из очереди, если больше не ждёт)
+            del self._waiting[user_key]
+            if waiters:
+                self._waiting[user_key] = waiters
+            self._depth -= 1
+            self._take()
+            waiter.granted = True
+            waiter.event.set()
+        if self._waiting and self._in_flight < self._max_concurrency:
+            # Ждём пополнения bucket: будим диспетчер, когда появится токен
+            self._schedule_refill_wakeup()
+
+    def _schedule_refill_wakeup(self):
+        if self._timer is not None or self._rate <= 0:
+            return
+        delay = max(0.01, (1 - self._tokens) / self._rate)
+
+        def wakeup():
+            with self._lock:
+                self._timer = None
+                self._dispatch()
+
+        self._timer = threading.Timer(delay, wakeup)
+        self._timer.daemon = True
+        self._timer.start()
+
+    # --- Публичный API ---
+    def acquire(self, user_key):
+        started = time.monotonic()
+        with self._lock:
+            if not self._waiting and self._can_grant():
+                self._take()
+                self._record_wait(started)
+                return
+            if self._depth >= self._queue_size:
+                self.stats["rejected"] += 1
+                raise SchedulerBusy("AI queue is full")
+            if len(self._waiting.get(user_key, ())) >= self._queue_per_user:
+                self.stats["rejected"] += 1
+                raise SchedulerBusy("too many queued AI requests for this user")
+            waiter = _Waiter()
+            self._waiting.setdefault(user_key, deque()).append(waiter)
+            self._depth += 1
+            self._dispatch()
+
+        if not waiter.event.wait(self._queue_timeout):
+            with self._lock:
+                if not waiter.granted:
+                    waiters = self._waiting.get(user_key)
+                    if waiters is not None and waiter in waiters:
+                        waiters.remove(waiter)
+                        if not waiters:
+                            del self._waiting[user_key]
+                        self._depth -= 1
+                    self.stats["timeouts"] += 1
+                    raise SchedulerBusy("AI queue wait timed out")
+        with self._lock:
+            self._record_wait(started)
+
+    def release(self):
+        with self._lock:
+            self._in_flight -= 1
+            self._dispatch()
+
+    def _record_wait(self, started):
+        waited = (time.monotonic() - started) * 1000
+        self.stats["granted"] += 1
+        self.stats["wait_total_ms"] += waited
+        self.stats["wait_max_ms"] = max(self.stats["wait_max_ms"], waited)
+
+    @contextmanager
+    def slot(self, user_key):
+        """Держит слот на всё время блока (например, пока идёт стрим)"""
+        self.acquire(user_key)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def retry(self, fn):
+        """Повторяет fn при временных ошибках с экспоненциальной задержкой и джиттером"""
+        for attempt in range(self._max_retries + 1):
+            try:
+                return fn()
+            except Exception as e:
+                if attempt >= self._max_retries or not is_retryable(e):
+                    raise
+                with self._lock:
+                    self.stats["retries"] += 1
+                time.sleep(random.uniform(0, min(8.0, 0.5 * (2 ** attempt))))
+
+    def run(self, user_key, fn):
+        """Выполняет fn в слоте планировщика; каждая повторная попытка заново берёт слот"""
+        for attempt in range(self._max_retries + 1):
+            with self.slot(user_key):
+                try:
+                    return fn()
+                except Exception as e:
+                    if attempt >= self._max_retries or not is_retryable(e):
+                        raise
+                    with self._lock:
+                        self.stats["retries"] += 1
+            # Спим вне слота, чтобы не держать его во время паузы
+            time.sleep(random.uniform(0, min(8.0, 0.5 * (2 ** attempt))))
+
+    def snapshot(self):
+        with self._lock:
+            self._refill()
+            granted = self.stats["granted"]
+            return {
+                "queue_depth": self._depth,
+                "waiting_users": len(self._waiting),
+                "in_flight": self._in_flight,
+                "tokens_available": round(self._tokens, 2),
+                "granted": granted,
+                "rejected": self.stats["rejected"],
+                "timeouts": self.stats["timeouts"],
+                "retries": self.stats["retries"],
+                "wait_avg_ms": round(self.stats["wait_total_ms"] / granted, 1) if granted else 0.0,
+                "wait_max_ms": round(self.stats["wait_max_ms"], 1),
+            }
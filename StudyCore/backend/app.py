@@ -1,16 +1,38 @@
 ﻿import os
-from datetime import datetime, timedelta, timezone
-from flask import Flask, jsonify, request, send_from_directory
+import json
+import logging
+import time
+from flask import Flask, Response, g, jsonify, request, send_from_directory, stream_with_context
 from flask_cors import CORS
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
 from dotenv import load_dotenv
 from werkzeug.utils import secure_filename
-import uuid
 from openai import OpenAI
+from credentials import CredentialIndex
+from attendance_writer import AttendanceWriter
+from attendance_rollup import AttendanceRollup
+from storage_upload import spool_to_disk, upload_spooled, UploadTooLarge, ContentIndex
+from image_pipeline import ImagePipeline, strip_metadata, variant_names
+from response_cache import CachedJSON, CachedJSONMap, serialize
+import homework_feed
+from homework_feed import FeedParamError
+from homework_search import HomeworkSearchIndex
+from ai_cache import AIResponseCache
+from ai_history import HistoryCompactor
+from ai_scheduler import AIScheduler
+import http_pool
+import metrics
+from structured_log import get_logger
+from static_assets import StaticManifest
+from repositories import DATA_BACKEND, open_repositories
+from user_import import (ImportFormatError, UserImporter, iter_json_records,
+                         USER_IMPORT_BATCH_SIZE, USER_IMPORT_PARALLEL)
 
 # Load environment variables
 load_dotenv()
 
+logger = get_logger("app")
+
 # Путь к frontend dist (build.sh копирует в корень проекта)
 FRONTEND_DIST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../dist")
 
@@ -21,27 +43,79 @@ ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp', 'pdf', 'doc', 'docx',
 # Создаём папку uploads если её нет
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
-app = Flask(__name__, static_folder=FRONTEND_DIST, static_url_path='')
+# static_folder отключён: dist/ раздаётся из манифеста (см. serve_frontend)
+app = Flask(__name__, static_folder=None)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # Максимум 16MB
+# Файл копируется на диск кусками, поэтому лимит можно держать выше (по умолчанию 50MB)
+MAX_UPLOAD_MB = int(os.getenv("MAX_UPLOAD_MB", "50"))
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_MB * 1024 * 1024
 # Configure CORS to allow requests from any origin in production
-CORS(app, resources={r"/api/*": {"origins": "*"}}, supports_credentials=True)
+CORS(app, resources={r"/api/*": {"origins": "*"}}, supports_credentials=True, expose_headers=["ETag"])
+
+# --- Метрики запросов (экспорт: GET /metrics) ---
+@app.before_request
+def _metrics_start():
+    # Имя view-функции: login, get_homework... (ограниченный набор меток)
+    route = request.endpoint or "unmatched"
+    g.metrics_route = route
+    metrics.current_route.set(route)
+    g.metrics_started = time.perf_counter()
+    metrics.IN_FLIGHT.inc(route)
+
+@app.after_request
+def _metrics_status(response):
+    route = g.get("metrics_route", "unmatched")
+    metrics.REQUESTS.inc(route, request.method, str(response.status_code))
+    # Ошибки считаются здесь; необработанное исключение тоже доходит сюда как 500
+    g.metrics_status = response.status_code
+    if response.status_code >= 500:
+        metrics.REQUEST_ERRORS.inc(route, request.method)
+    return response
+
+@app.teardown_request
+def _metrics_finish(error=None):
+    # Вызывается и при исключении; для SSE - после окончания стрима
+    if "metrics_started" not in g:
+        return
+    route = g.metrics_route
+    metrics.REQUEST_SECONDS.observe(time.perf_counter() - g.metrics_started, route, request.method)
+    metrics.IN_FLIGHT.dec(route)
+    if error is not None and "metrics_status" not in g:
+        # Ответ так и не был сформирован (например, упал after_request)
+        metrics.REQUEST_ERRORS.inc(route, request.method)
+    metrics.current_route.set("background")
+    g.pop("metrics_started")
 
 # Supabase setup
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
-if not SUPABASE_URL or not SUPABASE_KEY:
-    raise Exception("Supabase env variables not found")
+# Общий пул соединений (keep-alive, HTTP/2) для PostgREST и Storage
+supabase_http = http_pool.make_client("supabase", timeout=30.0)
+supabase: Client = None
 
-# Strip trailing slash if present
-SUPABASE_URL = SUPABASE_URL.rstrip("/")
+if SUPABASE_URL and SUPABASE_KEY:
+    # Strip trailing slash if present
+    SUPABASE_URL = SUPABASE_URL.rstrip("/")
 
-# Validate SUPABASE_URL format
-if not SUPABASE_URL.startswith("https://") or not SUPABASE_URL.endswith(".supabase.co"):
-    raise Exception("Invalid SUPABASE_URL format. Must be https://xxxx.supabase.co without trailing slash.")
+    # Validate SUPABASE_URL format (локальный Supabase и стенд бенчмарка - http://127.0.0.1:порт)
+    LOCAL_SUPABASE_PREFIXES = ("http://127.0.0.1:", "http://localhost:")
+    if not SUPABASE_URL.startswith(LOCAL_SUPABASE_PREFIXES) and (
+            not SUPABASE_URL.startswith("https://") or not SUPABASE_URL.endswith(".supabase.co")):
+        raise Exception("Invalid SUPABASE_URL format. Must be https://xxxx.supabase.co without trailing slash.")
+
+    supabase = create_client(SUPABASE_URL, SUPABASE_KEY, options=ClientOptions(httpx_client=supabase_http))
+elif DATA_BACKEND in ("sqlite", "json"):
+    # Полностью локальный режим: таблицы в SQLite/JSON, загрузка файлов недоступна
+    logger.warning("Supabase env variables not found, file uploads are disabled", extra={"data_backend": DATA_BACKEND})
+else:
+    raise Exception("Supabase env variables not found")
 
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+# Таблицы users/homework/attendance/profiles - через репозитории (DATA_BACKEND).
+# По умолчанию - прямые запросы к Supabase; DATA_BACKEND=replica - локальная
+# SQLite-копия заданий и профилей с фоновой синхронизацией (replica.py)
+repos = open_repositories(default="supabase", supabase=supabase)
+logger.info("data backend ready", extra={"backend": repos.kind})
 
 # OpenAI setup
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -64,60 +138,95 @@ if OPENAI_API_KEY and OPENAI_API_KEY != "your_openai_api_key_here":
 Помни: ты здесь чтобы помочь учиться, а не давать готовые ответы!"""
         
         ai_model = {
-            'client': OpenAI(api_key=OPENAI_API_KEY, timeout=30.0),
+            # Повторы делает ai_scheduler (с учётом очереди), поэтому у клиента их нет
+            'client': OpenAI(
+                api_key=OPENAI_API_KEY,
+                timeout=30.0,
+                max_retries=0,
+                http_client=http_pool.make_client("openai", timeout=30.0)
+            ),
             'model': OPENAI_MODEL,
             'system_instruction': SYSTEM_INSTRUCTION
         }
-        print("✅ OpenAI initialized successfully")
+        logger.info("OpenAI initialized", extra={"model": OPENAI_MODEL})
     except Exception as e:
-        print(f"❌ Error initializing OpenAI: {str(e)}")
+        logger.error("OpenAI initialization failed: %s", e)
         ai_model = None
 else:
     ai_model = None
-    print("⚠️  WARNING: OPENAI_API_KEY not configured. AI chat will be disabled.")
+    logger.warning("OPENAI_API_KEY not configured, AI chat is disabled")
 
 # --- Вспомогательные функции для файлов ---
 def allowed_file(filename):
     """Проверяет допустимость расширения файла"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+# Bucket для файлов домашних заданий (нужно создать в Supabase, если его нет)
+HOMEWORK_BUCKET = "homework-files"
+
+def _store_image_variant(object_name, data, content_type):
+    supabase.storage.from_(HOMEWORK_BUCKET).upload(
+        path=object_name,
+        file=data,
+        # Имя копии выводится из хеша оригинала - перезапись безопасна
+        file_options={"content-type": content_type, "upsert": "true"}
+    )
+    # Дубликат оригинала отдаёт только копии, про которые известно, что они есть
+    content_index.add(object_name)
+
+# Индекс уже загруженных объектов на диске (имя = SHA-256 содержимого)
+content_index = ContentIndex()
+
+# Пул обработки изображений: WebP-копия и миниатюра строятся в фоне
+image_pipeline = ImagePipeline(_store_image_variant)
+if not image_pipeline.available():
+    logger.warning("Pillow not installed, image variants will not be generated")
+
 # --- API для загрузки файлов ---
 @app.route("/api/upload", methods=["POST"])
 def upload_file():
     """
     Загружает файл в Supabase Storage и возвращает публичный URL
     """
+    if supabase is None:
+        return jsonify({"error": "Загрузка файлов недоступна: Supabase не настроен"}), 503
     try:
-        print("=" * 60)
-        print("FILE UPLOAD REQUEST")
-        print("=" * 60)
-        
         # Проверяем наличие файла в запросе
         if 'file' not in request.files:
-            print("ERROR: No file in request")
-            print("=" * 60)
+            logger.debug("upload rejected: no file in request")
             return jsonify({"error": "Файл не найден в запросе"}), 400
         
         file = request.files['file']
         
         # Проверяем что файл выбран
         if file.filename == '':
-            print("ERROR: Empty filename")
-            print("=" * 60)
+            logger.debug("upload rejected: empty filename")
             return jsonify({"error": "Файл не выбран"}), 400
         
         # Проверяем расширение
         if not allowed_file(file.filename):
-            print(f"ERROR: File type not allowed: {file.filename}")
-            print("=" * 60)
+            logger.debug("upload rejected: file type not allowed", extra={"upload_name": file.filename})
             return jsonify({"error": "Неподдерживаемый формат файла"}), 400
         
-        # Генерируем уникальное имя файла
         ext = file.filename.rsplit('.', 1)[1].lower()
-        unique_filename = f"{uuid.uuid4().hex}.{ext}"
         
-        # Читаем содержимое файла
-        file_content = file.read()
+        # Копируем файл на диск кусками (не читаем целиком в память)
+        try:
+            spooled = spool_to_disk(file.stream, max_size=app.config['MAX_CONTENT_LENGTH'])
+        except UploadTooLarge:
+            logger.info("upload rejected: file too large", extra={"limit_mb": MAX_UPLOAD_MB})
+            return jsonify({"error": f"Файл больше {MAX_UPLOAD_MB}MB"}), 413
+        
+        # EXIF (в том числе GPS) и прочие метаданные вырезаются до подсчёта
+        # имени: в Storage попадает только очищенный файл
+        try:
+            spooled = strip_metadata(spooled, ext)
+        except Exception:
+            spooled.cleanup()
+            raise
+        
+        # Имя файла по содержимому (SHA-256): одинаковые файлы хранятся один раз
+        unique_filename = spooled.object_name(ext)
         
         # Определяем MIME тип
         mime_types = {
@@ -133,62 +242,82 @@ def upload_file():
         }
         content_type = mime_types.get(ext, 'application/octet-stream')
         
-        print(f"Uploading to Supabase Storage: {unique_filename}")
-        print(f"File size: {len(file_content)} bytes")
-        print(f"Content type: {content_type}")
+        logger.debug("uploading to storage", extra={
+            "object": unique_filename, "size": spooled.size, "content_type": content_type
+        })
         
         # Загружаем файл в Supabase Storage
-        # Bucket: homework-files (нужно создать в Supabase, если его нет)
-        bucket_name = "homework-files"
+        bucket_name = HOMEWORK_BUCKET
         
+        # Spool-файл изображения передаётся пулу обработки и удаляется им
+        handed_off = False
         try:
-            # Пытаемся загрузить файл в bucket
-            upload_response = supabase.storage.from_(bucket_name).upload(
-                path=unique_filename,
-                file=file_content,
-                file_options={"content-type": content_type}
-            )
-            
-            print(f"Supabase upload response: {upload_response}")
+            duplicate = content_index.contains(unique_filename)
+            if duplicate:
+                # Такой файл уже загружен - повторно не отправляем
+                logger.debug("duplicate upload skipped", extra={"object": unique_filename})
+            else:
+                # Пытаемся загрузить файл в bucket (большие файлы - через resumable)
+                upload_response = upload_spooled(
+                    supabase, SUPABASE_URL, SUPABASE_KEY, bucket_name,
+                    unique_filename, spooled, content_type, client=supabase_http
+                )
+                content_index.add(unique_filename)
+                logger.debug("storage upload response: %s", upload_response)
             
             # Получаем публичный URL
             public_url = supabase.storage.from_(bucket_name).get_public_url(unique_filename)
             
-            print(f"SUCCESS: File uploaded to Supabase Storage")
-            print(f"Public URL: {public_url}")
-            print("=" * 60)
-            
-            return jsonify({
+            result = {
                 "url": public_url,
-                "filename": unique_filename
-            }), 200
+                "filename": unique_filename,
+                "duplicate": duplicate
+            }
+            
+            # Для изображений ставим в очередь WebP-копию и миниатюру.
+            # Дубликат отдаёт готовые копии, только если все они есть в
+            # Storage; иначе (обработка первой загрузки не удалась) копии
+            # строятся заново, как для нового файла
+            if image_pipeline.accepts(ext):
+                names = variant_names(unique_filename)
+                if not duplicate or not all(content_index.contains(name) for name in names.values()):
+                    image_pipeline.submit(unique_filename, spooled)
+                    handed_off = True
+                    result["processing"] = True
+                result["variants"] = {
+                    key: supabase.storage.from_(bucket_name).get_public_url(name)
+                    for key, name in names.items()
+                }
+            
+            logger.info("file uploaded", extra={
+                "object": unique_filename, "size": spooled.size, "duplicate": duplicate
+            })
+            
+            return jsonify(result), 200
             
         except Exception as storage_error:
             error_message = str(storage_error)
-            print(f"Supabase Storage Error: {error_message}")
+            logger.error("storage error: %s", error_message)
             
             # Проверяем специфичные ошибки
             if "not found" in error_message.lower() or "bucket" in error_message.lower():
-                print("=" * 60)
-                print("⚠️  HINT: Bucket 'homework-files' does not exist!")
-                print("⚠️  Create it in Supabase Dashboard:")
-                print("   1. Go to Storage in Supabase Dashboard")
-                print("   2. Create new bucket: 'homework-files'")
-                print("   3. Make it PUBLIC (Settings -> Public bucket: ON)")
-                print("=" * 60)
+                logger.error(
+                    "bucket '%s' does not exist: create it in Supabase Dashboard -> Storage and make it public",
+                    bucket_name
+                )
                 return jsonify({
                     "error": "Storage bucket not configured",
                     "hint": "Create 'homework-files' bucket in Supabase Storage and make it public"
                 }), 500
             
             # Другие ошибки
-            print("=" * 60)
             raise
+        finally:
+            if not handed_off:
+                spooled.cleanup()
         
     except Exception as e:
-        print(f"ERROR uploading file: {str(e)}")
-        print(f"ERROR TYPE: {type(e).__name__}")
-        print("=" * 60)
+        logger.exception("upload failed: %s", e)
         return jsonify({"error": f"Ошибка загрузки файла: {str(e)}"}), 500
 
 # --- Раздача загруженных файлов (для обратной совместимости, если нужно) ---
@@ -197,16 +326,30 @@ def uploaded_file(filename):
     """Отдаёт загруженные файлы из локальной папки (запасной вариант)"""
     return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
 
+def _fetch_attendance_page(start_date, after, limit):
+    return repos.attendance.page_since(start_date.isoformat(), limit, after)
+
+# Дневные счётчики посещаемости (GET /api/attendance не сканирует таблицу,
+# пересборка из таблицы идёт в фоновом потоке)
+attendance_rollup = AttendanceRollup(_fetch_attendance_page).start()
+
+# Посещаемость пишется в фоне пачками, а не на потоке запроса. Это её единственная
+# очередь: с повторами и spill-файлом, реплика передаёт вставки в Supabase напрямую
+attendance_writer = AttendanceWriter(repos.attendance.insert_many, on_flush=attendance_rollup.record).start()
+attendance_writer.install_signal_handlers()
+
 def log_attendance(user):
-    try:
-        supabase.table('attendance').insert({
-            "user_id": user.get("id"),
-            "login": user.get("login"),
-            "name": user.get("name"),
-            "role": user.get("role")
-        }).execute()
-    except Exception as e:
-        print(f"ATTENDANCE LOG ERROR: {str(e)}")
+    attendance_writer.submit({
+        "user_id": user.get("id"),
+        "login": user.get("login"),
+        "name": user.get("name"),
+        "role": user.get("role")
+    })
+
+# Индекс пользователей по паролю: загружается один раз, обновляется по TTL
+# и после каждой записи в users через репозиторий
+credential_index = CredentialIndex(repos.users.all, repos.users.find_by_password)
+repos.users.on_change(credential_index.invalidate)
 
 # --- API для логина по паролю ---
 @app.route("/api/login", methods=["POST"])
@@ -219,101 +362,62 @@ def login():
     # Получаем данные из запроса
     data = request.json
     if not data:
-        print("ERROR: No JSON data received")
+        logger.debug("login rejected: no JSON body")
         return jsonify({"error": "Некорректный запрос"}), 400
     
-    # Извлекаем пароль и убираем пробелы
+    # Извлекаем пароль и убираем пробелы (сам пароль в лог не пишется)
     password = data.get("password", "").strip()
     
-    # Детальное логирование
-    print("=" * 60)
-    print("LOGIN ATTEMPT")
-    print("=" * 60)
-    print(f"PASSWORD FROM CLIENT: '{password}'")
-    print(f"PASSWORD LENGTH: {len(password)}")
-    print(f"REQUEST METHOD: {request.method}")
-    print(f"REQUEST ORIGIN: {request.headers.get('Origin', 'No origin')}")
-    print(f"CONTENT-TYPE: {request.headers.get('Content-Type', 'Not set')}")
-    print("=" * 60)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("login attempt", extra={
+            "password_length": len(password),
+            "origin": request.headers.get("Origin"),
+            "content_type": request.headers.get("Content-Type")
+        })
     
     # Проверка что пароль предоставлен
     if not password:
-        print("ERROR: Password is empty")
+        logger.debug("login rejected: empty password")
         return jsonify({"error": "Пароль не указан"}), 400
     
     try:
-        # СНАЧАЛА получаем всех пользователей для отладки
-        print("STEP 1: Fetching ALL users from Supabase...")
-        all_users_response = supabase.table('users').select('*').execute()
-        print(f"Total users in database: {len(all_users_response.data) if all_users_response.data else 0}")
-        
-        if all_users_response.data:
-            print("Sample passwords in database:")
-            for user in all_users_response.data[:5]:
-                db_password = user.get('password', '')
-                print(f"  - User '{user.get('login')}' has password: '{db_password}' (length: {len(db_password)})")
-        else:
-            print("⚠️  WARNING: Supabase table 'users' is EMPTY!")
-            print("⚠️  You need to run POST /api/init-users to load data!")
-            print("=" * 60)
+        # Ищем пользователя в индексе учётных данных (без полного скана таблицы)
+        if credential_index.is_empty():
+            logger.warning("table 'users' is empty: run POST /api/init-users to load data")
             return jsonify({
                 "error": "Database is empty. Contact administrator.",
                 "hint": "Run POST /api/init-users to initialize data"
             }), 500
-        
-        # ТЕПЕРЬ ищем пользователя по паролю
-        print(f"\nSTEP 2: Searching user with password: '{password}' (length: {len(password)})")
-        response = supabase.table('users').select('*').eq('password', password).execute()
-        
-        # Логируем результат запроса
-        print(f"Supabase response data type: {type(response.data)}")
-        print(f"Supabase response data length: {len(response.data) if response.data else 0}")
-        
-        # Дополнительная отладка: проверяем точное совпадение
-        if not response.data:
-            print("\n⚠️  LOGIN FAILED: No user found with this password")
-            print("Comparing entered password with all passwords in database:")
-            for user in all_users_response.data:
-                db_pwd = user.get('password', '')
-                if db_pwd == password:
-                    print(f"  ✓ EXACT MATCH FOUND with user {user.get('login')}!")
-                elif db_pwd.strip() == password.strip():
-                    print(f"  ⚠️  Match after strip() with user {user.get('login')}")
-                    print(f"     DB password: '{db_pwd}' vs Input: '{password}'")
-            print("=" * 60)
+
+        with metrics.stage("credential_lookup"):
+            user = credential_index.lookup(password)
+
+        if not user:
+            logger.info("login failed: unknown password")
             return jsonify({"error": "Неверный пароль"}), 401
-        
-        # Получаем первого пользователя из массива
-        user = response.data[0]
-        print(f"USER FOUND: {user.get('login', 'unknown')} ({user.get('name', 'unknown')})")
-        print(f"USER ROLE: {user.get('role', 'unknown')}")
-        print(f"USER GENDER: {user.get('gender', 'unknown')}")
-        
+
         # Формируем ответ (НЕ возвращаем пароль!)
         response_data = {
             "id": user["id"],
             "login": user["login"],
             "name": user["name"],
             "role": user["role"],
-            "gender": user["gender"]
+            "gender": user.get("gender")
         }
         
-        print(f"LOGIN SUCCESSFUL for user: {user['name']}")
-        print("=" * 60)
-        log_attendance(user)
+        logger.info("login succeeded", extra={"user_id": user["id"], "role": user["role"]})
+        with metrics.stage("attendance_submit"):
+            log_attendance(user)
         return jsonify(response_data), 200
         
     except KeyError as e:
         # Ошибка структуры данных
-        print(f"ERROR: Missing field in user data: {str(e)}")
-        print("=" * 60)
+        logger.error("login failed: missing field in user data: %s", e)
         return jsonify({"error": "Ошибка данных пользователя"}), 500
         
     except Exception as e:
         # Любая другая ошибка
-        print(f"DATABASE ERROR: {str(e)}")
-        print(f"ERROR TYPE: {type(e).__name__}")
-        print("=" * 60)
+        logger.exception("login failed: %s", e)
         return jsonify({"error": "Ошибка сервера"}), 500
 
 # --- API для получения всех пользователей (с детальным логированием) ---
@@ -321,21 +425,17 @@ def login():
 def get_users():
     try:
         limit = request.args.get("limit", "").strip()
-        query = supabase.table('profiles').select('id, username, role, created_at').order('created_at', desc=True)
-        if limit.isdigit():
-            query = query.limit(int(limit))
-        response = query.execute()
-        return jsonify(response.data)
+        return jsonify(repos.users.list_profiles(int(limit) if limit.isdigit() else None))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/users/<user_id>", methods=["GET"])
 def get_user_by_id(user_id):
     try:
-        response = supabase.table('profiles').select('id, username, role, created_at').eq('id', user_id).execute()
-        if not response.data:
+        profile = repos.users.get_profile(user_id)
+        if not profile:
             return jsonify({"error": "User not found"}), 404
-        return jsonify(response.data[0]), 200
+        return jsonify(profile), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -347,10 +447,10 @@ def update_user_role(user_id):
         allowed_roles = {"Student", "Admin", "Creator"}
         if role not in allowed_roles:
             return jsonify({"error": "Invalid role"}), 400
-        response = supabase.table('profiles').update({"role": role}).eq('id', user_id).execute()
-        if not response.data:
+        profile = repos.users.update_role(user_id, role)
+        if not profile:
             return jsonify({"error": "User not found"}), 404
-        return jsonify(response.data[0]), 200
+        return jsonify(profile), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -361,26 +461,8 @@ def get_attendance():
         days = int(days_param) if days_param.isdigit() else 14
         days = max(1, min(days, 90))
 
-        start_date = (datetime.now(timezone.utc).date() - timedelta(days=days - 1))
-        response = supabase.table('attendance').select('created_at').gte('created_at', start_date.isoformat()).execute()
-
-        counts = {}
-        for item in (response.data or []):
-            created_at = item.get("created_at")
-            if not created_at:
-                continue
-            try:
-                dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                day_key = dt.date().isoformat()
-                counts[day_key] = counts.get(day_key, 0) + 1
-            except Exception:
-                continue
-
-        result = []
-        for i in range(days):
-            day = (start_date + timedelta(days=i)).isoformat()
-            result.append({"date": day, "count": counts.get(day, 0)})
-
+        role = request.args.get("role", "").strip() or None
+        result = attendance_rollup.series(days, role=role)
         return jsonify(result), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -394,94 +476,183 @@ def log_attendance_api():
         role = data.get("role")
         if not user_id:
             return jsonify({"error": "user_id is required"}), 400
-        response = supabase.table('attendance').insert({
+        row = {
             "user_id": user_id,
             "login": data.get("login"),
             "name": username,
             "role": role
-        }).execute()
-        return jsonify(response.data[0] if response.data else {}), 200
+        }
+        attendance_writer.submit(row)
+        # Запись уходит в хранилище асинхронно - отвечаем 202 Accepted
+        return jsonify(row), 202
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
-# --- API для загрузки данных из users.json в Supabase (ТОЛЬКО ДЛЯ ИНИЦИАЛИЗАЦИИ!) ---
+@app.route("/api/attendance/rollup/rebuild", methods=["POST"])
+def rebuild_attendance_rollup():
+    """
+    Пересобирает дневные счётчики из таблицы attendance (backfill)
+    POST /api/attendance/rollup/rebuild
+    """
+    try:
+        rows = attendance_rollup.backfill()
+        logger.info("attendance rollup rebuilt", extra={"rows": rows})
+        return jsonify({"message": "Rollup rebuilt", "rows": rows}), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+# --- Импорт пользователей (users.json или тело запроса) ---
+def _int_arg(name, default):
+    value = request.args.get(name, "").strip()
+    return int(value) if value.isdigit() else default
+
 @app.route("/api/init-users", methods=["POST"])
 def init_users():
     """
-    Загружает пользователей из users.json в Supabase.
-    ВНИМАНИЕ: Используйте ТОЛЬКО один раз для инициализации!
+    Импортирует пользователей: upsert по login пачками, повторный запуск безопасен.
+    POST /api/init-users?dry_run=1&batch_size=200&parallel=4
+    Тело: JSON-массив или NDJSON с пользователями; без тела - data/users.json.
+    dry_run=1 ничего не пишет и возвращает diff.
     """
+    importer = UserImporter(
+        repos.users,
+        batch_size=_int_arg("batch_size", USER_IMPORT_BATCH_SIZE),
+        parallel=_int_arg("parallel", USER_IMPORT_PARALLEL),
+        dry_run=request.args.get("dry_run", "").strip().lower() in ("1", "true", "yes"),
+    )
     try:
-        import json
-        users_file_path = os.path.join(os.path.dirname(__file__), "data", "users.json")
-        
-        # Проверяем, существует ли файл
-        if not os.path.exists(users_file_path):
-            return jsonify({"error": "users.json not found"}), 404
-        
-        # Читаем файл
-        with open(users_file_path, 'r', encoding='utf-8') as f:
-            users = json.load(f)
-        
-        print("=" * 60)
-        print(f"INITIALIZING SUPABASE WITH {len(users)} USERS")
-        print("=" * 60)
-        
-        # Сначала проверяем, есть ли уже пользователи
-        existing = supabase.table('users').select('id').execute()
-        if existing.data and len(existing.data) > 0:
-            print(f"WARNING: Table already contains {len(existing.data)} users")
-            return jsonify({
-                "error": "Table already contains users. Clear it first if you want to reinitialize.",
-                "existing_count": len(existing.data)
-            }), 400
-        
-        # Вставляем всех пользователей
-        response = supabase.table('users').insert(users).execute()
-        
-        print(f"SUCCESS: Inserted {len(response.data)} users")
-        print("=" * 60)
-        
-        return jsonify({
-            "message": "Users initialized successfully",
-            "count": len(response.data)
-        }), 200
-        
+        if request.content_length:
+            # Тело читается потоково, целиком в память не загружается
+            report = importer.run(iter_json_records(request.stream))
+        else:
+            users_file_path = os.path.join(os.path.dirname(__file__), "data", "users.json")
+            if not os.path.exists(users_file_path):
+                return jsonify({"error": "users.json not found"}), 404
+            with open(users_file_path, "rb") as f:
+                report = importer.run(iter_json_records(f))
+    except ImportFormatError as e:
+        return jsonify({"error": str(e), "report": importer.report}), 400
     except Exception as e:
-        print(f"ERROR initializing users: {str(e)}")
-        print("=" * 60)
-        return jsonify({"error": str(e)}), 500
+        logger.exception("users import failed: %s", e)
+        return jsonify({"error": str(e), "report": importer.report}), 500
+
+    # "created" - стандартный атрибут LogRecord, поэтому поля отчёта идут с префиксом
+    logger.info("users imported", extra={f"import_{k}": report[k] for k in (
+        "dry_run", "received", "created", "updated", "unchanged", "failed")})
+    return jsonify(report), 200
 
 # --- API для домашнего задания ---
+def _load_homework():
+    rows = repos.homework.all()
+    logger.debug("homework loaded", extra={"rows": len(rows)})
+    return rows
+
+def _load_homework_page(key):
+    fields, mode, limit, cursor = key
+    after = homework_feed.cursor_row(cursor) if cursor else None
+    rows = repos.homework.page(fields, limit + 1, after)
+    if mode == "list":
+        rows = homework_feed.preview(rows)
+    return homework_feed.build_page(rows, limit)
+
+# Список заданий кэшируется до изменения (или до HOMEWORK_CACHE_TTL)
+homework_cache = CachedJSON(_load_homework)
+# Первые страницы ленты тоже кэшируются (по набору параметров)
+homework_first_pages = CachedJSONMap(_load_homework_page)
+repos.homework.on_change(homework_cache.invalidate)
+repos.homework.on_change(homework_first_pages.invalidate)
+
+# Поисковый индекс: обновляется при добавлении/удалении, пересобирается по TTL
+homework_search = HomeworkSearchIndex(repos.homework.all)
+if hasattr(repos.backend, "on_change"):
+    # Реплика сообщает об изменениях из Supabase и об отправленных из очереди заданиях
+    repos.backend.on_change(lambda table: homework_search.invalidate() if table == "homework" else None)
+
+def _homework_page(args):
+    """
+    Страница ленты: ?limit=20&cursor=...&fields=title,created_at&mode=list
+    Тело ответа: {"items": [...], "next_cursor": "..." | null}
+    Возвращает (body, etag).
+    """
+    fields = tuple(homework_feed.parse_fields(args.get("fields", "").strip()))
+    limit = homework_feed.parse_limit(args.get("limit", "").strip())
+    mode = args.get("mode", "").strip() or "full"
+    cursor = args.get("cursor", "").strip() or None
+    if cursor:
+        homework_feed.decode_cursor(cursor)
+        return serialize(_load_homework_page((fields, mode, limit, cursor)))
+    _, body, etag = homework_first_pages.get((fields, mode, limit, None))
+    return body, etag
+
 @app.route("/api/homework", methods=["GET"])
 def get_homework():
     try:
-        print("=" * 60)
-        print("FETCHING HOMEWORK FROM SUPABASE")
-        print("=" * 60)
-        response = supabase.table('homework').select('*').execute()
-        print(f"Homework count: {len(response.data) if response.data else 0}")
-        print("=" * 60)
-        return jsonify(response.data)
+        # С параметрами пагинации - постраничная лента, без них - полный список
+        if any(name in request.args for name in ("limit", "cursor", "fields", "mode")):
+            body, etag = _homework_page(request.args)
+        else:
+            _, body, etag = homework_cache.get()
+        response = app.response_class(body, mimetype="application/json")
+        response.set_etag(etag)
+        # Браузер всегда переспрашивает, но при совпадении ETag получает пустой 304
+        response.headers["Cache-Control"] = "no-cache"
+        return response.make_conditional(request)
+    except FeedParamError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.exception("homework fetch failed: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+@app.route("/api/homework/search", methods=["GET"])
+def search_homework():
+    """
+    Поиск по заголовкам и описаниям заданий
+    GET /api/homework/search?q=дроби&limit=20&offset=0&mode=list
+    Ответ: {"items": [...], "total": N, "query": "..."}
+    """
+    try:
+        query = request.args.get("q", "").strip()
+        if not query:
+            return jsonify({"error": "Parameter q is required"}), 400
+        limit = homework_feed.parse_limit(request.args.get("limit", "").strip())
+        offset_param = request.args.get("offset", "").strip()
+        offset = int(offset_param) if offset_param.isdigit() else 0
+        with metrics.stage("search_index"):
+            ids, total = homework_search.search(query, limit=limit, offset=offset)
+        # Строки - по id одним запросом, порядок - по релевантности
+        rows = {row["id"]: dict(row) for row in repos.homework.get_many(ids)} if ids else {}
+        items = [rows[i] for i in ids if i in rows]
+        if request.args.get("mode", "").strip() == "list":
+            items = homework_feed.preview(items)
+        return jsonify({"items": items, "total": total, "query": query}), 200
+    except FeedParamError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.exception("homework search failed: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+@app.route("/api/homework/search/rebuild", methods=["POST"])
+def rebuild_homework_search():
+    """
+    Пересобирает поисковый индекс из таблицы homework
+    POST /api/homework/search/rebuild
+    """
+    try:
+        documents = homework_search.rebuild()
+        logger.info("homework search index rebuilt", extra={"documents": documents})
+        return jsonify({"message": "Search index rebuilt", **homework_search.snapshot()}), 200
     except Exception as e:
-        print(f"ERROR fetching homework: {str(e)}")
-        print(f"ERROR TYPE: {type(e).__name__}")
-        print("=" * 60)
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/homework", methods=["POST"])
 def add_homework():
     try:
         data = request.json
-        print("=" * 60)
-        print("ADDING HOMEWORK TO SUPABASE")
-        print("=" * 60)
-        print(f"Raw data received: {data}")
+        logger.debug("add homework request: %s", data)
         
         # Валидация обязательных полей
         if not data.get('title') or not data.get('description'):
-            print("ERROR: Missing title or description")
-            print("=" * 60)
+            logger.debug("add homework rejected: missing title or description")
             return jsonify({"error": "Title and description are required"}), 400
         
         # Подготовка данных для вставки
@@ -495,25 +666,19 @@ def add_homework():
         image_url = data.get('image_url', '').strip()
         if image_url:
             homework_data['image_url'] = image_url
-            print(f"Image URL provided: {image_url}")
-        else:
-            print("No image URL (will be NULL in database)")
-        
-        print(f"Title: {homework_data['title']}")
-        print(f"Description: {homework_data['description']}")
-        print(f"Data to insert: {homework_data}")
         
         # Вставляем данные
-        response = supabase.table('homework').insert(homework_data).execute()
+        homework = repos.homework.add(homework_data)
+        homework_search.add(homework)
         
-        print(f"SUCCESS: Homework added with ID: {response.data[0].get('id') if response.data else 'unknown'}")
-        print("=" * 60)
-        return jsonify(response.data[0]), 201
+        logger.info("homework added", extra={
+            "homework_id": homework.get('id') if homework else None,
+            "has_image": bool(image_url)
+        })
+        return jsonify(homework), 201
         
     except Exception as e:
         error_str = str(e)
-        print(f"ERROR adding homework: {error_str}")
-        print(f"ERROR TYPE: {type(e).__name__}")
         
         # Проверяем специфичные ошибки и даём подробные подсказки
         error_message_lower = error_str.lower()
@@ -524,20 +689,14 @@ def add_homework():
         if "relation" in error_message_lower and "does not exist" in error_message_lower:
             hint = "Таблица 'homework' не существует в Supabase. Выполните SQL из файла ИСПРАВЛЕНИЕ_ДЗ.md"
             user_friendly_error = "Таблица homework не создана в базе данных"
-            print("⚠️  HINT: Table 'homework' DOES NOT EXIST in Supabase!")
-            print("⚠️  FIX: Open ИСПРАВЛЕНИЕ_ДЗ.md and run the SQL script")
             
         elif "column" in error_message_lower and "does not exist" in error_message_lower:
             hint = "В таблице homework отсутствует нужная колонка. Пересоздайте таблицу используя SQL из ИСПРАВЛЕНИЕ_ДЗ.md"
             user_friendly_error = "Структура таблицы homework неправильная"
-            print("⚠️  HINT: Table 'homework' has wrong structure (missing column)!")
-            print("⚠️  FIX: Run SQL from ИСПРАВЛЕНИЕ_ДЗ.md to recreate the table")
             
         elif "row-level security" in error_message_lower or "policy" in error_message_lower:
             hint = "Row Level Security блокирует добавление. Выполните: ALTER TABLE homework DISABLE ROW LEVEL SECURITY;"
             user_friendly_error = "Доступ к базе данных заблокирован (RLS)"
-            print("⚠️  HINT: Row Level Security (RLS) is blocking INSERT!")
-            print("⚠️  FIX: Disable RLS using SQL from ИСПРАВЛЕНИЕ_ДЗ.md")
             
         elif "duplicate" in error_message_lower or "unique" in error_message_lower:
             hint = "Такое задание уже существует"
@@ -545,10 +704,10 @@ def add_homework():
             
         else:
             hint = "Проверьте что таблица homework создана в Supabase. См. файл ИСПРАВЛЕНИЕ_ДЗ.md"
-            print("⚠️  HINT: Unknown error. Check that 'homework' table exists and has correct structure")
-            print("⚠️  See SUPABASE_HOMEWORK_FIX.md or ИСПРАВЛЕНИЕ_ДЗ.md for setup instructions")
         
-        print("=" * 60)
+        logger.error("homework insert failed: %s", error_str, extra={
+            "error_type": type(e).__name__, "hint": hint
+        })
         return jsonify({
             "error": user_friendly_error,
             "hint": hint,
@@ -556,83 +715,163 @@ def add_homework():
             "fix_file": "ИСПРАВЛЕНИЕ_ДЗ.md"
         }), 500
 
-@app.route("/api/homework/<int:hw_id>", methods=["DELETE"])
+# signed: задания, созданные без связи с Supabase, до отправки имеют отрицательный id
+@app.route("/api/homework/<int(signed=True):hw_id>", methods=["DELETE"])
 def delete_homework(hw_id):
     try:
-        print("=" * 60)
-        print(f"DELETING HOMEWORK ID: {hw_id}")
-        print("=" * 60)
-        supabase.table('homework').delete().eq('id', hw_id).execute()
-        print(f"SUCCESS: Homework {hw_id} deleted")
-        print("=" * 60)
+        repos.homework.delete(hw_id)
+        homework_search.remove(hw_id)
+        logger.info("homework deleted", extra={"homework_id": hw_id})
         return jsonify({"message": "Задание удалено"}), 200
     except Exception as e:
-        print(f"ERROR deleting homework: {str(e)}")
-        print("=" * 60)
+        logger.exception("homework delete failed: %s", e)
         return jsonify({"error": str(e)}), 500
 
 # --- API для AI чата ---
+def _to_openai_role(msg):
+    return "user" if msg.get("role") == "user" else "assistant"
+
+def _summarize_history(previous_summary, turns):
+    """Сворачивает старые реплики диалога в краткое содержание (для ai_history)"""
+    transcript = "\n".join(
+        f"{'Студент' if _to_openai_role(m) == 'user' else 'Помощник'}: {m.get('content', '')}"
+        for m in turns
+    )
+    prompt = "Кратко (до 150 слов) перескажи ход учебного диалога: темы, вопросы студента, ключевые объяснения."
+    if previous_summary:
+        prompt += f"\n\nПредыдущее краткое содержание:\n{previous_summary}"
+    response = ai_scheduler.run("__summary__", lambda: ai_model["client"].responses.create(
+        model=ai_model["model"],
+        input=[
+            {"role": "system", "content": prompt},
+            {"role": "user", "content": transcript}
+        ]
+    ))
+    return response.output_text
+
+# Все вызовы OpenAI проходят через планировщик: лимит RPM, очередь, справедливость
+ai_scheduler = AIScheduler()
+
+# История чата ограничивается бюджетом токенов, старое сворачивается в summary
+history_compactor = HistoryCompactor(_summarize_history)
+
+def _build_ai_messages(chat_history, user_message, conversation_id=None):
+    """Собирает input для OpenAI: системная инструкция + история + новое сообщение"""
+    messages = [
+        {"role": "system", "content": ai_model["system_instruction"]}
+    ]
+    summary, chat_history = history_compactor.compact(conversation_id, chat_history)
+    if summary:
+        messages.append({
+            "role": "system",
+            "content": f"Краткое содержание предыдущей части диалога:\n{summary}"
+        })
+    for msg in chat_history:
+        messages.append({
+            "role": _to_openai_role(msg),
+            "content": msg.get("content", "")
+        })
+    messages.append({"role": "user", "content": user_message})
+    return messages
+
+def _parse_ai_request():
+    """
+    Проверяет запрос к AI чату.
+    Возвращает ((history, message, conversation_id, user_key), None) или (None, (payload, status)) при ошибке.
+    """
+    # Проверяем что AI модель настроена
+    if not ai_model:
+        logger.debug("AI request rejected: OpenAI not configured")
+        return None, ({
+            "error": "AI чат не настроен",
+            "hint": "Администратор должен добавить OPENAI_API_KEY в .env файл. Получить ключ можно на https://platform.openai.com/api-keys"
+        }, 503)
+    
+    # Получаем данные из запроса
+    data = request.json
+    if not data:
+        logger.debug("AI request rejected: no JSON body")
+        return None, ({"error": "Некорректный запрос"}, 400)
+    
+    user_message = data.get("message", "").strip()
+    chat_history = data.get("history", [])
+    conversation_id = (data.get("conversation_id") or "").strip() or None
+    # Ключ справедливой очереди: пользователь, иначе IP
+    user_key = str(data.get("user_id") or request.remote_addr or "anonymous")
+    
+    logger.debug("AI request", extra={
+        "message_length": len(user_message), "history_length": len(chat_history)
+    })
+    
+    if not user_message:
+        logger.debug("AI request rejected: empty message")
+        return None, ({"error": "Сообщение не может быть пустым"}, 400)
+    
+    return (chat_history, user_message, conversation_id, user_key), None
+
+# Кэш ответов AI: одинаковые вопросы с одинаковой историей не идут в OpenAI
+ai_cache = AIResponseCache()
+
+def _ai_error_payload(e):
+    """Переводит исключение OpenAI в (payload, status) для клиента"""
+    error_str = str(e)
+    logger.error("AI chat failed: %s", error_str, extra={"error_type": type(e).__name__})
+    
+    # Проверяем специфичные ошибки
+    status_code = getattr(e, "status_code", None)
+    error_upper = error_str.upper()
+    if status_code == 429 or "RATE LIMIT" in error_upper or "QUOTA" in error_upper or "LIMIT" in error_upper:
+        return {
+            "error": "Превышен лимит запросов",
+            "hint": "Подождите немного и попробуйте снова"
+        }, 429
+    if status_code == 408 or "TIMEOUT" in error_upper:
+        return {
+            "error": "Истекло время ожидания ответа",
+            "hint": "Повторите запрос чуть позже"
+        }, 504
+    if "API_KEY" in error_upper or "INVALID" in error_upper:
+        return {
+            "error": "Неверный API ключ",
+            "hint": "Проверьте OPENAI_API_KEY в .env файле"
+        }, 500
+    return {
+        "error": "Ошибка AI сервиса",
+        "details": error_str
+    }, 500
+
 @app.route("/api/ai/chat", methods=["POST"])
 def ai_chat():
     """
     Endpoint для общения с AI помощником
     POST /api/ai/chat
-    Body: { "message": "Привет, помоги с математикой", "history": [] }
+    Body: { "message": "Привет, помоги с математикой", "history": [], "conversation_id": "..." }
     """
     try:
-        print("=" * 60)
-        print("AI CHAT REQUEST")
-        print("=" * 60)
-        
-        # Проверяем что AI модель настроена
-        if not ai_model:
-            print("ERROR: OpenAI not configured")
-            print("=" * 60)
+        parsed, error = _parse_ai_request()
+        if error:
+            payload, status = error
+            return jsonify(payload), status
+        chat_history, user_message, conversation_id, user_key = parsed
+        
+        cached = ai_cache.get(ai_model["model"], chat_history, user_message)
+        if cached is not None:
+            logger.debug("AI cache hit")
             return jsonify({
-                "error": "AI чат не настроен",
-                "hint": "Администратор должен добавить OPENAI_API_KEY в .env файл. Получить ключ можно на https://platform.openai.com/api-keys"
-            }), 503
-        
-        # Получаем данные из запроса
-        data = request.json
-        if not data:
-            print("ERROR: No JSON data received")
-            print("=" * 60)
-            return jsonify({"error": "Некорректный запрос"}), 400
-        
-        user_message = data.get("message", "").strip()
-        chat_history = data.get("history", [])
-        
-        print(f"USER MESSAGE: {user_message}")
-        print(f"HISTORY LENGTH: {len(chat_history)} messages")
-        
-        if not user_message:
-            print("ERROR: Message is empty")
-            print("=" * 60)
-            return jsonify({"error": "Сообщение не может быть пустым"}), 400
-        
-        # Создаем чат с системной инструкцией
-        messages = [
-            {"role": "system", "content": ai_model["system_instruction"]}
-        ]
-        for msg in chat_history:
-            role = "user" if msg.get("role") == "user" else "assistant"
-            messages.append({
-                "role": role,
-                "content": msg.get("content", "")
-            })
-        messages.append({"role": "user", "content": user_message})
+                "response": cached,
+                "success": True,
+                "cached": True
+            }), 200
         
-        # Отправляем запрос в OpenAI
-        print("Sending message to OpenAI...")
-        response = ai_model["client"].responses.create(
+        # Отправляем запрос в OpenAI (через очередь планировщика)
+        messages = _build_ai_messages(chat_history, user_message, conversation_id)
+        response = ai_scheduler.run(user_key, lambda: ai_model["client"].responses.create(
             model=ai_model["model"],
             input=messages
-        )
+        ))
         ai_response = response.output_text        
-        print(f"AI RESPONSE LENGTH: {len(ai_response)} characters")
-        print(f"AI RESPONSE PREVIEW: {ai_response[:100]}...")
-        print("=" * 60)
+        ai_cache.put(ai_model["model"], chat_history, user_message, ai_response)
+        logger.debug("AI response", extra={"response_length": len(ai_response)})
         
         return jsonify({
             "response": ai_response,
@@ -640,34 +879,63 @@ def ai_chat():
         }), 200
         
     except Exception as e:
-        error_str = str(e)
-        print(f"ERROR in AI chat: {error_str}")
-        print(f"ERROR TYPE: {type(e).__name__}")
-        print("=" * 60)
-        
-        # Проверяем специфичные ошибки
-        status_code = getattr(e, "status_code", None)
-        error_upper = error_str.upper()
-        if status_code == 429 or "RATE LIMIT" in error_upper or "QUOTA" in error_upper or "LIMIT" in error_upper:
-            return jsonify({
-                "error": "Превышен лимит запросов",
-                "hint": "Подождите немного и попробуйте снова"
-            }), 429
-        if status_code == 408 or "TIMEOUT" in error_upper:
-            return jsonify({
-                "error": "Истекло время ожидания ответа",
-                "hint": "Повторите запрос чуть позже"
-            }), 504
-        if "API_KEY" in error_upper or "INVALID" in error_upper:
-            return jsonify({
-                "error": "Неверный API ключ",
-                "hint": "Проверьте OPENAI_API_KEY в .env файле"
-            }), 500
-        else:
-            return jsonify({
-                "error": "Ошибка AI сервиса",
-                "details": error_str
-            }), 500
+        payload, status = _ai_error_payload(e)
+        return jsonify(payload), status
+
+def _sse(event, data):
+    """Форматирует одно событие Server-Sent Events"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.route("/api/ai/chat/stream", methods=["POST"])
+def ai_chat_stream():
+    """
+    Потоковый ответ AI помощника (Server-Sent Events)
+    POST /api/ai/chat/stream
+    Body: как у /api/ai/chat
+    События: delta {"text"}, done {"response"}, error {"error", "hint", "status"}
+    """
+    parsed, error = _parse_ai_request()
+    if error:
+        payload, status = error
+        return jsonify(payload), status
+    chat_history, user_message, conversation_id, user_key = parsed
+    
+    def generate():
+        cached = ai_cache.get(ai_model["model"], chat_history, user_message)
+        if cached is not None:
+            logger.debug("AI cache hit")
+            yield _sse("delta", {"text": cached})
+            yield _sse("done", {"response": cached, "success": True, "cached": True})
+            return
+        parts = []
+        try:
+            messages = _build_ai_messages(chat_history, user_message, conversation_id)
+            # Слот планировщика держим, пока идёт стрим
+            with ai_scheduler.slot(user_key):
+                stream = ai_scheduler.retry(lambda: ai_model["client"].responses.create(
+                    model=ai_model["model"],
+                    input=messages,
+                    stream=True
+                ))
+                for event in stream:
+                    if event.type == "response.output_text.delta":
+                        parts.append(event.delta)
+                        yield _sse("delta", {"text": event.delta})
+                    elif event.type == "error":
+                        raise Exception(getattr(event, "message", "stream error"))
+            ai_response = "".join(parts)
+            ai_cache.put(ai_model["model"], chat_history, user_message, ai_response)
+            logger.debug("AI stream finished", extra={"response_length": len(ai_response)})
+            yield _sse("done", {"response": ai_response, "success": True})
+        except Exception as e:
+            payload, status = _ai_error_payload(e)
+            yield _sse("error", {**payload, "status": status})
+    
+    response = Response(stream_with_context(generate()), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    # Отключаем буферизацию в nginx/прокси, иначе токены придут пачкой в конце
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
 
 @app.route("/api/ai/status", methods=["GET"])
 def ai_status():
@@ -679,7 +947,9 @@ def ai_status():
         return jsonify({
             "available": True,
             "model": ai_model.get("model", "openai"),
-            "message": "AI чат готов к работе ✨"
+            "message": "AI чат готов к работе ✨",
+            "cache": ai_cache.snapshot(),
+            "scheduler": ai_scheduler.snapshot()
         }), 200
     else:
         return jsonify({
@@ -688,23 +958,59 @@ def ai_status():
             "hint": "Получить ключ: https://platform.openai.com/api-keys"
         }), 503
 
+@app.route("/api/status/pools", methods=["GET"])
+def pool_status():
+    """
+    Состояние пулов HTTP-соединений (Supabase, OpenAI) и кэша репозиториев
+    GET /api/status/pools
+    """
+    return jsonify({**http_pool.snapshot(), "repositories": repos.snapshot()}), 200
+
+@metrics.registry.collector
+def _queue_metrics():
+    scheduler = ai_scheduler.snapshot()
+    ai_queue = metrics.Gauge("studycore_ai_queue_depth", "Requests waiting for an OpenAI slot")
+    ai_queue.set(scheduler["queue_depth"])
+    ai_in_flight = metrics.Gauge("studycore_ai_in_flight", "OpenAI calls holding a scheduler slot")
+    ai_in_flight.set(scheduler["in_flight"])
+    writer = attendance_writer.snapshot()
+    attendance = metrics.Gauge("studycore_attendance_pending", "Attendance rows waiting to be inserted")
+    attendance.set(writer["pending"])
+    spilled = metrics.Gauge("studycore_attendance_spilled", "Attendance rows saved to the spill file for a later retry")
+    spilled.set(writer["spilled"])
+    gauges = [ai_queue, ai_in_flight, attendance, spilled]
+    if hasattr(repos.backend, "pending"):
+        outbox = metrics.Gauge("studycore_replica_outbox_pending", "Writes queued for Supabase in the local replica")
+        outbox.set(repos.backend.pending())
+        gauges.append(outbox)
+    return gauges
+
+@app.route("/metrics", methods=["GET"])
+def metrics_endpoint():
+    """
+    Метрики в формате Prometheus
+    GET /metrics
+    """
+    return Response(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
 # --- Раздача фронтенда ---
+# Манифест dist/ строится один раз при старте (без stat на каждый запрос)
+frontend_manifest = StaticManifest(FRONTEND_DIST)
+if frontend_manifest.stale:
+    logger.warning("stale assets skipped (not in asset-manifest.json)", extra={"count": len(frontend_manifest.stale)})
+
 @app.route("/", defaults={"path": ""})
 @app.route("/<path:path>")
 def serve_frontend(path):
-    # если путь существует в dist, отдаем файл
-    file_path = os.path.join(FRONTEND_DIST, path)
-    if path != "" and os.path.exists(file_path) and os.path.isfile(file_path):
-        return send_from_directory(FRONTEND_DIST, path)
-    # иначе отдаём index.html (SPA)
-    index_path = os.path.join(FRONTEND_DIST, "index.html")
-    if os.path.exists(index_path):
-        return send_from_directory(FRONTEND_DIST, "index.html")
+    # файл из dist или index.html для маршрутов SPA
+    entry = frontend_manifest.lookup(path)
+    if entry is not None:
+        return frontend_manifest.response(entry, request)
     # если нет index.html, возвращаем ошибку
     return jsonify({"error": "Frontend not built yet"}), 500
 
 # --- Запуск ---
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))  # порт для Railway
-    print(f"Server started on port {port}")
+    logger.info("server started", extra={"port": port})
     app.run(host="0.0.0.0", port=port)
@@ -0,0 +1,92 @@
+"""
+ASGI-режим запуска бэкенда StudyCore.
+
+Те же Flask-маршруты работают под ASGI-сервером (uvicorn). Каждый запрос
+выполняется в пуле из ASGI_THREADS потоков (wsgi_bridge.WsgiBridge), а
+event loop только принимает соединения и передаёт данные, поэтому сотни
+одновременных запросов, ждущих Supabase или OpenAI, не блокируют друг друга.
+SSE-стрим (/api/ai/chat/stream) передаётся клиенту по мере генерации.
+
+STUDYCORE_APP выбирает приложение: supabase (app.py рядом, по умолчанию)
+или json (корневой app.py на JSON-файлах) - то же, что start_services.py
+запускает в режимах dev и wsgi.
+
+Запуск:
+    python asgi.py
+    uvicorn asgi:application --host 0.0.0.0 --port 5000
+"""
+import asyncio
+import importlib.util
+import os
+
+from structured_log import get_logger
+from wsgi_bridge import WsgiBridge
+
+# Сколько запросов могут одновременно выполняться в потоках
+ASGI_THREADS = int(os.getenv("ASGI_THREADS", "200"))
+STUDYCORE_APP = os.getenv("STUDYCORE_APP", "supabase").lower()
+ROOT_APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "app.py")
+
+
+def load_backend(name=STUDYCORE_APP):
+    """Модуль приложения: supabase - app.py рядом, json - корневой app.py"""
+    if name == "supabase":
+        import app
+        return app
+    if name == "json":
+        # Оба файла называются app.py, поэтому корневой грузится под своим именем
+        spec = importlib.util.spec_from_file_location("studycore_json_app", ROOT_APP_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    raise ValueError(f"Unknown STUDYCORE_APP: {name}")
+
+
+backend = load_backend()
+
+
+class StudyCoreASGI:
+    """WSGI-приложение Flask + пул потоков + обработка lifespan"""
+
+    def __init__(self, wsgi_app, threads=ASGI_THREADS):
+        self._bridge = WsgiBridge(wsgi_app, threads)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                # Дописываем очередь посещаемости и дожидаемся обработки изображений
+                # (у JSON-приложения фоновых очередей нет)
+                loop = asyncio.get_running_loop()
+                for hook in _shutdown_hooks(backend):
+                    await loop.run_in_executor(self._bridge.executor, hook)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        await self._bridge(scope, receive, send)
+
+
+def _shutdown_hooks(module):
+    hooks = []
+    if hasattr(module, "attendance_writer"):
+        hooks.append(module.attendance_writer.close)
+    if hasattr(module, "image_pipeline"):
+        hooks.append(module.image_pipeline.shutdown)
+    return hooks
+
+
+application = StudyCoreASGI(backend.app)
+
+if __name__ == "__main__":
+    import uvicorn
+
+    port = int(os.environ.get("PORT", 5000))
+    get_logger("asgi").info("ASGI server started", extra={"port": port, "threads": ASGI_THREADS,
+                                                          "app": STUDYCORE_APP})
+    uvicorn.run(application, host="0.0.0.0", port=port, lifespan="on")
@@ -0,0 +1,176 @@
+"""
+Дневные счётчики посещаемости для GET /api/attendance.
+
+Счётчики хранятся в памяти по дням (и по ролям). Они пополняются при
+каждой успешной записи посещаемости, а записи других процессов
+подтягиваются фоновой пересборкой из таблицы attendance: новые счётчики
+строятся в стороне и подменяют старые целиком. Запрос таблицу не читает,
+ответ на любое окно days строится за O(days), независимо от истории.
+"""
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+from structured_log import get_logger
+
+logger = get_logger("attendance_rollup")
+
+# Сколько дней истории держим в счётчиках (максимальное окно эндпоинта)
+ATTENDANCE_ROLLUP_DAYS = int(os.getenv("ATTENDANCE_ROLLUP_DAYS", "90"))
+# Как часто пересобирать счётчики из таблицы в фоне (секунды, 0 - один раз при старте)
+ATTENDANCE_ROLLUP_TTL = float(os.getenv("ATTENDANCE_ROLLUP_TTL", "600"))
+# Повтор неудачной пересборки (таблица недоступна) через столько секунд
+ATTENDANCE_ROLLUP_RETRY = float(os.getenv("ATTENDANCE_ROLLUP_RETRY", "60"))
+# Пересборка читает таблицу до «сейчас минус столько секунд»; более свежие
+# строки этого процесса берутся из record(). Должно быть больше задержки
+# AttendanceWriter между submit и вставкой
+ATTENDANCE_ROLLUP_SETTLE = float(os.getenv("ATTENDANCE_ROLLUP_SETTLE", "60"))
+
+
+def _today():
+    return datetime.now(timezone.utc).date()
+
+
+def _timestamp(created_at):
+    """created_at в одном формате с datetime.isoformat(), чтобы строки сравнивались как время"""
+    return created_at.replace("Z", "+00:00") if created_at else None
+
+
+def _day_key(created_at):
+    """Достаёт дату YYYY-MM-DD из ISO-строки Supabase без полного разбора"""
+    if not created_at:
+        return None
+    if len(created_at) >= 10 and created_at[4] == "-" and created_at[7] == "-":
+        # Supabase отдаёт timestamptz в UTC, дата - первые 10 символов
+        if created_at.endswith(("Z", "+00:00")) or len(created_at) == 10:
+            return created_at[:10]
+    try:
+        dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc)
+        return dt.date().isoformat()
+    except ValueError:
+        return None
+
+
+def _add(counts, day, role):
+    by_role = counts.setdefault(day, {})
+    by_role[role] = by_role.get(role, 0) + 1
+
+
+class AttendanceRollup:
+    """
+    Счётчики {день: {роль: количество}}.
+
+    fetch_page(start_date, after, limit) -> list[dict] - страница строк
+    attendance (поля id, created_at, role) с created_at >= start_date по
+    возрастанию (created_at, id); after - последняя строка прошлой страницы.
+    """
+
+    def __init__(self, fetch_page, days=ATTENDANCE_ROLLUP_DAYS, interval=ATTENDANCE_ROLLUP_TTL,
+                 page_size=1000, settle=ATTENDANCE_ROLLUP_SETTLE):
+        self._fetch_page = fetch_page
+        self._days = days
+        self._interval = interval
+        self._page_size = page_size
+        self._settle = settle
+        self._lock = threading.Lock()
+        # Пересборки (фоновая и POST /api/attendance/rollup/rebuild) не идут параллельно
+        self._rebuild_lock = threading.Lock()
+        self._counts = {}
+        # Свои записи (created_at, день, роль) новее границы последней пересборки
+        self._recent = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="attendance-rollup", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.backfill()
+            except Exception as e:
+                # Supabase недоступен: отдаём накопленные счётчики и повторяем позже
+                logger.warning("attendance rollup rebuild failed, serving cached counts: %s", e)
+                self._stop.wait(ATTENDANCE_ROLLUP_RETRY)
+                continue
+            if self._interval <= 0:
+                return
+            self._stop.wait(self._interval)
+
+    def backfill(self):
+        """
+        Пересобирает счётчики из таблицы attendance и подменяет их целиком.
+        Таблица читается до границы (сейчас - settle), свои записи новее неё
+        добавляются из record(): строка не теряется и не считается дважды.
+        """
+        with self._rebuild_lock:
+            boundary = (datetime.now(timezone.utc) - timedelta(seconds=self._settle)).isoformat()
+            start_date = _today() - timedelta(days=self._days - 1)
+            counts = {}
+            total = 0
+            after = None
+            done = False
+            while not done:
+                rows = self._fetch_page(start_date, after, self._page_size) or []
+                for row in rows:
+                    created_at = _timestamp(row.get("created_at"))
+                    if created_at is not None and created_at >= boundary:
+                        # Строки идут по возрастанию: дальше только более свежие
+                        done = True
+                        break
+                    day = _day_key(created_at)
+                    if day is not None:
+                        _add(counts, day, row.get("role") or "")
+                        total += 1
+                done = done or len(rows) < self._page_size
+                after = rows[-1] if rows else None
+            with self._lock:
+                self._recent = [entry for entry in self._recent if entry[0] >= boundary]
+                for _, day, role in self._recent:
+                    _add(counts, day, role)
+                self._counts = counts
+                self._prune()
+        return total
+
+    def record(self, rows):
+        """Учитывает только что записанные строки посещаемости"""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            for row in rows:
+                created_at = _timestamp(row.get("created_at")) or now
+                day = _day_key(created_at) or now[:10]
+                role = row.get("role") or ""
+                _add(self._counts, day, role)
+                self._recent.append((created_at, day, role))
+            self._prune()
+
+    def _prune(self):
+        cutoff = (_today() - timedelta(days=self._days - 1)).isoformat()
+        for day in [d for d in self._counts if d < cutoff]:
+            del self._counts[day]
+        if self._recent and self._recent[0][1] < cutoff:
+            self._recent = [entry for entry in self._recent if entry[1] >= cutoff]
+
+    def series(self, days, role=None):
+        """
+        Возвращает [{"date", "count"}] за последние days дней.
+        Таблицу не читает: до первой пересборки видны только записи этого процесса.
+        """
+        start_date = _today() - timedelta(days=days - 1)
+        result = []
+        with self._lock:
+            for i in range(days):
+                day = (start_date + timedelta(days=i)).isoformat()
+                by_role = self._counts.get(day, {})
+                count = by_role.get(role, 0) if role else sum(by_role.values())
+                result.append({"date": day, "count": count})
+        return result
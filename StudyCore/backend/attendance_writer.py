@@ -0,0 +1,219 @@
+"""
+Фоновая запись посещаемости в Supabase.
+
+Запросы кладут строки в ограниченную очередь и сразу отвечают клиенту.
+Отдельный поток отправляет их одним bulk insert каждые N строк или
+каждые T миллисекунд. Если Supabase недоступен, пачка после нескольких
+попыток сохраняется в локальный spill-файл и досылается позже.
+"""
+import atexit
+import json
+import os
+import queue
+import random
+import signal
+import threading
+import time
+from datetime import datetime, timezone
+
+from structured_log import get_logger
+
+logger = get_logger("attendance")
+
+ATTENDANCE_BATCH_SIZE = int(os.getenv("ATTENDANCE_BATCH_SIZE", "50"))
+ATTENDANCE_FLUSH_MS = int(os.getenv("ATTENDANCE_FLUSH_MS", "500"))
+ATTENDANCE_QUEUE_SIZE = int(os.getenv("ATTENDANCE_QUEUE_SIZE", "1000"))
+ATTENDANCE_MAX_RETRIES = int(os.getenv("ATTENDANCE_MAX_RETRIES", "3"))
+ATTENDANCE_REPLAY_INTERVAL = float(os.getenv("ATTENDANCE_REPLAY_INTERVAL", "30"))
+ATTENDANCE_SPILL_FILE = os.getenv(
+    "ATTENDANCE_SPILL_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "attendance_spill.jsonl")
+)
+
+
+class AttendanceWriter:
+    """
+    Очередь + поток-флашер для таблицы attendance.
+
+    insert_rows(rows) - вставляет список строк одним запросом
+    (исключение означает, что пачку нужно повторить).
+    on_flush(rows) - вызывается после успешной вставки пачки.
+    """
+
+    def __init__(self, insert_rows, batch_size=ATTENDANCE_BATCH_SIZE,
+                 flush_ms=ATTENDANCE_FLUSH_MS, queue_size=ATTENDANCE_QUEUE_SIZE,
+                 max_retries=ATTENDANCE_MAX_RETRIES, spill_file=ATTENDANCE_SPILL_FILE,
+                 on_flush=None):
+        self._insert_rows = insert_rows
+        self._on_flush = on_flush
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = max(1, flush_ms) / 1000.0
+        self._max_retries = max(0, max_retries)
+        self._spill_file = spill_file
+        self._queue = queue.Queue(maxsize=max(1, queue_size))
+        self._spill_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._next_replay = 0.0
+        # Счётчики меняют и потоки запросов, и флашер, а читает /metrics
+        self._stats_lock = threading.Lock()
+        self.stats = {"enqueued": 0, "inserted": 0, "batches": 0, "spilled": 0, "retries": 0}
+
+    # --- Публичный API ---
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="attendance-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+        return self
+
+    def submit(self, row, timeout=0.05):
+        """
+        Ставит строку в очередь. Если очередь заполнена, ждём не дольше timeout
+        (backpressure), после чего строка уходит сразу в spill-файл - не теряется.
+        """
+        # Фиксируем время события сразу: вставка в БД происходит позже
+        row.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+        try:
+            self._queue.put(row, timeout=timeout)
+            self._count(enqueued=1)
+            return True
+        except queue.Full:
+            self._spill([row])
+            return False
+
+    def close(self, timeout=10.0):
+        """Останавливает поток и дописывает всё, что осталось в очереди"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+        # Всё, что не успели отправить, сохраняем на диск
+        leftover = self._drain_queue(limit=None)
+        if leftover:
+            self._spill(leftover)
+
+    def install_signal_handlers(self):
+        """
+        Дописывает очередь при SIGTERM/SIGINT и передаёт сигнал дальше.
+        Работает только из главного потока (ограничение модуля signal).
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            previous = signal.getsignal(sig)
+
+            def handler(signum, frame, previous=previous):
+                self.close()
+                if callable(previous):
+                    previous(signum, frame)
+                elif previous == signal.SIG_DFL:
+                    raise SystemExit(128 + signum)
+
+            signal.signal(sig, handler)
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def snapshot(self):
+        with self._stats_lock:
+            return {**self.stats, "pending": self.pending()}
+
+    def _count(self, **deltas):
+        with self._stats_lock:
+            for key, amount in deltas.items():
+                self.stats[key] += amount
+
+    # --- Внутренняя логика ---
+    def _run(self):
+        while not self._stop.is_set():
+            batch = self._collect_batch()
+            if batch:
+                self._flush(batch)
+            elif time.monotonic() >= self._next_replay and os.path.exists(self._spill_file):
+                self._replay_spill()
+        # Финальный слив при остановке
+        while True:
+            batch = self._drain_queue(limit=self._batch_size)
+            if not batch:
+                break
+            self._flush(batch, retries=0)
+
+    def _collect_batch(self):
+        """Ждёт первую строку, затем добирает пачку до batch_size или до дедлайна"""
+        try:
+            first = self._queue.get(timeout=self._flush_interval)
+        except queue.Empty:
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self._flush_interval
+        while len(batch) < self._batch_size and not self._stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain_queue(self, limit):
+        rows = []
+        while limit is None or len(rows) < limit:
+            try:
+                rows.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return rows
+
+    def _flush(self, batch, retries=None):
+        retries = self._max_retries if retries is None else retries
+        for attempt in range(retries + 1):
+            try:
+                self._insert_rows(batch)
+                self._count(inserted=len(batch), batches=1)
+                if self._on_flush is not None:
+                    try:
+                        self._on_flush(batch)
+                    except Exception as e:
+                        logger.error("attendance flush hook failed: %s", e)
+                return True
+            except Exception as e:
+                logger.warning("attendance insert failed: %s", e, extra={"attempt": attempt + 1, "rows": len(batch)})
+                if attempt < retries:
+                    self._count(retries=1)
+                    # Экспоненциальная задержка с джиттером
+                    time.sleep(min(5.0, 0.2 * (2 ** attempt)) * (0.5 + random.random()))
+        self._spill(batch)
+        return False
+
+    def _spill(self, rows):
+        try:
+            with self._spill_lock:
+                os.makedirs(os.path.dirname(self._spill_file), exist_ok=True)
+                with open(self._spill_file, "a", encoding="utf-8") as f:
+                    for row in rows:
+                        f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            self._count(spilled=len(rows))
+        except Exception as e:
+            logger.error("attendance spill failed, rows lost: %s", e, extra={"rows": len(rows)})
+
+    def _replay_spill(self):
+        """Пытается дослать строки из spill-файла одной попыткой на пачку"""
+        with self._spill_lock:
+            replay_path = self._spill_file + ".replay"
+            try:
+                os.replace(self._spill_file, replay_path)
+            except FileNotFoundError:
+                return
+        with open(replay_path, "r", encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+        os.remove(replay_path)
+        for i in range(0, len(rows), self._batch_size):
+            if not self._flush(rows[i:i + self._batch_size], retries=0):
+                # Supabase всё ещё недоступен - остаток вернётся в spill-файл
+                self._spill(rows[i + self._batch_size:])
+                self._next_replay = time.monotonic() + ATTENDANCE_REPLAY_INTERVAL
+                break
@@ -0,0 +1,8 @@
+"""
+Бенчмарк бэкенда StudyCore на локальных заменителях Supabase и OpenAI.
+
+Не тесты: харнесс измеряет p50/p95/p99, пропускную способность и RSS
+в сценариях "30 студентов входят за минуту", "класс открывает ДЗ",
+"10 одновременных чатов с AI", "пакетная загрузка PDF".
+Запуск: cd StudyCore/backend && python -m bench --help
+"""
@@ -0,0 +1,171 @@
+"""
+Запуск бенчмарка: поднимает фейковые Supabase и OpenAI, запускает бэкенд
+отдельным процессом и прогоняет сценарии.
+
+    python -m bench                                  # все сценарии
+    python -m bench --scenario login_burst --window 10
+    python -m bench --server wsgi --workers 4 --supabase-latency-ms 40
+    python -m bench --json results.json
+
+Запускать из StudyCore/backend.
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from bench.fakes import Latency, SupabaseState, fake_openai, fake_supabase
+from bench.scenarios import SCENARIOS
+from bench.stats import Recorder, RSSSampler
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _server_command(mode, port, workers, threads):
+    if mode == "wsgi":
+        return [sys.executable, "-m", "gunicorn", "--bind", f"127.0.0.1:{port}", "--workers", str(workers),
+                "--worker-class", "gthread", "--threads", str(threads), "app:app"]
+    if mode == "asgi":
+        return [sys.executable, "-m", "uvicorn", "asgi:application", "--host", "127.0.0.1",
+                "--port", str(port), "--workers", str(workers), "--log-level", "warning"]
+    return [sys.executable, "app.py"]
+
+
+def start_backend(args, supabase_url, openai_url, spill_dir):
+    port = _free_port()
+    env = {
+        **os.environ,
+        "PORT": str(port),
+        "SUPABASE_URL": supabase_url,
+        "SUPABASE_KEY": "bench-service-key",
+        "OPENAI_API_KEY": "sk-bench",
+        "OPENAI_BASE_URL": f"{openai_url}/v1",
+        "LOG_LEVEL": args.log_level,
+        "ATTENDANCE_SPILL_FILE": os.path.join(spill_dir, "attendance_spill.jsonl"),
+        "DATA_BACKEND": args.data_backend,
+        "REPLICA_PATH": os.path.join(spill_dir, "replica.db"),
+        "UPLOAD_CONTENT_INDEX_PATH": os.path.join(spill_dir, "uploads.db"),
+    }
+    process = subprocess.Popen(
+        _server_command(args.server, port, args.workers, args.threads),
+        cwd=BACKEND_DIR, env=env,
+        stdout=None if args.verbose else subprocess.DEVNULL,
+        stderr=None if args.verbose else subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + args.startup_timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"backend exited with code {process.returncode} (run with --verbose)")
+        try:
+            if httpx.get(f"{base_url}/api/ai/status", timeout=1.0).status_code == 200:
+                return process, base_url
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("backend did not start in time")
+
+
+def run_scenario(name, base_url, pid, args):
+    recorder = Recorder()
+    sampler = RSSSampler(pid).start()
+    recorder.start()
+    SCENARIOS[name](base_url, recorder, args)
+    recorder.stop()
+    result = recorder.summary()
+    result["rss"] = sampler.stop()
+    return result
+
+
+def print_report(name, result):
+    rss = result["rss"]
+    rss_text = "n/a" if rss["peak_mb"] is None else f"{rss['start_mb']} -> peak {rss['peak_mb']} -> {rss['end_mb']} MB"
+    print(f"\n=== {name} ({result['duration_s']} s, RSS {rss_text}) ===")
+    print(f"{'operation':<26}{'reqs':>6}{'err':>5}{'rps':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for operation, stats in sorted(result["operations"].items()):
+        print(f"{operation:<26}{stats['requests']:>6}{stats['errors']:>5}{stats['throughput_rps']:>8}"
+              f"{stats['p50_ms']:>9}{stats['p95_ms']:>9}{stats['p99_ms']:>9}{stats['max_ms']:>9}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench", description="StudyCore backend benchmark")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--server", choices=("dev", "wsgi", "asgi"), default="dev")
+    parser.add_argument("--data-backend", choices=("supabase", "replica"), default="supabase",
+                        help="local SQLite replica or direct Supabase queries")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--supabase-latency-ms", type=float, default=20.0)
+    parser.add_argument("--supabase-jitter-ms", type=float, default=10.0)
+    parser.add_argument("--openai-latency-ms", type=float, default=300.0)
+    parser.add_argument("--openai-token-ms", type=float, default=5.0)
+    parser.add_argument("--openai-tokens", type=int, default=60)
+    parser.add_argument("--users", type=int, default=30, help="students in login_burst/class_homework")
+    parser.add_argument("--window", type=float, default=60.0, help="login_burst arrival window, seconds")
+    parser.add_argument("--chats", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--ai-stream", dest="ai_stream", action="store_true", default=None,
+                        help="stream every chat (default: half plain, half streaming)")
+    parser.add_argument("--ai-plain", dest="ai_stream", action="store_false")
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--file-mb", type=float, default=2.0)
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--startup-timeout", type=float, default=30.0)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--verbose", action="store_true", help="show backend output")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    state = SupabaseState()
+    state.seed(students=max(args.users, 30))
+    supabase = fake_supabase(state, Latency(args.supabase_latency_ms, args.supabase_jitter_ms)).start()
+    openai = fake_openai(Latency(args.openai_latency_ms), args.openai_token_ms, args.openai_tokens).start()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as spill_dir:
+        process, base_url = start_backend(args, supabase.url, openai.url, spill_dir)
+        try:
+            print(f"Backend ({args.server}) at {base_url}, Supabase stub {supabase.url}, OpenAI stub {openai.url}")
+            for name in args.scenario or list(SCENARIOS):
+                requests_before = state.requests
+                results[name] = run_scenario(name, base_url, process.pid, args)
+                results[name]["upstream_calls"] = {
+                    "supabase": state.requests - requests_before,
+                }
+                print_report(name, results[name])
+            results["_config"] = {k: v for k, v in vars(args).items() if k not in ("json", "verbose")}
+            results["_config"]["openai_calls"] = len(openai.calls)
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+            supabase.stop()
+            openai.stop()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
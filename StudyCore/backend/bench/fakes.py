@@ -0,0 +1,370 @@
+"""
+Локальные заменители Supabase (PostgREST + Storage) и OpenAI для бенчмарка.
+
+Оба сервера - ThreadingHTTPServer в фоновых потоках, данные в памяти.
+Задержка каждого ответа задаётся в миллисекундах (базовая + случайный
+разброс), у OpenAI отдельно - пауза между токенами стрима.
+
+PostgREST поддерживается в объёме, который использует app.py:
+select (список колонок), eq/neq/gt/gte/lt/lte/in, order, limit, offset,
+заголовок Range, insert (в том числе upsert), update и delete.
+Фильтр or=(...) (курсор ленты) не разбирается и пропускается.
+"""
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+_RESERVED_PARAMS = {"select", "order", "limit", "offset", "or", "on_conflict", "columns"}
+
+
+class Latency:
+    def __init__(self, base_ms=0.0, jitter_ms=0.0):
+        self.base_ms = base_ms
+        self.jitter_ms = jitter_ms
+
+    def sleep(self):
+        delay = self.base_ms + random.uniform(0, self.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+
+def _coerce(value, sample):
+    """Приводит строковое значение фильтра к типу значения в строке таблицы"""
+    if isinstance(sample, bool):
+        return value == "true"
+    if isinstance(sample, int):
+        try:
+            return int(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _matches(row, column, expression):
+    op, _, raw = expression.partition(".")
+    current = row.get(column)
+    if op == "in":
+        values = [v.strip('"') for v in raw.strip("()").split(",")]
+        return str(current) in values
+    if op == "not":
+        return not _matches(row, column, raw)
+    if op == "is":
+        return current is None if raw == "null" else str(current).lower() == raw
+    if len(raw) > 1 and raw[0] == raw[-1] == '"':
+        # Значения в or=(...) приходят в кавычках
+        raw = raw[1:-1]
+    value = _coerce(raw, current)
+    if current is None:
+        return False
+    try:
+        return {
+            "eq": current == value, "neq": current != value,
+            "gt": current > value, "gte": current >= value,
+            "lt": current < value, "lte": current <= value,
+        }.get(op, True)
+    except TypeError:
+        return str(current) == str(value) if op == "eq" else True
+
+
+def _split_conditions(text):
+    """Делит условия PostgREST по запятым верхнего уровня (вне скобок и кавычек)"""
+    parts, current, depth, quoted = [], "", 0, False
+    for char in text:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char in "()":
+            depth += 1 if char == "(" else -1
+        elif not quoted and depth == 0 and char == ",":
+            parts.append(current)
+            current = ""
+            continue
+        current += char
+    return parts + [current] if current else parts
+
+
+def _condition(row, text):
+    """Условие из or=(...): column.op.value, and(...) или or(...)"""
+    for group, combine in (("and(", all), ("or(", any)):
+        if text.startswith(group):
+            return combine(_condition(row, part) for part in _split_conditions(text[len(group):-1]))
+    column, _, expression = text.partition(".")
+    return _matches(row, column, expression)
+
+
+def _row_matches(row, params):
+    for column, expression in params:
+        if column == "or":
+            if not _condition(row, "or" + expression):
+                return False
+        elif column not in _RESERVED_PARAMS and not _matches(row, column, expression):
+            return False
+    return True
+
+
+def _order(rows, spec):
+    # order=created_at.desc.nullslast,id.desc - сортируем с последнего ключа (стабильная сортировка)
+    for part in reversed([p for p in spec.split(",") if p]):
+        column, *modifiers = part.split(".")
+        reverse = "desc" in modifiers
+        # Как в Postgres: без модификатора NULL больше любого значения (первые при desc)
+        nulls_first = "nullsfirst" in modifiers or (reverse and "nullslast" not in modifiers)
+        nulls_high = nulls_first == reverse
+        rows.sort(key=lambda r: ((r.get(column) is None) == nulls_high, r.get(column)), reverse=reverse)
+    return rows
+
+
+class SupabaseState:
+    """Таблицы и объекты Storage фейкового Supabase"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tables = {}
+        self.next_id = {}
+        self.objects = {}
+        self.uploads = {}
+        self.requests = 0
+
+    def insert(self, table, row):
+        rows = self.tables.setdefault(table, [])
+        row = dict(row)
+        if "id" not in row:
+            self.next_id[table] = self.next_id.get(table, 0) + 1
+            row["id"] = self.next_id[table]
+        else:
+            self.next_id[table] = max(self.next_id.get(table, 0), row["id"] if isinstance(row["id"], int) else 0)
+        row.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+        rows.append(row)
+        return row
+
+    def seed(self, students=30, homework=50, attendance_days=30, attendance_per_day=25):
+        """Класс студентов (пароли student1..N), задания и посещаемость за месяц"""
+        with self.lock:
+            self.insert("users", {"login": "teacher", "password": "teacher", "name": "Учитель",
+                                  "role": "Teacher", "gender": "Female"})
+            for i in range(1, students + 1):
+                self.insert("users", {"login": f"student{i}", "password": f"student{i}",
+                                      "name": f"Студент {i}", "role": "Student",
+                                      "gender": "Male" if i % 2 else "Female"})
+                self.insert("profiles", {"id": str(uuid.uuid4()), "username": f"student{i}", "role": "Student"})
+            now = datetime.now(timezone.utc)
+            for i in range(homework):
+                self.insert("homework", {
+                    "title": f"Задание {i + 1}",
+                    "description": "Решить упражнения из учебника. " * 20,
+                    "image_url": None,
+                    "created_at": (now - timedelta(hours=i * 7)).isoformat(),
+                })
+            for day in range(attendance_days):
+                for j in range(attendance_per_day):
+                    self.insert("attendance", {
+                        "user_id": j + 1, "name": f"Студент {j + 1}", "role": "Student",
+                        "created_at": (now - timedelta(days=day, minutes=j)).isoformat(),
+                    })
+
+
+class _SupabaseHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state = None
+    latency = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _body(self):
+        return self._request_body
+
+    def _send(self, status, payload=None, headers=None):
+        body = b"" if payload is None else json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _dispatch(self):
+        # Тело читается всегда (и у GET/DELETE): иначе его остаток испортит
+        # следующий запрос в том же keep-alive соединении
+        length = int(self.headers.get("Content-Length") or 0)
+        self._request_body = self.rfile.read(length) if length else b""
+        self.latency.sleep()
+        with self.state.lock:
+            self.state.requests += 1
+        parts = urlsplit(self.path)
+        path = unquote(parts.path)
+        if path.startswith("/rest/v1/"):
+            return self._rest(path[len("/rest/v1/"):], parse_qsl(parts.query, keep_blank_values=True))
+        if path.startswith("/storage/v1/"):
+            return self._storage(path[len("/storage/v1/"):])
+        self._send(404, {"message": "not found"})
+
+    do_GET = do_POST = do_PATCH = do_DELETE = do_HEAD = do_PUT = lambda self: self._dispatch()
+
+    # --- PostgREST ---
+    def _rest(self, table, params):
+        state = self.state
+        if self.command == "POST":
+            payload = json.loads(self._body() or b"[]")
+            rows = payload if isinstance(payload, list) else [payload]
+            with state.lock:
+                created = [state.insert(table, row) for row in rows]
+            return self._send(201, created)
+
+        with state.lock:
+            rows = state.tables.setdefault(table, [])
+            selected = [r for r in rows if _row_matches(r, params)]
+            if self.command == "DELETE":
+                state.tables[table] = [r for r in rows if r not in selected]
+                return self._send(200, selected)
+            if self.command == "PATCH":
+                changes = json.loads(self._body() or b"{}")
+                for row in selected:
+                    row.update(changes)
+                return self._send(200, selected)
+            selected = [dict(r) for r in selected]
+
+        query = dict(params)
+        if "order" in query:
+            _order(selected, query["order"])
+        offset = int(query.get("offset", 0))
+        if self.headers.get("Range"):
+            start, _, end = self.headers["Range"].partition("-")
+            offset = int(start)
+            selected = selected[offset:int(end) + 1]
+        else:
+            selected = selected[offset:]
+        if "limit" in query:
+            selected = selected[:int(query["limit"])]
+        columns = query.get("select", "*")
+        if columns != "*":
+            names = [c.strip() for c in columns.split(",")]
+            selected = [{k: r.get(k) for k in names} for r in selected]
+        self._send(200, selected)
+
+    # --- Storage ---
+    def _storage(self, path):
+        state = self.state
+        if path.startswith("object/public/"):
+            exists = path[len("object/public/"):] in state.objects
+            return self._send(200 if exists else 404, None)
+        if path.startswith("object/") and self.command in ("POST", "PUT"):
+            key = path[len("object/"):]
+            size = len(self._body())
+            with state.lock:
+                state.objects[key] = size
+            return self._send(200, {"Key": key, "Id": str(uuid.uuid4())})
+        if path == "upload/resumable" and self.command == "POST":
+            upload_id = uuid.uuid4().hex
+            with state.lock:
+                state.uploads[upload_id] = {"offset": 0, "length": int(self.headers.get("Upload-Length", 0)),
+                                            "metadata": self.headers.get("Upload-Metadata", "")}
+            location = f"http://{self.headers.get('Host')}/storage/v1/upload/resumable/{upload_id}"
+            return self._send(201, None, {"Location": location, "Tus-Resumable": "1.0.0"})
+        if path.startswith("upload/resumable/"):
+            upload = state.uploads.get(path.rsplit("/", 1)[1])
+            if upload is None:
+                return self._send(404, {"message": "upload not found"})
+            if self.command == "PATCH":
+                upload["offset"] += len(self._body())
+            return self._send(204, None, {"Upload-Offset": str(upload["offset"]), "Tus-Resumable": "1.0.0"})
+        self._send(404, {"message": "not found"})
+
+
+class _OpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = None
+    token_ms = 0.0
+    tokens = 60
+    counter = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+        self.counter.append(1)
+        self.latency.sleep()
+        words = [f"слово{i}" for i in range(self.tokens)]
+        if request.get("stream"):
+            return self._stream(request, words)
+        text = " ".join(words)
+        body = json.dumps(self._response(request, text), ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _response(self, request, text):
+        return {
+            "id": f"resp_{uuid.uuid4().hex}", "object": "response", "created_at": int(time.time()),
+            "model": request.get("model", "gpt-4o-mini"), "status": "completed",
+            "parallel_tool_calls": True, "tool_choice": "auto", "tools": [],
+            "output": [{
+                "type": "message", "id": f"msg_{uuid.uuid4().hex}", "role": "assistant", "status": "completed",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }],
+        }
+
+    def _stream(self, request, words):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for i, word in enumerate(words):
+            event = {"type": "response.output_text.delta", "delta": word + " ", "item_id": "msg",
+                     "output_index": 0, "content_index": 0, "sequence_number": i}
+            self.wfile.write(f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            if self.token_ms > 0:
+                time.sleep(self.token_ms / 1000)
+        done = {"type": "response.completed", "sequence_number": len(words),
+                "response": self._response(request, " ".join(words))}
+        self.wfile.write(f"event: response.completed\ndata: {json.dumps(done, ensure_ascii=False)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+        self.close_connection = True
+
+
+class FakeServer:
+    """HTTP-сервер в фоновом потоке на свободном порту"""
+
+    def __init__(self, handler):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def fake_supabase(state, latency):
+    handler = type("SupabaseHandler", (_SupabaseHandler,), {"state": state, "latency": latency})
+    return FakeServer(handler)
+
+
+def fake_openai(latency, token_ms=0.0, tokens=60):
+    counter = []
+    handler = type("OpenAIHandler", (_OpenAIHandler,), {
+        "latency": latency, "token_ms": token_ms, "tokens": tokens, "counter": counter,
+    })
+    server = FakeServer(handler)
+    server.calls = counter
+    return server
@@ -0,0 +1,151 @@
+"""
+Сценарии нагрузки. Каждый сценарий - функция (base_url, recorder, options),
+которая шлёт запросы к запущенному бэкенду и пишет задержки в recorder.
+Виртуальный пользователь - отдельный поток со своим httpx.Client,
+как отдельный браузер.
+"""
+import json
+import os
+import random
+import threading
+import time
+import uuid
+
+import httpx
+
+
+def _timed(recorder, operation, fn):
+    started = time.perf_counter()
+    status = None
+    try:
+        response = fn()
+        status = response.status_code
+        return response
+    except httpx.HTTPError:
+        return None
+    finally:
+        recorder.record(operation, (time.perf_counter() - started) * 1000, status)
+
+
+def _run_users(count, target):
+    threads = [threading.Thread(target=target, args=(i,), daemon=True) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def login_burst(base_url, recorder, options):
+    """N студентов входят в течение окна (по умолчанию 30 за 60 с), затем открывают дашборд"""
+    users, window = options.users, options.window
+    started = time.monotonic()
+    arrivals = sorted(random.uniform(0, window) for _ in range(users))
+
+    def student(i):
+        delay = started + arrivals[i] - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        with httpx.Client(base_url=base_url, timeout=30.0) as client:
+            _timed(recorder, "login", lambda: client.post("/api/login", json={"password": f"student{i + 1}"}))
+            _timed(recorder, "get_attendance", lambda: client.get("/api/attendance", params={"days": 14}))
+
+    _run_users(users, student)
+
+
+def class_homework(base_url, recorder, options):
+    """Весь класс одновременно открывает домашние задания, потом обновляет страницу"""
+    barrier = threading.Barrier(options.users)
+
+    def student(i):
+        with httpx.Client(base_url=base_url, timeout=30.0) as client:
+            barrier.wait()
+            response = _timed(recorder, "get_homework", lambda: client.get("/api/homework"))
+            etag = response.headers.get("ETag") if response is not None else None
+            _timed(recorder, "get_homework_page", lambda: client.get(
+                "/api/homework", params={"limit": 20, "mode": "list"}))
+            if etag:
+                _timed(recorder, "get_homework_revalidate", lambda: client.get(
+                    "/api/homework", headers={"If-None-Match": etag}))
+
+    _run_users(options.users, student)
+
+
+def ai_chats(base_url, recorder, options):
+    """N одновременных диалогов с AI по несколько реплик (обычный и потоковый режим)"""
+
+    def chat(i):
+        conversation_id = uuid.uuid4().hex
+        history = []
+        stream = options.ai_stream or (options.ai_stream is None and i % 2 == 1)
+        with httpx.Client(base_url=base_url, timeout=120.0) as client:
+            for turn in range(options.turns):
+                # Уникальный текст, чтобы не попадать в кэш ответов
+                message = f"Объясни тему {turn + 1} ({conversation_id[:8]})"
+                payload = {"message": message, "history": history, "conversation_id": conversation_id,
+                           "user_id": f"bench-{i}"}
+                answer = _stream_turn(client, recorder, payload) if stream else _plain_turn(client, recorder, payload)
+                history += [{"role": "user", "content": message}, {"role": "assistant", "content": answer or ""}]
+
+    _run_users(options.chats, chat)
+
+
+def _plain_turn(client, recorder, payload):
+    response = _timed(recorder, "ai_chat", lambda: client.post("/api/ai/chat", json=payload))
+    if response is None or response.status_code != 200:
+        return None
+    return response.json().get("response")
+
+
+def _stream_turn(client, recorder, payload):
+    started = time.perf_counter()
+    first_token = None
+    status = None
+    answer = None
+    try:
+        with client.stream("POST", "/api/ai/chat/stream", json=payload) as response:
+            status = response.status_code
+            event = None
+            for line in response.iter_lines():
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                elif line.startswith("data: "):
+                    if event == "delta" and first_token is None:
+                        first_token = time.perf_counter()
+                        recorder.record("ai_stream_first_token", (first_token - started) * 1000, status)
+                    elif event == "done":
+                        answer = json.loads(line[len("data: "):]).get("response")
+                    elif event == "error":
+                        status = json.loads(line[len("data: "):]).get("status", 500)
+    except httpx.HTTPError:
+        status = None
+    recorder.record("ai_chat_stream", (time.perf_counter() - started) * 1000, status)
+    return answer
+
+
+def pdf_uploads(base_url, recorder, options):
+    """Пакетная загрузка PDF: files файлов по file_mb МБ, concurrency одновременно"""
+    size = int(options.file_mb * 1024 * 1024)
+    lock = threading.Lock()
+    remaining = list(range(options.files))
+
+    def uploader(_):
+        with httpx.Client(base_url=base_url, timeout=300.0) as client:
+            while True:
+                with lock:
+                    if not remaining:
+                        return
+                    remaining.pop()
+                # Случайное содержимое: каждый файл новый, без дедупликации
+                content = b"%PDF-1.4\n" + os.urandom(max(0, size - 9))
+                _timed(recorder, "upload_file", lambda: client.post(
+                    "/api/upload", files={"file": ("lesson.pdf", content, "application/pdf")}))
+
+    _run_users(options.concurrency, uploader)
+
+
+SCENARIOS = {
+    "login_burst": login_burst,
+    "class_homework": class_homework,
+    "ai_chats": ai_chats,
+    "pdf_uploads": pdf_uploads,
+}
@@ -0,0 +1,133 @@
+"""
+Сбор результатов бенчмарка: задержки по операциям, пропускная
+способность, ошибки и память (RSS) процесса бэкенда.
+"""
+import os
+import threading
+import time
+
+
+def percentile(sorted_values, q):
+    """Перцентиль с линейной интерполяцией (q от 0 до 100)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class Recorder:
+    """Задержки (мс) и ошибки по имени операции, потокобезопасно"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies = {}
+        self._errors = {}
+        self._statuses = {}
+        self.started = None
+        self.finished = None
+
+    def start(self):
+        self.started = time.perf_counter()
+
+    def stop(self):
+        self.finished = time.perf_counter()
+
+    def record(self, operation, elapsed_ms, status):
+        ok = status is not None and status < 400
+        with self._lock:
+            self._latencies.setdefault(operation, []).append(elapsed_ms)
+            statuses = self._statuses.setdefault(operation, {})
+            statuses[status] = statuses.get(status, 0) + 1
+            if not ok:
+                self._errors[operation] = self._errors.get(operation, 0) + 1
+
+    def summary(self):
+        duration = (self.finished or time.perf_counter()) - (self.started or time.perf_counter())
+        result = {}
+        with self._lock:
+            for operation, values in self._latencies.items():
+                ordered = sorted(values)
+                result[operation] = {
+                    "requests": len(ordered),
+                    "errors": self._errors.get(operation, 0),
+                    "statuses": {str(k): v for k, v in self._statuses[operation].items()},
+                    "throughput_rps": round(len(ordered) / duration, 2) if duration > 0 else 0.0,
+                    "p50_ms": round(percentile(ordered, 50), 1),
+                    "p95_ms": round(percentile(ordered, 95), 1),
+                    "p99_ms": round(percentile(ordered, 99), 1),
+                    "max_ms": round(ordered[-1], 1),
+                }
+        return {"duration_s": round(duration, 2), "operations": result}
+
+
+def _children(pid):
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                # Поле 4 - PPID; имя процесса в скобках может содержать пробелы
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == pid:
+            children.append(int(entry))
+    return children
+
+
+def _rss_kb(pid):
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss_mb(pid):
+    """RSS процесса и всех его потомков (воркеры gunicorn), МБ; None вне Linux"""
+    if not os.path.isdir("/proc"):
+        return None
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        total += _rss_kb(current)
+        pending.extend(_children(current))
+    return round(total / 1024, 1)
+
+
+class RSSSampler:
+    """Фоновый опрос RSS бэкенда: стартовое, пиковое и конечное значение"""
+
+    def __init__(self, pid, interval=0.25):
+        self._pid = pid
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.start_mb = None
+        self.peak_mb = None
+        self.end_mb = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            value = process_tree_rss_mb(self._pid)
+            if value is not None:
+                self.peak_mb = max(self.peak_mb or 0, value)
+            self._stop.wait(self._interval)
+
+    def start(self):
+        self.start_mb = process_tree_rss_mb(self._pid)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.end_mb = process_tree_rss_mb(self._pid)
+        return {"start_mb": self.start_mb, "peak_mb": self.peak_mb, "end_mb": self.end_mb}
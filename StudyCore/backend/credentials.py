@@ -0,0 +1,113 @@
+"""
+Индекс учётных данных в памяти процесса для /api/login.
+
+Таблица users загружается один раз и хранится в словаре,
+ключ которого - SHA-256 от пароля. Индекс перечитывается по TTL
+или после инвалидации (репозиторий users вызывает её после каждой
+записи, в том числе после init_users). Неизвестные пароли недолго
+помнятся, чтобы перебор паролей не превращался в запросы к БД.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Время жизни индекса в секундах (0 - перечитывать только после invalidate)
+CREDENTIAL_INDEX_TTL = float(os.getenv("CREDENTIAL_INDEX_TTL", "300"))
+# Сколько секунд помнить пароль, которого нет в БД (0 - не помнить), и сколько таких паролей
+CREDENTIAL_MISS_TTL = float(os.getenv("CREDENTIAL_MISS_TTL", "30"))
+CREDENTIAL_MISS_MAX = int(os.getenv("CREDENTIAL_MISS_MAX", "10000"))
+
+
+def password_key(password):
+    """Возвращает ключ индекса для пароля (пароли в открытом виде не храним как ключи)"""
+    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+
+class CredentialIndex:
+    """
+    Потокобезопасный индекс пользователей по хешу пароля.
+
+    loader() -> list[dict]      - загружает всех пользователей (один запрос)
+    fetcher(password) -> dict   - точечный поиск при промахе (необязателен)
+    """
+
+    def __init__(self, loader, fetcher=None, ttl=CREDENTIAL_INDEX_TTL, miss_ttl=CREDENTIAL_MISS_TTL,
+                 miss_max=CREDENTIAL_MISS_MAX):
+        self._loader = loader
+        self._fetcher = fetcher
+        self._ttl = ttl
+        self._miss_ttl = miss_ttl
+        self._miss_max = miss_max
+        self._lock = threading.Lock()
+        self._by_password = {}
+        self._loaded_at = None
+        # Хеш неизвестного пароля -> момент, до которого БД не спрашиваем (LRU)
+        self._misses = OrderedDict()
+
+    def _is_stale(self):
+        if self._loaded_at is None:
+            return True
+        return self._ttl > 0 and time.monotonic() - self._loaded_at > self._ttl
+
+    def _reload(self):
+        users = self._loader() or []
+        index = {}
+        for user in users:
+            password = user.get("password")
+            if password:
+                index[password_key(password)] = user
+        self._by_password = index
+        self._misses.clear()
+        self._loaded_at = time.monotonic()
+
+    def ensure_loaded(self):
+        """Загружает индекс, если он ещё не загружен или устарел"""
+        if not self._is_stale():
+            return
+        with self._lock:
+            if self._is_stale():
+                self._reload()
+
+    def is_empty(self):
+        self.ensure_loaded()
+        return not self._by_password
+
+    def lookup(self, password):
+        """
+        Ищет пользователя по паролю.
+        Тёплый индекс - ноль запросов к БД, промах - не больше одного,
+        повторный промах в течение miss_ttl - ни одного.
+        """
+        self.ensure_loaded()
+        key = password_key(password)
+        user = self._by_password.get(key)
+        if user is not None or self._fetcher is None:
+            return user
+
+        with self._lock:
+            if self._misses.get(key, 0) > time.monotonic():
+                return None
+
+        # Пользователь мог быть добавлен в обход процесса - один точечный запрос
+        user = self._fetcher(password)
+        with self._lock:
+            if user:
+                self._by_password[key] = user
+                self._misses.pop(key, None)
+            elif self._miss_ttl > 0:
+                self._misses[key] = time.monotonic() + self._miss_ttl
+                self._misses.move_to_end(key)
+                while len(self._misses) > self._miss_max:
+                    self._misses.popitem(last=False)
+        return user
+
+    def invalidate(self):
+        """Помечает индекс устаревшим - следующий вход перечитает таблицу"""
+        with self._lock:
+            self._loaded_at = None
+            self._misses.clear()
+
+    def __len__(self):
+        return len(self._by_password)
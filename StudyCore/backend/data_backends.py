@@ -0,0 +1,401 @@
+"""
+Хранилища данных для репозиториев (repositories.py).
+
+У всех трёх бэкендов один и тот же небольшой набор операций над
+таблицами users, profiles, homework, attendance:
+
+    select(table, columns=None, eq=None, gte=None, order=(), limit=None, offset=0, after=None)
+    count(table, eq=None)
+    insert(table, rows) / upsert(table, rows, key) / update(table, values, eq) / delete(table, eq)
+
+eq - {колонка: значение или список значений (IN)}, gte - {колонка: значение},
+order - [(колонка, desc)], after - строка-курсор: вернуть строки, идущие
+строго после неё в порядке order (keyset-пагинация).
+
+SupabaseBackend  - таблицы в Supabase (PostgREST)
+SQLiteBackend    - локальный файл SQLite в режиме WAL
+JsonBackend      - JSON-файлы с журналом (json_store.JsonStore)
+"""
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from json_store import JsonStore
+
+# Колонки таблиц для локальных бэкендов (у Supabase схема своя)
+SCHEMAS = {
+    "users": {
+        "columns": {
+            "id": "INTEGER PRIMARY KEY", "login": "TEXT UNIQUE", "password": "TEXT", "name": "TEXT",
+            "role": "TEXT", "gender": "TEXT", "created_at": "TEXT",
+        },
+        "indexes": [("password",)],
+    },
+    "profiles": {
+        "columns": {"id": "TEXT PRIMARY KEY", "username": "TEXT", "role": "TEXT", "created_at": "TEXT"},
+        "indexes": [("created_at",)],
+    },
+    "homework": {
+        "columns": {
+            "id": "INTEGER PRIMARY KEY AUTOINCREMENT", "title": "TEXT", "description": "TEXT",
+            "image_url": "TEXT", "created_at": "TEXT",
+        },
+        "indexes": [("created_at", "id")],
+    },
+    "attendance": {
+        "columns": {
+            "id": "INTEGER PRIMARY KEY AUTOINCREMENT", "user_id": "INTEGER", "login": "TEXT", "name": "TEXT",
+            "role": "TEXT", "created_at": "TEXT",
+        },
+        "indexes": [("created_at",)],
+    },
+}
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _as_list(value):
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+def _sort_key(value):
+    """None меньше любого значения - как NULL в SQLite (строки без created_at в конце ленты)"""
+    return (value is not None, value)
+
+
+def _after_matches(row, order, after):
+    """True, если row идёт строго после after в порядке order"""
+    for column, desc in order:
+        a, b = _sort_key(row.get(column)), _sort_key(after.get(column))
+        if a != b:
+            return a < b if desc else a > b
+    return False
+
+
+class SupabaseBackend:
+    def __init__(self, client):
+        self.client = client
+
+    @staticmethod
+    def _quote(value):
+        # Строки в кавычках: в timestamptz есть ':' и '+'
+        return f'"{value}"' if isinstance(value, str) else str(value)
+
+    def _keyset_filter(self, order, after):
+        """
+        or-условие PostgREST: (c1 < v1) или (c1 = v1 и c2 < v2) ...
+        NULL меньше любого значения, как в SQLiteBackend; пустая строка - после курсора строк нет.
+        """
+        parts = []
+        for i, (column, desc) in enumerate(order):
+            value = after[column]
+            if value is None and desc:
+                continue
+            equal = [f"{c}.is.null" if after[c] is None else f"{c}.eq.{self._quote(after[c])}"
+                     for c, _ in order[:i]]
+            if value is None:
+                conditions = [f"{column}.not.is.null"]
+            elif desc:
+                conditions = [f"{column}.lt.{self._quote(value)}", f"{column}.is.null"]
+            else:
+                conditions = [f"{column}.gt.{self._quote(value)}"]
+            for condition in conditions:
+                parts.append(f"and({','.join(equal + [condition])})" if equal else condition)
+        return ",".join(parts)
+
+    def _filtered(self, query, eq=None, gte=None):
+        for column, value in (eq or {}).items():
+            if isinstance(value, (list, tuple, set)):
+                query = query.in_(column, list(value))
+            else:
+                query = query.eq(column, value)
+        for column, value in (gte or {}).items():
+            query = query.gte(column, value)
+        return query
+
+    def select(self, table, columns=None, eq=None, gte=None, order=(), limit=None, offset=0, after=None):
+        query = self._filtered(self.client.table(table).select(",".join(columns) if columns else "*"), eq, gte)
+        if after:
+            keyset = self._keyset_filter(order, after)
+            if not keyset:
+                return []
+            query = query.or_(keyset)
+        for column, desc in order:
+            # Postgres по умолчанию ставит NULL первыми при DESC - выравниваем с SQLite
+            query = query.order(column, desc=desc, nullsfirst=not desc)
+        if limit is not None:
+            query = query.range(offset, offset + limit - 1) if offset else query.limit(limit)
+        return query.execute().data or []
+
+    def count(self, table, eq=None):
+        response = self._filtered(self.client.table(table).select("id", count="exact"), eq).limit(1).execute()
+        return response.count or 0
+
+    def insert(self, table, rows):
+        return self.client.table(table).insert(rows).execute().data or []
+
+    def upsert(self, table, rows, key):
+        return self.client.table(table).upsert(rows, on_conflict=key).execute().data or []
+
+    def update(self, table, values, eq):
+        return self._filtered(self.client.table(table).update(values), eq).execute().data or []
+
+    def delete(self, table, eq):
+        return self._filtered(self.client.table(table).delete(), eq).execute().data or []
+
+
+class SQLiteBackend:
+    """Одно соединение на поток; WAL позволяет читать параллельно с записью"""
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        with self.transaction() as conn:
+            self._create_schema(conn)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _create_schema(conn):
+        for table, schema in SCHEMAS.items():
+            columns = ", ".join(f"{name} {kind}" for name, kind in schema["columns"].items())
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns})")
+            for index in schema["indexes"]:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{'_'.join(index)} ON {table} ({', '.join(index)})")
+
+    @staticmethod
+    def _columns(table, names):
+        known = SCHEMAS[table]["columns"]
+        unknown = [n for n in names if n not in known]
+        if unknown:
+            raise ValueError(f"Unknown columns for {table}: {', '.join(unknown)}")
+        return list(names)
+
+    def _where(self, table, eq=None, gte=None, order=(), after=None):
+        clauses, params = [], []
+        for column, value in (eq or {}).items():
+            self._columns(table, [column])
+            values = _as_list(value)
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        for column, value in (gte or {}).items():
+            self._columns(table, [column])
+            clauses.append(f"{column} >= ?")
+            params.append(value)
+        if after:
+            # NULL меньше любого значения: «после NULL» по убыванию ничего нет,
+            # а по возрастанию - все не-NULL
+            alternatives = []
+            for i, (column, desc) in enumerate(order):
+                value = after[column]
+                if value is None and desc:
+                    continue
+                terms = [f"{c} IS ?" for c, _ in order[:i]]
+                if value is None:
+                    terms.append(f"{column} IS NOT NULL")
+                elif desc:
+                    terms.append(f"({column} < ? OR {column} IS NULL)")
+                else:
+                    terms.append(f"{column} > ?")
+                alternatives.append("(" + " AND ".join(terms) + ")")
+                params.extend([after[c] for c, _ in order[:i]] + ([] if value is None else [value]))
+            clauses.append("(" + " OR ".join(alternatives or ["0"]) + ")")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def select(self, table, columns=None, eq=None, gte=None, order=(), limit=None, offset=0, after=None):
+        names = ", ".join(self._columns(table, columns)) if columns else "*"
+        where, params = self._where(table, eq, gte, order, after)
+        sql = f"SELECT {names} FROM {table}{where}"
+        if order:
+            self._columns(table, [c for c, _ in order])
+            sql += " ORDER BY " + ", ".join(f"{c} {'DESC' if d else 'ASC'}" for c, d in order)
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        return [dict(row) for row in self._connection().execute(sql, params)]
+
+    def count(self, table, eq=None):
+        where, params = self._where(table, eq)
+        return self._connection().execute(f"SELECT COUNT(*) FROM {table}{where}", params).fetchone()[0]
+
+    def _prepare(self, table, row):
+        known = SCHEMAS[table]["columns"]
+        row = {k: v for k, v in row.items() if k in known}
+        if "created_at" in known and not row.get("created_at"):
+            row["created_at"] = _now()
+        return row
+
+    @contextmanager
+    def transaction(self):
+        """
+        Транзакция записи (BEGIN IMMEDIATE) на соединении потока.
+        Вложенные вызовы, в том числе insert/update/delete, идут в ту же транзакцию.
+        """
+        conn = self._connection()
+        if getattr(self._local, "depth", 0):
+            self._local.depth += 1
+            try:
+                yield conn
+            finally:
+                self._local.depth -= 1
+            return
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            self._local.depth = 1
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+            finally:
+                self._local.depth = 0
+
+    def _write_rows(self, table, rows, verb, key=None):
+        result = []
+        with self.transaction() as conn:
+            for row in rows:
+                row = self._prepare(table, row)
+                names = list(row)
+                sql = f"{verb} INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})"
+                if key:
+                    updates = ", ".join(f"{n} = excluded.{n}" for n in names if n != key)
+                    sql += f" ON CONFLICT({key}) DO " + (f"UPDATE SET {updates}" if updates else "NOTHING")
+                cursor = conn.execute(sql + " RETURNING *", [row[n] for n in names])
+                result.extend(dict(r) for r in cursor.fetchall())
+        return result
+
+    def insert(self, table, rows):
+        return self._write_rows(table, rows, "INSERT")
+
+    def upsert(self, table, rows, key):
+        self._columns(table, [key])
+        return self._write_rows(table, rows, "INSERT", key=key)
+
+    def update(self, table, values, eq):
+        self._columns(table, values)
+        where, params = self._where(table, eq)
+        assignments = ", ".join(f"{name} = ?" for name in values)
+        with self.transaction() as conn:
+            cursor = conn.execute(f"UPDATE {table} SET {assignments}{where} RETURNING *", list(values.values()) + params)
+            return [dict(r) for r in cursor.fetchall()]
+
+    def delete(self, table, eq):
+        where, params = self._where(table, eq)
+        with self.transaction() as conn:
+            cursor = conn.execute(f"DELETE FROM {table}{where} RETURNING *", params)
+            return [dict(r) for r in cursor.fetchall()]
+
+
+class JsonBackend:
+    """
+    Таблица = JSON-файл <data_dir>/<table>.json (формат users.json/homework.json).
+    Фильтры выполняются в памяти; поиск по login/password - через индекс JsonStore.
+    """
+
+    INDEXED = {"users": ("password", "login")}
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self._stores = {}
+        self._lock = threading.Lock()
+
+    def _store(self, table):
+        store = self._stores.get(table)
+        if store is None:
+            with self._lock:
+                store = self._stores.get(table)
+                if store is None:
+                    path = os.path.join(self.data_dir, f"{table}.json")
+                    store = self._stores[table] = JsonStore(path, index_fields=self.INDEXED.get(table, ()))
+        return store
+
+    def _rows(self, table, eq=None, gte=None):
+        store = self._store(table)
+        eq = dict(eq or {})
+        # Точное совпадение по индексированному полю - без перебора
+        for column in list(eq):
+            if column in store.index_fields:
+                records = (store.find(column, value) for value in dict.fromkeys(_as_list(eq.pop(column))))
+                rows = [record for record in records if record is not None]
+                break
+        else:
+            rows = store.all()
+        for column, value in eq.items():
+            values = set(_as_list(value))
+            rows = [r for r in rows if r.get(column) in values]
+        for column, value in (gte or {}).items():
+            rows = [r for r in rows if r.get(column) is not None and r[column] >= value]
+        return rows
+
+    def select(self, table, columns=None, eq=None, gte=None, order=(), limit=None, offset=0, after=None):
+        rows = self._rows(table, eq, gte)
+        if after:
+            rows = [r for r in rows if _after_matches(r, order, after)]
+        for column, desc in reversed(order):
+            rows = sorted(rows, key=lambda r: _sort_key(r.get(column)), reverse=desc)
+        if limit is not None:
+            rows = rows[offset:offset + limit]
+        elif offset:
+            rows = rows[offset:]
+        if columns:
+            return [{c: r.get(c) for c in columns} for r in rows]
+        return [dict(r) for r in rows]
+
+    def count(self, table, eq=None):
+        return len(self._rows(table, eq))
+
+    def insert(self, table, rows):
+        store = self._store(table)
+        return [store.insert({"created_at": _now(), **row}) for row in rows]
+
+    def upsert(self, table, rows, key):
+        store = self._store(table)
+        result = []
+        for row in rows:
+            existing = self._rows(table, eq={key: row[key]})
+            if existing:
+                merged = {**existing[0], **row, "id": existing[0]["id"]}
+                result.append(store.insert(merged))
+            else:
+                result.append(store.insert({"created_at": _now(), **row}))
+        return result
+
+    def update(self, table, values, eq):
+        store = self._store(table)
+        return [store.insert({**row, **values}) for row in self._rows(table, eq)]
+
+    def delete(self, table, eq):
+        store = self._store(table)
+        rows = self._rows(table, eq)
+        for row in rows:
+            store.delete(row["id"])
+        return rows
+
+
+def create_backend(kind, supabase=None, sqlite_path=None, data_dir=None):
+    if kind == "supabase":
+        if supabase is None:
+            raise ValueError("DATA_BACKEND=supabase requires a Supabase client")
+        return SupabaseBackend(supabase)
+    if kind == "sqlite":
+        return SQLiteBackend(sqlite_path)
+    if kind == "json":
+        return JsonBackend(data_dir)
+    raise ValueError(f"Unknown DATA_BACKEND: {kind}")
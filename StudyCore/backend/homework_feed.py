@@ -0,0 +1,82 @@
+"""
+Постраничная выдача ленты домашних заданий.
+
+Курсор (keyset) строится по паре (created_at, id), сортировка - от новых
+к старым. Курсор непрозрачен для клиента: это base64 от JSON.
+"""
+import base64
+import json
+import os
+
+HOMEWORK_FIELDS = ("id", "title", "description", "image_url", "created_at")
+# Поля, без которых нельзя построить следующий курсор
+CURSOR_FIELDS = ("id", "created_at")
+HOMEWORK_PAGE_DEFAULT = int(os.getenv("HOMEWORK_PAGE_DEFAULT", "20"))
+HOMEWORK_PAGE_MAX = int(os.getenv("HOMEWORK_PAGE_MAX", "100"))
+# Длина описания в облегчённом режиме mode=list
+HOMEWORK_PREVIEW_CHARS = int(os.getenv("HOMEWORK_PREVIEW_CHARS", "200"))
+
+
+class FeedParamError(ValueError):
+    pass
+
+
+def encode_cursor(row):
+    raw = json.dumps({"c": row["created_at"], "i": row["id"]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        # У старых заданий created_at может не быть - курсор хранит null
+        return (None if data["c"] is None else str(data["c"])), int(data["i"])
+    except Exception:
+        raise FeedParamError("Invalid cursor")
+
+
+def parse_fields(fields_param):
+    """Разбирает fields=title,created_at в список колонок для select()"""
+    if not fields_param:
+        return list(HOMEWORK_FIELDS)
+    requested = [f.strip() for f in fields_param.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in HOMEWORK_FIELDS]
+    if unknown:
+        raise FeedParamError(f"Unknown fields: {', '.join(unknown)}")
+    # Порядок как в HOMEWORK_FIELDS, поля курсора добавляются всегда
+    return [f for f in HOMEWORK_FIELDS if f in requested or f in CURSOR_FIELDS]
+
+
+def parse_limit(limit_param):
+    if not limit_param:
+        return HOMEWORK_PAGE_DEFAULT
+    if not limit_param.isdigit():
+        raise FeedParamError("limit must be a positive integer")
+    return max(1, min(int(limit_param), HOMEWORK_PAGE_MAX))
+
+
+def cursor_row(cursor):
+    """Строка-курсор для HomeworkRepo.page: выдача продолжается после неё"""
+    created_at, row_id = decode_cursor(cursor)
+    return {"created_at": created_at, "id": row_id}
+
+
+def preview(rows, max_chars=HOMEWORK_PREVIEW_CHARS):
+    """Облегчённый режим: обрезает длинные описания"""
+    for row in rows:
+        description = row.get("description")
+        if description and len(description) > max_chars:
+            row["description"] = description[:max_chars].rstrip() + "…"
+            row["truncated"] = True
+    return rows
+
+
+def build_page(rows, limit):
+    """rows запрошены с limit + 1 - лишняя строка означает, что есть следующая страница"""
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    return {
+        "items": items,
+        "next_cursor": encode_cursor(items[-1]) if has_more and items else None,
+    }
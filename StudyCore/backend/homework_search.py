@@ -0,0 +1,311 @@
+"""
+Поиск по домашним заданиям для GET /api/homework/search.
+
+Инвертированный индекс в памяти процесса: основа слова -> {id задания: вес}.
+Слова приводятся к нижнему регистру (ё -> е) и сокращаются до основы
+стеммером Портера для русского языка (Snowball), поэтому «дробей» находит
+«дроби» и «дробями». Каждое слово запроса ищется и как префикс основы
+(«математ» находит «математика»), все слова запроса обязательны.
+Совпадения в заголовке весят больше, чем в описании.
+
+Индекс обновляется при добавлении и удалении заданий этим процессом и
+полностью пересобирается из таблицы по HOMEWORK_SEARCH_TTL (изменения
+других процессов) или через POST /api/homework/search/rebuild.
+Поиск не перебирает задания: время зависит от числа подходящих основ.
+"""
+import bisect
+import functools
+import os
+import re
+import threading
+import time
+
+# Как часто пересобирать индекс из таблицы (секунды, 0 - только вручную)
+HOMEWORK_SEARCH_TTL = float(os.getenv("HOMEWORK_SEARCH_TTL", "600"))
+# Сколько основ может подойти под один префикс (защита от запросов из одной буквы)
+HOMEWORK_SEARCH_MAX_EXPANSIONS = int(os.getenv("HOMEWORK_SEARCH_MAX_EXPANSIONS", "200"))
+
+TITLE_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 1.0
+# Совпадение по префиксу весит меньше точного совпадения основы
+PREFIX_FACTOR = 0.5
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+STOP_WORDS = frozenset(
+    "и в во на с со по для не к ко о об от до из за у а но что как это или же ли бы то".split())
+
+# --- Стеммер Snowball для русского языка ---
+_VOWELS = "аеиоуыэюя"
+_PERFECTIVE_GERUND = (("в", "вши", "вшись"), ("ив", "ивши", "ившись", "ыв", "ывши", "ывшись"))
+_REFLEXIVE = ("ся", "сь")
+_ADJECTIVE = ("ее", "ие", "ые", "ое", "ими", "ыми", "ей", "ий", "ый", "ой", "ем", "им", "ым", "ом", "его", "ого",
+              "ему", "ому", "их", "ых", "ую", "юю", "ая", "яя", "ою", "ею")
+_PARTICIPLE = (("ем", "нн", "вш", "ющ", "щ"), ("ивш", "ывш", "ующ"))
+_VERB = (("ла", "на", "ете", "йте", "ли", "й", "л", "ем", "н", "ло", "но", "ет", "ют", "ны", "ть", "ешь", "нно"),
+         ("ила", "ыла", "ена", "ейте", "уйте", "ите", "или", "ыли", "ей", "уй", "ил", "ыл", "им", "ым", "ен", "ило",
+          "ыло", "ено", "ят", "ует", "уют", "ит", "ыт", "ены", "ить", "ыть", "ишь", "ую", "ю"))
+_NOUN = ("а", "ев", "ов", "ие", "ье", "е", "иями", "ями", "ами", "еи", "ии", "и", "ией", "ей", "ой", "ий", "й",
+         "иям", "ям", "ием", "ем", "ам", "ом", "о", "у", "ах", "иях", "ях", "ы", "ь", "ию", "ью", "ю", "ия", "ья", "я")
+_SUPERLATIVE = ("ейш", "ейше")
+_DERIVATIONAL = ("ост", "ость")
+
+
+def _regions(word):
+    """Начала областей RV и R2 (по определению Snowball)"""
+    rv = len(word)
+    for i, char in enumerate(word):
+        if char in _VOWELS:
+            rv = i + 1
+            break
+    r1 = len(word)
+    for i in range(1, len(word)):
+        if word[i] not in _VOWELS and word[i - 1] in _VOWELS:
+            r1 = i + 1
+            break
+    r2 = len(word)
+    for i in range(r1 + 1, len(word)):
+        if word[i] not in _VOWELS and word[i - 1] in _VOWELS:
+            r2 = i + 1
+            break
+    return rv, r2
+
+
+def _longest_first(suffixes):
+    return tuple(sorted(suffixes, key=len, reverse=True))
+
+
+_PERFECTIVE_GERUND = tuple(_longest_first(group) for group in _PERFECTIVE_GERUND)
+_PARTICIPLE = tuple(_longest_first(group) for group in _PARTICIPLE)
+_VERB = tuple(_longest_first(group) for group in _VERB)
+_REFLEXIVE, _ADJECTIVE, _NOUN, _SUPERLATIVE, _DERIVATIONAL = (
+    _longest_first(s) for s in (_REFLEXIVE, _ADJECTIVE, _NOUN, _SUPERLATIVE, _DERIVATIONAL))
+
+
+def _strip(word, start, suffixes, after_a=False):
+    """Отрезает самое длинное окончание из suffixes, лежащее в word[start:]; None - не нашлось"""
+    for suffix in suffixes:
+        cut = len(word) - len(suffix)
+        if cut < start or not word.endswith(suffix):
+            continue
+        # Окончания первой группы - только после «а» или «я»
+        if after_a and (cut - 1 < start or word[cut - 1] not in "ая"):
+            continue
+        return word[:cut]
+    return None
+
+
+def _strip_grouped(word, start, groups):
+    candidates = [w for w in (_strip(word, start, groups[0], after_a=True), _strip(word, start, groups[1]))
+                  if w is not None]
+    # Из двух групп побеждает более длинное окончание
+    return min(candidates, key=len) if candidates else None
+
+
+@functools.lru_cache(maxsize=65536)
+def stem(word):
+    word = word.lower().replace("ё", "е")
+    if len(word) < 3 or not any(char in _VOWELS for char in word):
+        return word
+    rv, r2 = _regions(word)
+
+    # Шаг 1
+    result = _strip_grouped(word, rv, _PERFECTIVE_GERUND)
+    if result is None:
+        word = _strip(word, rv, _REFLEXIVE) or word
+        result = _strip(word, rv, _ADJECTIVE)
+        if result is not None:
+            result = _strip_grouped(result, rv, _PARTICIPLE) or result
+        else:
+            result = _strip_grouped(word, rv, _VERB) or _strip(word, rv, _NOUN)
+    word = result if result is not None else word
+
+    # Шаг 2
+    if word.endswith("и") and len(word) - 1 >= rv:
+        word = word[:-1]
+
+    # Шаг 3
+    word = _strip(word, r2, _DERIVATIONAL) or word
+
+    # Шаг 4
+    if word.endswith("нн") and len(word) - 2 >= rv:
+        word = word[:-1]
+    else:
+        stripped = _strip(word, rv, _SUPERLATIVE)
+        if stripped is not None:
+            word = stripped[:-1] if stripped.endswith("нн") else stripped
+        elif word.endswith("ь") and len(word) - 1 >= rv:
+            word = word[:-1]
+    return word
+
+
+def tokenize(text):
+    """Основы слов текста без стоп-слов"""
+    words = _WORD_RE.findall((text or "").lower().replace("ё", "е"))
+    return [stem(w) for w in words if w not in STOP_WORDS]
+
+
+class HomeworkSearchIndex:
+    """
+    loader() -> list[dict] - все задания (для пересборки).
+    search() возвращает id заданий по убыванию релевантности.
+    """
+
+    def __init__(self, loader, ttl=HOMEWORK_SEARCH_TTL):
+        self._loader = loader
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+        # Изменения, пришедшие во время пересборки, применяются к новому индексу
+        self._changes = None
+        self._postings = {}
+        self._terms = []
+        self._docs = {}
+        self._built_at = None
+
+    def _is_stale(self):
+        if self._built_at is None:
+            return True
+        return self._ttl > 0 and time.monotonic() - self._built_at > self._ttl
+
+    @staticmethod
+    def _weights(row):
+        weights = {}
+        for term in tokenize(row.get("title")):
+            weights[term] = weights.get(term, 0.0) + TITLE_WEIGHT
+        for term in tokenize(row.get("description")):
+            weights[term] = weights.get(term, 0.0) + DESCRIPTION_WEIGHT
+        return weights
+
+    def _add(self, row):
+        doc_id = row["id"]
+        if doc_id in self._docs:
+            self._remove(doc_id)
+        weights = self._weights(row)
+        for term, weight in weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                bisect.insort(self._terms, term)
+            postings[doc_id] = weight
+        self._docs[doc_id] = (tuple(weights), row.get("created_at") or "")
+
+    def _remove(self, doc_id):
+        entry = self._docs.pop(doc_id, None)
+        if entry is None:
+            return
+        for term in entry[0]:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                i = bisect.bisect_left(self._terms, term)
+                if i < len(self._terms) and self._terms[i] == term:
+                    del self._terms[i]
+
+    # --- Обновление ---
+    def add(self, row):
+        """Учитывает новое или изменённое задание"""
+        if not row or row.get("id") is None:
+            return
+        with self._lock:
+            if self._changes is not None:
+                self._changes.append((self._add, row))
+            if self._built_at is not None:
+                self._add(row)
+
+    def remove(self, doc_id):
+        with self._lock:
+            if self._changes is not None:
+                self._changes.append((self._remove, doc_id))
+            self._remove(doc_id)
+
+    def rebuild(self):
+        """Пересобирает индекс из таблицы; возвращает число заданий"""
+        with self._rebuild_lock:
+            with self._lock:
+                self._changes = []
+            try:
+                rows = self._loader() or []
+                fresh = HomeworkSearchIndex(self._loader, ttl=self._ttl)
+                for row in rows:
+                    if row.get("id") is not None:
+                        fresh._add(row)
+            except Exception:
+                with self._lock:
+                    self._changes = None
+                raise
+            with self._lock:
+                self._postings, self._terms, self._docs = fresh._postings, fresh._terms, fresh._docs
+                for apply, argument in self._changes:
+                    apply(argument)
+                self._changes = None
+                self._built_at = time.monotonic()
+            return len(rows)
+
+    def invalidate(self):
+        """Таблица изменена в обход этого процесса - следующий поиск пересоберёт индекс"""
+        with self._lock:
+            self._built_at = None
+
+    def ensure_fresh(self):
+        if not self._is_stale():
+            return
+        with self._lock:
+            if not self._is_stale():
+                return
+            # Помечаем как свежий, чтобы параллельные запросы не пересобирали повторно
+            previous, self._built_at = self._built_at, time.monotonic()
+        try:
+            self.rebuild()
+        except Exception:
+            with self._lock:
+                self._built_at = previous
+            raise
+
+    # --- Поиск ---
+    def _matches(self, term):
+        """{id: вес} для основы term: точное совпадение и основы с этим префиксом"""
+        scores = dict(self._postings.get(term, {}))
+        start = bisect.bisect_left(self._terms, term)
+        for candidate in self._terms[start:start + HOMEWORK_SEARCH_MAX_EXPANSIONS + 1]:
+            if not candidate.startswith(term):
+                break
+            if candidate == term:
+                continue
+            for doc_id, weight in self._postings[candidate].items():
+                scores[doc_id] = max(scores.get(doc_id, 0.0), weight * PREFIX_FACTOR)
+        return scores
+
+    def search(self, query, limit=20, offset=0):
+        """(id по убыванию релевантности, всего найдено)"""
+        self.ensure_fresh()
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return [], 0
+        with self._lock:
+            scores = None
+            # Сначала самые редкие основы: пересечение быстро сужается
+            for term in sorted(terms, key=lambda t: len(self._postings.get(t, ()))):
+                matches = self._matches(term)
+                if scores is None:
+                    scores = matches
+                else:
+                    scores = {doc_id: score + matches[doc_id] for doc_id, score in scores.items() if doc_id in matches}
+                if not scores:
+                    return [], 0
+            created = {doc_id: self._docs[doc_id][1] for doc_id in scores}
+        # Сортировка устойчивая: при равной релевантности новые задания выше
+        ranked = sorted(scores, key=lambda doc_id: (created[doc_id], _numeric(doc_id)), reverse=True)
+        ranked.sort(key=scores.get, reverse=True)
+        return ranked[offset:offset + limit], len(ranked)
+
+    def snapshot(self):
+        with self._lock:
+            return {"documents": len(self._docs), "terms": len(self._terms),
+                    "built": self._built_at is not None}
+
+
+def _numeric(doc_id):
+    return doc_id if isinstance(doc_id, (int, float)) else 0
@@ -0,0 +1,133 @@
+"""
+Общие пулы HTTP-соединений для Supabase, Storage и OpenAI.
+
+Каждый клиент получает httpx.Client с настроенными лимитами пула,
+keep-alive и HTTP/2 (если установлен пакет h2), чтобы TLS-рукопожатие
+не повторялось на каждый запрос. Транспорт считает запросы в полёте,
+пик одновременных запросов и таймауты ожидания свободного соединения.
+
+httpx.Client потокобезопасен; в режиме gunicorn каждый воркер создаёт
+свои пулы после fork (без --preload), поэтому соединения не делятся
+между процессами.
+
+Длительность каждого вызова (до получения заголовков ответа) пишется
+в metrics с меткой маршрута, из которого он сделан.
+"""
+import os
+import threading
+import time
+
+import httpx
+
+import metrics
+
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+# Сколько ждать свободного соединения из пула, прежде чем считать пул исчерпанным
+HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "10"))
+HTTP2_ENABLED = os.getenv("HTTP2", "1") == "1"
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Все созданные пулы: имя -> транспорт (для метрик)
+pools = {}
+
+
+class InstrumentedTransport(httpx.HTTPTransport):
+    """HTTPTransport со счётчиками использования пула"""
+
+    def __init__(self, name, **kwargs):
+        super().__init__(**kwargs)
+        self.name = name
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.stats = {
+            "requests": 0, "errors": 0, "pool_timeouts": 0,
+            "peak_in_flight": 0, "time_total_ms": 0.0,
+        }
+
+    def handle_request(self, request):
+        with self._lock:
+            self._in_flight += 1
+            self.stats["peak_in_flight"] = max(self.stats["peak_in_flight"], self._in_flight)
+        started = time.monotonic()
+        route = metrics.current_route.get()
+        try:
+            response = super().handle_request(request)
+            if response.status_code >= 500:
+                metrics.UPSTREAM_ERRORS.inc(self.name, route, "5xx")
+            return response
+        except httpx.PoolTimeout:
+            with self._lock:
+                self.stats["pool_timeouts"] += 1
+                self.stats["errors"] += 1
+            metrics.UPSTREAM_ERRORS.inc(self.name, route, "pool_timeout")
+            raise
+        except Exception as e:
+            with self._lock:
+                self.stats["errors"] += 1
+            metrics.UPSTREAM_ERRORS.inc(self.name, route, type(e).__name__)
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            with self._lock:
+                self._in_flight -= 1
+                self.stats["requests"] += 1
+                self.stats["time_total_ms"] += elapsed * 1000
+            metrics.UPSTREAM_SECONDS.observe(elapsed, self.name, route, request.method)
+
+    def snapshot(self):
+        # httpcore не даёт публичного API для состояния пула - читаем осторожно
+        connections = list(getattr(getattr(self, "_pool", None), "connections", []) or [])
+        with self._lock:
+            return {
+                **self.stats,
+                "in_flight": self._in_flight,
+                "connections": len(connections),
+                "idle_connections": sum(1 for c in connections if getattr(c, "is_idle", lambda: False)()),
+            }
+
+
+def make_client(name, timeout=30.0, **client_kwargs):
+    """Создаёт httpx.Client с общими настройками пула и регистрирует его для метрик"""
+    http2 = HTTP2_ENABLED and HTTP2_AVAILABLE
+    transport = InstrumentedTransport(
+        name,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+    pools[name] = transport
+    return httpx.Client(
+        transport=transport,
+        timeout=httpx.Timeout(timeout, pool=HTTP_POOL_TIMEOUT),
+        **client_kwargs
+    )
+
+
+def snapshot():
+    return {
+        "http2": HTTP2_ENABLED and HTTP2_AVAILABLE,
+        "max_connections": HTTP_MAX_CONNECTIONS,
+        "max_keepalive": HTTP_MAX_KEEPALIVE,
+        "pools": {name: transport.snapshot() for name, transport in pools.items()},
+    }
+
+
+@metrics.registry.collector
+def _pool_metrics():
+    in_flight = metrics.Gauge("studycore_upstream_in_flight", "Upstream calls in progress", ("upstream",))
+    connections = metrics.Gauge("studycore_upstream_connections", "Open pooled connections", ("upstream",))
+    for name, transport in pools.items():
+        state = transport.snapshot()
+        in_flight.set(state["in_flight"], name)
+        connections.set(state["connections"], name)
+    return [in_flight, connections]
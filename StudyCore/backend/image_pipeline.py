@@ -0,0 +1,288 @@
+"""
+Обработка изображений домашних заданий после загрузки.
+
+Из оригинала JPEG/PNG/WebP до загрузки вырезаются метаданные (EXIF с
+GPS-координатами, XMP, IPTC, текстовые блоки) без перекодирования
+пикселей; у JPEG сохраняется только тег Orientation.
+
+Для png/jpg/jpeg/gif/webp строятся две копии рядом с оригиналом:
+уменьшенная WebP-версия (без EXIF) и маленькая миниатюра.
+Обработка идёт в пуле потоков, запрос не ждёт ресайза:
+имена копий известны заранее и сразу возвращаются клиенту.
+Если Pillow не установлен, обработка просто отключается.
+"""
+import hashlib
+import io
+import os
+import shutil
+import struct
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from storage_upload import SpooledUpload, UPLOAD_CHUNK_SIZE
+from structured_log import get_logger
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+    ImageOps = None
+
+logger = get_logger("images")
+
+IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+IMAGE_MAX_SIDE = int(os.getenv("IMAGE_MAX_SIDE", "2048"))
+IMAGE_THUMB_SIDE = int(os.getenv("IMAGE_THUMB_SIDE", "320"))
+IMAGE_WEBP_QUALITY = int(os.getenv("IMAGE_WEBP_QUALITY", "80"))
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", str(os.cpu_count() or 2)))
+
+
+def variant_names(object_name):
+    """Имена копий изображения в bucket (рядом с оригиналом)"""
+    base = object_name.rsplit('.', 1)[0]
+    return {
+        "webp": f"{base}_full.webp",
+        "thumbnail": f"{base}_thumb.webp",
+    }
+
+
+# --- Удаление метаданных из оригинала ---
+# APP1 (EXIF, XMP), APP13 (IPTC), COM
+_JPEG_DROP = {0xE1, 0xED, 0xFE}
+_PNG_DROP = {b"eXIf", b"tEXt", b"zTXt", b"iTXt", b"tIME"}
+_WEBP_DROP = {b"EXIF", b"XMP "}
+# Флаги EXIF и XMP в заголовке VP8X
+_WEBP_METADATA_FLAGS = 0x08 | 0x04
+_EXIF_ORIENTATION = 0x0112
+
+
+class _Malformed(Exception):
+    pass
+
+
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise _Malformed("unexpected end of file")
+    return data
+
+
+def _copy_bytes(src, dst, size):
+    while size > 0:
+        chunk = _read_exact(src, min(size, UPLOAD_CHUNK_SIZE))
+        dst.write(chunk)
+        size -= len(chunk)
+
+
+def _skip_bytes(f, size):
+    f.seek(size, os.SEEK_CUR)
+
+
+def _exif_orientation(payload):
+    """Значение Orientation из APP1 "Exif" или None"""
+    if not payload.startswith(b"Exif\0\0"):
+        return None
+    tiff = payload[6:]
+    try:
+        order = {b"II": "<", b"MM": ">"}[tiff[:2]]
+        (ifd,) = struct.unpack_from(order + "I", tiff, 4)
+        (count,) = struct.unpack_from(order + "H", tiff, ifd)
+        for i in range(count):
+            tag, kind, _, value = struct.unpack_from(order + "HHIH", tiff, ifd + 2 + 12 * i)
+            if tag == _EXIF_ORIENTATION and kind == 3:
+                return value
+    except (KeyError, struct.error):
+        return None
+    return None
+
+
+def _orientation_segment(orientation):
+    """APP1 с единственным тегом Orientation"""
+    tiff = b"MM\0*" + struct.pack(">IH", 8, 1) + struct.pack(">HHIHH", _EXIF_ORIENTATION, 3, 1, orientation, 0) \
+        + struct.pack(">I", 0)
+    payload = b"Exif\0\0" + tiff
+    return b"\xff\xe1" + struct.pack(">H", len(payload) + 2) + payload
+
+
+def _strip_jpeg(src, dst):
+    if _read_exact(src, 2) != b"\xff\xd8":
+        raise _Malformed("not a JPEG")
+    dst.write(b"\xff\xd8")
+    while True:
+        if _read_exact(src, 1) != b"\xff":
+            raise _Malformed("marker expected")
+        marker = src.read(1)
+        while marker == b"\xff":
+            marker = src.read(1)
+        if not marker:
+            raise _Malformed("unexpected end of file")
+        code = marker[0]
+        if code == 0xD9 or 0xD0 <= code <= 0xD7 or code == 0x01:
+            dst.write(b"\xff" + marker)
+            if code == 0xD9:
+                return
+            continue
+        raw_length = _read_exact(src, 2)
+        (length,) = struct.unpack(">H", raw_length)
+        if length < 2:
+            raise _Malformed("bad segment length")
+        if code in _JPEG_DROP:
+            payload = _read_exact(src, length - 2)
+            orientation = _exif_orientation(payload) if code == 0xE1 else None
+            # Без Orientation фото с телефона показалось бы повёрнутым
+            if orientation and orientation != 1:
+                dst.write(_orientation_segment(orientation))
+            continue
+        dst.write(b"\xff" + marker + raw_length)
+        _copy_bytes(src, dst, length - 2)
+        if code == 0xDA:
+            # Дальше сжатые данные изображения - копируем как есть
+            shutil.copyfileobj(src, dst, UPLOAD_CHUNK_SIZE)
+            return
+
+
+def _strip_png(src, dst):
+    signature = _read_exact(src, 8)
+    if signature != b"\x89PNG\r\n\x1a\n":
+        raise _Malformed("not a PNG")
+    dst.write(signature)
+    while True:
+        header = _read_exact(src, 8)
+        (length,) = struct.unpack(">I", header[:4])
+        kind = header[4:]
+        if kind in _PNG_DROP:
+            _skip_bytes(src, length + 4)
+            continue
+        dst.write(header)
+        _copy_bytes(src, dst, length + 4)
+        if kind == b"IEND":
+            return
+
+
+def _strip_webp(src, dst):
+    header = _read_exact(src, 12)
+    if header[:4] != b"RIFF" or header[8:] != b"WEBP":
+        raise _Malformed("not a WebP")
+    (riff_size,) = struct.unpack("<I", header[4:8])
+    dst.write(header)
+    remaining = riff_size - 4
+    while remaining >= 8:
+        chunk_header = _read_exact(src, 8)
+        (length,) = struct.unpack("<I", chunk_header[4:])
+        padded = length + (length & 1)
+        remaining -= 8 + padded
+        kind = chunk_header[:4]
+        if kind in _WEBP_DROP:
+            _skip_bytes(src, padded)
+            continue
+        dst.write(chunk_header)
+        if kind == b"VP8X":
+            payload = bytearray(_read_exact(src, padded))
+            payload[0] &= ~_WEBP_METADATA_FLAGS & 0xFF
+            dst.write(payload)
+        else:
+            _copy_bytes(src, dst, padded)
+    # Размер RIFF изменился
+    size = dst.tell()
+    dst.seek(4)
+    dst.write(struct.pack("<I", size - 8))
+    dst.seek(size)
+
+
+_STRIPPERS = {"jpg": _strip_jpeg, "jpeg": _strip_jpeg, "png": _strip_png, "webp": _strip_webp}
+
+
+def strip_metadata(spooled, ext):
+    """
+    Копия загрузки без метаданных (новый SpooledUpload с новым SHA-256),
+    исходный временный файл удаляется. Для других форматов и файлов,
+    которые не удалось разобрать, возвращается сам spooled.
+    """
+    stripper = _STRIPPERS.get(ext)
+    if stripper is None:
+        return spooled
+    fd, path = tempfile.mkstemp(prefix="upload-")
+    try:
+        with os.fdopen(fd, "w+b") as dst, spooled.open() as src:
+            stripper(src, dst)
+            dst.seek(0)
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: dst.read(UPLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+            size = dst.tell()
+    except _Malformed as e:
+        os.remove(path)
+        logger.warning("image metadata not stripped: %s", e, extra={"ext": ext})
+        return spooled
+    except Exception:
+        os.remove(path)
+        raise
+    spooled.cleanup()
+    return SpooledUpload(path, size, digest.hexdigest())
+
+
+def _encode_webp(img, max_side):
+    copy = img.copy()
+    copy.thumbnail((max_side, max_side), Image.LANCZOS)
+    out = io.BytesIO()
+    # EXIF и прочие метаданные не передаём - в WebP попадают только пиксели
+    copy.save(out, "WEBP", quality=IMAGE_WEBP_QUALITY, method=4)
+    return out.getvalue()
+
+
+def render_variants(path, max_side=IMAGE_MAX_SIDE, thumb_side=IMAGE_THUMB_SIDE):
+    """Возвращает {"webp": bytes, "thumbnail": bytes} для файла изображения"""
+    with Image.open(path) as img:
+        # Для JPEG декодер сразу уменьшает картинку - дешевле полного декода
+        img.draft("RGB", (max_side, max_side))
+        # Поворачиваем по EXIF Orientation до того, как метаданные будут отброшены
+        img = ImageOps.exif_transpose(img)
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "transparency" in img.info or img.mode in ("LA", "PA") else "RGB")
+        return {
+            "webp": _encode_webp(img, max_side),
+            "thumbnail": _encode_webp(img, thumb_side),
+        }
+
+
+class ImagePipeline:
+    """
+    Пул обработки изображений.
+
+    store(object_name, data, content_type) - сохраняет готовую копию в Storage.
+    """
+
+    def __init__(self, store, max_workers=IMAGE_WORKERS):
+        self._store = store
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="image")
+
+    @staticmethod
+    def available():
+        return Image is not None
+
+    @staticmethod
+    def accepts(ext):
+        return Image is not None and ext in IMAGE_EXTENSIONS
+
+    def submit(self, object_name, spooled):
+        """
+        Ставит изображение в очередь на обработку и сразу возвращает имена копий.
+        Пул становится владельцем spooled и удаляет временный файл сам.
+        """
+        names = variant_names(object_name)
+        self._executor.submit(self._process, object_name, names, spooled)
+        return names
+
+    def _process(self, object_name, names, spooled):
+        try:
+            variants = render_variants(spooled.path)
+            for key, data in variants.items():
+                self._store(names[key], data, "image/webp")
+            logger.debug("image variants ready", extra={"object": object_name})
+        except Exception as e:
+            logger.error("image processing failed: %s", e, extra={"object": object_name})
+        finally:
+            spooled.cleanup()
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,259 @@
+"""
+Локальное хранилище записей для JSON-режима (корневой app.py).
+
+Записи держатся в памяти: словарь по id и индексы по выбранным полям
+(например, password), поэтому чтение не открывает файл. Изменения
+дописываются в журнал <файл>.journal по одной JSON-строке. Каждые
+JSON_STORE_COMPACT_EVERY операций журнал сворачивается в снимок:
+новый JSON пишется во временный файл и атомарно подменяет старый
+(os.replace), после чего начинается новый пустой журнал.
+
+Запись идёт под одним писателем: threading.Lock внутри процесса и
+flock на <файл>.lock между процессами (воркеры gunicorn). Перед каждой
+операцией процесс подхватывает чужие изменения - новый снимок или
+хвост журнала. Журнал начинается строкой-заголовком со своим id и
+тоже подменяется целиком, так что читатель не продолжит чтение старого
+смещения в новом журнале. Операции журнала идемпотентны, поэтому
+повторное применение после сбоя между подменой снимка и журнала безопасно.
+"""
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: только блокировка внутри процесса
+    fcntl = None
+
+JSON_STORE_COMPACT_EVERY = int(os.getenv("JSON_STORE_COMPACT_EVERY", "500"))
+JSON_STORE_FSYNC = os.getenv("JSON_STORE_FSYNC", "1") == "1"
+
+
+def _signature(path):
+    """Идентификатор версии снимка: меняется при каждой подмене файла"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _size(path):
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
+
+
+class JsonStore:
+    """
+    Записи - словари с полем id. all() возвращает общий список,
+    вызывающий код не должен его изменять.
+    """
+
+    def __init__(self, path, index_fields=(), compact_every=JSON_STORE_COMPACT_EVERY):
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.index_fields = tuple(index_fields)
+        self._compact_every = max(1, compact_every)
+        self._lock = threading.RLock()
+        self._lock_file = None
+        self._records = {}
+        self._indexes = {field: {} for field in self.index_fields}
+        self._list = None
+        self._next_id = 1
+        self._snapshot_sig = None
+        self._journal_id = None
+        self._journal_offset = 0
+        self._journal_entries = 0
+        with self._lock:
+            self._load()
+
+    # --- Чтение ---
+    def all(self):
+        with self._lock:
+            self._refresh()
+            if self._list is None:
+                self._list = list(self._records.values())
+            return self._list
+
+    def get(self, record_id):
+        with self._lock:
+            self._refresh()
+            return self._records.get(record_id)
+
+    def find(self, field, value):
+        """Запись по значению индексированного поля или None"""
+        with self._lock:
+            self._refresh()
+            record_id = self._indexes[field].get(value)
+            return self._records.get(record_id) if record_id is not None else None
+
+    def __len__(self):
+        with self._lock:
+            self._refresh()
+            return len(self._records)
+
+    # --- Запись ---
+    def insert(self, record):
+        """Добавляет запись; без id назначается следующий. Возвращает сохранённую запись"""
+        with self._writer():
+            record = dict(record)
+            if record.get("id") is None:
+                record["id"] = self._next_id
+            self._append({"op": "put", "record": record})
+            return record
+
+    def delete(self, record_id):
+        with self._writer():
+            if record_id not in self._records:
+                return False
+            self._append({"op": "delete", "id": record_id})
+            return True
+
+    def compact(self):
+        with self._writer():
+            if self._journal_entries:
+                self._compact()
+
+    # --- Внутренняя логика ---
+    def _apply(self, entry):
+        if entry["op"] == "put":
+            record = entry["record"]
+            previous = self._records.get(record["id"])
+            if previous is not None:
+                self._unindex(previous)
+            self._records[record["id"]] = record
+            for field in self.index_fields:
+                if field in record:
+                    self._indexes[field].setdefault(record[field], record["id"])
+            if isinstance(record["id"], int):
+                self._next_id = max(self._next_id, record["id"] + 1)
+        elif entry["op"] == "delete":
+            previous = self._records.pop(entry["id"], None)
+            if previous is not None:
+                self._unindex(previous)
+        self._list = None
+
+    def _unindex(self, record):
+        for field in self.index_fields:
+            index = self._indexes[field]
+            if index.get(record.get(field)) == record["id"]:
+                del index[record[field]]
+
+    def _load(self):
+        """Полная загрузка: снимок + весь журнал"""
+        self._records = {}
+        self._indexes = {field: {} for field in self.index_fields}
+        self._list = None
+        self._next_id = 1
+        self._snapshot_sig = _signature(self.path)
+        if self._snapshot_sig is not None:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for record in json.load(f):
+                    self._apply({"op": "put", "record": record})
+        self._journal_id = None
+        self._journal_offset = 0
+        self._journal_entries = 0
+        self._replay_journal()
+
+    def _replay_journal(self):
+        """Применяет строки журнала после _journal_offset (недописанную последнюю пропускает)"""
+        try:
+            f = open(self.journal_path, "rb")
+        except FileNotFoundError:
+            if self._journal_id is not None:
+                self._load()
+            return
+        with f:
+            header = f.readline()
+            if not header.endswith(b"\n"):
+                return
+            journal_id = json.loads(header)["journal"]
+            if self._journal_id is None:
+                self._journal_id = journal_id
+                self._journal_offset = len(header)
+            elif journal_id != self._journal_id:
+                # Журнал подменён при сворачивании: перечитываем всё с нуля
+                f.close()
+                self._load()
+                return
+            f.seek(self._journal_offset)
+            data = f.read()
+        complete = data[:data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            if line.strip():
+                self._apply(json.loads(line))
+                self._journal_entries += 1
+        self._journal_offset += len(complete)
+
+    def _refresh(self):
+        """Подхватывает изменения других процессов"""
+        if _signature(self.path) != self._snapshot_sig:
+            # Другой процесс свернул журнал в новый снимок
+            self._load()
+        elif _size(self.journal_path) != self._journal_offset:
+            self._replay_journal()
+
+    @contextmanager
+    def _writer(self):
+        with self._lock:
+            if fcntl is None:
+                self._refresh()
+                yield
+                return
+            if self._lock_file is None:
+                self._lock_file = open(self.path + ".lock", "a")
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            try:
+                self._refresh()
+                yield
+            finally:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _replace_file(self, path, write):
+        """Пишет файл через временный и атомарно подменяет им path"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            write(f)
+            f.flush()
+            if JSON_STORE_FSYNC:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _new_journal(self):
+        journal_id = uuid.uuid4().hex
+        header = (json.dumps({"journal": journal_id}) + "\n").encode("utf-8")
+        self._replace_file(self.journal_path, lambda f: f.write(header))
+        self._journal_id = journal_id
+        self._journal_offset = len(header)
+        self._journal_entries = 0
+
+    def _append(self, entry):
+        if self._journal_id is None:
+            self._new_journal()
+        # Недописанная строка после сбоя писателя обрезается
+        elif _size(self.journal_path) > self._journal_offset:
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(self._journal_offset)
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(self.journal_path, "ab") as f:
+            f.write(line)
+            f.flush()
+            if JSON_STORE_FSYNC:
+                os.fsync(f.fileno())
+        self._apply(entry)
+        self._journal_offset += len(line)
+        self._journal_entries += 1
+        if self._journal_entries >= self._compact_every:
+            self._compact()
+
+    def _compact(self):
+        """Снимок всех записей с атомарной подменой файла, затем новый пустой журнал"""
+        data = json.dumps(list(self._records.values()), indent=2, ensure_ascii=False).encode("utf-8")
+        self._replace_file(self.path, lambda f: f.write(data))
+        self._snapshot_sig = _signature(self.path)
+        self._new_journal()
@@ -0,0 +1,212 @@
+"""
+Метрики бэкенда в текстовом формате Prometheus (GET /metrics).
+
+Счётчики, gauge и гистограммы хранятся в памяти процесса; запись - это
+поиск по словарю и bisect под коротким локом. Маршрут текущего запроса
+лежит в contextvar, поэтому вызовы Supabase и OpenAI из http_pool
+подписываются маршрутом, внутри которого они сделаны (фоновые потоки
+получают route="background").
+
+В режиме gunicorn у каждого воркера свои значения: Prometheus собирает
+их по отдельности (метка instance), суммирование - в запросах PromQL.
+"""
+import bisect
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Границы бакетов (секунды): от кэша в памяти до долгих ответов OpenAI
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# structured_log сам импортирует metrics, поэтому берём логгер напрямую
+logger = logging.getLogger("studycore.metrics")
+
+current_route = ContextVar("current_route", default="background")
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value):
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        # кортеж значений меток -> значение
+        self._values = {}
+
+    def _header(self):
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}" for labels, value in items
+        ]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels, amount=1):
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value, *labels):
+        with self._lock:
+            self._values[labels] = value
+
+    def render(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}" for labels, value in items
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                # [счётчики по бакетам (последний - +Inf), сумма, количество]
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, *labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def render(self):
+        with self._lock:
+            items = sorted((labels, (list(state[0]), state[1], state[2])) for labels, state in self._values.items())
+        lines = self._header()
+        for labels, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                le = 'le="' + _number(float(bound)) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._add(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._add(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self._add(Histogram(name, documentation, labelnames, buckets))
+
+    def collector(self, fn):
+        """
+        fn() -> [Gauge, ...] - вызывается при каждом чтении /metrics,
+        для значений, которые уже считаются в других модулях (очереди, пулы).
+        """
+        self._collectors.append(fn)
+        return fn
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for fn in self._collectors:
+            try:
+                for metric in fn():
+                    lines.extend(metric.render())
+            except Exception as e:
+                logger.error("metrics collector failed: %s", e)
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# Входящие запросы: метка route - имя view-функции Flask (login, get_homework, ...)
+REQUEST_SECONDS = registry.histogram(
+    "studycore_http_request_duration_seconds", "Latency of HTTP requests by route", ("route", "method"))
+REQUESTS = registry.counter(
+    "studycore_http_requests_total", "HTTP responses by route and status", ("route", "method", "status"))
+REQUEST_ERRORS = registry.counter(
+    "studycore_http_request_errors_total", "Requests that ended with 5xx or an unhandled exception", ("route", "method"))
+IN_FLIGHT = registry.gauge(
+    "studycore_http_requests_in_flight", "Requests currently being processed", ("route",))
+
+# Исходящие вызовы (Supabase, OpenAI) - пишет http_pool
+UPSTREAM_SECONDS = registry.histogram(
+    "studycore_upstream_request_duration_seconds", "Latency of upstream HTTP calls by route",
+    ("upstream", "route", "method"))
+UPSTREAM_ERRORS = registry.counter(
+    "studycore_upstream_errors_total", "Upstream calls that failed or returned 5xx", ("upstream", "route", "kind"))
+
+# Этапы внутри маршрута, не являющиеся HTTP-вызовами (поиск в индексе, очередь)
+STAGE_SECONDS = registry.histogram(
+    "studycore_stage_duration_seconds", "Latency of named stages inside a route", ("route", "stage"))
+
+
+def stage(name):
+    """Замеряет этап текущего маршрута: with metrics.stage("credential_lookup"): ..."""
+    return STAGE_SECONDS.time(current_route.get(), name)
+
+
+def render():
+    return registry.render()
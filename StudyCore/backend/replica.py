@@ -0,0 +1,530 @@
+"""
+Встроенная SQLite-реплика Supabase (DATA_BACKEND=replica, включается явно).
+
+Таблицы homework и profiles целиком копируются в локальный файл SQLite
+(WAL, индексы из data_backends.SCHEMAS), и все чтения этих таблиц идут
+локально - лента заданий и список профилей не ждут сеть. Таблица users
+не реплицируется: пароли не должны лежать на диске. Вход и так
+обслуживает индекс учётных данных в памяти процесса (credentials.py).
+
+Фоновый поток синхронизации:
+- раз в REPLICA_PULL_INTERVAL секунд перечитывает таблицы из Supabase
+  постранично и, если содержимое изменилось, подменяет локальную копию
+  в одной транзакции (инкрементально нельзя: в таблицах нет updated_at,
+  а удаления иначе не увидеть). Чтение идёт без блокировки, поэтому
+  записи, принятые Supabase за время чтения, хранятся в журнале
+  recent_writes и накладываются поверх снимка вместе с очередью;
+- отправляет в Supabase очередь записей (таблица outbox в том же файле).
+
+Изменения заданий и ролей сначала пробуют записать в Supabase напрямую,
+а при сетевой ошибке ставятся в очередь: новое задание получает временный
+отрицательный id, который после отправки заменяется настоящим. Запись в
+остальные таблицы идёт в Supabase напрямую: у посещаемости своя очередь
+с повторами (attendance_writer), а пользователи с паролями не попадают
+ни в копию, ни в очередь.
+
+Файл общий для воркеров gunicorn: пересчитывать таблицы будет только
+один процесс за интервал (sync_state.pulled_at), очередь разбирается с
+захватом строк (claimed_by/claimed_at), а остальные процессы узнают
+об изменениях по счётчику версий и сбрасывают свои кэши.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+
+import httpx
+
+from data_backends import SQLiteBackend, SupabaseBackend
+from structured_log import get_logger
+
+logger = get_logger("replica")
+
+REPLICA_PATH = os.getenv("REPLICA_PATH") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "replica.db")
+REPLICA_PULL_INTERVAL = float(os.getenv("REPLICA_PULL_INTERVAL", "30"))
+REPLICA_PUSH_INTERVAL = float(os.getenv("REPLICA_PUSH_INTERVAL", "2"))
+REPLICA_PAGE_SIZE = int(os.getenv("REPLICA_PAGE_SIZE", "1000"))
+REPLICA_PUSH_BATCH = int(os.getenv("REPLICA_PUSH_BATCH", "200"))
+# После стольких неудачных попыток (не сетевых) запись помечается dead и не повторяется
+REPLICA_MAX_ATTEMPTS = int(os.getenv("REPLICA_MAX_ATTEMPTS", "10"))
+# Захват строк очереди процессом, который упал, истекает через столько секунд
+REPLICA_CLAIM_TIMEOUT = float(os.getenv("REPLICA_CLAIM_TIMEOUT", "120"))
+# Сколько секунд помнить записи, уже принятые Supabase (дольше любого pull)
+REPLICA_JOURNAL_TTL = float(os.getenv("REPLICA_JOURNAL_TTL", "600"))
+
+REPLICATED_TABLES = ("homework", "profiles")
+# Сетевые ошибки: Supabase недоступен, запись откладывается без счёта попыток
+TRANSIENT_ERRORS = (httpx.TransportError,)
+
+_SYNC_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS outbox (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, op TEXT NOT NULL, table_name TEXT NOT NULL,
+        payload TEXT NOT NULL, state TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0,
+        last_error TEXT, claimed_by TEXT, claimed_at REAL, created_at REAL NOT NULL)""",
+    "CREATE INDEX IF NOT EXISTS idx_outbox_state_id ON outbox (state, id)",
+    """CREATE TABLE IF NOT EXISTS recent_writes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, table_name TEXT NOT NULL, op TEXT NOT NULL,
+        payload TEXT NOT NULL, written_at REAL NOT NULL)""",
+    "CREATE INDEX IF NOT EXISTS idx_recent_writes_written_at ON recent_writes (written_at)",
+    """CREATE TABLE IF NOT EXISTS sync_state (
+        table_name TEXT PRIMARY KEY, digest TEXT, version INTEGER NOT NULL DEFAULT 0, pulled_at REAL)""",
+)
+
+
+def _digest(rows):
+    raw = json.dumps(rows, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ReplicatedBackend:
+    """
+    Тот же интерфейс, что у бэкендов data_backends: чтения реплицируемых
+    таблиц - из local (SQLiteBackend), остальное - из remote (SupabaseBackend).
+    """
+
+    def __init__(self, remote, local, pull_interval=REPLICA_PULL_INTERVAL, push_interval=REPLICA_PUSH_INTERVAL):
+        self.remote = remote
+        self.local = local
+        self._pull_interval = pull_interval
+        self._push_interval = push_interval
+        self._owner = uuid.uuid4().hex
+        self._listeners = []
+        self._versions = {}
+        self._versions_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        # Подряд идущие сетевые ошибки отправки: пауза растёт до REPLICA_PULL_INTERVAL
+        self._failures = 0
+        self.stats = {"pulls": 0, "pull_errors": 0, "pushed": 0, "push_errors": 0, "queued_writes": 0,
+                      "last_pull": None}
+        with self.local.transaction() as conn:
+            for statement in _SYNC_SCHEMA:
+                conn.execute(statement)
+        self._purge_users()
+
+    def _purge_users(self):
+        """Файл прежней версии реплики мог хранить users с паролями - стираем их"""
+        conn = self.local._connection()
+        queued = conn.execute("SELECT COUNT(*) FROM outbox WHERE table_name = 'users'").fetchone()[0]
+        if not conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] and not queued:
+            return
+        # secure_delete затирает освобождённые страницы, а не только помечает их свободными
+        conn.execute("PRAGMA secure_delete = ON")
+        try:
+            with self.local.transaction():
+                conn.execute("DELETE FROM users")
+                conn.execute("DELETE FROM outbox WHERE table_name = 'users'")
+                conn.execute("DELETE FROM sync_state WHERE table_name = 'users'")
+            # Старые версии страниц остаются в WAL до контрольной точки
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.execute("PRAGMA secure_delete = OFF")
+        logger.info("removed users table from the replica", extra={"outbox_dropped": queued})
+
+    # --- Жизненный цикл ---
+    def start(self):
+        """Первая загрузка синхронно (если реплика пуста), дальше - фоновый поток"""
+        if not self._ever_pulled():
+            try:
+                self.pull()
+            except Exception as e:
+                logger.warning("initial replica pull failed, serving empty replica: %s", e)
+        self._remember_versions()
+        self._thread = threading.Thread(target=self._run, name="replica-sync", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=5.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def on_change(self, callback):
+        """callback(table) - локальная копия таблицы изменилась (pull или отправка очереди)"""
+        self._listeners.append(callback)
+        return callback
+
+    def _notify(self, tables):
+        for table in tables:
+            for callback in self._listeners:
+                callback(table)
+
+    def _run(self):
+        next_pull = time.monotonic() + self._pull_interval
+        while not self._stop.is_set():
+            if time.monotonic() >= next_pull:
+                next_pull = time.monotonic() + self._pull_interval
+                try:
+                    self.pull(skip_recent=True)
+                except Exception as e:
+                    self.stats["pull_errors"] += 1
+                    logger.warning("replica pull failed: %s", e)
+            try:
+                self.push()
+            except Exception as e:
+                logger.exception("replica push failed: %s", e)
+            self._check_versions()
+            if self._failures:
+                # Supabase недоступен: новые записи не будят поток, ждём паузу
+                self._stop.wait(min(self._push_interval * 2 ** min(self._failures, 10), self._pull_interval))
+            else:
+                self._wake.wait(self._push_interval)
+            self._wake.clear()
+
+    # --- Чтение ---
+    def select(self, table, **kwargs):
+        if table in REPLICATED_TABLES:
+            return self.local.select(table, **kwargs)
+        return self.remote.select(table, **kwargs)
+
+    def count(self, table, eq=None):
+        # Точный ответ Supabase: локальная копия может отставать на интервал синхронизации
+        return self.remote.count(table, eq)
+
+    # --- Запись ---
+    # После каждой записи в локальную копию версия таблицы растёт: другие
+    # воркеры сбросят кэши, не дожидаясь следующего pull()
+    def insert(self, table, rows):
+        if table not in REPLICATED_TABLES:
+            return self.remote.insert(table, rows)
+        try:
+            inserted = self.remote.insert(table, rows)
+        except TRANSIENT_ERRORS as e:
+            logger.warning("Supabase unreachable, insert queued: %s", e, extra={"table": table, "rows": len(rows)})
+            inserted = self._insert_offline(table, rows)
+        else:
+            self._apply_remote(table, "upsert", inserted)
+        self._bump_versions([table])
+        return inserted
+
+    def upsert(self, table, rows, key):
+        if table not in REPLICATED_TABLES:
+            return self.remote.upsert(table, rows, key)
+        try:
+            upserted = self.remote.upsert(table, rows, key)
+        except TRANSIENT_ERRORS as e:
+            logger.warning("Supabase unreachable, upsert queued: %s", e, extra={"table": table, "rows": len(rows)})
+            with self.local.transaction():
+                self._enqueue([("upsert", table, {"row": row, "key": key}) for row in rows])
+                upserted = self.local.upsert(table, rows, key)
+        else:
+            self._apply_remote(table, "upsert", upserted)
+        self._bump_versions([table])
+        return upserted
+
+    def update(self, table, values, eq):
+        if table not in REPLICATED_TABLES:
+            return self.remote.update(table, values, eq)
+        try:
+            updated = self.remote.update(table, values, eq)
+        except TRANSIENT_ERRORS as e:
+            logger.warning("Supabase unreachable, update queued: %s", e, extra={"table": table})
+            with self.local.transaction():
+                self._enqueue([("update", table, {"values": values, "eq": eq})])
+                updated = self.local.update(table, values, eq)
+        else:
+            self._apply_remote(table, "upsert", updated)
+        self._bump_versions([table])
+        return updated
+
+    def delete(self, table, eq):
+        if table not in REPLICATED_TABLES:
+            return self.remote.delete(table, eq)
+        pending, eq = self._split_pending_ids(table, eq)
+        deleted = []
+        if pending:
+            # Задание ещё не отправлено: отменяем его вставку в очереди
+            deleted = self._cancel_offline(table, pending)
+        if eq is not None:
+            try:
+                deleted += self.remote.delete(table, eq)
+            except TRANSIENT_ERRORS as e:
+                logger.warning("Supabase unreachable, delete queued: %s", e, extra={"table": table})
+                with self.local.transaction():
+                    self._enqueue([("delete", table, {"eq": eq})])
+                    deleted += self.local.delete(table, eq)
+            else:
+                self._apply_remote(table, "delete", eq)
+        self._bump_versions([table])
+        return deleted
+
+    def _apply_remote(self, table, op, value):
+        """
+        Переносит в копию запись, уже принятую Supabase (op: upsert - строки,
+        delete - условие eq), и запоминает её в журнале для pull()
+        """
+        with self.local.transaction() as conn:
+            self._apply(table, op, value)
+            conn.execute("INSERT INTO recent_writes (table_name, op, payload, written_at) VALUES (?, ?, ?, ?)",
+                         (table, op, json.dumps(value, ensure_ascii=False, default=str), time.time()))
+
+    def _apply(self, table, op, value):
+        if op == "upsert":
+            self.local.upsert(table, value, key="id")
+        else:
+            self.local.delete(table, value)
+
+    # --- Очередь записей ---
+    def _enqueue(self, entries):
+        now = time.time()
+        with self.local.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO outbox (op, table_name, payload, created_at) VALUES (?, ?, ?, ?)",
+                [(op, table, json.dumps(payload, ensure_ascii=False, default=str), now)
+                 for op, table, payload in entries])
+        self.stats["queued_writes"] += len(entries)
+        self._wake.set()
+
+    def _insert_offline(self, table, rows):
+        """Строки с временными отрицательными id; настоящие id назначит Supabase при отправке"""
+        inserted = []
+        with self.local.transaction() as conn:
+            lowest = conn.execute(f"SELECT MIN(id) FROM {table} WHERE typeof(id) = 'integer'").fetchone()[0]
+            next_id = min(-1, (lowest or 0) - 1)
+            for row in rows:
+                local_row = self.local.insert(table, [{**row, "id": next_id}])[0]
+                self._enqueue([("insert", table, {"row": row, "local_id": next_id})])
+                inserted.append(local_row)
+                next_id -= 1
+        return inserted
+
+    @staticmethod
+    def _ids(eq):
+        value = (eq or {}).get("id")
+        if value is None or len(eq) != 1:
+            return None
+        return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+    def _split_pending_ids(self, table, eq):
+        """Делит delete по id на ещё не отправленные (временные) и обычные"""
+        ids = self._ids(eq)
+        if not ids:
+            return [], eq
+        pending = [i for i in ids if isinstance(i, int) and i < 0]
+        rest = [i for i in ids if not (isinstance(i, int) and i < 0)]
+        return pending, ({"id": rest} if rest else None)
+
+    def _cancel_offline(self, table, ids):
+        with self.local.transaction() as conn:
+            for row in conn.execute(
+                    "SELECT id, payload FROM outbox WHERE state = 'pending' AND op = 'insert' AND table_name = ?",
+                    (table,)).fetchall():
+                if json.loads(row["payload"]).get("local_id") in ids:
+                    conn.execute("DELETE FROM outbox WHERE id = ?", (row["id"],))
+            return self.local.delete(table, {"id": ids})
+
+    def pending(self):
+        return self.local._connection().execute(
+            "SELECT COUNT(*) FROM outbox WHERE state = 'pending'").fetchone()[0]
+
+    def _claim(self):
+        now = time.time()
+        with self.local.transaction() as conn:
+            rows = conn.execute(
+                "SELECT * FROM outbox WHERE state = 'pending' AND (claimed_at IS NULL OR claimed_at < ?) "
+                "ORDER BY id LIMIT ?", (now - REPLICA_CLAIM_TIMEOUT, REPLICA_PUSH_BATCH)).fetchall()
+            conn.executemany("UPDATE outbox SET claimed_by = ?, claimed_at = ? WHERE id = ?",
+                             [(self._owner, now, row["id"]) for row in rows])
+        return [dict(row) for row in rows]
+
+    def push(self):
+        """Отправляет очередь в Supabase. Возвращает число отправленных записей"""
+        pushed = 0
+        offline = False
+        entries = self._claim()
+        changed = set()
+        for i, entry in enumerate(entries):
+            try:
+                self._push_entry(entry)
+            except TRANSIENT_ERRORS as e:
+                # Supabase недоступен: всё оставшееся вернётся в очередь
+                offline = True
+                self.stats["push_errors"] += 1
+                self._failures += 1
+                log = logger.warning if self._failures == 1 else logger.debug
+                log("replica push postponed, Supabase unreachable: %s", e, extra={"failures": self._failures})
+                self._release(entries[i:], str(e), count=False)
+                break
+            except Exception as e:
+                self.stats["push_errors"] += 1
+                logger.error("replica push failed: %s", e, extra={"op": entry["op"], "table": entry["table_name"]})
+                self._release([entry], str(e), count=True)
+                continue
+            pushed += 1
+            changed.add(entry["table_name"])
+        if entries and not offline and self._failures:
+            logger.info("replica push resumed", extra={"failures": self._failures})
+            self._failures = 0
+        self.stats["pushed"] += pushed
+        if changed:
+            self._bump_versions(changed)
+            self._notify(changed)
+        return pushed
+
+    def _push_entry(self, entry):
+        op, table = entry["op"], entry["table_name"]
+        payload = json.loads(entry["payload"])
+        done = [entry["id"]]
+        if op == "insert":
+            row = self.remote.insert(table, [payload["row"]])[0]
+            with self.local.transaction():
+                self.local.delete(table, {"id": payload["local_id"]})
+                self._apply_remote(table, "upsert", [row])
+                self._finish(done)
+        elif op == "upsert":
+            rows = self.remote.upsert(table, [payload["row"]], payload["key"])
+            with self.local.transaction():
+                self._apply_remote(table, "upsert", rows)
+                self._finish(done)
+        elif op == "update":
+            rows = self.remote.update(table, payload["values"], payload["eq"])
+            with self.local.transaction():
+                self._apply_remote(table, "upsert", rows)
+                self._finish(done)
+        elif op == "delete":
+            self.remote.delete(table, payload["eq"])
+            with self.local.transaction():
+                self._apply_remote(table, "delete", payload["eq"])
+                self._finish(done)
+        else:
+            raise ValueError(f"Unknown outbox op: {op}")
+
+    def _finish(self, ids):
+        with self.local.transaction() as conn:
+            conn.executemany("DELETE FROM outbox WHERE id = ?", [(i,) for i in ids])
+
+    def _release(self, entries, error, count):
+        with self.local.transaction() as conn:
+            for entry in entries:
+                attempts = entry["attempts"] + (1 if count else 0)
+                state = "dead" if attempts >= REPLICA_MAX_ATTEMPTS else "pending"
+                conn.execute(
+                    "UPDATE outbox SET state = ?, attempts = ?, last_error = ?, claimed_by = NULL, claimed_at = NULL "
+                    "WHERE id = ?", (state, attempts, error[:500], entry["id"]))
+                if state == "dead":
+                    logger.error("outbox entry dropped after %s attempts", attempts, extra={
+                        "outbox_id": entry["id"], "op": entry["op"], "table": entry["table_name"]})
+
+    # --- Загрузка из Supabase ---
+    def _ever_pulled(self):
+        row = self.local._connection().execute(
+            "SELECT COUNT(*) FROM sync_state WHERE pulled_at IS NOT NULL").fetchone()
+        return row[0] > 0
+
+    def _fetch_table(self, table):
+        rows, offset = [], 0
+        while True:
+            page = self.remote.select(table, order=(("id", False),), limit=REPLICA_PAGE_SIZE, offset=offset)
+            rows.extend(page)
+            if len(page) < REPLICA_PAGE_SIZE:
+                return rows
+            offset += REPLICA_PAGE_SIZE
+
+    def pull(self, skip_recent=False):
+        """Перечитывает реплицируемые таблицы; возвращает список изменившихся"""
+        changed = []
+        with self.local.transaction() as conn:
+            conn.execute("DELETE FROM recent_writes WHERE written_at < ?", (time.time() - REPLICA_JOURNAL_TTL,))
+        for table in REPLICATED_TABLES:
+            conn = self.local._connection()
+            state = conn.execute("SELECT digest, pulled_at FROM sync_state WHERE table_name = ?", (table,)).fetchone()
+            if skip_recent and state and state["pulled_at"] and time.time() - state["pulled_at"] < self._pull_interval / 2:
+                # Другой воркер только что обновил эту таблицу
+                continue
+            fetch_started = time.time()
+            rows = self._fetch_table(table)
+            digest = _digest(rows)
+            with self.local.transaction() as conn:
+                if state is None or state["digest"] != digest:
+                    # Строки, ещё не отправленные в Supabase (временные id), сохраняются
+                    conn.execute(f"DELETE FROM {table} WHERE NOT (typeof(id) = 'integer' AND id < 0)")
+                    self.local.insert(table, rows)
+                    self._reapply_recent(table, fetch_started)
+                    self._reapply_pending(table)
+                    self._bump_version(conn, table)
+                    changed.append(table)
+                conn.execute(
+                    "INSERT INTO sync_state (table_name, digest, pulled_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(table_name) DO UPDATE SET digest = excluded.digest, pulled_at = excluded.pulled_at",
+                    (table, digest, time.time()))
+        self.stats["pulls"] += 1
+        self.stats["last_pull"] = time.time()
+        if changed:
+            logger.info("replica refreshed", extra={"tables": changed})
+            self._notify(changed)
+        return changed
+
+    def _reapply_recent(self, table, since):
+        """Записи, принятые Supabase после начала чтения снимка, могли в него не попасть"""
+        for row in self.local._connection().execute(
+                "SELECT op, payload FROM recent_writes WHERE table_name = ? AND written_at >= ? ORDER BY id",
+                (table, since)).fetchall():
+            self._apply(table, row["op"], json.loads(row["payload"]))
+
+    def _reapply_pending(self, table):
+        """Неотправленные изменения поверх свежей копии, чтобы они не «откатились» до отправки"""
+        conn = self.local._connection()
+        for row in conn.execute(
+                "SELECT op, payload FROM outbox WHERE state = 'pending' AND table_name = ? AND op != 'insert' "
+                "ORDER BY id", (table,)).fetchall():
+            payload = json.loads(row["payload"])
+            if row["op"] == "update":
+                self.local.update(table, payload["values"], payload["eq"])
+            elif row["op"] == "delete":
+                self.local.delete(table, payload["eq"])
+            elif row["op"] == "upsert":
+                self.local.upsert(table, [payload["row"]], payload["key"])
+
+    # --- Версии для других процессов ---
+    def _read_versions(self):
+        return {row["table_name"]: row["version"] for row in self.local._connection().execute(
+            "SELECT table_name, version FROM sync_state")}
+
+    def _remember_versions(self):
+        versions = self._read_versions()
+        with self._versions_lock:
+            self._versions = versions
+
+    def _bump_version(self, conn, table):
+        """
+        +1 к версии таблицы внутри транзакции conn. Своё изменение процесс
+        уже учёл; если версия до этого сменилась другим процессом, запомненная
+        остаётся старой и _check_versions сообщит об изменении.
+        """
+        row = conn.execute("SELECT version FROM sync_state WHERE table_name = ?", (table,)).fetchone()
+        previous = row["version"] if row else 0
+        conn.execute("INSERT INTO sync_state (table_name, version) VALUES (?, 1) "
+                     "ON CONFLICT(table_name) DO UPDATE SET version = version + 1", (table,))
+        with self._versions_lock:
+            if self._versions.get(table, 0) == previous:
+                self._versions[table] = previous + 1
+
+    def _bump_versions(self, tables):
+        with self.local.transaction() as conn:
+            for table in tables:
+                self._bump_version(conn, table)
+
+    def _check_versions(self):
+        versions = self._read_versions()
+        with self._versions_lock:
+            changed = [t for t, v in versions.items() if self._versions.get(t, 0) < v]
+            self._versions.update({t: versions[t] for t in changed})
+        if changed:
+            self._notify(changed)
+
+    def snapshot(self):
+        last_pull = self.stats["last_pull"]
+        return {
+            **self.stats,
+            "last_pull_age_s": round(time.time() - last_pull, 1) if last_pull else None,
+            "outbox_pending": self.pending(),
+        }
+
+
+def open_replica(supabase, path=REPLICA_PATH):
+    return ReplicatedBackend(SupabaseBackend(supabase), SQLiteBackend(path)).start()
@@ -0,0 +1,281 @@
+"""
+Слой доступа к данным: UsersRepo, HomeworkRepo, AttendanceRepo.
+
+Маршруты обоих Flask-приложений работают с таблицами только через
+репозитории, а хранилище выбирается переменной DATA_BACKEND
+(supabase | replica | sqlite | json, см. data_backends.py и replica.py).
+
+Чтения пользователей и профилей идут через общий кэш со сквозной
+загрузкой (read-through): промах загружает значение один раз, параллельные
+промахи по тому же ключу ждут этой загрузки. Задания здесь не кэшируются -
+их ответы кэширует app.py. Любая запись через репозиторий сбрасывает кэш
+своей таблицы и вызывает подписчиков on_change (например, кэш ответов
+со strong ETag). Изменения из других процессов подхватываются по TTL.
+Пакетные операции режут строки на пачки по REPO_BATCH_SIZE.
+"""
+import os
+import threading
+import time
+
+from data_backends import create_backend
+
+DATA_BACKEND = os.getenv("DATA_BACKEND", "").strip().lower()
+DATA_DIR = os.getenv("DATA_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SQLITE_PATH = os.getenv("SQLITE_PATH") or os.path.join(DATA_DIR, "studycore.db")
+# Время жизни кэша репозиториев в секундах (0 - только до записи)
+REPO_CACHE_TTL = float(os.getenv("REPO_CACHE_TTL", "30"))
+REPO_BATCH_SIZE = int(os.getenv("REPO_BATCH_SIZE", "500"))
+# Больше строк GET /api/users?limit= не отдаёт
+PROFILE_LIST_MAX = int(os.getenv("PROFILE_LIST_MAX", "1000"))
+
+HOMEWORK_ORDER = (("created_at", True), ("id", True))
+PROFILE_FIELDS = ("id", "username", "role", "created_at")
+
+
+def chunks(rows, size=REPO_BATCH_SIZE):
+    rows = list(rows)
+    size = max(1, size)
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+class ReadThroughCache:
+    """Значения по ключу с TTL; загрузка под блокировкой ключа"""
+
+    def __init__(self, ttl=REPO_CACHE_TTL):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._key_locks = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _fresh(self, entry):
+        return entry is not None and (self._ttl <= 0 or time.monotonic() - entry[1] <= self._ttl)
+
+    def get(self, key, loader):
+        entry = self._entries.get(key)
+        if self._fresh(entry):
+            self.hits += 1
+            return entry[0]
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            entry = self._entries.get(key)
+            if self._fresh(entry):
+                self.hits += 1
+                return entry[0]
+            generation = self._generation
+            value = loader()
+            self.misses += 1
+            with self._lock:
+                # Запись во время загрузки: результат мог устареть, не кэшируем
+                if generation == self._generation:
+                    self._entries[key] = (value, time.monotonic())
+            return value
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._entries = {}
+
+    def snapshot(self):
+        return {"keys": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class Repository:
+    table = None
+
+    def __init__(self, backend, ttl=REPO_CACHE_TTL, batch_size=REPO_BATCH_SIZE):
+        self.backend = backend
+        self.batch_size = batch_size
+        self.cache = ReadThroughCache(ttl)
+        self._listeners = []
+
+    def on_change(self, callback):
+        """callback() вызывается после каждой записи через репозиторий"""
+        self._listeners.append(callback)
+        return callback
+
+    def invalidate(self):
+        self.cache.invalidate()
+        for callback in self._listeners:
+            callback()
+
+    def _insert_batched(self, table, rows):
+        inserted = []
+        for batch in chunks(rows, self.batch_size):
+            inserted.extend(self.backend.insert(table, batch))
+        return inserted
+
+
+class UsersRepo(Repository):
+    """Таблица users (вход по паролю) и profiles (аккаунты Supabase Auth)"""
+
+    table = "users"
+
+    def all(self):
+        return self.cache.get(("all",), lambda: self.backend.select("users"))
+
+    def find_by_password(self, password):
+        rows = self.backend.select("users", eq={"password": password}, limit=1)
+        return rows[0] if rows else None
+
+    def find_by_logins(self, logins):
+        rows = []
+        for batch in chunks(logins, self.batch_size):
+            rows.extend(self.backend.select("users", eq={"login": batch}))
+        return rows
+
+    def find_by_passwords(self, passwords):
+        rows = []
+        for batch in chunks(passwords, self.batch_size):
+            rows.extend(self.backend.select("users", eq={"password": batch}))
+        return rows
+
+    def insert_many(self, users):
+        try:
+            return self._insert_batched("users", users)
+        finally:
+            self.invalidate()
+
+    def upsert_many(self, users, key="login"):
+        """Вставка или обновление по key (повторный импорт не создаёт дублей)"""
+        upserted = []
+        try:
+            for batch in chunks(users, self.batch_size):
+                upserted.extend(self.backend.upsert("users", batch, key))
+        finally:
+            self.invalidate()
+        return upserted
+
+    def list_profiles(self, limit=None):
+        """
+        Профили от новых к старым. limit обрезается до PROFILE_LIST_MAX, а в
+        кэше лежат только два списка (весь и первые PROFILE_LIST_MAX), поэтому
+        произвольные значения limit не плодят ключи кэша.
+        """
+        if limit is None:
+            key, load_limit = ("profiles",), None
+        else:
+            limit = max(1, min(limit, PROFILE_LIST_MAX))
+            key, load_limit = ("profiles", PROFILE_LIST_MAX), PROFILE_LIST_MAX
+        rows = self.cache.get(key, lambda: self.backend.select(
+            "profiles", columns=PROFILE_FIELDS, order=(("created_at", True),), limit=load_limit))
+        return rows if limit is None else rows[:limit]
+
+    def get_profile(self, profile_id):
+        rows = self.backend.select("profiles", columns=PROFILE_FIELDS, eq={"id": profile_id})
+        return rows[0] if rows else None
+
+    def update_role(self, profile_id, role):
+        rows = self.backend.update("profiles", {"role": role}, eq={"id": profile_id})
+        self.invalidate()
+        return rows[0] if rows else None
+
+
+class HomeworkRepo(Repository):
+    """
+    Задания не кэшируются здесь: список и первые страницы ленты кэширует
+    app.py вместе с телом ответа и ETag (response_cache), и у кэша один
+    путь сброса - on_change.
+    """
+
+    table = "homework"
+
+    def all(self):
+        return self.backend.select("homework")
+
+    def page(self, fields, limit, after=None):
+        """
+        limit строк ленты (created_at desc, id desc) после строки-курсора after
+        ({"created_at": ..., "id": ...})
+        """
+        return self.backend.select("homework", columns=fields, order=HOMEWORK_ORDER, limit=limit, after=after)
+
+    def get_many(self, ids):
+        """Задания по списку id одним запросом на пачку"""
+        rows = []
+        for batch in chunks(ids, self.batch_size):
+            rows.extend(self.backend.select("homework", eq={"id": batch}))
+        return rows
+
+    def add(self, homework):
+        rows = self.add_many([homework])
+        return rows[0] if rows else None
+
+    def add_many(self, homework):
+        try:
+            return self._insert_batched("homework", homework)
+        finally:
+            self.invalidate()
+
+    def delete(self, homework_id):
+        return self.delete_many([homework_id])
+
+    def delete_many(self, ids):
+        deleted = []
+        try:
+            for batch in chunks(ids, self.batch_size):
+                deleted.extend(self.backend.delete("homework", eq={"id": batch}))
+        finally:
+            self.invalidate()
+        return deleted
+
+
+class AttendanceRepo(Repository):
+    """Посещаемость не кэшируется: агрегаты держит attendance_rollup"""
+
+    table = "attendance"
+
+    def insert_many(self, rows):
+        return self._insert_batched("attendance", rows)
+
+    def page_since(self, start_iso, limit, after=None, columns=("id", "created_at", "role")):
+        """Строки с created_at >= start_iso по возрастанию (created_at, id); after - последняя строка прошлой страницы"""
+        return self.backend.select("attendance", columns=columns, gte={"created_at": start_iso},
+                                   order=(("created_at", False), ("id", False)), limit=limit, after=after)
+
+
+class Repositories:
+    """Репозитории поверх одного хранилища"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.users = UsersRepo(backend)
+        self.homework = HomeworkRepo(backend)
+        self.attendance = AttendanceRepo(backend)
+        if hasattr(backend, "on_change"):
+            # Реплика сообщает об изменениях, пришедших из Supabase
+            backend.on_change(self._table_changed)
+
+    def _table_changed(self, table):
+        repo = {"users": self.users, "profiles": self.users, "homework": self.homework}.get(table)
+        if repo is not None:
+            repo.invalidate()
+
+    @property
+    def kind(self):
+        return type(self.backend).__name__
+
+    def snapshot(self):
+        result = {
+            "backend": self.kind,
+            "users": self.users.cache.snapshot(),
+        }
+        if hasattr(self.backend, "snapshot"):
+            result["sync"] = self.backend.snapshot()
+        return result
+
+
+def open_repositories(default="supabase", supabase=None, kind=None):
+    """Репозитории для DATA_BACKEND (или default, если переменная не задана)"""
+    kind = kind or DATA_BACKEND or default
+    if kind == "replica":
+        # Импорт здесь: реплике нужен фоновый поток, JSON-режиму корневого app.py - нет
+        from replica import open_replica
+        if supabase is None:
+            raise ValueError("DATA_BACKEND=replica requires a Supabase client")
+        return Repositories(open_replica(supabase))
+    return Repositories(create_backend(kind, supabase=supabase, sqlite_path=SQLITE_PATH, data_dir=DATA_DIR))
@@ -0,0 +1,91 @@
+"""
+Кэш сериализованных JSON-ответов со strong ETag.
+
+Данные загружаются один раз, сериализуются в байты и хранятся вместе
+с ETag (SHA-256 тела). Запись в таблицу вызывает invalidate(), а TTL
+подхватывает изменения, сделанные другими процессами.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+HOMEWORK_CACHE_TTL = float(os.getenv("HOMEWORK_CACHE_TTL", "30"))
+
+
+def serialize(data):
+    """Сериализует данные в компактный JSON и считает strong ETag"""
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return body, hashlib.sha256(body).hexdigest()
+
+
+class CachedJSON:
+    """
+    loader() -> данные, которые нужно отдать клиенту.
+    get() -> (data, body_bytes, etag)
+    """
+
+    def __init__(self, loader, ttl=HOMEWORK_CACHE_TTL):
+        self._loader = loader
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entry = None
+        self._loaded_at = None
+        self.hits = 0
+        self.misses = 0
+
+    def _is_stale(self):
+        if self._entry is None:
+            return True
+        return self._ttl > 0 and time.monotonic() - self._loaded_at > self._ttl
+
+    def get(self):
+        entry, loaded_at = self._entry, self._loaded_at
+        if entry is not None and (self._ttl <= 0 or time.monotonic() - loaded_at <= self._ttl):
+            self.hits += 1
+            return entry
+        with self._lock:
+            if not self._is_stale():
+                self.hits += 1
+                return self._entry
+            # Загрузка идёт под блокировкой: параллельные промахи ждут один запрос к БД
+            data = self._loader()
+            body, etag = serialize(data)
+            self._entry = (data, body, etag)
+            self._loaded_at = time.monotonic()
+            self.misses += 1
+            return self._entry
+
+    def invalidate(self):
+        with self._lock:
+            self._entry = None
+
+
+class CachedJSONMap:
+    """
+    Несколько CachedJSON по ключу (например, по параметрам первой страницы).
+    loader(key) -> данные для этого ключа.
+    """
+
+    def __init__(self, loader, ttl=HOMEWORK_CACHE_TTL, max_keys=32):
+        self._loader = loader
+        self._ttl = ttl
+        self._max_keys = max_keys
+        self._lock = threading.Lock()
+        self._caches = {}
+
+    def get(self, key):
+        with self._lock:
+            cache = self._caches.get(key)
+            if cache is None:
+                if len(self._caches) >= self._max_keys:
+                    # Простое вытеснение: самый старый ключ
+                    self._caches.pop(next(iter(self._caches)))
+                cache = CachedJSON(lambda: self._loader(key), ttl=self._ttl)
+                self._caches[key] = cache
+        return cache.get()
+
+    def invalidate(self):
+        with self._lock:
+            self._caches = {}
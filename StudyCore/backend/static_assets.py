@@ -0,0 +1,262 @@
+"""
+Раздача собранного фронтенда (dist/) из манифеста в памяти.
+
+При старте dist/ сканируется один раз: для каждого файла запоминаются
+тип, ETag и заранее сжатые gzip/brotli-версии. На запрос не делается
+ни одного stat - файл ищется в словаре. Ассеты с хешем в имени
+(assets/index-1e3fb0c2.js) отдаются с Cache-Control: immutable,
+index.html и прочее - с ETag и no-cache.
+
+Сборка Vite пишет asset-manifest.json (точка входа -> файл с хешем).
+Если манифест есть, из assets/ загружаются только перечисленные в нём
+файлы, а остатки старых сборок игнорируются. При деплое сборка
+копируется в отдельный каталог, а dist/ - симлинк на него, который
+подменяется атомарно; лишние хеши удаляются:
+    python static_assets.py deploy StudyCore/frontend/dist dist
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+import sys
+import time
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Файлы больше этого размера не держим в памяти, отдаём с диска
+STATIC_MEMORY_LIMIT = int(os.getenv("STATIC_MEMORY_LIMIT", str(1024 * 1024)))
+# Сжимаем только текстовые файлы не меньше этого размера
+STATIC_COMPRESS_MIN = int(os.getenv("STATIC_COMPRESS_MIN", "1024"))
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+HASHED_ASSET_RE = re.compile(r"-[0-9a-zA-Z_]{8,}\.[a-z0-9]+$")
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+# Имя манифеста задаётся в vite.config.mjs (build.manifest)
+ASSET_MANIFEST = "asset-manifest.json"
+# Сколько сборок (включая текущую) хранить рядом с dist/ после деплоя
+STATIC_KEEP_RELEASES = int(os.getenv("STATIC_KEEP_RELEASES", "2"))
+
+
+class StaticEntry:
+    __slots__ = ("path", "abs_path", "content_type", "etag", "immutable", "variants")
+
+    def __init__(self, path, abs_path, content_type, etag, immutable):
+        self.path = path
+        self.abs_path = abs_path
+        self.content_type = content_type
+        self.etag = etag
+        self.immutable = immutable
+        # encoding -> bytes ("identity" есть только у файлов в памяти)
+        self.variants = {}
+
+
+def _content_type(path):
+    content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if content_type == "text/javascript":
+        content_type = "application/javascript"
+    if content_type.startswith("text/") or content_type == "application/javascript":
+        content_type += "; charset=utf-8"
+    return content_type
+
+
+def _read_prebuilt(abs_path, suffix):
+    prebuilt = abs_path + suffix
+    if os.path.isfile(prebuilt):
+        with open(prebuilt, "rb") as f:
+            return f.read()
+    return None
+
+
+def load_asset_manifest(dist_dir):
+    """Манифест сборки Vite или None, если его нет"""
+    path = os.path.join(dist_dir, ASSET_MANIFEST)
+    if not os.path.isfile(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def manifest_files(manifest):
+    """Все файлы, на которые ссылается манифест (JS, CSS, шрифты, картинки)"""
+    files = set()
+    for chunk in manifest.values():
+        files.add(chunk["file"])
+        files.update(chunk.get("css", []))
+        files.update(chunk.get("assets", []))
+    return files
+
+
+def _walk(dist_dir):
+    """(относительный путь, абсолютный путь) всех файлов кроме .gz/.br"""
+    for root, _, files in os.walk(dist_dir):
+        for name in files:
+            if name.endswith((".gz", ".br")):
+                continue
+            abs_path = os.path.join(root, name)
+            yield os.path.relpath(abs_path, dist_dir).replace(os.sep, "/"), abs_path
+
+
+def _is_stale(path, referenced):
+    return path.startswith("assets/") and path not in referenced
+
+
+def prune(dist_dir, manifest=None):
+    """Удаляет из assets/ файлы, которых нет в манифесте. Возвращает удалённые пути"""
+    manifest = manifest if manifest is not None else load_asset_manifest(dist_dir)
+    if manifest is None:
+        return []
+    referenced = manifest_files(manifest)
+    removed = []
+    for path, abs_path in list(_walk(dist_dir)):
+        if _is_stale(path, referenced):
+            for suffix in ("", ".gz", ".br"):
+                if os.path.isfile(abs_path + suffix):
+                    os.remove(abs_path + suffix)
+            removed.append(path)
+    return sorted(removed)
+
+
+def deploy(src_dir, dest_dir, keep=STATIC_KEEP_RELEASES):
+    """
+    Выкладывает свежую сборку: файлы копируются в новый каталог
+    <dest_dir>.releases/<время>, а dest_dir - симлинк, который подменяется
+    одним os.replace. Сервер в любой момент видит либо старую сборку, либо
+    новую целиком, и dist/ не пропадает ни на миг. Хранятся keep последних
+    сборок: большие файлы раздаются с диска по пути предыдущей сборки,
+    пока процесс не перезапущен.
+
+    Первый деплой поверх обычного каталога dest_dir не атомарен: каталог
+    переносится в releases и на его месте создаётся симлинк (между двумя
+    переименованиями dist/ отсутствует).
+    """
+    if load_asset_manifest(src_dir) is None:
+        raise FileNotFoundError(f"{ASSET_MANIFEST} not found in {src_dir}")
+    dest_dir = os.path.abspath(dest_dir)
+    releases = dest_dir + ".releases"
+    os.makedirs(releases, exist_ok=True)
+    release = os.path.join(releases, time.strftime("%Y%m%d%H%M%S") + f"-{os.getpid()}")
+    shutil.copytree(src_dir, release)
+    removed = prune(release)
+
+    if os.path.isdir(dest_dir) and not os.path.islink(dest_dir):
+        os.rename(dest_dir, os.path.join(releases, "legacy"))
+    link = dest_dir + ".link"
+    if os.path.lexists(link):
+        os.remove(link)
+    # Относительная ссылка: каталог можно переносить вместе с releases
+    os.symlink(os.path.relpath(release, os.path.dirname(dest_dir)), link)
+    os.replace(link, dest_dir)
+
+    current = os.path.basename(release)
+    # Имена сборок - время деплоя; перенесённый старый каталог самый ранний
+    old = sorted((name for name in os.listdir(releases) if name != current),
+                 key=lambda name: (name != "legacy", name))
+    for name in old[:max(0, len(old) - (keep - 1))]:
+        shutil.rmtree(os.path.join(releases, name), ignore_errors=True)
+    return removed
+
+
+class StaticManifest:
+    def __init__(self, dist_dir):
+        self.dist_dir = dist_dir
+        self.entries = {}
+        self.index = None
+        self.stale = []
+        self.build()
+
+    def build(self):
+        entries = {}
+        stale = []
+        if os.path.isdir(self.dist_dir):
+            # dist/ - симлинк на сборку: файлы с диска читаем из неё, а не
+            # из того, на что dist/ укажет после следующего деплоя
+            root = os.path.realpath(self.dist_dir)
+            manifest = load_asset_manifest(root)
+            referenced = manifest_files(manifest) if manifest is not None else None
+            for path, abs_path in _walk(root):
+                if path == ASSET_MANIFEST:
+                    continue
+                # Без манифеста раздаём всё, как раньше
+                if referenced is not None and _is_stale(path, referenced):
+                    stale.append(path)
+                    continue
+                entries[path] = self._load(path, abs_path)
+        self.entries = entries
+        self.index = entries.get("index.html")
+        self.stale = sorted(stale)
+        return len(entries)
+
+    def _load(self, path, abs_path):
+        content_type = _content_type(path)
+        immutable = path.startswith("assets/") and bool(HASHED_ASSET_RE.search(path))
+        size = os.path.getsize(abs_path)
+        if size > STATIC_MEMORY_LIMIT:
+            stat = os.stat(abs_path)
+            etag = f"{stat.st_size:x}-{int(stat.st_mtime):x}"
+            return StaticEntry(path, abs_path, content_type, etag, immutable)
+
+        with open(abs_path, "rb") as f:
+            data = f.read()
+        entry = StaticEntry(path, abs_path, content_type, hashlib.sha256(data).hexdigest()[:32], immutable)
+        entry.variants["identity"] = data
+        if size >= STATIC_COMPRESS_MIN and content_type.startswith(COMPRESSIBLE_TYPES):
+            # Берём собранные при сборке .gz/.br, иначе сжимаем один раз здесь
+            gz = _read_prebuilt(abs_path, ".gz") or gzip.compress(data, compresslevel=9, mtime=0)
+            if len(gz) < size:
+                entry.variants["gzip"] = gz
+            br = _read_prebuilt(abs_path, ".br")
+            if br is None and brotli is not None:
+                br = brotli.compress(data, quality=11)
+            if br is not None and len(br) < size:
+                entry.variants["br"] = br
+        return entry
+
+    def lookup(self, path):
+        """Файл по пути или index.html для маршрутов SPA (None, если фронтенд не собран)"""
+        return self.entries.get(path) or self.index
+
+    @staticmethod
+    def _choose_encoding(entry, accept_encoding):
+        accepted = {part.split(";")[0].strip().lower() for part in (accept_encoding or "").split(",")}
+        for encoding in ("br", "gzip"):
+            if encoding in entry.variants and encoding in accepted:
+                return encoding
+        return "identity"
+
+    def response(self, entry, request):
+        # Flask - только для раздачи: deploy запускается в build.sh до pip install
+        from flask import Response, send_file
+
+        encoding = self._choose_encoding(entry, request.headers.get("Accept-Encoding"))
+        etag = entry.etag if encoding == "identity" else f"{entry.etag}-{encoding}"
+
+        if "identity" in entry.variants:
+            response = Response(entry.variants[encoding], content_type=entry.content_type)
+        else:
+            response = send_file(entry.abs_path, mimetype=entry.content_type, conditional=False, etag=False)
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+        if len(entry.variants) > 1:
+            response.headers["Vary"] = "Accept-Encoding"
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE if entry.immutable else REVALIDATE_CACHE
+        return response.make_conditional(request)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "deploy":
+        removed = deploy(sys.argv[2], sys.argv[3])
+    elif len(sys.argv) == 3 and sys.argv[1] == "prune":
+        removed = prune(sys.argv[2])
+    else:
+        print("Usage: python static_assets.py deploy <src_dist> <dest_dist> | prune <dist>")
+        sys.exit(2)
+    print(f"Stale assets removed: {len(removed)}")
+    for path in removed:
+        print(f"  {path}")
@@ -0,0 +1,234 @@
+"""
+Потоковая загрузка файлов в Supabase Storage.
+
+Загрузка сначала копируется на диск кусками по UPLOAD_CHUNK_SIZE,
+затем отправляется в Storage из открытого файла (httpx читает его
+порциями). Большие файлы уходят через resumable-протокол TUS
+кусками по 6MB, с докачкой после обрыва. Пиковая память на одну
+загрузку ограничена размером куска, а не размером файла.
+
+Имя объекта - SHA-256 содержимого, посчитанный при копировании на диск.
+Загруженные имена записываются в индекс на диске (SQLite), поэтому
+повторная загрузка того же файла не отправляется в Storage повторно и
+после перезапуска, а проверка не ходит в сеть.
+"""
+import base64
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+import httpx
+
+from structured_log import get_logger
+
+logger = get_logger("storage")
+
+# Размер куска при копировании загрузки на диск
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(64 * 1024)))
+# Файлы больше этого порога загружаются через resumable (TUS)
+RESUMABLE_THRESHOLD = int(os.getenv("UPLOAD_RESUMABLE_THRESHOLD", str(6 * 1024 * 1024)))
+# Supabase требует куски ровно по 6MB (кроме последнего)
+RESUMABLE_CHUNK_SIZE = 6 * 1024 * 1024
+RESUMABLE_MAX_RETRIES = int(os.getenv("UPLOAD_RESUMABLE_MAX_RETRIES", "3"))
+# Сколько известных хешей держать в памяти (перед индексом на диске)
+CONTENT_INDEX_SIZE = int(os.getenv("UPLOAD_CONTENT_INDEX_SIZE", "10000"))
+CONTENT_INDEX_PATH = os.getenv("UPLOAD_CONTENT_INDEX_PATH") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "uploads.db")
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+class SpooledUpload:
+    """Загрузка, сохранённая во временный файл на диске"""
+
+    def __init__(self, path, size, sha256):
+        self.path = path
+        self.size = size
+        self.sha256 = sha256
+
+    def object_name(self, ext):
+        """Имя объекта по содержимому: одинаковые файлы получают одинаковое имя"""
+        return f"{self.sha256}.{ext}"
+
+    def open(self):
+        return open(self.path, "rb")
+
+    def cleanup(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.cleanup()
+
+
+def spool_to_disk(stream, max_size=None, chunk_size=UPLOAD_CHUNK_SIZE):
+    """
+    Копирует поток во временный файл кусками, не держа файл целиком в памяти.
+    Заодно считает SHA-256 содержимого.
+    """
+    fd, path = tempfile.mkstemp(prefix="upload-")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise UploadTooLarge(f"File exceeds {max_size} bytes")
+                digest.update(chunk)
+                out.write(chunk)
+    except Exception:
+        os.remove(path)
+        raise
+    return SpooledUpload(path, size, digest.hexdigest())
+
+
+class ContentIndex:
+    """
+    Множество уже загруженных объектов: таблица uploaded_objects в SQLite
+    (ключ - имя объекта, то есть SHA-256 содержимого) и LRU в памяти перед ней.
+    Storage не опрашивается: объект, которого нет в индексе (например,
+    загруженный до появления индекса), загрузится ещё раз - это безопасно,
+    имя определяется содержимым. Ошибка чтения индекса считается промахом.
+    """
+
+    def __init__(self, path=CONTENT_INDEX_PATH, max_entries=CONTENT_INDEX_SIZE):
+        self._max_entries = max_entries
+        self._known = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS uploaded_objects (name TEXT PRIMARY KEY, added_at REAL NOT NULL)")
+
+    def _remember(self, name):
+        self._known[name] = True
+        self._known.move_to_end(name)
+        while len(self._known) > self._max_entries:
+            self._known.popitem(last=False)
+
+    def contains(self, name):
+        with self._lock:
+            if name in self._known:
+                self._known.move_to_end(name)
+                return True
+            try:
+                found = self._conn.execute(
+                    "SELECT 1 FROM uploaded_objects WHERE name = ?", (name,)).fetchone() is not None
+            except sqlite3.Error as e:
+                logger.warning("content index lookup failed: %s", e)
+                return False
+            if found:
+                self._remember(name)
+            return found
+
+    def add(self, name):
+        with self._lock:
+            self._remember(name)
+            try:
+                self._conn.execute("INSERT OR IGNORE INTO uploaded_objects (name, added_at) VALUES (?, ?)",
+                                   (name, time.time()))
+            except sqlite3.Error as e:
+                # Объект загружен; без записи в индексе он просто загрузится повторно
+                logger.warning("content index write failed: %s", e)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def upload_spooled(supabase, supabase_url, supabase_key, bucket, object_name, spooled, content_type, client=None):
+    """
+    Загружает файл из spool: обычной загрузкой или resumable для больших файлов.
+    client - общий httpx.Client (пул соединений) для resumable-загрузки.
+    """
+    if spooled.size > RESUMABLE_THRESHOLD:
+        return upload_resumable(supabase_url, supabase_key, bucket, object_name, spooled, content_type, client=client)
+    with spooled.open() as f:
+        # BufferedReader передаётся в httpx как есть и читается порциями
+        return supabase.storage.from_(bucket).upload(
+            path=object_name,
+            file=f,
+            # Имя зависит от содержимого, поэтому перезапись безопасна
+            # (и снимает гонку двух одновременных одинаковых загрузок)
+            file_options={"content-type": content_type, "upsert": "true"}
+        )
+
+
+def _b64(value):
+    return base64.b64encode(value.encode("utf-8")).decode("ascii")
+
+
+def upload_resumable(supabase_url, supabase_key, bucket, object_name, spooled, content_type, client=None):
+    """
+    Загрузка по протоколу TUS (Supabase resumable uploads).
+    При обрыве спрашиваем у сервера Upload-Offset и продолжаем с него.
+    """
+    endpoint = f"{supabase_url}/storage/v1/upload/resumable"
+    headers = {
+        "Authorization": f"Bearer {supabase_key}",
+        "apikey": supabase_key,
+        "Tus-Resumable": "1.0.0",
+        "x-upsert": "true",
+    }
+    if client is None:
+        with httpx.Client(timeout=60.0) as own_client:
+            return upload_resumable(supabase_url, supabase_key, bucket, object_name, spooled,
+                                    content_type, client=own_client)
+    create = client.post(endpoint, headers={
+        **headers,
+        "Upload-Length": str(spooled.size),
+        "Upload-Metadata": ",".join([
+            f"bucketName {_b64(bucket)}",
+            f"objectName {_b64(object_name)}",
+            f"contentType {_b64(content_type)}",
+        ]),
+    })
+    create.raise_for_status()
+    location = create.headers["Location"]
+
+    offset = 0
+    retries = 0
+    with spooled.open() as f:
+        while offset < spooled.size:
+            f.seek(offset)
+            chunk = f.read(RESUMABLE_CHUNK_SIZE)
+            try:
+                response = client.patch(location, content=chunk, timeout=60.0, headers={
+                    **headers,
+                    "Upload-Offset": str(offset),
+                    "Content-Type": "application/offset+octet-stream",
+                })
+                response.raise_for_status()
+                offset = int(response.headers.get("Upload-Offset", offset + len(chunk)))
+                retries = 0
+            except httpx.HTTPError:
+                retries += 1
+                if retries > RESUMABLE_MAX_RETRIES:
+                    raise
+                time.sleep(0.5 * (2 ** retries))
+                # Узнаём, сколько байт сервер уже принял; если и это не
+                # удалось, следующая попытка повторит кусок с прежнего offset
+                try:
+                    head = client.head(location, headers=headers)
+                    head.raise_for_status()
+                    offset = int(head.headers.get("Upload-Offset", offset))
+                except httpx.HTTPError as e:
+                    logger.warning("resumable offset check failed: %s", e, extra={"object": object_name})
+    return {"path": object_name, "resumable": True}
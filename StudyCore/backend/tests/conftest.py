@@ -0,0 +1,50 @@
+"""
+Тесты бэкенда: python -m pytest -q (из StudyCore/backend).
+Модули бэкенда импортируются как в app.py - по имени, без пакета.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def supabase_state():
+    """Таблицы фейкового Supabase из bench/fakes.py, общие для всех тестов маршрутов"""
+    from bench.fakes import SupabaseState
+
+    state = SupabaseState()
+    state.seed(students=5, homework=30, attendance_days=3, attendance_per_day=3)
+    return state
+
+
+@pytest.fixture(scope="session")
+def client(supabase_state, tmp_path_factory):
+    """
+    Flask test client для app.py без сети: Supabase и OpenAI - фейки бенчмарка.
+    app.py читает настройки при импорте, поэтому окружение задаётся до него.
+    """
+    from bench.fakes import Latency, fake_openai, fake_supabase
+
+    supabase_server = fake_supabase(supabase_state, Latency()).start()
+    openai_server = fake_openai(Latency(), tokens=5).start()
+    data_dir = tmp_path_factory.mktemp("app")
+    with pytest.MonkeyPatch.context() as env:
+        for name, value in {
+            "SUPABASE_URL": supabase_server.url,
+            "SUPABASE_KEY": "test-service-key",
+            "OPENAI_API_KEY": "sk-test",
+            "OPENAI_BASE_URL": f"{openai_server.url}/v1",
+            "DATA_BACKEND": "supabase",
+            "DATA_DIR": str(data_dir),
+            "ATTENDANCE_SPILL_FILE": str(data_dir / "attendance_spill.jsonl"),
+            "UPLOAD_CONTENT_INDEX_PATH": str(data_dir / "uploads.db"),
+        }.items():
+            env.setenv(name, value)
+        import app
+
+        yield app.app.test_client()
+    supabase_server.stop()
+    openai_server.stop()
@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+
+import ai_scheduler
+from ai_scheduler import AIScheduler, SchedulerBusy
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+def _queue(scheduler, users, order):
+    """Ставит пользователей в очередь строго по порядку; каждый записывает момент получения слота"""
+    def worker(user):
+        with scheduler.slot(user):
+            order.append(user)
+
+    queued = scheduler.snapshot()["queue_depth"]
+    threads = []
+    for user in users:
+        thread = threading.Thread(target=worker, args=(user,))
+        thread.start()
+        threads.append(thread)
+        _wait_until(lambda: scheduler.snapshot()["queue_depth"] == queued + len(threads))
+    return threads
+
+
+def test_waiting_users_are_served_round_robin():
+    scheduler = AIScheduler(rpm=6000, burst=100, max_concurrency=1, queue_timeout=5)
+    scheduler.acquire("holder")
+    order = []
+    threads = _queue(scheduler, ["a", "a", "a", "b", "c"], order)
+    assert scheduler.snapshot()["waiting_users"] == 3
+
+    scheduler.release()
+    for thread in threads:
+        thread.join(5)
+    # Студент с тремя запросами не задерживает остальных
+    assert order == ["a", "b", "c", "a", "a"]
+    assert scheduler.snapshot()["in_flight"] == 0
+
+
+def test_full_queue_rejects_immediately():
+    scheduler = AIScheduler(rpm=6000, burst=100, max_concurrency=1, queue_size=1, queue_timeout=5)
+    scheduler.acquire("holder")
+    threads = _queue(scheduler, ["a"], [])
+    with pytest.raises(SchedulerBusy):
+        scheduler.acquire("b")
+    assert scheduler.snapshot()["rejected"] == 1
+    scheduler.release()
+    for thread in threads:
+        thread.join(5)
+
+
+def test_per_user_cap_rejects_only_that_user():
+    scheduler = AIScheduler(rpm=6000, burst=100, max_concurrency=1, queue_per_user=2, queue_timeout=5)
+    scheduler.acquire("holder")
+    order = []
+    threads = _queue(scheduler, ["a", "a"], order)
+    with pytest.raises(SchedulerBusy):
+        scheduler.acquire("a")
+    # Другой пользователь по-прежнему встаёт в очередь
+    threads += _queue(scheduler, ["b"], order)
+    assert scheduler.snapshot()["queue_depth"] == 3
+
+    scheduler.release()
+    for thread in threads:
+        thread.join(5)
+    assert order == ["a", "b", "a"]
+    assert scheduler.snapshot()["rejected"] == 1
+
+
+def test_wait_timeout_leaves_the_queue():
+    scheduler = AIScheduler(rpm=6000, burst=100, max_concurrency=1, queue_timeout=0.05)
+    scheduler.acquire("holder")
+    with pytest.raises(SchedulerBusy):
+        scheduler.acquire("a")
+    snapshot = scheduler.snapshot()
+    assert (snapshot["queue_depth"], snapshot["waiting_users"], snapshot["timeouts"]) == (0, 0, 1)
+
+
+def test_token_bucket_limits_burst():
+    # 1200 RPM = токен каждые 50 мс, сразу доступны только burst токенов
+    scheduler = AIScheduler(rpm=1200, burst=2, max_concurrency=10, queue_timeout=5)
+    started = time.monotonic()
+    for _ in range(3):
+        scheduler.acquire("a")
+        scheduler.release()
+    assert time.monotonic() - started >= 0.03
+
+
+def test_run_retries_retryable_errors(monkeypatch):
+    monkeypatch.setattr(ai_scheduler.random, "uniform", lambda low, high: 0)
+
+    class RateLimited(Exception):
+        status_code = 429
+
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise RateLimited()
+        return "ok"
+
+    scheduler = AIScheduler(rpm=6000, burst=100, max_retries=3)
+    assert scheduler.run("a", flaky) == "ok"
+    assert len(calls) == 3
+    assert scheduler.snapshot()["retries"] == 2
+    assert scheduler.snapshot()["in_flight"] == 0
+
+    with pytest.raises(ValueError):
+        scheduler.run("a", lambda: (_ for _ in ()).throw(ValueError("bad request")))
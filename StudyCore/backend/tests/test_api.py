@@ -0,0 +1,267 @@
+"""Маршруты app.py через Flask test client (фикстура client - в conftest.py)"""
+import hashlib
+import io
+import json
+import os
+import time
+
+
+def _ndjson(users):
+    return "\n".join(json.dumps(user, ensure_ascii=False) for user in users)
+
+
+def _logins(state):
+    return {row["login"] for row in state.tables["users"]}
+
+
+# --- /api/init-users ---
+def test_init_users_imports_body_and_reports(client, supabase_state):
+    users = [{"login": f"import{i}", "password": f"import-pw-{i}", "name": f"Import {i}", "role": "Student"}
+             for i in range(3)]
+    response = client.post("/api/init-users?batch_size=2", data=_ndjson(users),
+                           content_type="application/x-ndjson")
+    assert response.status_code == 200
+    report = response.get_json()
+    assert (report["received"], report["created"], report["failed"]) == (3, 3, 0)
+    assert {"import0", "import1", "import2"} <= _logins(supabase_state)
+
+    # Повторный импорт ничего не меняет
+    report = client.post("/api/init-users", data=_ndjson(users), content_type="application/x-ndjson").get_json()
+    assert (report["created"], report["updated"], report["unchanged"]) == (0, 0, 3)
+
+
+def test_init_users_dry_run_writes_nothing(client, supabase_state):
+    users = [{"login": "dry-run", "password": "dry-run-pw", "name": "Dry", "role": "Student"}]
+    response = client.post("/api/init-users?dry_run=1", data=json.dumps(users), content_type="application/json")
+    assert response.status_code == 200
+    report = response.get_json()
+    assert report["dry_run"] is True
+    assert report["diff"] == [{"index": 0, "login": "dry-run", "action": "create",
+                               "fields": ["login", "name", "password", "role"]}]
+    assert "dry-run" not in _logins(supabase_state)
+
+
+def test_init_users_malformed_body_is_400(client):
+    response = client.post("/api/init-users", data='[{"login": "a"', content_type="application/json")
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+# --- /api/homework ---
+def _all_pages(client, query):
+    items, cursor = [], None
+    while True:
+        page = client.get(f"/api/homework?{query}" + (f"&cursor={cursor}" if cursor else "")).get_json()
+        items += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items
+
+
+def test_homework_pages_cover_the_full_list_newest_first(client):
+    full = client.get("/api/homework").get_json()
+    paged = _all_pages(client, "limit=7")
+    assert [row["id"] for row in paged] == [row["id"] for row in full]
+    assert [row["created_at"] for row in paged] == sorted((row["created_at"] for row in paged), reverse=True)
+
+
+def test_homework_page_projects_fields_and_truncates_in_list_mode(client):
+    page = client.get("/api/homework?limit=2&fields=title&mode=list").get_json()
+    assert [sorted(row) for row in page["items"]] == [["created_at", "id", "title"]] * 2
+
+    page = client.get("/api/homework?limit=30&fields=description&mode=list").get_json()
+    assert any(row.get("truncated") for row in page["items"])
+    assert all(len(row["description"]) <= 201 for row in page["items"])
+
+
+def test_homework_first_page_answers_304_for_matching_etag(client):
+    response = client.get("/api/homework?limit=5")
+    etag = response.headers["ETag"]
+    again = client.get("/api/homework?limit=5", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.data == b""
+
+
+def test_homework_page_rejects_bad_parameters(client):
+    assert client.get("/api/homework?limit=abc").status_code == 400
+    assert client.get("/api/homework?cursor=not-a-cursor").status_code == 400
+    assert client.get("/api/homework?fields=password").status_code == 400
+
+
+# --- /api/homework/search ---
+def test_search_finds_added_homework_and_forgets_deleted(client):
+    created = client.post("/api/homework", json={"title": "Логарифмы", "description": "Решить логарифмические уравнения"})
+    assert created.status_code == 201
+    homework_id = created.get_json()["id"]
+
+    body = client.get("/api/homework/search?q=логарифмов").get_json()
+    assert (body["total"], [row["id"] for row in body["items"]], body["query"]) == (1, [homework_id], "логарифмов")
+
+    assert client.delete(f"/api/homework/{homework_id}").status_code == 200
+    assert client.get("/api/homework/search?q=логарифмов").get_json()["total"] == 0
+
+
+def test_search_pages_and_truncates_in_list_mode(client):
+    # В сиде 30 заданий «Задание N» с длинным описанием
+    first = client.get("/api/homework/search?q=задание&limit=4&mode=list").get_json()
+    second = client.get("/api/homework/search?q=задание&limit=4&offset=4").get_json()
+    assert first["total"] == second["total"] >= 30
+    assert not {row["id"] for row in first["items"]} & {row["id"] for row in second["items"]}
+    assert all(row["truncated"] for row in first["items"])
+
+
+def test_search_requires_a_query(client):
+    assert client.get("/api/homework/search").status_code == 400
+    assert client.get("/api/homework/search?q=дроби&limit=x").status_code == 400
+
+
+def test_search_rebuild_reports_the_index(client):
+    response = client.post("/api/homework/search/rebuild")
+    assert response.status_code == 200
+    assert response.get_json()["documents"] >= 30
+
+
+# --- /api/ai/chat/stream ---
+def _events(response):
+    """[(event, data)] из тела text/event-stream"""
+    events = []
+    for block in response.get_data(as_text=True).split("\n\n"):
+        if block.strip():
+            name, data = block.split("\n", 1)
+            events.append((name[len("event: "):], json.loads(data[len("data: "):])))
+    return events
+
+
+def test_ai_stream_sends_deltas_then_done_and_caches(client):
+    request = {"message": "Что такое дробь?", "history": [], "user_id": "stream-test"}
+    response = client.post("/api/ai/chat/stream", json=request)
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    events = _events(response)
+    names = [name for name, _ in events]
+    assert names == ["delta"] * (len(names) - 1) + ["done"] and len(names) > 2
+    done = events[-1][1]
+    assert done["response"] == "".join(data["text"] for name, data in events[:-1])
+    assert done["response"].startswith("слово0")
+
+    # Повторный вопрос отдаётся из кэша одним delta
+    cached = _events(client.post("/api/ai/chat/stream", json=request))
+    assert [name for name, _ in cached] == ["delta", "done"]
+    assert cached[1][1] == {"response": done["response"], "success": True, "cached": True}
+
+
+def test_ai_stream_reports_upstream_errors_as_event(client, monkeypatch):
+    import app
+
+    class RateLimited(Exception):
+        status_code = 429
+
+    def fail(call):
+        raise RateLimited("rate limit")
+
+    monkeypatch.setattr(app.ai_scheduler, "retry", fail)
+    events = _events(client.post("/api/ai/chat/stream", json={"message": "Ошибка?", "user_id": "stream-test"}))
+    assert [name for name, _ in events] == ["error"]
+    assert events[0][1]["status"] == 429
+    assert app.ai_scheduler.snapshot()["in_flight"] == 0
+
+
+def test_ai_stream_rejects_empty_message_before_streaming(client):
+    response = client.post("/api/ai/chat/stream", json={"message": "  "})
+    assert response.status_code == 400
+    assert response.is_json
+
+
+# --- /api/upload ---
+def _upload(client, name, data):
+    return client.post("/api/upload", data={"file": (io.BytesIO(data), name)}, content_type="multipart/form-data")
+
+
+def test_upload_is_named_by_content_and_stored_once(client, supabase_state):
+    data = b"%PDF-1.4 route test " + os.urandom(16)
+    first = _upload(client, "notes.pdf", data)
+    assert first.status_code == 200
+    body = first.get_json()
+    assert body["filename"] == hashlib.sha256(data).hexdigest() + ".pdf"
+    assert body["duplicate"] is False
+    assert body["url"].endswith(body["filename"])
+    assert f"homework-files/{body['filename']}" in supabase_state.objects
+    stored = len(supabase_state.objects)
+
+    # Тот же файл под другим именем не загружается повторно
+    again = _upload(client, "copy.pdf", data).get_json()
+    assert (again["filename"], again["duplicate"]) == (body["filename"], True)
+    assert len(supabase_state.objects) == stored
+
+
+def test_image_upload_strips_exif_and_builds_variants(client, supabase_state):
+    from PIL import Image
+
+    exif = Image.Exif()
+    exif[0x010F] = "Route Test Camera"
+    exif[0x0112] = 6
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48), tuple(os.urandom(3))).save(buffer, "JPEG", exif=exif.tobytes())
+    data = buffer.getvalue()
+
+    body = _upload(client, "photo.jpg", data).get_json()
+    # Имя считается по очищенному файлу, а поворот из EXIF сохраняется
+    assert body["filename"] != hashlib.sha256(data).hexdigest() + ".jpg"
+    assert body["processing"] is True
+    assert set(body["variants"]) == {"webp", "thumbnail"}
+    base = body["filename"].rsplit(".", 1)[0]
+    deadline = time.monotonic() + 5
+    while not {f"homework-files/{base}_full.webp", f"homework-files/{base}_thumb.webp"} <= set(supabase_state.objects):
+        assert time.monotonic() < deadline, "variants were not uploaded"
+        time.sleep(0.02)
+
+
+def test_upload_rejects_bad_requests(client):
+    assert client.post("/api/upload", data={}, content_type="multipart/form-data").status_code == 400
+    assert _upload(client, "script.exe", b"MZ").status_code == 400
+    assert _upload(client, "", b"x").status_code == 400
+
+
+# --- /api/attendance ---
+def _attendance_total(client, days=3):
+    return sum(day["count"] for day in client.get(f"/api/attendance?days={days}").get_json())
+
+
+def test_attendance_log_is_counted_without_reading_the_table(client, supabase_state):
+    deadline = time.monotonic() + 5
+    # Первая пересборка счётчиков идёт в фоне после импорта app
+    while _attendance_total(client) == 0:
+        assert time.monotonic() < deadline, "rollup was not built"
+        time.sleep(0.02)
+    before = _attendance_total(client)
+
+    response = client.post("/api/attendance/log", json={"user_id": 1, "username": "Студент 1", "role": "Student"})
+    assert response.status_code == 202
+    while _attendance_total(client) != before + 1:
+        assert time.monotonic() < deadline, "logged visit was not counted"
+        time.sleep(0.02)
+
+    requests = supabase_state.requests
+    assert len(client.get("/api/attendance?days=90").get_json()) == 90
+    assert supabase_state.requests == requests
+
+
+def test_attendance_log_requires_user_id(client):
+    assert client.post("/api/attendance/log", json={"username": "x"}).status_code == 400
+
+
+# --- /metrics ---
+def test_unhandled_exception_is_counted_as_one_error(client, monkeypatch):
+    import app
+    import metrics
+
+    def broken():
+        raise RuntimeError("boom")
+
+    # Иначе Flask пробрасывает исключение в тест вместо ответа 500
+    monkeypatch.setattr(app.app, "testing", False)
+    monkeypatch.setitem(app.app.view_functions, "pool_status", broken)
+    errors = metrics.REQUEST_ERRORS._values.get(("pool_status", "GET"), 0)
+    assert client.get("/api/status/pools").status_code == 500
+    assert metrics.REQUEST_ERRORS._values[("pool_status", "GET")] == errors + 1
+    assert metrics.REQUESTS._values[("pool_status", "GET", "500")] >= 1
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from attendance_rollup import AttendanceRollup
+from data_backends import SQLiteBackend
+from repositories import AttendanceRepo
+
+
+def _ago(**delta):
+    return (datetime.now(timezone.utc) - timedelta(**delta)).isoformat()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return AttendanceRepo(SQLiteBackend(str(tmp_path / "attendance.db")))
+
+
+def _rollup(repo, page_size=2, settle=60, calls=None):
+    def fetch_page(start_date, after, limit):
+        if calls is not None:
+            calls.append(after)
+        return repo.page_since(start_date.isoformat(), limit, after)
+
+    return AttendanceRollup(fetch_page, days=7, interval=0, page_size=page_size, settle=settle)
+
+
+def _recent(rollup, role=None):
+    """Сумма за сегодня и вчера: тест не зависит от того, пришлась ли полночь на последние часы"""
+    return sum(day["count"] for day in rollup.series(2, role=role))
+
+
+def test_backfill_pages_by_keyset_and_series_does_not_read_the_table(repo):
+    same = _ago(hours=2)
+    # Одинаковый created_at на границе страниц не теряется и не повторяется
+    repo.insert_many([{"role": "Student", "created_at": same} for _ in range(3)] +
+                     [{"role": "Teacher", "created_at": _ago(hours=1)}, {"role": "Student", "created_at": _ago(days=30)}])
+    calls = []
+    rollup = _rollup(repo, calls=calls)
+    assert rollup.backfill() == 4
+    assert (_recent(rollup), _recent(rollup, "Student"), _recent(rollup, "Teacher")) == (4, 3, 1)
+    assert len(calls) == 3
+
+    rollup.series(7)
+    assert len(calls) == 3
+
+
+def test_row_recorded_during_backfill_is_counted_once(repo):
+    repo.insert_many([{"role": "Student", "created_at": _ago(hours=1)}])
+    rollup = _rollup(repo, page_size=10)
+    fetch_page = rollup._fetch_page
+
+    def fetch_and_write(start_date, after, limit):
+        # Другой поток вставляет строку и сообщает о ней, пока идёт пересборка:
+        # одна уже в таблице (старше границы), другая ещё свежая
+        written = [{"role": "Student", "created_at": _ago(minutes=5)}, {"role": "Teacher", "created_at": _ago()}]
+        repo.insert_many(written)
+        rollup.record(written)
+        return fetch_page(start_date, after, limit)
+
+    rollup._fetch_page = fetch_and_write
+    rollup.backfill()
+    assert (_recent(rollup, "Student"), _recent(rollup, "Teacher")) == (2, 1)
+
+    # Следующая пересборка видит те же строки и не добавляет их повторно
+    rollup._fetch_page = fetch_page
+    rollup.backfill()
+    assert (_recent(rollup, "Student"), _recent(rollup, "Teacher")) == (2, 1)
+
+
+def test_fresh_rows_of_other_workers_appear_after_they_settle(repo):
+    rollup = _rollup(repo, settle=60)
+    repo.insert_many([{"role": "Student", "created_at": _ago(seconds=10)}])
+    rollup.backfill()
+    assert _recent(rollup) == 0
+
+    rollup._settle = 0
+    rollup.backfill()
+    assert _recent(rollup) == 1
+
+
+def test_background_thread_builds_counts(repo):
+    repo.insert_many([{"role": "Student", "created_at": _ago(hours=1)}])
+    rollup = _rollup(repo).start()
+    rollup._thread.join(5)
+    assert _recent(rollup) == 1
@@ -0,0 +1,43 @@
+from credentials import CredentialIndex
+
+USERS = [{"id": 1, "login": "a", "password": "pw-a"}]
+
+
+def _index(users, **kwargs):
+    fetched = []
+
+    def fetcher(password):
+        fetched.append(password)
+        return next((user for user in users if user["password"] == password), None)
+
+    return CredentialIndex(lambda: list(users), fetcher, **kwargs), fetched
+
+
+def test_unknown_password_hits_the_database_once_within_miss_ttl():
+    index, fetched = _index(USERS, miss_ttl=60)
+    assert index.lookup("pw-a")["login"] == "a"
+    assert fetched == []
+    for _ in range(3):
+        assert index.lookup("wrong") is None
+    assert fetched == ["wrong"]
+
+
+def test_invalidate_forgets_misses():
+    users = list(USERS)
+    index, fetched = _index(users, miss_ttl=60)
+    assert index.lookup("pw-b") is None
+    users.append({"id": 2, "login": "b", "password": "pw-b"})
+    index.invalidate()
+    assert index.lookup("pw-b")["login"] == "b"
+
+
+def test_miss_cache_is_bounded_and_can_be_disabled():
+    index, fetched = _index(USERS, miss_ttl=60, miss_max=2)
+    for password in ("x", "y", "z", "x"):
+        index.lookup(password)
+    assert fetched == ["x", "y", "z", "x"]
+
+    index, fetched = _index(USERS, miss_ttl=0)
+    index.lookup("x")
+    index.lookup("x")
+    assert fetched == ["x", "x"]
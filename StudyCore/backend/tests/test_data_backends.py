@@ -0,0 +1,66 @@
+import pytest
+from supabase import create_client
+
+from bench.fakes import Latency, SupabaseState, fake_supabase
+from data_backends import SQLiteBackend, SupabaseBackend
+
+ORDER = [("created_at", True), ("id", True)]
+
+
+def test_keyset_filter_uses_is_null_for_missing_values():
+    backend = SupabaseBackend(client=None)
+    assert backend._keyset_filter(ORDER, {"created_at": "2026-01-02T00:00:00+00:00", "id": 5}) == (
+        'created_at.lt."2026-01-02T00:00:00+00:00",created_at.is.null,'
+        'and(created_at.eq."2026-01-02T00:00:00+00:00",id.lt.5),'
+        'and(created_at.eq."2026-01-02T00:00:00+00:00",id.is.null)'
+    )
+    # После строки без created_at идут только такие же строки с меньшим id
+    assert backend._keyset_filter(ORDER, {"created_at": None, "id": 5}) == (
+        "and(created_at.is.null,id.lt.5),and(created_at.is.null,id.is.null)"
+    )
+    assert backend._keyset_filter([("created_at", False)], {"created_at": None}) == "created_at.not.is.null"
+    assert backend._keyset_filter([("created_at", True)], {"created_at": None}) == ""
+
+
+ROWS = [
+    {"title": "a", "created_at": "2026-01-03T00:00:00+00:00"},
+    {"title": "b", "created_at": None},
+    {"title": "c", "created_at": "2026-01-01T00:00:00+00:00"},
+    {"title": "d", "created_at": "2026-01-03T00:00:00+00:00"},
+    {"title": "e", "created_at": None},
+]
+
+
+@pytest.fixture
+def backends(tmp_path):
+    state = SupabaseState()
+    for row in ROWS:
+        state.insert("homework", row)
+    # Оба бэкенда ставят created_at сами - возвращаем NULL как в старых строках
+    for row, source in zip(state.tables["homework"], ROWS):
+        row["created_at"] = source["created_at"]
+    server = fake_supabase(state, Latency()).start()
+    sqlite = SQLiteBackend(str(tmp_path / "local.db"))
+    sqlite.insert("homework", ROWS)
+    sqlite.update("homework", {"created_at": None}, {"title": ["b", "e"]})
+    yield SupabaseBackend(create_client(server.url, "test-service-key")), sqlite
+    server.stop()
+
+
+def _pages(backend, limit=2):
+    titles, after = [], None
+    while True:
+        rows = backend.select("homework", order=ORDER, limit=limit, after=after)
+        titles += [row["title"] for row in rows]
+        if len(rows) < limit:
+            return titles
+        after = rows[-1]
+
+
+def test_supabase_pages_match_sqlite_with_null_created_at(backends):
+    supabase, sqlite = backends
+    expected = [row["title"] for row in sqlite.select("homework", order=ORDER)]
+    assert expected == ["d", "a", "c", "e", "b"]
+    assert [row["title"] for row in supabase.select("homework", order=ORDER)] == expected
+    assert _pages(supabase) == expected
+    assert _pages(sqlite) == expected
@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+
+from homework_search import HomeworkSearchIndex, stem, tokenize
+
+
+@pytest.mark.parametrize("word, expected", [
+    # Эталонные основы Snowball для русского языка
+    ("дроби", "дроб"),
+    ("дробями", "дроб"),
+    ("дробей", "дроб"),
+    ("математика", "математик"),
+    ("уравнения", "уравнен"),
+    ("решите", "реш"),
+    ("прочитавши", "прочита"),
+    ("красивейший", "красив"),
+    ("вычислительных", "вычислительн"),
+    ("Ёлки", "елк"),
+])
+def test_stem(word, expected):
+    assert stem(word) == expected
+
+
+def test_tokenize_drops_stop_words_and_punctuation():
+    assert tokenize("Решить задачи по геометрии, и в тетради!") == ["реш", "задач", "геометр", "тетрад"]
+    assert tokenize(None) == []
+
+
+def _index(rows, ttl=0):
+    index = HomeworkSearchIndex(lambda: rows, ttl=ttl)
+    index.rebuild()
+    return index
+
+
+ROWS = [
+    {"id": 1, "title": "Дроби", "description": "Сложение дробей", "created_at": "2026-01-01"},
+    {"id": 2, "title": "Геометрия", "description": "Задачи про дроби и углы", "created_at": "2026-01-02"},
+    {"id": 3, "title": "Математика", "description": "Уравнения", "created_at": "2026-01-03"},
+]
+
+
+def test_title_matches_rank_above_description_matches():
+    assert _index(ROWS).search("дробями") == ([1, 2], 2)
+
+
+def test_every_query_word_is_required():
+    assert _index(ROWS).search("дроби углы") == ([2], 1)
+    assert _index(ROWS).search("дроби синусы") == ([], 0)
+
+
+def test_prefix_of_a_stem_matches():
+    assert _index(ROWS).search("матем") == ([3], 1)
+
+
+def test_equal_scores_put_newer_first_and_paginate():
+    rows = [{"id": i, "title": "Задача", "created_at": f"2026-01-0{i}"} for i in range(1, 5)]
+    index = _index(rows)
+    assert index.search("задача", limit=2) == ([4, 3], 4)
+    assert index.search("задача", limit=2, offset=2) == ([2, 1], 4)
+
+
+def test_add_and_remove_update_the_index():
+    index = _index(list(ROWS))
+    index.add({"id": 4, "title": "Дроби: контрольная", "created_at": "2026-01-04"})
+    assert index.search("контрольная") == ([4], 1)
+    index.add({"id": 4, "title": "Проценты", "created_at": "2026-01-04"})
+    assert index.search("контрольная") == ([], 0)
+    index.remove(1)
+    assert index.search("дроби") == ([2], 1)
+    assert index.snapshot()["documents"] == 3
+
+
+def test_changes_during_rebuild_are_not_lost():
+    loading = threading.Event()
+    resume = threading.Event()
+
+    def loader():
+        loading.set()
+        resume.wait(5)
+        return ROWS
+
+    index = HomeworkSearchIndex(loader, ttl=0)
+    thread = threading.Thread(target=index.rebuild)
+    thread.start()
+    loading.wait(5)
+    # Снимок таблицы уже прочитан: эти изменения в него не попали
+    index.add({"id": 9, "title": "Интегралы", "created_at": "2026-01-09"})
+    index.remove(3)
+    resume.set()
+    thread.join(5)
+    assert index.snapshot()["documents"] == 3
+    assert index.search("интегралы") == ([9], 1)
+    assert index.search("математика") == ([], 0)
+
+
+def test_invalidate_rebuilds_on_next_search():
+    rows = list(ROWS)
+    index = _index(rows, ttl=3600)
+    rows.append({"id": 5, "title": "Логарифмы", "created_at": "2026-01-05"})
+    assert index.search("логарифмы") == ([], 0)
+    index.invalidate()
+    assert index.search("логарифмы") == ([5], 1)
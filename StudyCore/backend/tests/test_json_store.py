@@ -0,0 +1,91 @@
+import json
+import os
+
+import pytest
+
+import json_store
+from json_store import JsonStore
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "users.json")
+
+
+def _snapshot(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_journal_is_replayed_on_open(path):
+    store = JsonStore(path, index_fields=("login",), compact_every=100)
+    first = store.insert({"login": "a"})
+    store.insert({"login": "b"})
+    store.delete(first["id"])
+
+    # Снимка ещё нет: всё состояние - в журнале
+    assert not os.path.exists(path)
+    reopened = JsonStore(path, index_fields=("login",), compact_every=100)
+    assert [record["login"] for record in reopened.all()] == ["b"]
+    assert reopened.find("login", "a") is None
+    assert reopened.find("login", "b")["id"] == 2
+    # id не переиспользуются после удаления
+    assert reopened.insert({"login": "c"})["id"] == 3
+
+
+def test_torn_last_line_is_ignored_and_overwritten(path):
+    store = JsonStore(path, compact_every=100)
+    store.insert({"login": "a"})
+    # Писатель упал посреди строки
+    with open(store.journal_path, "ab") as f:
+        f.write(b'{"op": "put", "record": {"id": 9')
+
+    assert [record["login"] for record in JsonStore(path, compact_every=100).all()] == ["a"]
+    store.insert({"login": "b"})
+    assert [record["login"] for record in JsonStore(path, compact_every=100).all()] == ["a", "b"]
+
+
+def test_compaction_writes_snapshot_and_starts_empty_journal(path):
+    store = JsonStore(path, compact_every=3)
+    for login in ("a", "b", "c"):
+        store.insert({"login": login})
+
+    assert [record["login"] for record in _snapshot(path)] == ["a", "b", "c"]
+    with open(store.journal_path, "rb") as f:
+        assert len(f.read().splitlines()) == 1  # только заголовок
+    assert not os.path.exists(path + ".tmp")
+    assert [record["login"] for record in JsonStore(path).all()] == ["a", "b", "c"]
+
+
+def test_failed_snapshot_replace_keeps_previous_snapshot(path, monkeypatch):
+    store = JsonStore(path, compact_every=100)
+    store.insert({"login": "a"})
+    store.compact()
+    store.insert({"login": "b"})
+
+    def broken_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json_store.os, "replace", broken_replace)
+    with pytest.raises(OSError):
+        store.compact()
+    monkeypatch.undo()
+
+    # Старый снимок цел, а запись b осталась в журнале
+    assert [record["login"] for record in _snapshot(path)] == ["a"]
+    assert [record["login"] for record in JsonStore(path).all()] == ["a", "b"]
+
+
+def test_other_process_sees_appends_and_compaction(path):
+    writer = JsonStore(path, compact_every=100)
+    reader = JsonStore(path, compact_every=100)
+    writer.insert({"login": "a"})
+    assert [record["login"] for record in reader.all()] == ["a"]
+
+    writer.insert({"login": "b"})
+    writer.compact()
+    writer.insert({"login": "c"})
+    assert [record["login"] for record in reader.all()] == ["a", "b", "c"]
+    # Запись второго процесса после чужого сворачивания не теряет данные
+    reader.insert({"login": "d"})
+    assert [record["login"] for record in writer.all()] == ["a", "b", "c", "d"]
@@ -0,0 +1,217 @@
+import httpx
+import pytest
+
+import replica
+from data_backends import SQLiteBackend
+from replica import ReplicatedBackend
+
+
+class FakeSupabase:
+    """Supabase без сети: своя база SQLite, которую можно «отключить»"""
+
+    def __init__(self, path):
+        self.db = SQLiteBackend(path)
+        self.down = False
+        self.fail_with = None
+        # after_select() вызывается после чтения страницы (запись «во время» pull)
+        self.after_select = None
+
+    def _check(self):
+        if self.down:
+            raise httpx.ConnectError("Supabase unreachable")
+        if self.fail_with is not None:
+            raise self.fail_with
+
+    def select(self, table, **kwargs):
+        self._check()
+        rows = self.db.select(table, **kwargs)
+        if self.after_select is not None:
+            hook, self.after_select = self.after_select, None
+            hook()
+        return rows
+
+    def count(self, table, eq=None):
+        self._check()
+        return self.db.count(table, eq)
+
+    def insert(self, table, rows):
+        self._check()
+        return self.db.insert(table, rows)
+
+    def upsert(self, table, rows, key):
+        self._check()
+        return self.db.upsert(table, rows, key)
+
+    def update(self, table, values, eq):
+        self._check()
+        return self.db.update(table, values, eq)
+
+    def delete(self, table, eq):
+        self._check()
+        return self.db.delete(table, eq)
+
+
+@pytest.fixture
+def remote(tmp_path):
+    return FakeSupabase(str(tmp_path / "supabase.db"))
+
+
+def _replica(remote, tmp_path):
+    """Реплика без фонового потока: pull() и push() вызываются тестом"""
+    return ReplicatedBackend(remote, SQLiteBackend(str(tmp_path / "replica.db")), pull_interval=60, push_interval=60)
+
+
+def _titles(backend):
+    return sorted(row["title"] for row in backend.select("homework"))
+
+
+def test_offline_insert_gets_temporary_ids_until_pushed(remote, tmp_path):
+    backend = _replica(remote, tmp_path)
+    remote.down = True
+    rows = backend.insert("homework", [{"title": "a"}, {"title": "b"}])
+    assert [row["id"] for row in rows] == [-1, -2]
+    # Следующая пачка продолжает отрицательные id, а не повторяет их
+    assert backend.insert("homework", [{"title": "c"}])[0]["id"] == -3
+    assert backend.pending() == 3
+    assert _titles(backend) == ["a", "b", "c"]
+
+    remote.down = False
+    assert backend.push() == 3
+    assert backend.pending() == 0
+    local = {row["title"]: row["id"] for row in backend.select("homework")}
+    assert local == {row["title"]: row["id"] for row in remote.db.select("homework")}
+    assert all(row_id > 0 for row_id in local.values())
+
+
+def test_delete_of_unsent_insert_cancels_it(remote, tmp_path):
+    backend = _replica(remote, tmp_path)
+    remote.down = True
+    kept, dropped = backend.insert("homework", [{"title": "kept"}, {"title": "dropped"}])
+    backend.delete("homework", {"id": dropped["id"]})
+    assert backend.pending() == 1
+
+    remote.down = False
+    backend.push()
+    assert [row["title"] for row in remote.db.select("homework")] == ["kept"]
+
+
+def test_transient_push_error_keeps_entries_without_counting_attempts(remote, tmp_path):
+    backend = _replica(remote, tmp_path)
+    remote.down = True
+    backend.insert("homework", [{"title": "a"}, {"title": "b"}])
+    assert backend.push() == 0
+    entries = backend._claim()
+    assert [entry["attempts"] for entry in entries] == [0, 0]
+    assert all(entry["state"] == "pending" for entry in entries)
+
+
+def test_claimed_entries_are_not_taken_by_another_worker(remote, tmp_path):
+    backend = _replica(remote, tmp_path)
+    other = _replica(remote, tmp_path)
+    remote.down = True
+    backend.insert("homework", [{"title": "a"}, {"title": "b"}])
+
+    claimed = backend._claim()
+    assert len(claimed) == 2
+    assert other._claim() == []
+
+    # Освобождённые записи снова доступны любому процессу
+    backend._release(claimed, "network", count=False)
+    assert [entry["id"] for entry in other._claim()] == [entry["id"] for entry in claimed]
+
+
+def test_expired_claim_is_taken_over(remote, tmp_path, monkeypatch):
+    backend = _replica(remote, tmp_path)
+    other = _replica(remote, tmp_path)
+    remote.down = True
+    backend.insert("homework", [{"title": "a"}])
+    assert len(backend._claim()) == 1
+    # Процесс, захвативший запись, «упал»: захват истекает
+    monkeypatch.setattr(replica, "REPLICA_CLAIM_TIMEOUT", -1)
+    assert len(other._claim()) == 1
+
+
+def test_finished_entries_leave_the_outbox(remote, tmp_path):
+    backend = _replica(remote, tmp_path)
+    remote.down = True
+    backend.insert("homework", [{"title": "a"}, {"title": "b"}])
+    entries = backend._claim()
+    backend._finish([entries[0]["id"]])
+    backend._release(entries[1:], "network", count=False)
+    assert backend.pending() == 1
+
+
+def test_failing_entry_becomes_dead_after_max_attempts(remote, tmp_path, monkeypatch):
+    monkeypatch.setattr(replica, "REPLICA_MAX_ATTEMPTS", 2)
+    backend = _replica(remote, tmp_path)
+    remote.down = True
+    backend.insert("homework", [{"title": "a"}])
+    remote.down = False
+    remote.fail_with = ValueError("rejected")
+
+    assert backend.push() == 0
+    assert backend.pending() == 1
+    assert backend.push() == 0
+    assert backend.pending() == 0
+    row = backend.local._connection().execute("SELECT state, attempts, last_error FROM outbox").fetchone()
+    assert (row["state"], row["attempts"], row["last_error"]) == ("dead", 2, "rejected")
+
+
+def test_pull_replaces_copy_and_keeps_unsent_rows(remote, tmp_path):
+    remote.db.insert("homework", [{"title": "remote"}])
+    backend = _replica(remote, tmp_path)
+    assert "homework" in backend.pull()
+    assert _titles(backend) == ["remote"]
+
+    remote.down = True
+    backend.insert("homework", [{"title": "offline"}])
+    remote.down = False
+    remote.db.insert("homework", [{"title": "added elsewhere"}])
+    assert backend.pull() == ["homework"]
+    assert _titles(backend) == ["added elsewhere", "offline", "remote"]
+    # Неизменившиеся таблицы не перезаписываются
+    assert backend.pull() == []
+
+
+def test_write_accepted_during_pull_is_not_lost(remote, tmp_path):
+    backend = _replica(remote, tmp_path)
+    remote.after_select = lambda: backend.insert("homework", [{"title": "during pull"}])
+    backend.pull()
+    assert _titles(backend) == ["during pull"]
+
+
+def test_delete_accepted_during_pull_is_not_resurrected(remote, tmp_path):
+    row = remote.db.insert("homework", [{"title": "deleted"}])[0]
+    backend = _replica(remote, tmp_path)
+    backend.pull()
+    remote.db.insert("homework", [{"title": "other"}])
+    remote.after_select = lambda: backend.delete("homework", {"id": row["id"]})
+    backend.pull()
+    assert _titles(backend) == ["other"]
+
+
+def test_writes_notify_other_workers(remote, tmp_path):
+    backend = _replica(remote, tmp_path)
+    other = _replica(remote, tmp_path)
+    backend._remember_versions()
+    other._remember_versions()
+    changed = []
+    other.on_change(changed.append)
+    own = []
+    backend.on_change(own.append)
+
+    backend.insert("homework", [{"title": "a"}])
+    other._check_versions()
+    backend._check_versions()
+    assert changed == ["homework"]
+    # Процесс, сделавший запись, не сбрасывает свои кэши повторно
+    assert own == []
+
+
+def test_users_are_not_replicated(remote, tmp_path):
+    backend = _replica(remote, tmp_path)
+    remote.down = True
+    with pytest.raises(httpx.ConnectError):
+        backend.insert("users", [{"login": "a", "password": "secret", "name": "A", "role": "Student"}])
+    assert backend.pending() == 0
+    assert backend.local.count("users") == 0
@@ -0,0 +1,108 @@
+import io
+import json
+
+import pytest
+
+from data_backends import SQLiteBackend
+from repositories import UsersRepo
+from user_import import ImportFormatError, UserImporter, iter_json_records
+
+
+def _records(data, chunk_size=7):
+    """Маленькие куски: значения и экранирование попадают на границы чтения"""
+    return list(iter_json_records(io.BytesIO(data.encode("utf-8")), chunk_size=chunk_size))
+
+
+def _user(login, password=None, **fields):
+    return {"login": login, "password": password or f"pw-{login}", "name": login.title(), "role": "Student",
+            **fields}
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return UsersRepo(SQLiteBackend(str(tmp_path / "users.db")), ttl=0)
+
+
+# --- Потоковый разбор ---
+def test_json_array_is_read_in_chunks():
+    data = json.dumps([{"login": "ä", "n": 12345}, {"login": "b\\\"c"}, 7, "x"], ensure_ascii=False)
+    assert _records(data) == [{"login": "ä", "n": 12345}, {"login": "b\\\"c"}, 7, "x"]
+
+
+def test_ndjson_and_bom_are_accepted():
+    data = "\ufeff" + '{"login": "a"}\n\n{"login": "b"}\n12345'
+    assert _records(data) == [{"login": "a"}, {"login": "b"}, 12345]
+
+
+def test_empty_array_and_empty_input():
+    assert _records(" [ ] ") == []
+    assert _records("") == []
+
+
+@pytest.mark.parametrize("data", [
+    '[{"login": "a"} {"login": "b"}]',
+    '[{"login": "a"},',
+    '[{"login": "a"}] trailing',
+    '{"login": "a"}\n{"login": ',
+])
+def test_malformed_input_raises_format_error(data):
+    with pytest.raises(ImportFormatError):
+        _records(data)
+
+
+# --- Импорт ---
+def test_import_creates_updates_and_skips_unchanged(repo):
+    repo.insert_many([_user("kept"), _user("renamed")])
+    report = UserImporter(repo, batch_size=2).run([
+        _user("kept"), _user("renamed", name="New Name"), _user("new"),
+    ])
+    assert (report["created"], report["updated"], report["unchanged"], report["failed"]) == (1, 1, 1, 0)
+    users = {user["login"]: user for user in repo.all()}
+    assert users["renamed"]["name"] == "New Name"
+    assert set(users) == {"kept", "renamed", "new"}
+
+
+def test_invalid_and_duplicate_rows_are_reported_by_index(repo):
+    repo.insert_many([_user("owner", password="taken")])
+    report = UserImporter(repo, batch_size=10).run([
+        _user("a"),
+        {"login": "b"},
+        _user("a", password="other"),
+        _user("c", password="pw-a"),
+        _user("d", role="Guest"),
+        _user("e", password="taken"),
+    ])
+    errors = {error["index"]: error["error"] for error in report["errors"]}
+    assert sorted(errors) == [1, 2, 3, 4, 5]
+    assert errors[2] == "duplicate login in import"
+    assert errors[3] == "duplicate password in import"
+    assert errors[5] == "password already used by another user"
+    assert (report["received"], report["created"], report["failed"]) == (6, 1, 5)
+
+
+def test_dry_run_reports_diff_without_writing(repo):
+    repo.insert_many([_user("renamed")])
+    report = UserImporter(repo, dry_run=True).run([_user("renamed", name="New Name"), _user("new")])
+    assert report["diff"] == [
+        {"index": 0, "login": "renamed", "action": "update", "fields": ["name"]},
+        {"index": 1, "login": "new", "action": "create", "fields": ["login", "name", "password", "role"]},
+    ]
+    assert (report["created"], report["updated"]) == (1, 1)
+    # Ничего не записано, пароли в отчёт не попадают
+    assert [user["name"] for user in repo.all()] == ["Renamed"]
+    assert "pw-new" not in json.dumps(report)
+
+
+def test_rejected_batch_is_retried_row_by_row(repo, monkeypatch):
+    upsert_many = repo.upsert_many
+
+    def reject_bad(users, key="login"):
+        if any(user["login"] == "bad" for user in users):
+            raise RuntimeError("rejected by storage")
+        return upsert_many(users, key)
+
+    monkeypatch.setattr(repo, "upsert_many", reject_bad)
+    report = UserImporter(repo, batch_size=10).run([_user("a"), _user("bad"), _user("b")])
+    assert (report["created"], report["failed"]) == (2, 1)
+    assert report["errors"] == [{"index": 1, "login": "bad", "error": "rejected by storage"}]
+    assert sorted(user["login"] for user in repo.all()) == ["a", "b"]
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+
+from wsgi_bridge import WsgiBridge, build_environ
+
+
+def _scope(path="/", method="GET", query=b"", headers=()):
+    return {"type": "http", "method": method, "path": path, "query_string": query, "root_path": "",
+            "headers": list(headers), "http_version": "1.1", "scheme": "http",
+            "server": ("testserver", 80), "client": ("127.0.0.1", 5555)}
+
+
+async def _request(bridge, scope, body=b""):
+    """(status, тело, сообщения) одного запроса через мост"""
+    incoming = asyncio.Queue()
+    await incoming.put({"type": "http.request", "body": body, "more_body": False})
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    await bridge(scope, incoming.get, send)
+    status = sent[0]["status"]
+    return status, b"".join(m.get("body", b"") for m in sent[1:]), sent
+
+
+def test_threads_serve_requests_concurrently():
+    threads = 4
+    # Каждый запрос ждёт остальных: при последовательном выполнении барьер не сработает
+    barrier = threading.Barrier(threads, timeout=5)
+    names = set()
+
+    def app(environ, start_response):
+        barrier.wait()
+        names.add(threading.current_thread().name)
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [b"ok"]
+
+    bridge = WsgiBridge(app, threads=threads)
+
+    async def run():
+        return await asyncio.gather(*(_request(bridge, _scope()) for _ in range(threads)))
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        bridge.shutdown()
+    assert [(status, body) for status, body, _ in results] == [(200, b"ok")] * threads
+    assert len(names) == threads
+
+
+def test_body_headers_and_streaming():
+    def app(environ, start_response):
+        body = environ["wsgi.input"].read()
+        start_response("201 Created", [("X-Echo", environ["HTTP_X_ECHO"])])
+        return iter([environ["PATH_INFO"].encode("latin-1"), b"|", environ["QUERY_STRING"].encode(), b"|", body])
+
+    bridge = WsgiBridge(app, threads=2)
+    scope = _scope("/api/тест", "POST", b"a=1", [(b"x-echo", b"1"), (b"x-echo", b"2"), (b"content-type", b"text/plain")])
+    try:
+        status, body, sent = asyncio.run(_request(bridge, scope, b"payload"))
+    finally:
+        bridge.shutdown()
+    assert status == 201
+    assert (b"x-echo", b"1,2") in sent[0]["headers"]
+    assert body.decode("utf-8") == "/api/тест|a=1|payload"
+    # Каждый кусок уходит отдельным сообщением, последнее закрывает ответ
+    assert [m.get("more_body") for m in sent[1:]] == [True] * 5 + [False]
+
+
+def test_environ_content_headers_without_http_prefix():
+    environ = build_environ(_scope(headers=[(b"content-type", b"application/json"), (b"content-length", b"2")]),
+                            body=None)
+    assert environ["CONTENT_TYPE"] == "application/json"
+    assert environ["CONTENT_LENGTH"] == "2"
+    assert "HTTP_CONTENT_TYPE" not in environ
+
+
+def test_stops_streaming_after_disconnect():
+    produced = []
+    closed = threading.Event()
+    disconnect = threading.Event()
+
+    def app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "text/event-stream")])
+
+        def stream():
+            try:
+                for i in range(1000):
+                    produced.append(i)
+                    if i == 2:
+                        disconnect.set()
+                        # Даём event loop обработать http.disconnect
+                        closed.wait(0.2)
+                    yield b"data: %d\n\n" % i
+            finally:
+                closed.set()
+        return stream()
+
+    bridge = WsgiBridge(app, threads=1)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        await queue.put({"type": "http.request", "body": b"", "more_body": False})
+
+        async def receive():
+            message = await queue.get()
+            return message
+
+        async def signal_disconnect():
+            await loop.run_in_executor(None, disconnect.wait)
+            await queue.put({"type": "http.disconnect"})
+
+        async def send(message):
+            pass
+
+        task = loop.create_task(signal_disconnect())
+        await bridge(_scope(), receive, send)
+        await task
+
+    try:
+        asyncio.run(run())
+    finally:
+        bridge.shutdown()
+    assert closed.is_set()
+    assert len(produced) < 1000
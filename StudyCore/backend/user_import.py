@@ -0,0 +1,277 @@
+"""
+Пакетный импорт пользователей для POST /api/init-users.
+
+Источник читается потоково (JSON-массив или NDJSON) и режется на пачки
+по batch_size строк; одновременно обрабатывается не больше parallel
+пачек, поэтому память не зависит от размера файла. Каждая пачка:
+
+1. одним запросом находит уже существующих пользователей по login и
+   владельцев тех же паролей (вход идёт по паролю - он должен быть уникален);
+2. делит строки на create / update / unchanged;
+3. отправляет create и update одним upsert по login. Если пачка
+   отклонена целиком, строки повторяются по одной, чтобы ошибка
+   досталась только виноватой строке.
+
+Повторный запуск безопасен: неизменённые строки не пишутся, а
+существующие обновляются по login с сохранением их id. В режиме
+dry_run ничего не пишется, а в отчёт попадает список изменений
+(без значений паролей).
+"""
+import codecs
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from credentials import password_key
+from structured_log import get_logger
+
+logger = get_logger("user_import")
+
+USER_IMPORT_BATCH_SIZE = int(os.getenv("USER_IMPORT_BATCH_SIZE", "200"))
+USER_IMPORT_BATCH_MAX = int(os.getenv("USER_IMPORT_BATCH_MAX", "1000"))
+USER_IMPORT_PARALLEL = int(os.getenv("USER_IMPORT_PARALLEL", "4"))
+USER_IMPORT_PARALLEL_MAX = int(os.getenv("USER_IMPORT_PARALLEL_MAX", "8"))
+# Сколько ошибок и строк diff попадает в отчёт (остальные только считаются)
+USER_IMPORT_MAX_REPORT = int(os.getenv("USER_IMPORT_MAX_REPORT", "200"))
+
+USER_FIELDS = ("id", "login", "password", "name", "role", "gender")
+REQUIRED_FIELDS = ("login", "password", "name", "role")
+USER_ROLES = {"Student", "Admin", "Creator"}
+USER_GENDERS = {"Male", "Female"}
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+def iter_json_records(stream, chunk_size=64 * 1024):
+    """
+    Значения верхнего уровня из JSON-массива ([{...}, {...}]) или NDJSON,
+    читая бинарный поток кусками по chunk_size байт.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer, pos, eof = "", 0, False
+    array = None
+    expect_value = True
+
+    def fill():
+        nonlocal buffer, pos, eof
+        data = stream.read(chunk_size)
+        if not data:
+            eof = True
+            buffer = buffer[pos:] + text.decode(b"", final=True)
+        else:
+            buffer = buffer[pos:] + text.decode(data)
+        pos = 0
+
+    while True:
+        while pos < len(buffer) and buffer[pos].isspace():
+            pos += 1
+        if pos >= len(buffer):
+            if eof:
+                break
+            fill()
+            continue
+        char = buffer[pos]
+        if array is None:
+            array = char == "["
+            if array:
+                pos += 1
+            continue
+        if array and not expect_value:
+            if char == ",":
+                expect_value = True
+                pos += 1
+                continue
+            if char == "]":
+                # После закрывающей скобки допускаются только пробелы
+                pos += 1
+                while True:
+                    if buffer[pos:].strip():
+                        raise ImportFormatError("Unexpected data after JSON array")
+                    if eof:
+                        return
+                    fill()
+            raise ImportFormatError(f"Expected ',' or ']' in JSON array, got {char!r}")
+        if array and char == "]" and expect_value:
+            return
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            if eof:
+                raise ImportFormatError(f"Invalid JSON: {e.msg}")
+            fill()
+            continue
+        if end == len(buffer) and not eof and not isinstance(value, (dict, list)):
+            # Число или литерал на границе куска может быть не дочитан
+            fill()
+            continue
+        pos = end
+        expect_value = False
+        yield value
+    if array:
+        raise ImportFormatError("Unterminated JSON array")
+
+
+def validate_user(row):
+    """Возвращает (пользователь, None) или (None, текст ошибки)"""
+    if not isinstance(row, dict):
+        return None, "record must be a JSON object"
+    unknown = [k for k in row if k not in USER_FIELDS]
+    if unknown:
+        return None, f"unknown fields: {', '.join(sorted(unknown))}"
+    missing = [f for f in REQUIRED_FIELDS if not isinstance(row.get(f), str) or not row[f].strip()]
+    if missing:
+        return None, f"missing or empty fields: {', '.join(missing)}"
+    user = {k: v.strip() if isinstance(v, str) else v for k, v in row.items()}
+    if user["role"] not in USER_ROLES:
+        return None, f"invalid role: {user['role']}"
+    if user.get("gender") not in (None, *USER_GENDERS):
+        return None, f"invalid gender: {user['gender']}"
+    if user.get("id") is None:
+        user.pop("id", None)
+    elif not isinstance(user["id"], int) or isinstance(user["id"], bool):
+        return None, "id must be an integer"
+    return user, None
+
+
+class UserImporter:
+    """users_repo - repositories.UsersRepo"""
+
+    def __init__(self, users_repo, batch_size=USER_IMPORT_BATCH_SIZE, parallel=USER_IMPORT_PARALLEL,
+                 dry_run=False, max_report=USER_IMPORT_MAX_REPORT):
+        self.repo = users_repo
+        self.batch_size = max(1, min(batch_size, USER_IMPORT_BATCH_MAX))
+        self.parallel = max(1, min(parallel, USER_IMPORT_PARALLEL_MAX))
+        self.dry_run = dry_run
+        self.max_report = max_report
+        self.report = {
+            "dry_run": dry_run, "batch_size": self.batch_size, "parallel": self.parallel,
+            "received": 0, "created": 0, "updated": 0, "unchanged": 0, "failed": 0,
+            "errors": [], "errors_truncated": False,
+        }
+        if dry_run:
+            self.report.update(diff=[], diff_truncated=False)
+
+    def run(self, records):
+        with ThreadPoolExecutor(max_workers=self.parallel, thread_name_prefix="user-import") as pool:
+            pending = set()
+            for batch in self._batches(records):
+                if len(pending) >= self.parallel:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    self._merge(done)
+                pending.add(pool.submit(self._process, batch))
+            self._merge(wait(pending)[0])
+        self.report["errors"].sort(key=lambda e: e["index"])
+        if self.dry_run:
+            self.report["diff"].sort(key=lambda d: d["index"])
+        return self.report
+
+    def _add(self, key, entry):
+        entries = self.report[key]
+        if len(entries) < self.max_report:
+            entries.append(entry)
+        else:
+            self.report[f"{key}_truncated"] = True
+
+    def _error(self, index, login, message):
+        self.report["failed"] += 1
+        self._add("errors", {"index": index, "login": login, "error": message})
+
+    def _batches(self, records):
+        """Проверка строк и дубликатов внутри источника; выдаёт пачки (index, user)"""
+        seen_logins = set()
+        seen_passwords = set()
+        batch = []
+        for index, row in enumerate(records):
+            self.report["received"] += 1
+            user, error = validate_user(row)
+            login = row.get("login") if isinstance(row, dict) else None
+            if error is None and user["login"] in seen_logins:
+                error = "duplicate login in import"
+            if error is None and password_key(user["password"]) in seen_passwords:
+                error = "duplicate password in import"
+            if error is not None:
+                self._error(index, login, error)
+                continue
+            seen_logins.add(user["login"])
+            seen_passwords.add(password_key(user["password"]))
+            batch.append((index, user))
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _process(self, batch):
+        try:
+            return self._process_batch(batch)
+        except Exception as e:
+            # Хранилище не ответило на поиск: вся пачка - ошибки, остальные пачки продолжают
+            logger.warning("user import batch failed: %s", e, extra={"rows": len(batch)})
+            return {"created": 0, "updated": 0, "unchanged": 0, "diff": [],
+                    "errors": [{"index": index, "login": user["login"], "error": str(e)} for index, user in batch]}
+
+    def _process_batch(self, batch):
+        result = {"created": 0, "updated": 0, "unchanged": 0, "errors": [], "diff": []}
+        existing = {u["login"]: u for u in self.repo.find_by_logins([user["login"] for _, user in batch])}
+        owners = {u["password"]: u["login"] for u in self.repo.find_by_passwords([user["password"] for _, user in batch])}
+        writes = []
+        for index, user in batch:
+            owner = owners.get(user["password"])
+            if owner is not None and owner != user["login"]:
+                result["errors"].append({"index": index, "login": user["login"],
+                                         "error": "password already used by another user"})
+                continue
+            current = existing.get(user["login"])
+            if current is None:
+                action, fields, payload = "create", sorted(k for k in user if k != "id"), user
+            else:
+                fields = sorted(k for k in user if k not in ("id", "login") and current.get(k) != user[k])
+                if not fields:
+                    result["unchanged"] += 1
+                    continue
+                # id существующей строки не меняется, даже если в файле другой
+                action, payload = "update", {**user, "id": current["id"]}
+            writes.append((index, action, payload))
+            if self.dry_run:
+                result["diff"].append({"index": index, "login": user["login"], "action": action, "fields": fields})
+        if not self.dry_run:
+            writes = self._write(writes, result)
+        for _, action, _ in writes:
+            result["created" if action == "create" else "updated"] += 1
+        return result
+
+    def _write(self, writes, result):
+        """Возвращает успешно записанные строки; ошибки - в result"""
+        # Один upsert на набор колонок: PostgREST требует одинаковые ключи в пачке
+        groups = {}
+        for write in writes:
+            groups.setdefault(tuple(sorted(write[2])), []).append(write)
+        written = []
+        for group in groups.values():
+            try:
+                self.repo.upsert_many([payload for _, _, payload in group])
+                written.extend(group)
+                continue
+            except Exception as e:
+                logger.warning("user import batch rejected, retrying row by row: %s", e, extra={"rows": len(group)})
+            for write in group:
+                try:
+                    self.repo.upsert_many([write[2]])
+                    written.append(write)
+                except Exception as e:
+                    result["errors"].append({"index": write[0], "login": write[2]["login"], "error": str(e)})
+        return written
+
+    def _merge(self, futures):
+        for future in futures:
+            result = future.result()
+            for key in ("created", "updated", "unchanged"):
+                self.report[key] += result[key]
+            for error in result["errors"]:
+                self._error(error["index"], error["login"], error["error"])
+            if self.dry_run:
+                for entry in result["diff"]:
+                    self._add("diff", entry)
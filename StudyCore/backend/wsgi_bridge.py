@@ -0,0 +1,142 @@
+"""
+WSGI-приложение под ASGI-сервером.
+
+WsgiBridge - ASGI-приложение для HTTP-запросов: тело запроса читается в
+event loop (до 1 МБ в памяти, дальше во временный файл), а само
+WSGI-приложение выполняется в собственном пуле из threads потоков через
+loop.run_in_executor. Размер пула и есть предел одновременно
+выполняемых запросов. Ответ отправляется клиенту по мере того, как
+приложение отдаёт куски (SSE), а после отключения клиента итерация
+ответа прекращается.
+"""
+import asyncio
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Сколько байт тела запроса держать в памяти до сброса во временный файл
+BODY_MEMORY_LIMIT = 1024 * 1024
+
+
+def build_environ(scope, body):
+    """environ по PEP 3333 для HTTP-запроса ASGI"""
+    root_path = scope.get("root_path", "")
+    path = scope["path"]
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+    server = scope.get("server") or ("localhost", 80)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        # Строки environ - байты запроса, прочитанные как latin-1
+        "SCRIPT_NAME": root_path.encode("utf-8").decode("latin-1"),
+        "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": str(server[0]),
+        "SERVER_PORT": str(server[1] if server[1] is not None else 80),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": body,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    client = scope.get("client")
+    if client:
+        environ["REMOTE_ADDR"] = client[0]
+        environ["REMOTE_PORT"] = str(client[1])
+    for raw_name, raw_value in scope.get("headers", ()):
+        name = raw_name.decode("latin-1").upper().replace("-", "_")
+        value = raw_value.decode("latin-1")
+        if name not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            name = f"HTTP_{name}"
+        # Повторяющиеся заголовки склеиваются через запятую (RFC 9110)
+        environ[name] = f"{environ[name]},{value}" if name in environ else value
+    return environ
+
+
+class WsgiBridge:
+    """wsgi_app - WSGI-приложение (Flask app), threads - размер пула запросов"""
+
+    def __init__(self, wsgi_app, threads):
+        self._wsgi_app = wsgi_app
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="asgi")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+        body = await self._read_body(receive)
+        if body is None:
+            return
+        disconnected = threading.Event()
+        loop = asyncio.get_running_loop()
+        watcher = loop.create_task(self._watch_disconnect(receive, disconnected))
+        try:
+            await loop.run_in_executor(self.executor, self._run, scope, body, send, loop, disconnected)
+        finally:
+            watcher.cancel()
+            body.close()
+
+    @staticmethod
+    async def _read_body(receive):
+        """Тело запроса во временном файле; None - клиент отключился раньше"""
+        body = tempfile.SpooledTemporaryFile(max_size=BODY_MEMORY_LIMIT)
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                body.close()
+                return None
+            body.write(message.get("body", b""))
+            if not message.get("more_body", False):
+                body.seek(0)
+                return body
+
+    @staticmethod
+    async def _watch_disconnect(receive, disconnected):
+        while (await receive())["type"] != "http.disconnect":
+            pass
+        disconnected.set()
+
+    def _run(self, scope, body, send, loop, disconnected):
+        """Выполняется в потоке пула: вызывает приложение и отправляет ответ"""
+        def send_message(message):
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        response = {}
+
+        def send_start():
+            if not response.get("sent"):
+                response["sent"] = True
+                send_message({"type": "http.response.start", "status": response["status"],
+                              "headers": response["headers"]})
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info is not None and response.get("sent"):
+                raise exc_info[1].with_traceback(exc_info[2])
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [(name.lower().encode("latin-1"), value.encode("latin-1"))
+                                   for name, value in headers]
+            return write
+
+        def write(data):
+            send_start()
+            if data:
+                send_message({"type": "http.response.body", "body": data, "more_body": True})
+
+        result = self._wsgi_app(build_environ(scope, body), start_response)
+        try:
+            for chunk in result:
+                if disconnected.is_set():
+                    # Клиент ушёл: генератор закрывается, дальше не считаем
+                    return
+                write(chunk)
+            send_start()
+            send_message({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
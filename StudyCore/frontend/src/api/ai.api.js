@@ -1,16 +1,62 @@
 import axios from "./axios";
 
 /**
- * Отправить сообщение AI помощнику
+ * Отправить сообщение AI помощнику и получать ответ по частям (SSE)
  * @param {string} message - Сообщение пользователя
  * @param {Array} history - История чата
- * @returns {Promise} - Ответ от AI
+ * @param {Object} handlers - { onDelta(text), signal, conversationId, userId }
+ * @returns {Promise<string>} - Полный ответ после завершения потока
  */
-export const sendMessageToAI = async (message, history = []) => {
-  return axios.post("/api/ai/chat", {
-    message,
-    history
+export const streamMessageToAI = async (message, history = [], { onDelta, signal, conversationId, userId } = {}) => {
+  // axios в браузере не умеет читать тело по частям, поэтому fetch
+  const response = await fetch(`${axios.defaults.baseURL}/api/ai/chat/stream`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ message, history, conversation_id: conversationId, user_id: userId }),
+    signal
   });
+
+  if (!response.ok) {
+    const data = await response.json().catch(() => ({}));
+    throw { response: { status: response.status, data } };
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let fullText = "";
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    // События SSE разделены пустой строкой
+    let boundary;
+    while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+      const chunk = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      let event = "message";
+      let data = "";
+      for (const line of chunk.split("\n")) {
+        if (line.startsWith("event: ")) event = line.slice(7);
+        else if (line.startsWith("data: ")) data += line.slice(6);
+      }
+      const payload = data ? JSON.parse(data) : {};
+
+      if (event === "delta") {
+        fullText += payload.text;
+        onDelta?.(payload.text, fullText);
+      } else if (event === "done") {
+        return payload.response ?? fullText;
+      } else if (event === "error") {
+        throw { response: { status: payload.status, data: payload } };
+      }
+    }
+  }
+
+  return fullText;
 };
 
 /**
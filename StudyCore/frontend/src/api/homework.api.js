@@ -1,9 +1,88 @@
 import axios from "./axios";
 
-export const getHomework = () => axios.get("/api/homework");
+// Полученные страницы ленты и их ETag (для условного GET): ключ - параметры
+// запроса, у каждого курсора свой ETag
+const cachedPages = new Map();
+const CACHED_PAGES_MAX = 50;
+
+/**
+ * Одна страница ленты заданий (от новых к старым)
+ * @param {Object} options - { cursor, limit, fields, mode: "list" | "full" }
+ * @returns {Promise} - { items, next_cursor }
+ */
+export const getHomeworkPage = async ({ cursor, limit = 20, fields, mode = "list" } = {}) => {
+  const params = { limit, mode };
+  if (cursor) params.cursor = cursor;
+  if (fields) params.fields = Array.isArray(fields) ? fields.join(",") : fields;
+
+  const key = JSON.stringify(params);
+  const cached = cachedPages.get(key);
+  const response = await axios.get("/api/homework", {
+    params,
+    headers: cached ? { "If-None-Match": cached.etag } : {},
+    validateStatus: (status) => (status >= 200 && status < 300) || status === 304
+  });
+
+  // 304 - страница не изменилась, отдаём сохранённую
+  if (response.status === 304 && cached) {
+    return cached.data;
+  }
+
+  cachedPages.delete(key);
+  const etag = response.headers.etag;
+  if (etag) {
+    // Самая старая страница вытесняется первой (Map хранит порядок вставки)
+    if (cachedPages.size >= CACHED_PAGES_MAX) {
+      cachedPages.delete(cachedPages.keys().next().value);
+    }
+    cachedPages.set(key, { etag, data: response.data });
+  }
+  return response.data;
+};
+
+/**
+ * Лента для бесконечной прокрутки: loadMore() подгружает следующую страницу
+ * @param {Object} options - те же параметры, что у getHomeworkPage (кроме cursor)
+ */
+export const createHomeworkFeed = (options = {}) => {
+  let cursor = null;
+  let done = false;
+  let pending = null;
+
+  const loadMore = async () => {
+    if (done) return [];
+    // Повторный вызов во время загрузки не запрашивает ту же страницу дважды
+    if (pending) return pending;
+    pending = getHomeworkPage({ ...options, cursor })
+      .then((page) => {
+        cursor = page.next_cursor;
+        done = !cursor;
+        return page.items;
+      })
+      .finally(() => {
+        pending = null;
+      });
+    return pending;
+  };
+
+  return {
+    loadMore,
+    hasMore: () => !done,
+    reset: () => {
+      cursor = null;
+      done = false;
+    }
+  };
+};
 
 export const addHomework = (title, description, image_url) =>
-  axios.post("/api/homework", { title, description, image_url });
+  axios.post("/api/homework", { title, description, image_url }).then((res) => {
+    cachedPages.clear();
+    return res;
+  });
 
 export const deleteHomework = (id) =>
-  axios.delete(`/api/homework/${id}`);
+  axios.delete(`/api/homework/${id}`).then((res) => {
+    cachedPages.clear();
+    return res;
+  });
@@ -12,7 +12,9 @@ export const uploadFile = async (file) => {
   const response = await axios.post("/api/upload", formData, {
     headers: {
       'Content-Type': 'multipart/form-data'
-    }
+    },
+    // Большие файлы (до MAX_UPLOAD_MB на сервере) грузятся дольше общего таймаута
+    timeout: 120000
   });
   
   return response.data;
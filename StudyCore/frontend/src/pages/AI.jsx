@@ -1,6 +1,6 @@
 ﻿import React, { useState, useEffect, useRef } from "react";
 import { useAuth } from "../store/authStore";
-import { sendMessageToAI, getAIStatus } from "../api/ai.api";
+import { streamMessageToAI, getAIStatus } from "../api/ai.api";
 import "../styles/new-ai.css";
 
 const AI = () => {
@@ -12,6 +12,10 @@ const AI = () => {
   const [error, setError] = useState("");
   const [checking, setChecking] = useState(true);
   const messagesEndRef = useRef(null);
+  // ID диалога: по нему сервер хранит краткое содержание старых сообщений
+  const conversationIdRef = useRef(
+    window.crypto?.randomUUID ? window.crypto.randomUUID() : `${Date.now()}-${Math.random().toString(36).slice(2)}`
+  );
 
   // Проверяем доступность AI при загрузке
   useEffect(() => {
@@ -63,16 +67,31 @@ const AI = () => {
         content: msg.content
       }));
 
-      const response = await sendMessageToAI(userMessage, history);
-      
-      // Добавляем ответ AI
+      // Добавляем пустой ответ AI и дописываем его по мере прихода токенов
       const aiMessage = {
         role: "bot",
-        content: response.data.response,
+        content: "",
         timestamp: new Date().toLocaleTimeString("ru-RU", { hour: "2-digit", minute: "2-digit" })
       };
       setMessages(prev => [...prev, aiMessage]);
+
+      const updateAiMessage = (content) => {
+        setMessages(prev => {
+          const next = [...prev];
+          next[next.length - 1] = { ...next[next.length - 1], content };
+          return next;
+        });
+      };
+
+      const fullText = await streamMessageToAI(userMessage, history, {
+        onDelta: (_, text) => updateAiMessage(text),
+        conversationId: conversationIdRef.current,
+        userId: user?.id
+      });
+      updateAiMessage(fullText);
     } catch (err) {
+      // Убираем незаполненный ответ AI, если поток оборвался до первого токена
+      setMessages(prev => (prev.length && prev[prev.length - 1].role === "bot" && !prev[prev.length - 1].content ? prev.slice(0, -1) : prev));
       console.error("Ошибка отправки сообщения:", err);
       const errorMessage = err.response?.data?.error || "Не удалось получить ответ от AI";
       const errorHint = err.response?.data?.hint || "";
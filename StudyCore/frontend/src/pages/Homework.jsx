@@ -1,14 +1,24 @@
-﻿import { useState, useEffect } from "react";
+﻿import { useState, useEffect, useRef } from "react";
 import { useAuth } from "../store/authStore";
-import { getHomework, addHomework, deleteHomework } from "../api/homework.api";
+import { createHomeworkFeed, addHomework, deleteHomework } from "../api/homework.api";
 import "../styles/clean-homework.css";
 
+// Сколько заданий подгружать за раз
+const PAGE_SIZE = 20;
+
 export default function Homework() {
   const profile = useAuth((state) => state.profile);
   const [list, setList] = useState([]);
   const [title, setTitle] = useState("");
   const [desc, setDesc] = useState("");
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [hasMore, setHasMore] = useState(false);
+  // Лента от новых к старым, страницы по PAGE_SIZE
+  const feed = useRef(null);
+  if (feed.current === null) {
+    feed.current = createHomeworkFeed({ limit: PAGE_SIZE, mode: "full" });
+  }
 
   useEffect(() => {
     loadHomework();
@@ -16,8 +26,9 @@ export default function Homework() {
 
   const loadHomework = async () => {
     try {
-      const response = await getHomework();
-      setList(response.data);
+      const items = await feed.current.loadMore();
+      setList(items);
+      setHasMore(feed.current.hasMore());
     } catch (err) {
       console.error("Ошибка загрузки ДЗ:", err);
       setList([]);
@@ -26,6 +37,21 @@ export default function Homework() {
     }
   };
 
+  const loadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const items = await feed.current.loadMore();
+      // Курсор - последнее загруженное задание, страницы не пересекаются
+      setList((prev) => [...prev, ...items]);
+      setHasMore(feed.current.hasMore());
+    } catch (err) {
+      console.error("Ошибка загрузки ДЗ:", err);
+      alert("Не удалось загрузить задания");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const add = async () => {
     if (!title || !desc) {
       alert("Заполните название и описание!");
@@ -33,7 +59,8 @@ export default function Homework() {
     }
     try {
       const response = await addHomework(title, desc);
-      setList([...list, response.data]);
+      // Лента идёт от новых к старым - новое задание сверху
+      setList((prev) => [response.data, ...prev]);
       setTitle("");
       setDesc("");
       alert("✅ Задание успешно добавлено!");
@@ -49,7 +76,7 @@ export default function Homework() {
     }
     try {
       await deleteHomework(id);
-      setList(list.filter((h) => h.id !== id));
+      setList((prev) => prev.filter((h) => h.id !== id));
     } catch (err) {
       console.error("Ошибка при удалении ДЗ:", err);
       alert("Ошибка при удалении задания");
@@ -121,6 +148,12 @@ export default function Homework() {
             ))}
           </div>
         )}
+
+        {hasMore && (
+          <button className="btn-load-more" onClick={loadMore} disabled={loadingMore}>
+            {loadingMore ? "Загрузка..." : "Показать ещё"}
+          </button>
+        )}
       </div>
     </div>
   );
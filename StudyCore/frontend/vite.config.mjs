@@ -5,6 +5,8 @@ export default defineConfig({
   plugins: [react()],
   build: {
     outDir: "dist", // билд в dist папку frontend
-    emptyOutDir: true
+    emptyOutDir: true,
+    // манифест "точка входа -> файл с хешем" для сервера и очистки старых ассетов
+    manifest: "asset-manifest.json"
   }
 });
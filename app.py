@@ -1,8 +1,14 @@
 import os
-import json
-from flask import Flask, jsonify, request, send_from_directory
+import sys
+from flask import Flask, jsonify, request
 from flask_cors import CORS
 
+# Общие модули бэкенда (раздача статики и т.п.)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "StudyCore", "backend"))
+from static_assets import StaticManifest
+from repositories import DATA_DIR, open_repositories
+import homework_feed
+
 # Путь к frontend dist (build.sh копирует в корень)
 FRONTEND_DIST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dist")
 print(f"FRONTEND_DIST: {FRONTEND_DIST}")
@@ -11,39 +17,22 @@ print(f"Dist exists: {os.path.exists(FRONTEND_DIST)}")
 if os.path.exists(FRONTEND_DIST):
     print(f"Contents of dist: {os.listdir(FRONTEND_DIST)}")
 
-app = Flask(__name__, static_folder=FRONTEND_DIST, static_url_path='')
+# static_folder отключён: dist/ раздаётся из манифеста (см. serve_frontend)
+app = Flask(__name__, static_folder=None)
 CORS(app)  # разрешаем кросс-доменные запросы
 
-# Путь к данным
-USERS_FILE = os.path.join(os.path.dirname(__file__), "StudyCore/backend/data/users.json")
-HOMEWORK_FILE = os.path.join(os.path.dirname(__file__), "StudyCore/backend/data/homework.json")
+# Данные: по умолчанию JSON-файлы StudyCore/backend/data (DATA_BACKEND=sqlite - локальная БД)
+USERS_FILE = os.path.join(DATA_DIR, "users.json")
+if not os.path.exists(USERS_FILE):
+    print(f"ERROR: Users file not found at {USERS_FILE}")
+repos = open_repositories(default="json")
 
 # --- Helper функции ---
 def read_users():
-    try:
-        with open(USERS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"ERROR: Users file not found at {USERS_FILE}")
-        return []
-    except Exception as e:
-        print(f"ERROR reading users file: {e}")
-        return []
+    return repos.users.all()
 
 def read_homework():
-    try:
-        if not os.path.exists(HOMEWORK_FILE):
-            with open(HOMEWORK_FILE, "w", encoding="utf-8") as f:
-                json.dump([], f)
-        with open(HOMEWORK_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"ERROR reading homework file: {e}")
-        return []
-
-def write_homework(data):
-    with open(HOMEWORK_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    return repos.homework.all()
 
 # --- API для логина по паролю ---
 @app.route("/api/login", methods=["POST"])
@@ -51,10 +40,8 @@ def login():
     data = request.json
     password = data.get("password")
     
-    print(f"Login attempt with password: '{password}'")  # для отладки
-
-    users = read_users()
-    user = next((u for u in users if u["password"] == password), None)
+    # Поиск по индексу паролей (пароль в лог не пишем)
+    user = repos.users.find_by_password(password)
 
     if user:
         gender_prefix = "Ученица" if user.get("gender") == "Female" else "Ученик"
@@ -80,41 +67,47 @@ def get_users():
 # --- API для домашнего задания ---
 @app.route("/api/homework", methods=["GET"])
 def get_homework():
-    homework = read_homework()
-    return jsonify(homework)
+    # С параметрами пагинации - страница ленты {"items", "next_cursor"}, как в StudyCore/backend
+    if not any(name in request.args for name in ("limit", "cursor", "fields", "mode")):
+        return jsonify(read_homework())
+    try:
+        fields = homework_feed.parse_fields(request.args.get("fields", "").strip())
+        limit = homework_feed.parse_limit(request.args.get("limit", "").strip())
+        cursor = request.args.get("cursor", "").strip() or None
+        after = homework_feed.cursor_row(cursor) if cursor else None
+    except homework_feed.FeedParamError as e:
+        return jsonify({"error": str(e)}), 400
+    rows = repos.homework.page(fields, limit + 1, after)
+    if request.args.get("mode", "").strip() == "list":
+        rows = homework_feed.preview(rows)
+    return jsonify(homework_feed.build_page(rows, limit))
 
 @app.route("/api/homework", methods=["POST"])
 def add_homework():
     data = request.json
-    homework = read_homework()
-
-    # Генерируем ID
-    new_id = max([h.get("id", 0) for h in homework], default=0) + 1
-    data["id"] = new_id
-
-    homework.append(data)
-    write_homework(homework)
-    return jsonify(data), 201
+    # ID назначает хранилище (под блокировкой писателя)
+    data.pop("id", None)
+    record = repos.homework.add(data)
+    return jsonify(record), 201
 
 @app.route("/api/homework/<int:hw_id>", methods=["DELETE"])
 def delete_homework(hw_id):
-    homework = read_homework()
-    homework = [h for h in homework if h.get("id") != hw_id]
-    write_homework(homework)
+    repos.homework.delete(hw_id)
     return jsonify({"message": "Задание удалено"}), 200
 
 # --- Раздача фронтенда ---
+# Манифест dist/ строится один раз при старте (без stat на каждый запрос)
+frontend_manifest = StaticManifest(FRONTEND_DIST)
+if frontend_manifest.stale:
+    print(f"Stale assets skipped (not in asset-manifest.json): {len(frontend_manifest.stale)}")
+
 @app.route("/", defaults={"path": ""})
 @app.route("/<path:path>")
 def serve_frontend(path):
-    # если путь существует в dist, отдаем файл
-    if path and os.path.exists(os.path.join(FRONTEND_DIST, path)) and os.path.isfile(os.path.join(FRONTEND_DIST, path)):
-        return send_from_directory(FRONTEND_DIST, path)
-
-    # для всех остальных маршрутов отдаём index.html (SPA)
-    index_path = os.path.join(FRONTEND_DIST, "index.html")
-    if os.path.exists(index_path):
-        return send_from_directory(FRONTEND_DIST, "index.html")
+    # файл из dist или index.html для маршрутов SPA
+    entry = frontend_manifest.lookup(path)
+    if entry is not None:
+        return frontend_manifest.response(entry, request)
 
     # если нет index.html, возвращаем ошибку
     return jsonify({"error": "Frontend not built yet"}), 500
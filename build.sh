@@ -47,8 +47,10 @@ ls -la dist/
 # Возвращаемся в корень
 cd ../..
 
-echo "=== Copying frontend dist to root ==="
-cp -r StudyCore/frontend/dist .
+echo "=== Deploying frontend dist to root ==="
+# Сборка копируется в dist.releases/<время>, а dist/ - симлинк, который
+# подменяется атомарно; ассеты, которых нет в asset-manifest.json, удаляются
+python3 StudyCore/backend/static_assets.py deploy StudyCore/frontend/dist dist
 
 echo "=== Verifying dist copy ==="
 if [ ! -d "dist" ]; then
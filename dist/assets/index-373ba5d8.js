@@ -1,88 +0,0 @@
-function Ud(e,t){for(var n=0;n<t.length;n++){const r=t[n];if(typeof r!="string"&&!Array.isArray(r)){for(const l in r)if(l!=="default"&&!(l in e)){const o=Object.getOwnPropertyDescriptor(r,l);o&&Object.defineProperty(e,l,o.get?o:{enumerable:!0,get:()=>r[l]})}}}return Object.freeze(Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}))}(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const o of l)if(o.type==="childList")for(const i of o.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(l){const o={};return l.integrity&&(o.integrity=l.integrity),l.referrerPolicy&&(o.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?o.credentials="include":l.crossOrigin==="anonymous"?o.credentials="omit":o.credentials="same-origin",o}function r(l){if(l.ep)return;l.ep=!0;const o=n(l);fetch(l.href,o)}})();function Ba(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var $a={exports:{}},Jl={},Ha={exports:{}},D={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var _r=Symbol.for("react.element"),Ad=Symbol.for("react.portal"),Id=Symbol.for("react.fragment"),Md=Symbol.for("react.strict_mode"),Bd=Symbol.for("react.profiler"),$d=Symbol.for("react.provider"),Hd=Symbol.for("react.context"),Vd=Symbol.for("react.forward_ref"),Wd=Symbol.for("react.suspense"),Qd=Symbol.for("react.memo"),Kd=Symbol.for("react.lazy"),nu=Symbol.iterator;function Jd(e){return e===null||typeof e!="object"?null:(e=nu&&e[nu]||e["@@iterator"],typeof e=="function"?e:null)}var Va={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Wa=Object.assign,Qa={};function Ln(e,t,n){this.props=e,this.context=t,this.refs=Qa,this.updater=n||Va}Ln.prototype.isReactComponent={};Ln.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};Ln.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function Ka(){}Ka.prototype=Ln.prototype;function Gi(e,t,n){this.props=e,this.context=t,this.refs=Qa,this.updater=n||Va}var Yi=Gi.prototype=new Ka;Yi.constructor=Gi;Wa(Yi,Ln.prototype);Yi.isPureReactComponent=!0;var ru=Array.isArray,Ja=Object.prototype.hasOwnProperty,Zi={current:null},Xa={key:!0,ref:!0,__self:!0,__source:!0};function qa(e,t,n){var r,l={},o=null,i=null;if(t!=null)for(r in t.ref!==void 0&&(i=t.ref),t.key!==void 0&&(o=""+t.key),t)Ja.call(t,r)&&!Xa.hasOwnProperty(r)&&(l[r]=t[r]);var s=arguments.length-2;if(s===1)l.children=n;else if(1<s){for(var u=Array(s),a=0;a<s;a++)u[a]=arguments[a+2];l.children=u}if(e&&e.defaultProps)for(r in s=e.defaultProps,s)l[r]===void 0&&(l[r]=s[r]);return{$$typeof:_r,type:e,key:o,ref:i,props:l,_owner:Zi.current}}function Xd(e,t){return{$$typeof:_r,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function bi(e){return typeof e=="object"&&e!==null&&e.$$typeof===_r}function qd(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var lu=/\/+/g;function wo(e,t){return typeof e=="object"&&e!==null&&e.key!=null?qd(""+e.key):t.toString(36)}function rl(e,t,n,r,l){var o=typeof e;(o==="undefined"||o==="boolean")&&(e=null);var i=!1;if(e===null)i=!0;else switch(o){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case _r:case Ad:i=!0}}if(i)return i=e,l=l(i),e=r===""?"."+wo(i,0):r,ru(l)?(n="",e!=null&&(n=e.replace(lu,"$&/")+"/"),rl(l,t,n,"",function(a){return a})):l!=null&&(bi(l)&&(l=Xd(l,n+(!l.key||i&&i.key===l.key?"":(""+l.key).replace(lu,"$&/")+"/")+e)),t.push(l)),1;if(i=0,r=r===""?".":r+":",ru(e))for(var s=0;s<e.length;s++){o=e[s];var u=r+wo(o,s);i+=rl(o,t,n,u,l)}else if(u=Jd(e),typeof u=="function")for(e=u.call(e),s=0;!(o=e.next()).done;)o=o.value,u=r+wo(o,s++),i+=rl(o,t,n,u,l);else if(o==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return i}function Mr(e,t,n){if(e==null)return e;var r=[],l=0;return rl(e,r,"","",function(o){return t.call(n,o,l++)}),r}function Gd(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var pe={current:null},ll={transition:null},Yd={ReactCurrentDispatcher:pe,ReactCurrentBatchConfig:ll,ReactCurrentOwner:Zi};function Ga(){throw Error("act(...) is not supported in production builds of React.")}D.Children={map:Mr,forEach:function(e,t,n){Mr(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return Mr(e,function(){t++}),t},toArray:function(e){return Mr(e,function(t){return t})||[]},only:function(e){if(!bi(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};D.Component=Ln;D.Fragment=Id;D.Profiler=Bd;D.PureComponent=Gi;D.StrictMode=Md;D.Suspense=Wd;D.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Yd;D.act=Ga;D.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=Wa({},e.props),l=e.key,o=e.ref,i=e._owner;if(t!=null){if(t.ref!==void 0&&(o=t.ref,i=Zi.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var s=e.type.defaultProps;for(u in t)Ja.call(t,u)&&!Xa.hasOwnProperty(u)&&(r[u]=t[u]===void 0&&s!==void 0?s[u]:t[u])}var u=arguments.length-2;if(u===1)r.children=n;else if(1<u){s=Array(u);for(var a=0;a<u;a++)s[a]=arguments[a+2];r.children=s}return{$$typeof:_r,type:e.type,key:l,ref:o,props:r,_owner:i}};D.createContext=function(e){return e={$$typeof:Hd,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:$d,_context:e},e.Consumer=e};D.createElement=qa;D.createFactory=function(e){var t=qa.bind(null,e);return t.type=e,t};D.createRef=function(){return{current:null}};D.forwardRef=function(e){return{$$typeof:Vd,render:e}};D.isValidElement=bi;D.lazy=function(e){return{$$typeof:Kd,_payload:{_status:-1,_result:e},_init:Gd}};D.memo=function(e,t){return{$$typeof:Qd,type:e,compare:t===void 0?null:t}};D.startTransition=function(e){var t=ll.transition;ll.transition={};try{e()}finally{ll.transition=t}};D.unstable_act=Ga;D.useCallback=function(e,t){return pe.current.useCallback(e,t)};D.useContext=function(e){return pe.current.useContext(e)};D.useDebugValue=function(){};D.useDeferredValue=function(e){return pe.current.useDeferredValue(e)};D.useEffect=function(e,t){return pe.current.useEffect(e,t)};D.useId=function(){return pe.current.useId()};D.useImperativeHandle=function(e,t,n){return pe.current.useImperativeHandle(e,t,n)};D.useInsertionEffect=function(e,t){return pe.current.useInsertionEffect(e,t)};D.useLayoutEffect=function(e,t){return pe.current.useLayoutEffect(e,t)};D.useMemo=function(e,t){return pe.current.useMemo(e,t)};D.useReducer=function(e,t,n){return pe.current.useReducer(e,t,n)};D.useRef=function(e){return pe.current.useRef(e)};D.useState=function(e){return pe.current.useState(e)};D.useSyncExternalStore=function(e,t,n){return pe.current.useSyncExternalStore(e,t,n)};D.useTransition=function(){return pe.current.useTransition()};D.version="18.3.1";Ha.exports=D;var N=Ha.exports;const Ya=Ba(N),Zd=Ud({__proto__:null,default:Ya},[N]);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var bd=N,ep=Symbol.for("react.element"),tp=Symbol.for("react.fragment"),np=Object.prototype.hasOwnProperty,rp=bd.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,lp={key:!0,ref:!0,__self:!0,__source:!0};function Za(e,t,n){var r,l={},o=null,i=null;n!==void 0&&(o=""+n),t.key!==void 0&&(o=""+t.key),t.ref!==void 0&&(i=t.ref);for(r in t)np.call(t,r)&&!lp.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:ep,type:e,key:o,ref:i,props:l,_owner:rp.current}}Jl.Fragment=tp;Jl.jsx=Za;Jl.jsxs=Za;$a.exports=Jl;var y=$a.exports,Go={},ba={exports:{}},_e={},ec={exports:{}},tc={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(R,O){var z=R.length;R.push(O);e:for(;0<z;){var A=z-1>>>1,$=R[A];if(0<l($,O))R[A]=O,R[z]=$,z=A;else break e}}function n(R){return R.length===0?null:R[0]}function r(R){if(R.length===0)return null;var O=R[0],z=R.pop();if(z!==O){R[0]=z;e:for(var A=0,$=R.length,dt=$>>>1;A<dt;){var je=2*(A+1)-1,tn=R[je],At=je+1,Ir=R[At];if(0>l(tn,z))At<$&&0>l(Ir,tn)?(R[A]=Ir,R[At]=z,A=At):(R[A]=tn,R[je]=z,A=je);else if(At<$&&0>l(Ir,z))R[A]=Ir,R[At]=z,A=At;else break e}}return O}function l(R,O){var z=R.sortIndex-O.sortIndex;return z!==0?z:R.id-O.id}if(typeof performance=="object"&&typeof performance.now=="function"){var o=performance;e.unstable_now=function(){return o.now()}}else{var i=Date,s=i.now();e.unstable_now=function(){return i.now()-s}}var u=[],a=[],c=1,f=null,v=3,g=!1,m=!1,w=!1,E=typeof setTimeout=="function"?setTimeout:null,p=typeof clearTimeout=="function"?clearTimeout:null,d=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function h(R){for(var O=n(a);O!==null;){if(O.callback===null)r(a);else if(O.startTime<=R)r(a),O.sortIndex=O.expirationTime,t(u,O);else break;O=n(a)}}function x(R){if(w=!1,h(R),!m)if(n(u)!==null)m=!0,ve(C);else{var O=n(a);O!==null&&en(x,O.startTime-R)}}function C(R,O){m=!1,w&&(w=!1,p(T),T=-1),g=!0;var z=v;try{for(h(O),f=n(u);f!==null&&(!(f.expirationTime>O)||R&&!me());){var A=f.callback;if(typeof A=="function"){f.callback=null,v=f.priorityLevel;var $=A(f.expirationTime<=O);O=e.unstable_now(),typeof $=="function"?f.callback=$:f===n(u)&&r(u),h(O)}else r(u);f=n(u)}if(f!==null)var dt=!0;else{var je=n(a);je!==null&&en(x,je.startTime-O),dt=!1}return dt}finally{f=null,v=z,g=!1}}var j=!1,_=null,T=-1,M=5,F=-1;function me(){return!(e.unstable_now()-F<M)}function Ke(){if(_!==null){var R=e.unstable_now();F=R;var O=!0;try{O=_(!0,R)}finally{O?Ue():(j=!1,_=null)}}else j=!1}var Ue;if(typeof d=="function")Ue=function(){d(Ke)};else if(typeof MessageChannel<"u"){var Je=new MessageChannel,Ar=Je.port2;Je.port1.onmessage=Ke,Ue=function(){Ar.postMessage(null)}}else Ue=function(){E(Ke,0)};function ve(R){_=R,j||(j=!0,Ue())}function en(R,O){T=E(function(){R(e.unstable_now())},O)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(R){R.callback=null},e.unstable_continueExecution=function(){m||g||(m=!0,ve(C))},e.unstable_forceFrameRate=function(R){0>R||125<R?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):M=0<R?Math.floor(1e3/R):5},e.unstable_getCurrentPriorityLevel=function(){return v},e.unstable_getFirstCallbackNode=function(){return n(u)},e.unstable_next=function(R){switch(v){case 1:case 2:case 3:var O=3;break;default:O=v}var z=v;v=O;try{return R()}finally{v=z}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(R,O){switch(R){case 1:case 2:case 3:case 4:case 5:break;default:R=3}var z=v;v=R;try{return O()}finally{v=z}},e.unstable_scheduleCallback=function(R,O,z){var A=e.unstable_now();switch(typeof z=="object"&&z!==null?(z=z.delay,z=typeof z=="number"&&0<z?A+z:A):z=A,R){case 1:var $=-1;break;case 2:$=250;break;case 5:$=1073741823;break;case 4:$=1e4;break;default:$=5e3}return $=z+$,R={id:c++,callback:O,priorityLevel:R,startTime:z,expirationTime:$,sortIndex:-1},z>A?(R.sortIndex=z,t(a,R),n(u)===null&&R===n(a)&&(w?(p(T),T=-1):w=!0,en(x,z-A))):(R.sortIndex=$,t(u,R),m||g||(m=!0,ve(C))),R},e.unstable_shouldYield=me,e.unstable_wrapCallback=function(R){var O=v;return function(){var z=v;v=O;try{return R.apply(this,arguments)}finally{v=z}}}})(tc);ec.exports=tc;var op=ec.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var ip=N,Re=op;function k(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var nc=new Set,ur={};function Zt(e,t){xn(e,t),xn(e+"Capture",t)}function xn(e,t){for(ur[e]=t,e=0;e<t.length;e++)nc.add(t[e])}var st=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Yo=Object.prototype.hasOwnProperty,sp=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,ou={},iu={};function up(e){return Yo.call(iu,e)?!0:Yo.call(ou,e)?!1:sp.test(e)?iu[e]=!0:(ou[e]=!0,!1)}function ap(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function cp(e,t,n,r){if(t===null||typeof t>"u"||ap(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function he(e,t,n,r,l,o,i){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=i}var oe={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){oe[e]=new he(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];oe[t]=new he(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){oe[e]=new he(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){oe[e]=new he(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){oe[e]=new he(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){oe[e]=new he(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){oe[e]=new he(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){oe[e]=new he(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){oe[e]=new he(e,5,!1,e.toLowerCase(),null,!1,!1)});var es=/[\-:]([a-z])/g;function ts(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(es,ts);oe[t]=new he(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(es,ts);oe[t]=new he(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(es,ts);oe[t]=new he(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){oe[e]=new he(e,1,!1,e.toLowerCase(),null,!1,!1)});oe.xlinkHref=new he("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){oe[e]=new he(e,1,!1,e.toLowerCase(),null,!0,!0)});function ns(e,t,n,r){var l=oe.hasOwnProperty(t)?oe[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(cp(t,n,l,r)&&(n=null),r||l===null?up(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var ft=ip.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,Br=Symbol.for("react.element"),rn=Symbol.for("react.portal"),ln=Symbol.for("react.fragment"),rs=Symbol.for("react.strict_mode"),Zo=Symbol.for("react.profiler"),rc=Symbol.for("react.provider"),lc=Symbol.for("react.context"),ls=Symbol.for("react.forward_ref"),bo=Symbol.for("react.suspense"),ei=Symbol.for("react.suspense_list"),os=Symbol.for("react.memo"),ht=Symbol.for("react.lazy"),oc=Symbol.for("react.offscreen"),su=Symbol.iterator;function Mn(e){return e===null||typeof e!="object"?null:(e=su&&e[su]||e["@@iterator"],typeof e=="function"?e:null)}var J=Object.assign,So;function qn(e){if(So===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);So=t&&t[1]||""}return`
-`+So+e}var Eo=!1;function xo(e,t){if(!e||Eo)return"";Eo=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(a){var r=a}Reflect.construct(e,[],t)}else{try{t.call()}catch(a){r=a}e.call(t.prototype)}else{try{throw Error()}catch(a){r=a}e()}}catch(a){if(a&&r&&typeof a.stack=="string"){for(var l=a.stack.split(`
-`),o=r.stack.split(`
-`),i=l.length-1,s=o.length-1;1<=i&&0<=s&&l[i]!==o[s];)s--;for(;1<=i&&0<=s;i--,s--)if(l[i]!==o[s]){if(i!==1||s!==1)do if(i--,s--,0>s||l[i]!==o[s]){var u=`
-`+l[i].replace(" at new "," at ");return e.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",e.displayName)),u}while(1<=i&&0<=s);break}}}finally{Eo=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?qn(e):""}function fp(e){switch(e.tag){case 5:return qn(e.type);case 16:return qn("Lazy");case 13:return qn("Suspense");case 19:return qn("SuspenseList");case 0:case 2:case 15:return e=xo(e.type,!1),e;case 11:return e=xo(e.type.render,!1),e;case 1:return e=xo(e.type,!0),e;default:return""}}function ti(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case ln:return"Fragment";case rn:return"Portal";case Zo:return"Profiler";case rs:return"StrictMode";case bo:return"Suspense";case ei:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case lc:return(e.displayName||"Context")+".Consumer";case rc:return(e._context.displayName||"Context")+".Provider";case ls:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case os:return t=e.displayName||null,t!==null?t:ti(e.type)||"Memo";case ht:t=e._payload,e=e._init;try{return ti(e(t))}catch{}}return null}function dp(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return ti(t);case 8:return t===rs?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function Tt(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function ic(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function pp(e){var t=ic(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(i){r=""+i,o.call(this,i)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(i){r=""+i},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function $r(e){e._valueTracker||(e._valueTracker=pp(e))}function sc(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ic(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function wl(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function ni(e,t){var n=t.checked;return J({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function uu(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=Tt(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function uc(e,t){t=t.checked,t!=null&&ns(e,"checked",t,!1)}function ri(e,t){uc(e,t);var n=Tt(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?li(e,t.type,n):t.hasOwnProperty("defaultValue")&&li(e,t.type,Tt(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function au(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function li(e,t,n){(t!=="number"||wl(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Gn=Array.isArray;function vn(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+Tt(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function oi(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(k(91));return J({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function cu(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(k(92));if(Gn(n)){if(1<n.length)throw Error(k(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:Tt(n)}}function ac(e,t){var n=Tt(t.value),r=Tt(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function fu(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function cc(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function ii(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?cc(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var Hr,fc=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(Hr=Hr||document.createElement("div"),Hr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=Hr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function ar(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var bn={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},hp=["Webkit","ms","Moz","O"];Object.keys(bn).forEach(function(e){hp.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),bn[t]=bn[e]})});function dc(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||bn.hasOwnProperty(e)&&bn[e]?(""+t).trim():t+"px"}function pc(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=dc(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var mp=J({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function si(e,t){if(t){if(mp[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(k(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(k(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(k(61))}if(t.style!=null&&typeof t.style!="object")throw Error(k(62))}}function ui(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var ai=null;function is(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var ci=null,yn=null,gn=null;function du(e){if(e=Tr(e)){if(typeof ci!="function")throw Error(k(280));var t=e.stateNode;t&&(t=Zl(t),ci(e.stateNode,e.type,t))}}function hc(e){yn?gn?gn.push(e):gn=[e]:yn=e}function mc(){if(yn){var e=yn,t=gn;if(gn=yn=null,du(e),t)for(e=0;e<t.length;e++)du(t[e])}}function vc(e,t){return e(t)}function yc(){}var ko=!1;function gc(e,t,n){if(ko)return e(t,n);ko=!0;try{return vc(e,t,n)}finally{ko=!1,(yn!==null||gn!==null)&&(yc(),mc())}}function cr(e,t){var n=e.stateNode;if(n===null)return null;var r=Zl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(k(231,t,typeof n));return n}var fi=!1;if(st)try{var Bn={};Object.defineProperty(Bn,"passive",{get:function(){fi=!0}}),window.addEventListener("test",Bn,Bn),window.removeEventListener("test",Bn,Bn)}catch{fi=!1}function vp(e,t,n,r,l,o,i,s,u){var a=Array.prototype.slice.call(arguments,3);try{t.apply(n,a)}catch(c){this.onError(c)}}var er=!1,Sl=null,El=!1,di=null,yp={onError:function(e){er=!0,Sl=e}};function gp(e,t,n,r,l,o,i,s,u){er=!1,Sl=null,vp.apply(yp,arguments)}function wp(e,t,n,r,l,o,i,s,u){if(gp.apply(this,arguments),er){if(er){var a=Sl;er=!1,Sl=null}else throw Error(k(198));El||(El=!0,di=a)}}function bt(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function wc(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function pu(e){if(bt(e)!==e)throw Error(k(188))}function Sp(e){var t=e.alternate;if(!t){if(t=bt(e),t===null)throw Error(k(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var o=l.alternate;if(o===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===n)return pu(l),e;if(o===r)return pu(l),t;o=o.sibling}throw Error(k(188))}if(n.return!==r.return)n=l,r=o;else{for(var i=!1,s=l.child;s;){if(s===n){i=!0,n=l,r=o;break}if(s===r){i=!0,r=l,n=o;break}s=s.sibling}if(!i){for(s=o.child;s;){if(s===n){i=!0,n=o,r=l;break}if(s===r){i=!0,r=o,n=l;break}s=s.sibling}if(!i)throw Error(k(189))}}if(n.alternate!==r)throw Error(k(190))}if(n.tag!==3)throw Error(k(188));return n.stateNode.current===n?e:t}function Sc(e){return e=Sp(e),e!==null?Ec(e):null}function Ec(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Ec(e);if(t!==null)return t;e=e.sibling}return null}var xc=Re.unstable_scheduleCallback,hu=Re.unstable_cancelCallback,Ep=Re.unstable_shouldYield,xp=Re.unstable_requestPaint,q=Re.unstable_now,kp=Re.unstable_getCurrentPriorityLevel,ss=Re.unstable_ImmediatePriority,kc=Re.unstable_UserBlockingPriority,xl=Re.unstable_NormalPriority,Cp=Re.unstable_LowPriority,Cc=Re.unstable_IdlePriority,Xl=null,Ze=null;function Np(e){if(Ze&&typeof Ze.onCommitFiberRoot=="function")try{Ze.onCommitFiberRoot(Xl,e,void 0,(e.current.flags&128)===128)}catch{}}var $e=Math.clz32?Math.clz32:Pp,Rp=Math.log,_p=Math.LN2;function Pp(e){return e>>>=0,e===0?32:31-(Rp(e)/_p|0)|0}var Vr=64,Wr=4194304;function Yn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function kl(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,o=e.pingedLanes,i=n&268435455;if(i!==0){var s=i&~l;s!==0?r=Yn(s):(o&=i,o!==0&&(r=Yn(o)))}else i=n&~l,i!==0?r=Yn(i):o!==0&&(r=Yn(o));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,o=t&-t,l>=o||l===16&&(o&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-$e(t),l=1<<n,r|=e[n],t&=~l;return r}function jp(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Tp(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,o=e.pendingLanes;0<o;){var i=31-$e(o),s=1<<i,u=l[i];u===-1?(!(s&n)||s&r)&&(l[i]=jp(s,t)):u<=t&&(e.expiredLanes|=s),o&=~s}}function pi(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Nc(){var e=Vr;return Vr<<=1,!(Vr&4194240)&&(Vr=64),e}function Co(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Pr(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-$e(t),e[t]=n}function Op(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-$e(n),o=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~o}}function us(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-$e(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var I=0;function Rc(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var _c,as,Pc,jc,Tc,hi=!1,Qr=[],Et=null,xt=null,kt=null,fr=new Map,dr=new Map,vt=[],Lp="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function mu(e,t){switch(e){case"focusin":case"focusout":Et=null;break;case"dragenter":case"dragleave":xt=null;break;case"mouseover":case"mouseout":kt=null;break;case"pointerover":case"pointerout":fr.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":dr.delete(t.pointerId)}}function $n(e,t,n,r,l,o){return e===null||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[l]},t!==null&&(t=Tr(t),t!==null&&as(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function zp(e,t,n,r,l){switch(t){case"focusin":return Et=$n(Et,e,t,n,r,l),!0;case"dragenter":return xt=$n(xt,e,t,n,r,l),!0;case"mouseover":return kt=$n(kt,e,t,n,r,l),!0;case"pointerover":var o=l.pointerId;return fr.set(o,$n(fr.get(o)||null,e,t,n,r,l)),!0;case"gotpointercapture":return o=l.pointerId,dr.set(o,$n(dr.get(o)||null,e,t,n,r,l)),!0}return!1}function Oc(e){var t=Bt(e.target);if(t!==null){var n=bt(t);if(n!==null){if(t=n.tag,t===13){if(t=wc(n),t!==null){e.blockedOn=t,Tc(e.priority,function(){Pc(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function ol(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=mi(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);ai=r,n.target.dispatchEvent(r),ai=null}else return t=Tr(n),t!==null&&as(t),e.blockedOn=n,!1;t.shift()}return!0}function vu(e,t,n){ol(e)&&n.delete(t)}function Fp(){hi=!1,Et!==null&&ol(Et)&&(Et=null),xt!==null&&ol(xt)&&(xt=null),kt!==null&&ol(kt)&&(kt=null),fr.forEach(vu),dr.forEach(vu)}function Hn(e,t){e.blockedOn===t&&(e.blockedOn=null,hi||(hi=!0,Re.unstable_scheduleCallback(Re.unstable_NormalPriority,Fp)))}function pr(e){function t(l){return Hn(l,e)}if(0<Qr.length){Hn(Qr[0],e);for(var n=1;n<Qr.length;n++){var r=Qr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(Et!==null&&Hn(Et,e),xt!==null&&Hn(xt,e),kt!==null&&Hn(kt,e),fr.forEach(t),dr.forEach(t),n=0;n<vt.length;n++)r=vt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<vt.length&&(n=vt[0],n.blockedOn===null);)Oc(n),n.blockedOn===null&&vt.shift()}var wn=ft.ReactCurrentBatchConfig,Cl=!0;function Dp(e,t,n,r){var l=I,o=wn.transition;wn.transition=null;try{I=1,cs(e,t,n,r)}finally{I=l,wn.transition=o}}function Up(e,t,n,r){var l=I,o=wn.transition;wn.transition=null;try{I=4,cs(e,t,n,r)}finally{I=l,wn.transition=o}}function cs(e,t,n,r){if(Cl){var l=mi(e,t,n,r);if(l===null)Fo(e,t,r,Nl,n),mu(e,r);else if(zp(l,e,t,n,r))r.stopPropagation();else if(mu(e,r),t&4&&-1<Lp.indexOf(e)){for(;l!==null;){var o=Tr(l);if(o!==null&&_c(o),o=mi(e,t,n,r),o===null&&Fo(e,t,r,Nl,n),o===l)break;l=o}l!==null&&r.stopPropagation()}else Fo(e,t,r,null,n)}}var Nl=null;function mi(e,t,n,r){if(Nl=null,e=is(r),e=Bt(e),e!==null)if(t=bt(e),t===null)e=null;else if(n=t.tag,n===13){if(e=wc(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Nl=e,null}function Lc(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(kp()){case ss:return 1;case kc:return 4;case xl:case Cp:return 16;case Cc:return 536870912;default:return 16}default:return 16}}var gt=null,fs=null,il=null;function zc(){if(il)return il;var e,t=fs,n=t.length,r,l="value"in gt?gt.value:gt.textContent,o=l.length;for(e=0;e<n&&t[e]===l[e];e++);var i=n-e;for(r=1;r<=i&&t[n-r]===l[o-r];r++);return il=l.slice(e,1<r?1-r:void 0)}function sl(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Kr(){return!0}function yu(){return!1}function Pe(e){function t(n,r,l,o,i){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=o,this.target=i,this.currentTarget=null;for(var s in e)e.hasOwnProperty(s)&&(n=e[s],this[s]=n?n(o):o[s]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?Kr:yu,this.isPropagationStopped=yu,this}return J(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=Kr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=Kr)},persist:function(){},isPersistent:Kr}),t}var zn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},ds=Pe(zn),jr=J({},zn,{view:0,detail:0}),Ap=Pe(jr),No,Ro,Vn,ql=J({},jr,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:ps,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Vn&&(Vn&&e.type==="mousemove"?(No=e.screenX-Vn.screenX,Ro=e.screenY-Vn.screenY):Ro=No=0,Vn=e),No)},movementY:function(e){return"movementY"in e?e.movementY:Ro}}),gu=Pe(ql),Ip=J({},ql,{dataTransfer:0}),Mp=Pe(Ip),Bp=J({},jr,{relatedTarget:0}),_o=Pe(Bp),$p=J({},zn,{animationName:0,elapsedTime:0,pseudoElement:0}),Hp=Pe($p),Vp=J({},zn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Wp=Pe(Vp),Qp=J({},zn,{data:0}),wu=Pe(Qp),Kp={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Jp={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Xp={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function qp(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=Xp[e])?!!t[e]:!1}function ps(){return qp}var Gp=J({},jr,{key:function(e){if(e.key){var t=Kp[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=sl(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?Jp[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:ps,charCode:function(e){return e.type==="keypress"?sl(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?sl(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),Yp=Pe(Gp),Zp=J({},ql,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Su=Pe(Zp),bp=J({},jr,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:ps}),eh=Pe(bp),th=J({},zn,{propertyName:0,elapsedTime:0,pseudoElement:0}),nh=Pe(th),rh=J({},ql,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),lh=Pe(rh),oh=[9,13,27,32],hs=st&&"CompositionEvent"in window,tr=null;st&&"documentMode"in document&&(tr=document.documentMode);var ih=st&&"TextEvent"in window&&!tr,Fc=st&&(!hs||tr&&8<tr&&11>=tr),Eu=String.fromCharCode(32),xu=!1;function Dc(e,t){switch(e){case"keyup":return oh.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Uc(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var on=!1;function sh(e,t){switch(e){case"compositionend":return Uc(t);case"keypress":return t.which!==32?null:(xu=!0,Eu);case"textInput":return e=t.data,e===Eu&&xu?null:e;default:return null}}function uh(e,t){if(on)return e==="compositionend"||!hs&&Dc(e,t)?(e=zc(),il=fs=gt=null,on=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Fc&&t.locale!=="ko"?null:t.data;default:return null}}var ah={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function ku(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!ah[e.type]:t==="textarea"}function Ac(e,t,n,r){hc(r),t=Rl(t,"onChange"),0<t.length&&(n=new ds("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var nr=null,hr=null;function ch(e){Xc(e,0)}function Gl(e){var t=an(e);if(sc(t))return e}function fh(e,t){if(e==="change")return t}var Ic=!1;if(st){var Po;if(st){var jo="oninput"in document;if(!jo){var Cu=document.createElement("div");Cu.setAttribute("oninput","return;"),jo=typeof Cu.oninput=="function"}Po=jo}else Po=!1;Ic=Po&&(!document.documentMode||9<document.documentMode)}function Nu(){nr&&(nr.detachEvent("onpropertychange",Mc),hr=nr=null)}function Mc(e){if(e.propertyName==="value"&&Gl(hr)){var t=[];Ac(t,hr,e,is(e)),gc(ch,t)}}function dh(e,t,n){e==="focusin"?(Nu(),nr=t,hr=n,nr.attachEvent("onpropertychange",Mc)):e==="focusout"&&Nu()}function ph(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return Gl(hr)}function hh(e,t){if(e==="click")return Gl(t)}function mh(e,t){if(e==="input"||e==="change")return Gl(t)}function vh(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var We=typeof Object.is=="function"?Object.is:vh;function mr(e,t){if(We(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!Yo.call(t,l)||!We(e[l],t[l]))return!1}return!0}function Ru(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function _u(e,t){var n=Ru(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=Ru(n)}}function Bc(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Bc(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function $c(){for(var e=window,t=wl();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=wl(e.document)}return t}function ms(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function yh(e){var t=$c(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&Bc(n.ownerDocument.documentElement,n)){if(r!==null&&ms(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,o=Math.min(r.start,l);r=r.end===void 0?o:Math.min(r.end,l),!e.extend&&o>r&&(l=r,r=o,o=l),l=_u(n,o);var i=_u(n,r);l&&i&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var gh=st&&"documentMode"in document&&11>=document.documentMode,sn=null,vi=null,rr=null,yi=!1;function Pu(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;yi||sn==null||sn!==wl(r)||(r=sn,"selectionStart"in r&&ms(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),rr&&mr(rr,r)||(rr=r,r=Rl(vi,"onSelect"),0<r.length&&(t=new ds("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=sn)))}function Jr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var un={animationend:Jr("Animation","AnimationEnd"),animationiteration:Jr("Animation","AnimationIteration"),animationstart:Jr("Animation","AnimationStart"),transitionend:Jr("Transition","TransitionEnd")},To={},Hc={};st&&(Hc=document.createElement("div").style,"AnimationEvent"in window||(delete un.animationend.animation,delete un.animationiteration.animation,delete un.animationstart.animation),"TransitionEvent"in window||delete un.transitionend.transition);function Yl(e){if(To[e])return To[e];if(!un[e])return e;var t=un[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in Hc)return To[e]=t[n];return e}var Vc=Yl("animationend"),Wc=Yl("animationiteration"),Qc=Yl("animationstart"),Kc=Yl("transitionend"),Jc=new Map,ju="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Lt(e,t){Jc.set(e,t),Zt(t,[e])}for(var Oo=0;Oo<ju.length;Oo++){var Lo=ju[Oo],wh=Lo.toLowerCase(),Sh=Lo[0].toUpperCase()+Lo.slice(1);Lt(wh,"on"+Sh)}Lt(Vc,"onAnimationEnd");Lt(Wc,"onAnimationIteration");Lt(Qc,"onAnimationStart");Lt("dblclick","onDoubleClick");Lt("focusin","onFocus");Lt("focusout","onBlur");Lt(Kc,"onTransitionEnd");xn("onMouseEnter",["mouseout","mouseover"]);xn("onMouseLeave",["mouseout","mouseover"]);xn("onPointerEnter",["pointerout","pointerover"]);xn("onPointerLeave",["pointerout","pointerover"]);Zt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Zt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Zt("onBeforeInput",["compositionend","keypress","textInput","paste"]);Zt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Zt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Zt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Zn="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Eh=new Set("cancel close invalid load scroll toggle".split(" ").concat(Zn));function Tu(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,wp(r,t,void 0,e),e.currentTarget=null}function Xc(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var i=r.length-1;0<=i;i--){var s=r[i],u=s.instance,a=s.currentTarget;if(s=s.listener,u!==o&&l.isPropagationStopped())break e;Tu(l,s,a),o=u}else for(i=0;i<r.length;i++){if(s=r[i],u=s.instance,a=s.currentTarget,s=s.listener,u!==o&&l.isPropagationStopped())break e;Tu(l,s,a),o=u}}}if(El)throw e=di,El=!1,di=null,e}function H(e,t){var n=t[xi];n===void 0&&(n=t[xi]=new Set);var r=e+"__bubble";n.has(r)||(qc(t,e,2,!1),n.add(r))}function zo(e,t,n){var r=0;t&&(r|=4),qc(n,e,r,t)}var Xr="_reactListening"+Math.random().toString(36).slice(2);function vr(e){if(!e[Xr]){e[Xr]=!0,nc.forEach(function(n){n!=="selectionchange"&&(Eh.has(n)||zo(n,!1,e),zo(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[Xr]||(t[Xr]=!0,zo("selectionchange",!1,t))}}function qc(e,t,n,r){switch(Lc(t)){case 1:var l=Dp;break;case 4:l=Up;break;default:l=cs}n=l.bind(null,t,n,e),l=void 0,!fi||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Fo(e,t,n,r,l){var o=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var i=r.tag;if(i===3||i===4){var s=r.stateNode.containerInfo;if(s===l||s.nodeType===8&&s.parentNode===l)break;if(i===4)for(i=r.return;i!==null;){var u=i.tag;if((u===3||u===4)&&(u=i.stateNode.containerInfo,u===l||u.nodeType===8&&u.parentNode===l))return;i=i.return}for(;s!==null;){if(i=Bt(s),i===null)return;if(u=i.tag,u===5||u===6){r=o=i;continue e}s=s.parentNode}}r=r.return}gc(function(){var a=o,c=is(n),f=[];e:{var v=Jc.get(e);if(v!==void 0){var g=ds,m=e;switch(e){case"keypress":if(sl(n)===0)break e;case"keydown":case"keyup":g=Yp;break;case"focusin":m="focus",g=_o;break;case"focusout":m="blur",g=_o;break;case"beforeblur":case"afterblur":g=_o;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":g=gu;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":g=Mp;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":g=eh;break;case Vc:case Wc:case Qc:g=Hp;break;case Kc:g=nh;break;case"scroll":g=Ap;break;case"wheel":g=lh;break;case"copy":case"cut":case"paste":g=Wp;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":g=Su}var w=(t&4)!==0,E=!w&&e==="scroll",p=w?v!==null?v+"Capture":null:v;w=[];for(var d=a,h;d!==null;){h=d;var x=h.stateNode;if(h.tag===5&&x!==null&&(h=x,p!==null&&(x=cr(d,p),x!=null&&w.push(yr(d,x,h)))),E)break;d=d.return}0<w.length&&(v=new g(v,m,null,n,c),f.push({event:v,listeners:w}))}}if(!(t&7)){e:{if(v=e==="mouseover"||e==="pointerover",g=e==="mouseout"||e==="pointerout",v&&n!==ai&&(m=n.relatedTarget||n.fromElement)&&(Bt(m)||m[ut]))break e;if((g||v)&&(v=c.window===c?c:(v=c.ownerDocument)?v.defaultView||v.parentWindow:window,g?(m=n.relatedTarget||n.toElement,g=a,m=m?Bt(m):null,m!==null&&(E=bt(m),m!==E||m.tag!==5&&m.tag!==6)&&(m=null)):(g=null,m=a),g!==m)){if(w=gu,x="onMouseLeave",p="onMouseEnter",d="mouse",(e==="pointerout"||e==="pointerover")&&(w=Su,x="onPointerLeave",p="onPointerEnter",d="pointer"),E=g==null?v:an(g),h=m==null?v:an(m),v=new w(x,d+"leave",g,n,c),v.target=E,v.relatedTarget=h,x=null,Bt(c)===a&&(w=new w(p,d+"enter",m,n,c),w.target=h,w.relatedTarget=E,x=w),E=x,g&&m)t:{for(w=g,p=m,d=0,h=w;h;h=nn(h))d++;for(h=0,x=p;x;x=nn(x))h++;for(;0<d-h;)w=nn(w),d--;for(;0<h-d;)p=nn(p),h--;for(;d--;){if(w===p||p!==null&&w===p.alternate)break t;w=nn(w),p=nn(p)}w=null}else w=null;g!==null&&Ou(f,v,g,w,!1),m!==null&&E!==null&&Ou(f,E,m,w,!0)}}e:{if(v=a?an(a):window,g=v.nodeName&&v.nodeName.toLowerCase(),g==="select"||g==="input"&&v.type==="file")var C=fh;else if(ku(v))if(Ic)C=mh;else{C=ph;var j=dh}else(g=v.nodeName)&&g.toLowerCase()==="input"&&(v.type==="checkbox"||v.type==="radio")&&(C=hh);if(C&&(C=C(e,a))){Ac(f,C,n,c);break e}j&&j(e,v,a),e==="focusout"&&(j=v._wrapperState)&&j.controlled&&v.type==="number"&&li(v,"number",v.value)}switch(j=a?an(a):window,e){case"focusin":(ku(j)||j.contentEditable==="true")&&(sn=j,vi=a,rr=null);break;case"focusout":rr=vi=sn=null;break;case"mousedown":yi=!0;break;case"contextmenu":case"mouseup":case"dragend":yi=!1,Pu(f,n,c);break;case"selectionchange":if(gh)break;case"keydown":case"keyup":Pu(f,n,c)}var _;if(hs)e:{switch(e){case"compositionstart":var T="onCompositionStart";break e;case"compositionend":T="onCompositionEnd";break e;case"compositionupdate":T="onCompositionUpdate";break e}T=void 0}else on?Dc(e,n)&&(T="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(T="onCompositionStart");T&&(Fc&&n.locale!=="ko"&&(on||T!=="onCompositionStart"?T==="onCompositionEnd"&&on&&(_=zc()):(gt=c,fs="value"in gt?gt.value:gt.textContent,on=!0)),j=Rl(a,T),0<j.length&&(T=new wu(T,e,null,n,c),f.push({event:T,listeners:j}),_?T.data=_:(_=Uc(n),_!==null&&(T.data=_)))),(_=ih?sh(e,n):uh(e,n))&&(a=Rl(a,"onBeforeInput"),0<a.length&&(c=new wu("onBeforeInput","beforeinput",null,n,c),f.push({event:c,listeners:a}),c.data=_))}Xc(f,t)})}function yr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Rl(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,o=l.stateNode;l.tag===5&&o!==null&&(l=o,o=cr(e,n),o!=null&&r.unshift(yr(e,o,l)),o=cr(e,t),o!=null&&r.push(yr(e,o,l))),e=e.return}return r}function nn(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Ou(e,t,n,r,l){for(var o=t._reactName,i=[];n!==null&&n!==r;){var s=n,u=s.alternate,a=s.stateNode;if(u!==null&&u===r)break;s.tag===5&&a!==null&&(s=a,l?(u=cr(n,o),u!=null&&i.unshift(yr(n,u,s))):l||(u=cr(n,o),u!=null&&i.push(yr(n,u,s)))),n=n.return}i.length!==0&&e.push({event:t,listeners:i})}var xh=/\r\n?/g,kh=/\u0000|\uFFFD/g;function Lu(e){return(typeof e=="string"?e:""+e).replace(xh,`
-`).replace(kh,"")}function qr(e,t,n){if(t=Lu(t),Lu(e)!==t&&n)throw Error(k(425))}function _l(){}var gi=null,wi=null;function Si(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Ei=typeof setTimeout=="function"?setTimeout:void 0,Ch=typeof clearTimeout=="function"?clearTimeout:void 0,zu=typeof Promise=="function"?Promise:void 0,Nh=typeof queueMicrotask=="function"?queueMicrotask:typeof zu<"u"?function(e){return zu.resolve(null).then(e).catch(Rh)}:Ei;function Rh(e){setTimeout(function(){throw e})}function Do(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),pr(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);pr(t)}function Ct(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function Fu(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var Fn=Math.random().toString(36).slice(2),Ye="__reactFiber$"+Fn,gr="__reactProps$"+Fn,ut="__reactContainer$"+Fn,xi="__reactEvents$"+Fn,_h="__reactListeners$"+Fn,Ph="__reactHandles$"+Fn;function Bt(e){var t=e[Ye];if(t)return t;for(var n=e.parentNode;n;){if(t=n[ut]||n[Ye]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=Fu(e);e!==null;){if(n=e[Ye])return n;e=Fu(e)}return t}e=n,n=e.parentNode}return null}function Tr(e){return e=e[Ye]||e[ut],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function an(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(k(33))}function Zl(e){return e[gr]||null}var ki=[],cn=-1;function zt(e){return{current:e}}function V(e){0>cn||(e.current=ki[cn],ki[cn]=null,cn--)}function B(e,t){cn++,ki[cn]=e.current,e.current=t}var Ot={},ce=zt(Ot),we=zt(!1),Kt=Ot;function kn(e,t){var n=e.type.contextTypes;if(!n)return Ot;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},o;for(o in n)l[o]=t[o];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function Se(e){return e=e.childContextTypes,e!=null}function Pl(){V(we),V(ce)}function Du(e,t,n){if(ce.current!==Ot)throw Error(k(168));B(ce,t),B(we,n)}function Gc(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(k(108,dp(e)||"Unknown",l));return J({},n,r)}function jl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Ot,Kt=ce.current,B(ce,e),B(we,we.current),!0}function Uu(e,t,n){var r=e.stateNode;if(!r)throw Error(k(169));n?(e=Gc(e,t,Kt),r.__reactInternalMemoizedMergedChildContext=e,V(we),V(ce),B(ce,e)):V(we),B(we,n)}var nt=null,bl=!1,Uo=!1;function Yc(e){nt===null?nt=[e]:nt.push(e)}function jh(e){bl=!0,Yc(e)}function Ft(){if(!Uo&&nt!==null){Uo=!0;var e=0,t=I;try{var n=nt;for(I=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}nt=null,bl=!1}catch(l){throw nt!==null&&(nt=nt.slice(e+1)),xc(ss,Ft),l}finally{I=t,Uo=!1}}return null}var fn=[],dn=0,Tl=null,Ol=0,Te=[],Oe=0,Jt=null,lt=1,ot="";function It(e,t){fn[dn++]=Ol,fn[dn++]=Tl,Tl=e,Ol=t}function Zc(e,t,n){Te[Oe++]=lt,Te[Oe++]=ot,Te[Oe++]=Jt,Jt=e;var r=lt;e=ot;var l=32-$e(r)-1;r&=~(1<<l),n+=1;var o=32-$e(t)+l;if(30<o){var i=l-l%5;o=(r&(1<<i)-1).toString(32),r>>=i,l-=i,lt=1<<32-$e(t)+l|n<<l|r,ot=o+e}else lt=1<<o|n<<l|r,ot=e}function vs(e){e.return!==null&&(It(e,1),Zc(e,1,0))}function ys(e){for(;e===Tl;)Tl=fn[--dn],fn[dn]=null,Ol=fn[--dn],fn[dn]=null;for(;e===Jt;)Jt=Te[--Oe],Te[Oe]=null,ot=Te[--Oe],Te[Oe]=null,lt=Te[--Oe],Te[Oe]=null}var Ne=null,Ce=null,W=!1,Be=null;function bc(e,t){var n=Le(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function Au(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Ne=e,Ce=Ct(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Ne=e,Ce=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Jt!==null?{id:lt,overflow:ot}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=Le(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Ne=e,Ce=null,!0):!1;default:return!1}}function Ci(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Ni(e){if(W){var t=Ce;if(t){var n=t;if(!Au(e,t)){if(Ci(e))throw Error(k(418));t=Ct(n.nextSibling);var r=Ne;t&&Au(e,t)?bc(r,n):(e.flags=e.flags&-4097|2,W=!1,Ne=e)}}else{if(Ci(e))throw Error(k(418));e.flags=e.flags&-4097|2,W=!1,Ne=e}}}function Iu(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Ne=e}function Gr(e){if(e!==Ne)return!1;if(!W)return Iu(e),W=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!Si(e.type,e.memoizedProps)),t&&(t=Ce)){if(Ci(e))throw ef(),Error(k(418));for(;t;)bc(e,t),t=Ct(t.nextSibling)}if(Iu(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(k(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){Ce=Ct(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}Ce=null}}else Ce=Ne?Ct(e.stateNode.nextSibling):null;return!0}function ef(){for(var e=Ce;e;)e=Ct(e.nextSibling)}function Cn(){Ce=Ne=null,W=!1}function gs(e){Be===null?Be=[e]:Be.push(e)}var Th=ft.ReactCurrentBatchConfig;function Wn(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(k(309));var r=n.stateNode}if(!r)throw Error(k(147,e));var l=r,o=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===o?t.ref:(t=function(i){var s=l.refs;i===null?delete s[o]:s[o]=i},t._stringRef=o,t)}if(typeof e!="string")throw Error(k(284));if(!n._owner)throw Error(k(290,e))}return e}function Yr(e,t){throw e=Object.prototype.toString.call(t),Error(k(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Mu(e){var t=e._init;return t(e._payload)}function tf(e){function t(p,d){if(e){var h=p.deletions;h===null?(p.deletions=[d],p.flags|=16):h.push(d)}}function n(p,d){if(!e)return null;for(;d!==null;)t(p,d),d=d.sibling;return null}function r(p,d){for(p=new Map;d!==null;)d.key!==null?p.set(d.key,d):p.set(d.index,d),d=d.sibling;return p}function l(p,d){return p=Pt(p,d),p.index=0,p.sibling=null,p}function o(p,d,h){return p.index=h,e?(h=p.alternate,h!==null?(h=h.index,h<d?(p.flags|=2,d):h):(p.flags|=2,d)):(p.flags|=1048576,d)}function i(p){return e&&p.alternate===null&&(p.flags|=2),p}function s(p,d,h,x){return d===null||d.tag!==6?(d=Vo(h,p.mode,x),d.return=p,d):(d=l(d,h),d.return=p,d)}function u(p,d,h,x){var C=h.type;return C===ln?c(p,d,h.props.children,x,h.key):d!==null&&(d.elementType===C||typeof C=="object"&&C!==null&&C.$$typeof===ht&&Mu(C)===d.type)?(x=l(d,h.props),x.ref=Wn(p,d,h),x.return=p,x):(x=hl(h.type,h.key,h.props,null,p.mode,x),x.ref=Wn(p,d,h),x.return=p,x)}function a(p,d,h,x){return d===null||d.tag!==4||d.stateNode.containerInfo!==h.containerInfo||d.stateNode.implementation!==h.implementation?(d=Wo(h,p.mode,x),d.return=p,d):(d=l(d,h.children||[]),d.return=p,d)}function c(p,d,h,x,C){return d===null||d.tag!==7?(d=Qt(h,p.mode,x,C),d.return=p,d):(d=l(d,h),d.return=p,d)}function f(p,d,h){if(typeof d=="string"&&d!==""||typeof d=="number")return d=Vo(""+d,p.mode,h),d.return=p,d;if(typeof d=="object"&&d!==null){switch(d.$$typeof){case Br:return h=hl(d.type,d.key,d.props,null,p.mode,h),h.ref=Wn(p,null,d),h.return=p,h;case rn:return d=Wo(d,p.mode,h),d.return=p,d;case ht:var x=d._init;return f(p,x(d._payload),h)}if(Gn(d)||Mn(d))return d=Qt(d,p.mode,h,null),d.return=p,d;Yr(p,d)}return null}function v(p,d,h,x){var C=d!==null?d.key:null;if(typeof h=="string"&&h!==""||typeof h=="number")return C!==null?null:s(p,d,""+h,x);if(typeof h=="object"&&h!==null){switch(h.$$typeof){case Br:return h.key===C?u(p,d,h,x):null;case rn:return h.key===C?a(p,d,h,x):null;case ht:return C=h._init,v(p,d,C(h._payload),x)}if(Gn(h)||Mn(h))return C!==null?null:c(p,d,h,x,null);Yr(p,h)}return null}function g(p,d,h,x,C){if(typeof x=="string"&&x!==""||typeof x=="number")return p=p.get(h)||null,s(d,p,""+x,C);if(typeof x=="object"&&x!==null){switch(x.$$typeof){case Br:return p=p.get(x.key===null?h:x.key)||null,u(d,p,x,C);case rn:return p=p.get(x.key===null?h:x.key)||null,a(d,p,x,C);case ht:var j=x._init;return g(p,d,h,j(x._payload),C)}if(Gn(x)||Mn(x))return p=p.get(h)||null,c(d,p,x,C,null);Yr(d,x)}return null}function m(p,d,h,x){for(var C=null,j=null,_=d,T=d=0,M=null;_!==null&&T<h.length;T++){_.index>T?(M=_,_=null):M=_.sibling;var F=v(p,_,h[T],x);if(F===null){_===null&&(_=M);break}e&&_&&F.alternate===null&&t(p,_),d=o(F,d,T),j===null?C=F:j.sibling=F,j=F,_=M}if(T===h.length)return n(p,_),W&&It(p,T),C;if(_===null){for(;T<h.length;T++)_=f(p,h[T],x),_!==null&&(d=o(_,d,T),j===null?C=_:j.sibling=_,j=_);return W&&It(p,T),C}for(_=r(p,_);T<h.length;T++)M=g(_,p,T,h[T],x),M!==null&&(e&&M.alternate!==null&&_.delete(M.key===null?T:M.key),d=o(M,d,T),j===null?C=M:j.sibling=M,j=M);return e&&_.forEach(function(me){return t(p,me)}),W&&It(p,T),C}function w(p,d,h,x){var C=Mn(h);if(typeof C!="function")throw Error(k(150));if(h=C.call(h),h==null)throw Error(k(151));for(var j=C=null,_=d,T=d=0,M=null,F=h.next();_!==null&&!F.done;T++,F=h.next()){_.index>T?(M=_,_=null):M=_.sibling;var me=v(p,_,F.value,x);if(me===null){_===null&&(_=M);break}e&&_&&me.alternate===null&&t(p,_),d=o(me,d,T),j===null?C=me:j.sibling=me,j=me,_=M}if(F.done)return n(p,_),W&&It(p,T),C;if(_===null){for(;!F.done;T++,F=h.next())F=f(p,F.value,x),F!==null&&(d=o(F,d,T),j===null?C=F:j.sibling=F,j=F);return W&&It(p,T),C}for(_=r(p,_);!F.done;T++,F=h.next())F=g(_,p,T,F.value,x),F!==null&&(e&&F.alternate!==null&&_.delete(F.key===null?T:F.key),d=o(F,d,T),j===null?C=F:j.sibling=F,j=F);return e&&_.forEach(function(Ke){return t(p,Ke)}),W&&It(p,T),C}function E(p,d,h,x){if(typeof h=="object"&&h!==null&&h.type===ln&&h.key===null&&(h=h.props.children),typeof h=="object"&&h!==null){switch(h.$$typeof){case Br:e:{for(var C=h.key,j=d;j!==null;){if(j.key===C){if(C=h.type,C===ln){if(j.tag===7){n(p,j.sibling),d=l(j,h.props.children),d.return=p,p=d;break e}}else if(j.elementType===C||typeof C=="object"&&C!==null&&C.$$typeof===ht&&Mu(C)===j.type){n(p,j.sibling),d=l(j,h.props),d.ref=Wn(p,j,h),d.return=p,p=d;break e}n(p,j);break}else t(p,j);j=j.sibling}h.type===ln?(d=Qt(h.props.children,p.mode,x,h.key),d.return=p,p=d):(x=hl(h.type,h.key,h.props,null,p.mode,x),x.ref=Wn(p,d,h),x.return=p,p=x)}return i(p);case rn:e:{for(j=h.key;d!==null;){if(d.key===j)if(d.tag===4&&d.stateNode.containerInfo===h.containerInfo&&d.stateNode.implementation===h.implementation){n(p,d.sibling),d=l(d,h.children||[]),d.return=p,p=d;break e}else{n(p,d);break}else t(p,d);d=d.sibling}d=Wo(h,p.mode,x),d.return=p,p=d}return i(p);case ht:return j=h._init,E(p,d,j(h._payload),x)}if(Gn(h))return m(p,d,h,x);if(Mn(h))return w(p,d,h,x);Yr(p,h)}return typeof h=="string"&&h!==""||typeof h=="number"?(h=""+h,d!==null&&d.tag===6?(n(p,d.sibling),d=l(d,h),d.return=p,p=d):(n(p,d),d=Vo(h,p.mode,x),d.return=p,p=d),i(p)):n(p,d)}return E}var Nn=tf(!0),nf=tf(!1),Ll=zt(null),zl=null,pn=null,ws=null;function Ss(){ws=pn=zl=null}function Es(e){var t=Ll.current;V(Ll),e._currentValue=t}function Ri(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Sn(e,t){zl=e,ws=pn=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(ge=!0),e.firstContext=null)}function Fe(e){var t=e._currentValue;if(ws!==e)if(e={context:e,memoizedValue:t,next:null},pn===null){if(zl===null)throw Error(k(308));pn=e,zl.dependencies={lanes:0,firstContext:e}}else pn=pn.next=e;return t}var $t=null;function xs(e){$t===null?$t=[e]:$t.push(e)}function rf(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,xs(t)):(n.next=l.next,l.next=n),t.interleaved=n,at(e,r)}function at(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var mt=!1;function ks(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function lf(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function it(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Nt(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,U&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,at(e,n)}return l=r.interleaved,l===null?(t.next=t,xs(r)):(t.next=l.next,l.next=t),r.interleaved=t,at(e,n)}function ul(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,us(e,n)}}function Bu(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};o===null?l=o=i:o=o.next=i,n=n.next}while(n!==null);o===null?l=o=t:o=o.next=t}else l=o=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:o,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Fl(e,t,n,r){var l=e.updateQueue;mt=!1;var o=l.firstBaseUpdate,i=l.lastBaseUpdate,s=l.shared.pending;if(s!==null){l.shared.pending=null;var u=s,a=u.next;u.next=null,i===null?o=a:i.next=a,i=u;var c=e.alternate;c!==null&&(c=c.updateQueue,s=c.lastBaseUpdate,s!==i&&(s===null?c.firstBaseUpdate=a:s.next=a,c.lastBaseUpdate=u))}if(o!==null){var f=l.baseState;i=0,c=a=u=null,s=o;do{var v=s.lane,g=s.eventTime;if((r&v)===v){c!==null&&(c=c.next={eventTime:g,lane:0,tag:s.tag,payload:s.payload,callback:s.callback,next:null});e:{var m=e,w=s;switch(v=t,g=n,w.tag){case 1:if(m=w.payload,typeof m=="function"){f=m.call(g,f,v);break e}f=m;break e;case 3:m.flags=m.flags&-65537|128;case 0:if(m=w.payload,v=typeof m=="function"?m.call(g,f,v):m,v==null)break e;f=J({},f,v);break e;case 2:mt=!0}}s.callback!==null&&s.lane!==0&&(e.flags|=64,v=l.effects,v===null?l.effects=[s]:v.push(s))}else g={eventTime:g,lane:v,tag:s.tag,payload:s.payload,callback:s.callback,next:null},c===null?(a=c=g,u=f):c=c.next=g,i|=v;if(s=s.next,s===null){if(s=l.shared.pending,s===null)break;v=s,s=v.next,v.next=null,l.lastBaseUpdate=v,l.shared.pending=null}}while(1);if(c===null&&(u=f),l.baseState=u,l.firstBaseUpdate=a,l.lastBaseUpdate=c,t=l.shared.interleaved,t!==null){l=t;do i|=l.lane,l=l.next;while(l!==t)}else o===null&&(l.shared.lanes=0);qt|=i,e.lanes=i,e.memoizedState=f}}function $u(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(k(191,l));l.call(r)}}}var Or={},be=zt(Or),wr=zt(Or),Sr=zt(Or);function Ht(e){if(e===Or)throw Error(k(174));return e}function Cs(e,t){switch(B(Sr,t),B(wr,e),B(be,Or),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:ii(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=ii(t,e)}V(be),B(be,t)}function Rn(){V(be),V(wr),V(Sr)}function of(e){Ht(Sr.current);var t=Ht(be.current),n=ii(t,e.type);t!==n&&(B(wr,e),B(be,n))}function Ns(e){wr.current===e&&(V(be),V(wr))}var Q=zt(0);function Dl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Ao=[];function Rs(){for(var e=0;e<Ao.length;e++)Ao[e]._workInProgressVersionPrimary=null;Ao.length=0}var al=ft.ReactCurrentDispatcher,Io=ft.ReactCurrentBatchConfig,Xt=0,K=null,b=null,te=null,Ul=!1,lr=!1,Er=0,Oh=0;function ie(){throw Error(k(321))}function _s(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!We(e[n],t[n]))return!1;return!0}function Ps(e,t,n,r,l,o){if(Xt=o,K=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,al.current=e===null||e.memoizedState===null?Dh:Uh,e=n(r,l),lr){o=0;do{if(lr=!1,Er=0,25<=o)throw Error(k(301));o+=1,te=b=null,t.updateQueue=null,al.current=Ah,e=n(r,l)}while(lr)}if(al.current=Al,t=b!==null&&b.next!==null,Xt=0,te=b=K=null,Ul=!1,t)throw Error(k(300));return e}function js(){var e=Er!==0;return Er=0,e}function Ge(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return te===null?K.memoizedState=te=e:te=te.next=e,te}function De(){if(b===null){var e=K.alternate;e=e!==null?e.memoizedState:null}else e=b.next;var t=te===null?K.memoizedState:te.next;if(t!==null)te=t,b=e;else{if(e===null)throw Error(k(310));b=e,e={memoizedState:b.memoizedState,baseState:b.baseState,baseQueue:b.baseQueue,queue:b.queue,next:null},te===null?K.memoizedState=te=e:te=te.next=e}return te}function xr(e,t){return typeof t=="function"?t(e):t}function Mo(e){var t=De(),n=t.queue;if(n===null)throw Error(k(311));n.lastRenderedReducer=e;var r=b,l=r.baseQueue,o=n.pending;if(o!==null){if(l!==null){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,n.pending=null}if(l!==null){o=l.next,r=r.baseState;var s=i=null,u=null,a=o;do{var c=a.lane;if((Xt&c)===c)u!==null&&(u=u.next={lane:0,action:a.action,hasEagerState:a.hasEagerState,eagerState:a.eagerState,next:null}),r=a.hasEagerState?a.eagerState:e(r,a.action);else{var f={lane:c,action:a.action,hasEagerState:a.hasEagerState,eagerState:a.eagerState,next:null};u===null?(s=u=f,i=r):u=u.next=f,K.lanes|=c,qt|=c}a=a.next}while(a!==null&&a!==o);u===null?i=r:u.next=s,We(r,t.memoizedState)||(ge=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=u,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do o=l.lane,K.lanes|=o,qt|=o,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Bo(e){var t=De(),n=t.queue;if(n===null)throw Error(k(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,o=t.memoizedState;if(l!==null){n.pending=null;var i=l=l.next;do o=e(o,i.action),i=i.next;while(i!==l);We(o,t.memoizedState)||(ge=!0),t.memoizedState=o,t.baseQueue===null&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function sf(){}function uf(e,t){var n=K,r=De(),l=t(),o=!We(r.memoizedState,l);if(o&&(r.memoizedState=l,ge=!0),r=r.queue,Ts(ff.bind(null,n,r,e),[e]),r.getSnapshot!==t||o||te!==null&&te.memoizedState.tag&1){if(n.flags|=2048,kr(9,cf.bind(null,n,r,l,t),void 0,null),ne===null)throw Error(k(349));Xt&30||af(n,t,l)}return l}function af(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function cf(e,t,n,r){t.value=n,t.getSnapshot=r,df(t)&&pf(e)}function ff(e,t,n){return n(function(){df(t)&&pf(e)})}function df(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!We(e,n)}catch{return!0}}function pf(e){var t=at(e,1);t!==null&&He(t,e,1,-1)}function Hu(e){var t=Ge();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:xr,lastRenderedState:e},t.queue=e,e=e.dispatch=Fh.bind(null,K,e),[t.memoizedState,e]}function kr(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=K.updateQueue,t===null?(t={lastEffect:null,stores:null},K.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function hf(){return De().memoizedState}function cl(e,t,n,r){var l=Ge();K.flags|=e,l.memoizedState=kr(1|t,n,void 0,r===void 0?null:r)}function eo(e,t,n,r){var l=De();r=r===void 0?null:r;var o=void 0;if(b!==null){var i=b.memoizedState;if(o=i.destroy,r!==null&&_s(r,i.deps)){l.memoizedState=kr(t,n,o,r);return}}K.flags|=e,l.memoizedState=kr(1|t,n,o,r)}function Vu(e,t){return cl(8390656,8,e,t)}function Ts(e,t){return eo(2048,8,e,t)}function mf(e,t){return eo(4,2,e,t)}function vf(e,t){return eo(4,4,e,t)}function yf(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function gf(e,t,n){return n=n!=null?n.concat([e]):null,eo(4,4,yf.bind(null,t,e),n)}function Os(){}function wf(e,t){var n=De();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&_s(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Sf(e,t){var n=De();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&_s(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Ef(e,t,n){return Xt&21?(We(n,t)||(n=Nc(),K.lanes|=n,qt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,ge=!0),e.memoizedState=n)}function Lh(e,t){var n=I;I=n!==0&&4>n?n:4,e(!0);var r=Io.transition;Io.transition={};try{e(!1),t()}finally{I=n,Io.transition=r}}function xf(){return De().memoizedState}function zh(e,t,n){var r=_t(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},kf(e))Cf(t,n);else if(n=rf(e,t,n,r),n!==null){var l=de();He(n,e,r,l),Nf(n,t,r)}}function Fh(e,t,n){var r=_t(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(kf(e))Cf(t,l);else{var o=e.alternate;if(e.lanes===0&&(o===null||o.lanes===0)&&(o=t.lastRenderedReducer,o!==null))try{var i=t.lastRenderedState,s=o(i,n);if(l.hasEagerState=!0,l.eagerState=s,We(s,i)){var u=t.interleaved;u===null?(l.next=l,xs(t)):(l.next=u.next,u.next=l),t.interleaved=l;return}}catch{}finally{}n=rf(e,t,l,r),n!==null&&(l=de(),He(n,e,r,l),Nf(n,t,r))}}function kf(e){var t=e.alternate;return e===K||t!==null&&t===K}function Cf(e,t){lr=Ul=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Nf(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,us(e,n)}}var Al={readContext:Fe,useCallback:ie,useContext:ie,useEffect:ie,useImperativeHandle:ie,useInsertionEffect:ie,useLayoutEffect:ie,useMemo:ie,useReducer:ie,useRef:ie,useState:ie,useDebugValue:ie,useDeferredValue:ie,useTransition:ie,useMutableSource:ie,useSyncExternalStore:ie,useId:ie,unstable_isNewReconciler:!1},Dh={readContext:Fe,useCallback:function(e,t){return Ge().memoizedState=[e,t===void 0?null:t],e},useContext:Fe,useEffect:Vu,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,cl(4194308,4,yf.bind(null,t,e),n)},useLayoutEffect:function(e,t){return cl(4194308,4,e,t)},useInsertionEffect:function(e,t){return cl(4,2,e,t)},useMemo:function(e,t){var n=Ge();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Ge();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=zh.bind(null,K,e),[r.memoizedState,e]},useRef:function(e){var t=Ge();return e={current:e},t.memoizedState=e},useState:Hu,useDebugValue:Os,useDeferredValue:function(e){return Ge().memoizedState=e},useTransition:function(){var e=Hu(!1),t=e[0];return e=Lh.bind(null,e[1]),Ge().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=K,l=Ge();if(W){if(n===void 0)throw Error(k(407));n=n()}else{if(n=t(),ne===null)throw Error(k(349));Xt&30||af(r,t,n)}l.memoizedState=n;var o={value:n,getSnapshot:t};return l.queue=o,Vu(ff.bind(null,r,o,e),[e]),r.flags|=2048,kr(9,cf.bind(null,r,o,n,t),void 0,null),n},useId:function(){var e=Ge(),t=ne.identifierPrefix;if(W){var n=ot,r=lt;n=(r&~(1<<32-$e(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=Er++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=Oh++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},Uh={readContext:Fe,useCallback:wf,useContext:Fe,useEffect:Ts,useImperativeHandle:gf,useInsertionEffect:mf,useLayoutEffect:vf,useMemo:Sf,useReducer:Mo,useRef:hf,useState:function(){return Mo(xr)},useDebugValue:Os,useDeferredValue:function(e){var t=De();return Ef(t,b.memoizedState,e)},useTransition:function(){var e=Mo(xr)[0],t=De().memoizedState;return[e,t]},useMutableSource:sf,useSyncExternalStore:uf,useId:xf,unstable_isNewReconciler:!1},Ah={readContext:Fe,useCallback:wf,useContext:Fe,useEffect:Ts,useImperativeHandle:gf,useInsertionEffect:mf,useLayoutEffect:vf,useMemo:Sf,useReducer:Bo,useRef:hf,useState:function(){return Bo(xr)},useDebugValue:Os,useDeferredValue:function(e){var t=De();return b===null?t.memoizedState=e:Ef(t,b.memoizedState,e)},useTransition:function(){var e=Bo(xr)[0],t=De().memoizedState;return[e,t]},useMutableSource:sf,useSyncExternalStore:uf,useId:xf,unstable_isNewReconciler:!1};function Ie(e,t){if(e&&e.defaultProps){t=J({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function _i(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:J({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var to={isMounted:function(e){return(e=e._reactInternals)?bt(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=de(),l=_t(e),o=it(r,l);o.payload=t,n!=null&&(o.callback=n),t=Nt(e,o,l),t!==null&&(He(t,e,l,r),ul(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=de(),l=_t(e),o=it(r,l);o.tag=1,o.payload=t,n!=null&&(o.callback=n),t=Nt(e,o,l),t!==null&&(He(t,e,l,r),ul(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=de(),r=_t(e),l=it(n,r);l.tag=2,t!=null&&(l.callback=t),t=Nt(e,l,r),t!==null&&(He(t,e,r,n),ul(t,e,r))}};function Wu(e,t,n,r,l,o,i){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,o,i):t.prototype&&t.prototype.isPureReactComponent?!mr(n,r)||!mr(l,o):!0}function Rf(e,t,n){var r=!1,l=Ot,o=t.contextType;return typeof o=="object"&&o!==null?o=Fe(o):(l=Se(t)?Kt:ce.current,r=t.contextTypes,o=(r=r!=null)?kn(e,l):Ot),t=new t(n,o),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=to,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=o),t}function Qu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&to.enqueueReplaceState(t,t.state,null)}function Pi(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},ks(e);var o=t.contextType;typeof o=="object"&&o!==null?l.context=Fe(o):(o=Se(t)?Kt:ce.current,l.context=kn(e,o)),l.state=e.memoizedState,o=t.getDerivedStateFromProps,typeof o=="function"&&(_i(e,t,o,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&to.enqueueReplaceState(l,l.state,null),Fl(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function _n(e,t){try{var n="",r=t;do n+=fp(r),r=r.return;while(r);var l=n}catch(o){l=`
-Error generating stack: `+o.message+`
-`+o.stack}return{value:e,source:t,stack:l,digest:null}}function $o(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function ji(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var Ih=typeof WeakMap=="function"?WeakMap:Map;function _f(e,t,n){n=it(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Ml||(Ml=!0,Mi=r),ji(e,t)},n}function Pf(e,t,n){n=it(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){ji(e,t)}}var o=e.stateNode;return o!==null&&typeof o.componentDidCatch=="function"&&(n.callback=function(){ji(e,t),typeof r!="function"&&(Rt===null?Rt=new Set([this]):Rt.add(this));var i=t.stack;this.componentDidCatch(t.value,{componentStack:i!==null?i:""})}),n}function Ku(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new Ih;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=Zh.bind(null,e,t,n),t.then(e,e))}function Ju(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Xu(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=it(-1,1),t.tag=2,Nt(n,t,1))),n.lanes|=1),e)}var Mh=ft.ReactCurrentOwner,ge=!1;function fe(e,t,n,r){t.child=e===null?nf(t,null,n,r):Nn(t,e.child,n,r)}function qu(e,t,n,r,l){n=n.render;var o=t.ref;return Sn(t,l),r=Ps(e,t,n,r,o,l),n=js(),e!==null&&!ge?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,ct(e,t,l)):(W&&n&&vs(t),t.flags|=1,fe(e,t,r,l),t.child)}function Gu(e,t,n,r,l){if(e===null){var o=n.type;return typeof o=="function"&&!Ms(o)&&o.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=o,jf(e,t,o,r,l)):(e=hl(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!(e.lanes&l)){var i=o.memoizedProps;if(n=n.compare,n=n!==null?n:mr,n(i,r)&&e.ref===t.ref)return ct(e,t,l)}return t.flags|=1,e=Pt(o,r),e.ref=t.ref,e.return=t,t.child=e}function jf(e,t,n,r,l){if(e!==null){var o=e.memoizedProps;if(mr(o,r)&&e.ref===t.ref)if(ge=!1,t.pendingProps=r=o,(e.lanes&l)!==0)e.flags&131072&&(ge=!0);else return t.lanes=e.lanes,ct(e,t,l)}return Ti(e,t,n,r,l)}function Tf(e,t,n){var r=t.pendingProps,l=r.children,o=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},B(mn,ke),ke|=n;else{if(!(n&1073741824))return e=o!==null?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,B(mn,ke),ke|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=o!==null?o.baseLanes:n,B(mn,ke),ke|=r}else o!==null?(r=o.baseLanes|n,t.memoizedState=null):r=n,B(mn,ke),ke|=r;return fe(e,t,l,n),t.child}function Of(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Ti(e,t,n,r,l){var o=Se(n)?Kt:ce.current;return o=kn(t,o),Sn(t,l),n=Ps(e,t,n,r,o,l),r=js(),e!==null&&!ge?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,ct(e,t,l)):(W&&r&&vs(t),t.flags|=1,fe(e,t,n,l),t.child)}function Yu(e,t,n,r,l){if(Se(n)){var o=!0;jl(t)}else o=!1;if(Sn(t,l),t.stateNode===null)fl(e,t),Rf(t,n,r),Pi(t,n,r,l),r=!0;else if(e===null){var i=t.stateNode,s=t.memoizedProps;i.props=s;var u=i.context,a=n.contextType;typeof a=="object"&&a!==null?a=Fe(a):(a=Se(n)?Kt:ce.current,a=kn(t,a));var c=n.getDerivedStateFromProps,f=typeof c=="function"||typeof i.getSnapshotBeforeUpdate=="function";f||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(s!==r||u!==a)&&Qu(t,i,r,a),mt=!1;var v=t.memoizedState;i.state=v,Fl(t,r,i,l),u=t.memoizedState,s!==r||v!==u||we.current||mt?(typeof c=="function"&&(_i(t,n,c,r),u=t.memoizedState),(s=mt||Wu(t,n,s,r,v,u,a))?(f||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount()),typeof i.componentDidMount=="function"&&(t.flags|=4194308)):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=u),i.props=r,i.state=u,i.context=a,r=s):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,lf(e,t),s=t.memoizedProps,a=t.type===t.elementType?s:Ie(t.type,s),i.props=a,f=t.pendingProps,v=i.context,u=n.contextType,typeof u=="object"&&u!==null?u=Fe(u):(u=Se(n)?Kt:ce.current,u=kn(t,u));var g=n.getDerivedStateFromProps;(c=typeof g=="function"||typeof i.getSnapshotBeforeUpdate=="function")||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(s!==f||v!==u)&&Qu(t,i,r,u),mt=!1,v=t.memoizedState,i.state=v,Fl(t,r,i,l);var m=t.memoizedState;s!==f||v!==m||we.current||mt?(typeof g=="function"&&(_i(t,n,g,r),m=t.memoizedState),(a=mt||Wu(t,n,a,r,v,m,u)||!1)?(c||typeof i.UNSAFE_componentWillUpdate!="function"&&typeof i.componentWillUpdate!="function"||(typeof i.componentWillUpdate=="function"&&i.componentWillUpdate(r,m,u),typeof i.UNSAFE_componentWillUpdate=="function"&&i.UNSAFE_componentWillUpdate(r,m,u)),typeof i.componentDidUpdate=="function"&&(t.flags|=4),typeof i.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof i.componentDidUpdate!="function"||s===e.memoizedProps&&v===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||s===e.memoizedProps&&v===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=m),i.props=r,i.state=m,i.context=u,r=a):(typeof i.componentDidUpdate!="function"||s===e.memoizedProps&&v===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||s===e.memoizedProps&&v===e.memoizedState||(t.flags|=1024),r=!1)}return Oi(e,t,n,r,o,l)}function Oi(e,t,n,r,l,o){Of(e,t);var i=(t.flags&128)!==0;if(!r&&!i)return l&&Uu(t,n,!1),ct(e,t,o);r=t.stateNode,Mh.current=t;var s=i&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&i?(t.child=Nn(t,e.child,null,o),t.child=Nn(t,null,s,o)):fe(e,t,s,o),t.memoizedState=r.state,l&&Uu(t,n,!0),t.child}function Lf(e){var t=e.stateNode;t.pendingContext?Du(e,t.pendingContext,t.pendingContext!==t.context):t.context&&Du(e,t.context,!1),Cs(e,t.containerInfo)}function Zu(e,t,n,r,l){return Cn(),gs(l),t.flags|=256,fe(e,t,n,r),t.child}var Li={dehydrated:null,treeContext:null,retryLane:0};function zi(e){return{baseLanes:e,cachePool:null,transitions:null}}function zf(e,t,n){var r=t.pendingProps,l=Q.current,o=!1,i=(t.flags&128)!==0,s;if((s=i)||(s=e!==null&&e.memoizedState===null?!1:(l&2)!==0),s?(o=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),B(Q,l&1),e===null)return Ni(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(i=r.children,e=r.fallback,o?(r=t.mode,o=t.child,i={mode:"hidden",children:i},!(r&1)&&o!==null?(o.childLanes=0,o.pendingProps=i):o=lo(i,r,0,null),e=Qt(e,r,n,null),o.return=t,e.return=t,o.sibling=e,t.child=o,t.child.memoizedState=zi(n),t.memoizedState=Li,e):Ls(t,i));if(l=e.memoizedState,l!==null&&(s=l.dehydrated,s!==null))return Bh(e,t,i,r,s,l,n);if(o){o=r.fallback,i=t.mode,l=e.child,s=l.sibling;var u={mode:"hidden",children:r.children};return!(i&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=u,t.deletions=null):(r=Pt(l,u),r.subtreeFlags=l.subtreeFlags&14680064),s!==null?o=Pt(s,o):(o=Qt(o,i,n,null),o.flags|=2),o.return=t,r.return=t,r.sibling=o,t.child=r,r=o,o=t.child,i=e.child.memoizedState,i=i===null?zi(n):{baseLanes:i.baseLanes|n,cachePool:null,transitions:i.transitions},o.memoizedState=i,o.childLanes=e.childLanes&~n,t.memoizedState=Li,r}return o=e.child,e=o.sibling,r=Pt(o,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Ls(e,t){return t=lo({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function Zr(e,t,n,r){return r!==null&&gs(r),Nn(t,e.child,null,n),e=Ls(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function Bh(e,t,n,r,l,o,i){if(n)return t.flags&256?(t.flags&=-257,r=$o(Error(k(422))),Zr(e,t,i,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(o=r.fallback,l=t.mode,r=lo({mode:"visible",children:r.children},l,0,null),o=Qt(o,l,i,null),o.flags|=2,r.return=t,o.return=t,r.sibling=o,t.child=r,t.mode&1&&Nn(t,e.child,null,i),t.child.memoizedState=zi(i),t.memoizedState=Li,o);if(!(t.mode&1))return Zr(e,t,i,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var s=r.dgst;return r=s,o=Error(k(419)),r=$o(o,r,void 0),Zr(e,t,i,r)}if(s=(i&e.childLanes)!==0,ge||s){if(r=ne,r!==null){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|i)?0:l,l!==0&&l!==o.retryLane&&(o.retryLane=l,at(e,l),He(r,e,l,-1))}return Is(),r=$o(Error(k(421))),Zr(e,t,i,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=bh.bind(null,e),l._reactRetry=t,null):(e=o.treeContext,Ce=Ct(l.nextSibling),Ne=t,W=!0,Be=null,e!==null&&(Te[Oe++]=lt,Te[Oe++]=ot,Te[Oe++]=Jt,lt=e.id,ot=e.overflow,Jt=t),t=Ls(t,r.children),t.flags|=4096,t)}function bu(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Ri(e.return,t,n)}function Ho(e,t,n,r,l){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=l)}function Ff(e,t,n){var r=t.pendingProps,l=r.revealOrder,o=r.tail;if(fe(e,t,r.children,n),r=Q.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&bu(e,n,t);else if(e.tag===19)bu(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(B(Q,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&Dl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),Ho(t,!1,l,n,o);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&Dl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}Ho(t,!0,n,null,o);break;case"together":Ho(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function fl(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function ct(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),qt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(k(153));if(t.child!==null){for(e=t.child,n=Pt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=Pt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function $h(e,t,n){switch(t.tag){case 3:Lf(t),Cn();break;case 5:of(t);break;case 1:Se(t.type)&&jl(t);break;case 4:Cs(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;B(Ll,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(B(Q,Q.current&1),t.flags|=128,null):n&t.child.childLanes?zf(e,t,n):(B(Q,Q.current&1),e=ct(e,t,n),e!==null?e.sibling:null);B(Q,Q.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Ff(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),B(Q,Q.current),r)break;return null;case 22:case 23:return t.lanes=0,Tf(e,t,n)}return ct(e,t,n)}var Df,Fi,Uf,Af;Df=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Fi=function(){};Uf=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,Ht(be.current);var o=null;switch(n){case"input":l=ni(e,l),r=ni(e,r),o=[];break;case"select":l=J({},l,{value:void 0}),r=J({},r,{value:void 0}),o=[];break;case"textarea":l=oi(e,l),r=oi(e,r),o=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=_l)}si(n,r);var i;n=null;for(a in l)if(!r.hasOwnProperty(a)&&l.hasOwnProperty(a)&&l[a]!=null)if(a==="style"){var s=l[a];for(i in s)s.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else a!=="dangerouslySetInnerHTML"&&a!=="children"&&a!=="suppressContentEditableWarning"&&a!=="suppressHydrationWarning"&&a!=="autoFocus"&&(ur.hasOwnProperty(a)?o||(o=[]):(o=o||[]).push(a,null));for(a in r){var u=r[a];if(s=l!=null?l[a]:void 0,r.hasOwnProperty(a)&&u!==s&&(u!=null||s!=null))if(a==="style")if(s){for(i in s)!s.hasOwnProperty(i)||u&&u.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in u)u.hasOwnProperty(i)&&s[i]!==u[i]&&(n||(n={}),n[i]=u[i])}else n||(o||(o=[]),o.push(a,n)),n=u;else a==="dangerouslySetInnerHTML"?(u=u?u.__html:void 0,s=s?s.__html:void 0,u!=null&&s!==u&&(o=o||[]).push(a,u)):a==="children"?typeof u!="string"&&typeof u!="number"||(o=o||[]).push(a,""+u):a!=="suppressContentEditableWarning"&&a!=="suppressHydrationWarning"&&(ur.hasOwnProperty(a)?(u!=null&&a==="onScroll"&&H("scroll",e),o||s===u||(o=[])):(o=o||[]).push(a,u))}n&&(o=o||[]).push("style",n);var a=o;(t.updateQueue=a)&&(t.flags|=4)}};Af=function(e,t,n,r){n!==r&&(t.flags|=4)};function Qn(e,t){if(!W)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function se(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Hh(e,t,n){var r=t.pendingProps;switch(ys(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return se(t),null;case 1:return Se(t.type)&&Pl(),se(t),null;case 3:return r=t.stateNode,Rn(),V(we),V(ce),Rs(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Gr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Be!==null&&(Hi(Be),Be=null))),Fi(e,t),se(t),null;case 5:Ns(t);var l=Ht(Sr.current);if(n=t.type,e!==null&&t.stateNode!=null)Uf(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(k(166));return se(t),null}if(e=Ht(be.current),Gr(t)){r=t.stateNode,n=t.type;var o=t.memoizedProps;switch(r[Ye]=t,r[gr]=o,e=(t.mode&1)!==0,n){case"dialog":H("cancel",r),H("close",r);break;case"iframe":case"object":case"embed":H("load",r);break;case"video":case"audio":for(l=0;l<Zn.length;l++)H(Zn[l],r);break;case"source":H("error",r);break;case"img":case"image":case"link":H("error",r),H("load",r);break;case"details":H("toggle",r);break;case"input":uu(r,o),H("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},H("invalid",r);break;case"textarea":cu(r,o),H("invalid",r)}si(n,o),l=null;for(var i in o)if(o.hasOwnProperty(i)){var s=o[i];i==="children"?typeof s=="string"?r.textContent!==s&&(o.suppressHydrationWarning!==!0&&qr(r.textContent,s,e),l=["children",s]):typeof s=="number"&&r.textContent!==""+s&&(o.suppressHydrationWarning!==!0&&qr(r.textContent,s,e),l=["children",""+s]):ur.hasOwnProperty(i)&&s!=null&&i==="onScroll"&&H("scroll",r)}switch(n){case"input":$r(r),au(r,o,!0);break;case"textarea":$r(r),fu(r);break;case"select":case"option":break;default:typeof o.onClick=="function"&&(r.onclick=_l)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{i=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=cc(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=i.createElement(n,{is:r.is}):(e=i.createElement(n),n==="select"&&(i=e,r.multiple?i.multiple=!0:r.size&&(i.size=r.size))):e=i.createElementNS(e,n),e[Ye]=t,e[gr]=r,Df(e,t,!1,!1),t.stateNode=e;e:{switch(i=ui(n,r),n){case"dialog":H("cancel",e),H("close",e),l=r;break;case"iframe":case"object":case"embed":H("load",e),l=r;break;case"video":case"audio":for(l=0;l<Zn.length;l++)H(Zn[l],e);l=r;break;case"source":H("error",e),l=r;break;case"img":case"image":case"link":H("error",e),H("load",e),l=r;break;case"details":H("toggle",e),l=r;break;case"input":uu(e,r),l=ni(e,r),H("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=J({},r,{value:void 0}),H("invalid",e);break;case"textarea":cu(e,r),l=oi(e,r),H("invalid",e);break;default:l=r}si(n,l),s=l;for(o in s)if(s.hasOwnProperty(o)){var u=s[o];o==="style"?pc(e,u):o==="dangerouslySetInnerHTML"?(u=u?u.__html:void 0,u!=null&&fc(e,u)):o==="children"?typeof u=="string"?(n!=="textarea"||u!=="")&&ar(e,u):typeof u=="number"&&ar(e,""+u):o!=="suppressContentEditableWarning"&&o!=="suppressHydrationWarning"&&o!=="autoFocus"&&(ur.hasOwnProperty(o)?u!=null&&o==="onScroll"&&H("scroll",e):u!=null&&ns(e,o,u,i))}switch(n){case"input":$r(e),au(e,r,!1);break;case"textarea":$r(e),fu(e);break;case"option":r.value!=null&&e.setAttribute("value",""+Tt(r.value));break;case"select":e.multiple=!!r.multiple,o=r.value,o!=null?vn(e,!!r.multiple,o,!1):r.defaultValue!=null&&vn(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=_l)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return se(t),null;case 6:if(e&&t.stateNode!=null)Af(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(k(166));if(n=Ht(Sr.current),Ht(be.current),Gr(t)){if(r=t.stateNode,n=t.memoizedProps,r[Ye]=t,(o=r.nodeValue!==n)&&(e=Ne,e!==null))switch(e.tag){case 3:qr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&qr(r.nodeValue,n,(e.mode&1)!==0)}o&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[Ye]=t,t.stateNode=r}return se(t),null;case 13:if(V(Q),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(W&&Ce!==null&&t.mode&1&&!(t.flags&128))ef(),Cn(),t.flags|=98560,o=!1;else if(o=Gr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!o)throw Error(k(318));if(o=t.memoizedState,o=o!==null?o.dehydrated:null,!o)throw Error(k(317));o[Ye]=t}else Cn(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;se(t),o=!1}else Be!==null&&(Hi(Be),Be=null),o=!0;if(!o)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||Q.current&1?ee===0&&(ee=3):Is())),t.updateQueue!==null&&(t.flags|=4),se(t),null);case 4:return Rn(),Fi(e,t),e===null&&vr(t.stateNode.containerInfo),se(t),null;case 10:return Es(t.type._context),se(t),null;case 17:return Se(t.type)&&Pl(),se(t),null;case 19:if(V(Q),o=t.memoizedState,o===null)return se(t),null;if(r=(t.flags&128)!==0,i=o.rendering,i===null)if(r)Qn(o,!1);else{if(ee!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(i=Dl(e),i!==null){for(t.flags|=128,Qn(o,!1),r=i.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)o=n,e=r,o.flags&=14680066,i=o.alternate,i===null?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=i.childLanes,o.lanes=i.lanes,o.child=i.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=i.memoizedProps,o.memoizedState=i.memoizedState,o.updateQueue=i.updateQueue,o.type=i.type,e=i.dependencies,o.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return B(Q,Q.current&1|2),t.child}e=e.sibling}o.tail!==null&&q()>Pn&&(t.flags|=128,r=!0,Qn(o,!1),t.lanes=4194304)}else{if(!r)if(e=Dl(i),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),Qn(o,!0),o.tail===null&&o.tailMode==="hidden"&&!i.alternate&&!W)return se(t),null}else 2*q()-o.renderingStartTime>Pn&&n!==1073741824&&(t.flags|=128,r=!0,Qn(o,!1),t.lanes=4194304);o.isBackwards?(i.sibling=t.child,t.child=i):(n=o.last,n!==null?n.sibling=i:t.child=i,o.last=i)}return o.tail!==null?(t=o.tail,o.rendering=t,o.tail=t.sibling,o.renderingStartTime=q(),t.sibling=null,n=Q.current,B(Q,r?n&1|2:n&1),t):(se(t),null);case 22:case 23:return As(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?ke&1073741824&&(se(t),t.subtreeFlags&6&&(t.flags|=8192)):se(t),null;case 24:return null;case 25:return null}throw Error(k(156,t.tag))}function Vh(e,t){switch(ys(t),t.tag){case 1:return Se(t.type)&&Pl(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Rn(),V(we),V(ce),Rs(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return Ns(t),null;case 13:if(V(Q),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(k(340));Cn()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return V(Q),null;case 4:return Rn(),null;case 10:return Es(t.type._context),null;case 22:case 23:return As(),null;case 24:return null;default:return null}}var br=!1,ue=!1,Wh=typeof WeakSet=="function"?WeakSet:Set,P=null;function hn(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){X(e,t,r)}else n.current=null}function Di(e,t,n){try{n()}catch(r){X(e,t,r)}}var ea=!1;function Qh(e,t){if(gi=Cl,e=$c(),ms(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var i=0,s=-1,u=-1,a=0,c=0,f=e,v=null;t:for(;;){for(var g;f!==n||l!==0&&f.nodeType!==3||(s=i+l),f!==o||r!==0&&f.nodeType!==3||(u=i+r),f.nodeType===3&&(i+=f.nodeValue.length),(g=f.firstChild)!==null;)v=f,f=g;for(;;){if(f===e)break t;if(v===n&&++a===l&&(s=i),v===o&&++c===r&&(u=i),(g=f.nextSibling)!==null)break;f=v,v=f.parentNode}f=g}n=s===-1||u===-1?null:{start:s,end:u}}else n=null}n=n||{start:0,end:0}}else n=null;for(wi={focusedElem:e,selectionRange:n},Cl=!1,P=t;P!==null;)if(t=P,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,P=e;else for(;P!==null;){t=P;try{var m=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(m!==null){var w=m.memoizedProps,E=m.memoizedState,p=t.stateNode,d=p.getSnapshotBeforeUpdate(t.elementType===t.type?w:Ie(t.type,w),E);p.__reactInternalSnapshotBeforeUpdate=d}break;case 3:var h=t.stateNode.containerInfo;h.nodeType===1?h.textContent="":h.nodeType===9&&h.documentElement&&h.removeChild(h.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(k(163))}}catch(x){X(t,t.return,x)}if(e=t.sibling,e!==null){e.return=t.return,P=e;break}P=t.return}return m=ea,ea=!1,m}function or(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var o=l.destroy;l.destroy=void 0,o!==void 0&&Di(t,n,o)}l=l.next}while(l!==r)}}function no(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Ui(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function If(e){var t=e.alternate;t!==null&&(e.alternate=null,If(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Ye],delete t[gr],delete t[xi],delete t[_h],delete t[Ph])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function Mf(e){return e.tag===5||e.tag===3||e.tag===4}function ta(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Mf(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Ai(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=_l));else if(r!==4&&(e=e.child,e!==null))for(Ai(e,t,n),e=e.sibling;e!==null;)Ai(e,t,n),e=e.sibling}function Ii(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Ii(e,t,n),e=e.sibling;e!==null;)Ii(e,t,n),e=e.sibling}var re=null,Me=!1;function pt(e,t,n){for(n=n.child;n!==null;)Bf(e,t,n),n=n.sibling}function Bf(e,t,n){if(Ze&&typeof Ze.onCommitFiberUnmount=="function")try{Ze.onCommitFiberUnmount(Xl,n)}catch{}switch(n.tag){case 5:ue||hn(n,t);case 6:var r=re,l=Me;re=null,pt(e,t,n),re=r,Me=l,re!==null&&(Me?(e=re,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):re.removeChild(n.stateNode));break;case 18:re!==null&&(Me?(e=re,n=n.stateNode,e.nodeType===8?Do(e.parentNode,n):e.nodeType===1&&Do(e,n),pr(e)):Do(re,n.stateNode));break;case 4:r=re,l=Me,re=n.stateNode.containerInfo,Me=!0,pt(e,t,n),re=r,Me=l;break;case 0:case 11:case 14:case 15:if(!ue&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var o=l,i=o.destroy;o=o.tag,i!==void 0&&(o&2||o&4)&&Di(n,t,i),l=l.next}while(l!==r)}pt(e,t,n);break;case 1:if(!ue&&(hn(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(s){X(n,t,s)}pt(e,t,n);break;case 21:pt(e,t,n);break;case 22:n.mode&1?(ue=(r=ue)||n.memoizedState!==null,pt(e,t,n),ue=r):pt(e,t,n);break;default:pt(e,t,n)}}function na(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new Wh),t.forEach(function(r){var l=em.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Ae(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var o=e,i=t,s=i;e:for(;s!==null;){switch(s.tag){case 5:re=s.stateNode,Me=!1;break e;case 3:re=s.stateNode.containerInfo,Me=!0;break e;case 4:re=s.stateNode.containerInfo,Me=!0;break e}s=s.return}if(re===null)throw Error(k(160));Bf(o,i,l),re=null,Me=!1;var u=l.alternate;u!==null&&(u.return=null),l.return=null}catch(a){X(l,t,a)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)$f(t,e),t=t.sibling}function $f(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Ae(t,e),Xe(e),r&4){try{or(3,e,e.return),no(3,e)}catch(w){X(e,e.return,w)}try{or(5,e,e.return)}catch(w){X(e,e.return,w)}}break;case 1:Ae(t,e),Xe(e),r&512&&n!==null&&hn(n,n.return);break;case 5:if(Ae(t,e),Xe(e),r&512&&n!==null&&hn(n,n.return),e.flags&32){var l=e.stateNode;try{ar(l,"")}catch(w){X(e,e.return,w)}}if(r&4&&(l=e.stateNode,l!=null)){var o=e.memoizedProps,i=n!==null?n.memoizedProps:o,s=e.type,u=e.updateQueue;if(e.updateQueue=null,u!==null)try{s==="input"&&o.type==="radio"&&o.name!=null&&uc(l,o),ui(s,i);var a=ui(s,o);for(i=0;i<u.length;i+=2){var c=u[i],f=u[i+1];c==="style"?pc(l,f):c==="dangerouslySetInnerHTML"?fc(l,f):c==="children"?ar(l,f):ns(l,c,f,a)}switch(s){case"input":ri(l,o);break;case"textarea":ac(l,o);break;case"select":var v=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var g=o.value;g!=null?vn(l,!!o.multiple,g,!1):v!==!!o.multiple&&(o.defaultValue!=null?vn(l,!!o.multiple,o.defaultValue,!0):vn(l,!!o.multiple,o.multiple?[]:"",!1))}l[gr]=o}catch(w){X(e,e.return,w)}}break;case 6:if(Ae(t,e),Xe(e),r&4){if(e.stateNode===null)throw Error(k(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(w){X(e,e.return,w)}}break;case 3:if(Ae(t,e),Xe(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{pr(t.containerInfo)}catch(w){X(e,e.return,w)}break;case 4:Ae(t,e),Xe(e);break;case 13:Ae(t,e),Xe(e),l=e.child,l.flags&8192&&(o=l.memoizedState!==null,l.stateNode.isHidden=o,!o||l.alternate!==null&&l.alternate.memoizedState!==null||(Ds=q())),r&4&&na(e);break;case 22:if(c=n!==null&&n.memoizedState!==null,e.mode&1?(ue=(a=ue)||c,Ae(t,e),ue=a):Ae(t,e),Xe(e),r&8192){if(a=e.memoizedState!==null,(e.stateNode.isHidden=a)&&!c&&e.mode&1)for(P=e,c=e.child;c!==null;){for(f=P=c;P!==null;){switch(v=P,g=v.child,v.tag){case 0:case 11:case 14:case 15:or(4,v,v.return);break;case 1:hn(v,v.return);var m=v.stateNode;if(typeof m.componentWillUnmount=="function"){r=v,n=v.return;try{t=r,m.props=t.memoizedProps,m.state=t.memoizedState,m.componentWillUnmount()}catch(w){X(r,n,w)}}break;case 5:hn(v,v.return);break;case 22:if(v.memoizedState!==null){la(f);continue}}g!==null?(g.return=v,P=g):la(f)}c=c.sibling}e:for(c=null,f=e;;){if(f.tag===5){if(c===null){c=f;try{l=f.stateNode,a?(o=l.style,typeof o.setProperty=="function"?o.setProperty("display","none","important"):o.display="none"):(s=f.stateNode,u=f.memoizedProps.style,i=u!=null&&u.hasOwnProperty("display")?u.display:null,s.style.display=dc("display",i))}catch(w){X(e,e.return,w)}}}else if(f.tag===6){if(c===null)try{f.stateNode.nodeValue=a?"":f.memoizedProps}catch(w){X(e,e.return,w)}}else if((f.tag!==22&&f.tag!==23||f.memoizedState===null||f===e)&&f.child!==null){f.child.return=f,f=f.child;continue}if(f===e)break e;for(;f.sibling===null;){if(f.return===null||f.return===e)break e;c===f&&(c=null),f=f.return}c===f&&(c=null),f.sibling.return=f.return,f=f.sibling}}break;case 19:Ae(t,e),Xe(e),r&4&&na(e);break;case 21:break;default:Ae(t,e),Xe(e)}}function Xe(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(Mf(n)){var r=n;break e}n=n.return}throw Error(k(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(ar(l,""),r.flags&=-33);var o=ta(e);Ii(e,o,l);break;case 3:case 4:var i=r.stateNode.containerInfo,s=ta(e);Ai(e,s,i);break;default:throw Error(k(161))}}catch(u){X(e,e.return,u)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function Kh(e,t,n){P=e,Hf(e)}function Hf(e,t,n){for(var r=(e.mode&1)!==0;P!==null;){var l=P,o=l.child;if(l.tag===22&&r){var i=l.memoizedState!==null||br;if(!i){var s=l.alternate,u=s!==null&&s.memoizedState!==null||ue;s=br;var a=ue;if(br=i,(ue=u)&&!a)for(P=l;P!==null;)i=P,u=i.child,i.tag===22&&i.memoizedState!==null?oa(l):u!==null?(u.return=i,P=u):oa(l);for(;o!==null;)P=o,Hf(o),o=o.sibling;P=l,br=s,ue=a}ra(e)}else l.subtreeFlags&8772&&o!==null?(o.return=l,P=o):ra(e)}}function ra(e){for(;P!==null;){var t=P;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ue||no(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ue)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Ie(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=t.updateQueue;o!==null&&$u(t,o,r);break;case 3:var i=t.updateQueue;if(i!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}$u(t,i,n)}break;case 5:var s=t.stateNode;if(n===null&&t.flags&4){n=s;var u=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":u.autoFocus&&n.focus();break;case"img":u.src&&(n.src=u.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var a=t.alternate;if(a!==null){var c=a.memoizedState;if(c!==null){var f=c.dehydrated;f!==null&&pr(f)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(k(163))}ue||t.flags&512&&Ui(t)}catch(v){X(t,t.return,v)}}if(t===e){P=null;break}if(n=t.sibling,n!==null){n.return=t.return,P=n;break}P=t.return}}function la(e){for(;P!==null;){var t=P;if(t===e){P=null;break}var n=t.sibling;if(n!==null){n.return=t.return,P=n;break}P=t.return}}function oa(e){for(;P!==null;){var t=P;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{no(4,t)}catch(u){X(t,n,u)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(u){X(t,l,u)}}var o=t.return;try{Ui(t)}catch(u){X(t,o,u)}break;case 5:var i=t.return;try{Ui(t)}catch(u){X(t,i,u)}}}catch(u){X(t,t.return,u)}if(t===e){P=null;break}var s=t.sibling;if(s!==null){s.return=t.return,P=s;break}P=t.return}}var Jh=Math.ceil,Il=ft.ReactCurrentDispatcher,zs=ft.ReactCurrentOwner,ze=ft.ReactCurrentBatchConfig,U=0,ne=null,Y=null,le=0,ke=0,mn=zt(0),ee=0,Cr=null,qt=0,ro=0,Fs=0,ir=null,ye=null,Ds=0,Pn=1/0,tt=null,Ml=!1,Mi=null,Rt=null,el=!1,wt=null,Bl=0,sr=0,Bi=null,dl=-1,pl=0;function de(){return U&6?q():dl!==-1?dl:dl=q()}function _t(e){return e.mode&1?U&2&&le!==0?le&-le:Th.transition!==null?(pl===0&&(pl=Nc()),pl):(e=I,e!==0||(e=window.event,e=e===void 0?16:Lc(e.type)),e):1}function He(e,t,n,r){if(50<sr)throw sr=0,Bi=null,Error(k(185));Pr(e,n,r),(!(U&2)||e!==ne)&&(e===ne&&(!(U&2)&&(ro|=n),ee===4&&yt(e,le)),Ee(e,r),n===1&&U===0&&!(t.mode&1)&&(Pn=q()+500,bl&&Ft()))}function Ee(e,t){var n=e.callbackNode;Tp(e,t);var r=kl(e,e===ne?le:0);if(r===0)n!==null&&hu(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&hu(n),t===1)e.tag===0?jh(ia.bind(null,e)):Yc(ia.bind(null,e)),Nh(function(){!(U&6)&&Ft()}),n=null;else{switch(Rc(r)){case 1:n=ss;break;case 4:n=kc;break;case 16:n=xl;break;case 536870912:n=Cc;break;default:n=xl}n=Gf(n,Vf.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function Vf(e,t){if(dl=-1,pl=0,U&6)throw Error(k(327));var n=e.callbackNode;if(En()&&e.callbackNode!==n)return null;var r=kl(e,e===ne?le:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=$l(e,r);else{t=r;var l=U;U|=2;var o=Qf();(ne!==e||le!==t)&&(tt=null,Pn=q()+500,Wt(e,t));do try{Gh();break}catch(s){Wf(e,s)}while(1);Ss(),Il.current=o,U=l,Y!==null?t=0:(ne=null,le=0,t=ee)}if(t!==0){if(t===2&&(l=pi(e),l!==0&&(r=l,t=$i(e,l))),t===1)throw n=Cr,Wt(e,0),yt(e,r),Ee(e,q()),n;if(t===6)yt(e,r);else{if(l=e.current.alternate,!(r&30)&&!Xh(l)&&(t=$l(e,r),t===2&&(o=pi(e),o!==0&&(r=o,t=$i(e,o))),t===1))throw n=Cr,Wt(e,0),yt(e,r),Ee(e,q()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(k(345));case 2:Mt(e,ye,tt);break;case 3:if(yt(e,r),(r&130023424)===r&&(t=Ds+500-q(),10<t)){if(kl(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){de(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=Ei(Mt.bind(null,e,ye,tt),t);break}Mt(e,ye,tt);break;case 4:if(yt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var i=31-$e(r);o=1<<i,i=t[i],i>l&&(l=i),r&=~o}if(r=l,r=q()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Jh(r/1960))-r,10<r){e.timeoutHandle=Ei(Mt.bind(null,e,ye,tt),r);break}Mt(e,ye,tt);break;case 5:Mt(e,ye,tt);break;default:throw Error(k(329))}}}return Ee(e,q()),e.callbackNode===n?Vf.bind(null,e):null}function $i(e,t){var n=ir;return e.current.memoizedState.isDehydrated&&(Wt(e,t).flags|=256),e=$l(e,t),e!==2&&(t=ye,ye=n,t!==null&&Hi(t)),e}function Hi(e){ye===null?ye=e:ye.push.apply(ye,e)}function Xh(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],o=l.getSnapshot;l=l.value;try{if(!We(o(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function yt(e,t){for(t&=~Fs,t&=~ro,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-$e(t),r=1<<n;e[n]=-1,t&=~r}}function ia(e){if(U&6)throw Error(k(327));En();var t=kl(e,0);if(!(t&1))return Ee(e,q()),null;var n=$l(e,t);if(e.tag!==0&&n===2){var r=pi(e);r!==0&&(t=r,n=$i(e,r))}if(n===1)throw n=Cr,Wt(e,0),yt(e,t),Ee(e,q()),n;if(n===6)throw Error(k(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Mt(e,ye,tt),Ee(e,q()),null}function Us(e,t){var n=U;U|=1;try{return e(t)}finally{U=n,U===0&&(Pn=q()+500,bl&&Ft())}}function Gt(e){wt!==null&&wt.tag===0&&!(U&6)&&En();var t=U;U|=1;var n=ze.transition,r=I;try{if(ze.transition=null,I=1,e)return e()}finally{I=r,ze.transition=n,U=t,!(U&6)&&Ft()}}function As(){ke=mn.current,V(mn)}function Wt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Ch(n)),Y!==null)for(n=Y.return;n!==null;){var r=n;switch(ys(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Pl();break;case 3:Rn(),V(we),V(ce),Rs();break;case 5:Ns(r);break;case 4:Rn();break;case 13:V(Q);break;case 19:V(Q);break;case 10:Es(r.type._context);break;case 22:case 23:As()}n=n.return}if(ne=e,Y=e=Pt(e.current,null),le=ke=t,ee=0,Cr=null,Fs=ro=qt=0,ye=ir=null,$t!==null){for(t=0;t<$t.length;t++)if(n=$t[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,o=n.pending;if(o!==null){var i=o.next;o.next=l,r.next=i}n.pending=r}$t=null}return e}function Wf(e,t){do{var n=Y;try{if(Ss(),al.current=Al,Ul){for(var r=K.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}Ul=!1}if(Xt=0,te=b=K=null,lr=!1,Er=0,zs.current=null,n===null||n.return===null){ee=1,Cr=t,Y=null;break}e:{var o=e,i=n.return,s=n,u=t;if(t=le,s.flags|=32768,u!==null&&typeof u=="object"&&typeof u.then=="function"){var a=u,c=s,f=c.tag;if(!(c.mode&1)&&(f===0||f===11||f===15)){var v=c.alternate;v?(c.updateQueue=v.updateQueue,c.memoizedState=v.memoizedState,c.lanes=v.lanes):(c.updateQueue=null,c.memoizedState=null)}var g=Ju(i);if(g!==null){g.flags&=-257,Xu(g,i,s,o,t),g.mode&1&&Ku(o,a,t),t=g,u=a;var m=t.updateQueue;if(m===null){var w=new Set;w.add(u),t.updateQueue=w}else m.add(u);break e}else{if(!(t&1)){Ku(o,a,t),Is();break e}u=Error(k(426))}}else if(W&&s.mode&1){var E=Ju(i);if(E!==null){!(E.flags&65536)&&(E.flags|=256),Xu(E,i,s,o,t),gs(_n(u,s));break e}}o=u=_n(u,s),ee!==4&&(ee=2),ir===null?ir=[o]:ir.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,t&=-t,o.lanes|=t;var p=_f(o,u,t);Bu(o,p);break e;case 1:s=u;var d=o.type,h=o.stateNode;if(!(o.flags&128)&&(typeof d.getDerivedStateFromError=="function"||h!==null&&typeof h.componentDidCatch=="function"&&(Rt===null||!Rt.has(h)))){o.flags|=65536,t&=-t,o.lanes|=t;var x=Pf(o,s,t);Bu(o,x);break e}}o=o.return}while(o!==null)}Jf(n)}catch(C){t=C,Y===n&&n!==null&&(Y=n=n.return);continue}break}while(1)}function Qf(){var e=Il.current;return Il.current=Al,e===null?Al:e}function Is(){(ee===0||ee===3||ee===2)&&(ee=4),ne===null||!(qt&268435455)&&!(ro&268435455)||yt(ne,le)}function $l(e,t){var n=U;U|=2;var r=Qf();(ne!==e||le!==t)&&(tt=null,Wt(e,t));do try{qh();break}catch(l){Wf(e,l)}while(1);if(Ss(),U=n,Il.current=r,Y!==null)throw Error(k(261));return ne=null,le=0,ee}function qh(){for(;Y!==null;)Kf(Y)}function Gh(){for(;Y!==null&&!Ep();)Kf(Y)}function Kf(e){var t=qf(e.alternate,e,ke);e.memoizedProps=e.pendingProps,t===null?Jf(e):Y=t,zs.current=null}function Jf(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=Vh(n,t),n!==null){n.flags&=32767,Y=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{ee=6,Y=null;return}}else if(n=Hh(n,t,ke),n!==null){Y=n;return}if(t=t.sibling,t!==null){Y=t;return}Y=t=e}while(t!==null);ee===0&&(ee=5)}function Mt(e,t,n){var r=I,l=ze.transition;try{ze.transition=null,I=1,Yh(e,t,n,r)}finally{ze.transition=l,I=r}return null}function Yh(e,t,n,r){do En();while(wt!==null);if(U&6)throw Error(k(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(k(177));e.callbackNode=null,e.callbackPriority=0;var o=n.lanes|n.childLanes;if(Op(e,o),e===ne&&(Y=ne=null,le=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||el||(el=!0,Gf(xl,function(){return En(),null})),o=(n.flags&15990)!==0,n.subtreeFlags&15990||o){o=ze.transition,ze.transition=null;var i=I;I=1;var s=U;U|=4,zs.current=null,Qh(e,n),$f(n,e),yh(wi),Cl=!!gi,wi=gi=null,e.current=n,Kh(n),xp(),U=s,I=i,ze.transition=o}else e.current=n;if(el&&(el=!1,wt=e,Bl=l),o=e.pendingLanes,o===0&&(Rt=null),Np(n.stateNode),Ee(e,q()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(Ml)throw Ml=!1,e=Mi,Mi=null,e;return Bl&1&&e.tag!==0&&En(),o=e.pendingLanes,o&1?e===Bi?sr++:(sr=0,Bi=e):sr=0,Ft(),null}function En(){if(wt!==null){var e=Rc(Bl),t=ze.transition,n=I;try{if(ze.transition=null,I=16>e?16:e,wt===null)var r=!1;else{if(e=wt,wt=null,Bl=0,U&6)throw Error(k(331));var l=U;for(U|=4,P=e.current;P!==null;){var o=P,i=o.child;if(P.flags&16){var s=o.deletions;if(s!==null){for(var u=0;u<s.length;u++){var a=s[u];for(P=a;P!==null;){var c=P;switch(c.tag){case 0:case 11:case 15:or(8,c,o)}var f=c.child;if(f!==null)f.return=c,P=f;else for(;P!==null;){c=P;var v=c.sibling,g=c.return;if(If(c),c===a){P=null;break}if(v!==null){v.return=g,P=v;break}P=g}}}var m=o.alternate;if(m!==null){var w=m.child;if(w!==null){m.child=null;do{var E=w.sibling;w.sibling=null,w=E}while(w!==null)}}P=o}}if(o.subtreeFlags&2064&&i!==null)i.return=o,P=i;else e:for(;P!==null;){if(o=P,o.flags&2048)switch(o.tag){case 0:case 11:case 15:or(9,o,o.return)}var p=o.sibling;if(p!==null){p.return=o.return,P=p;break e}P=o.return}}var d=e.current;for(P=d;P!==null;){i=P;var h=i.child;if(i.subtreeFlags&2064&&h!==null)h.return=i,P=h;else e:for(i=d;P!==null;){if(s=P,s.flags&2048)try{switch(s.tag){case 0:case 11:case 15:no(9,s)}}catch(C){X(s,s.return,C)}if(s===i){P=null;break e}var x=s.sibling;if(x!==null){x.return=s.return,P=x;break e}P=s.return}}if(U=l,Ft(),Ze&&typeof Ze.onPostCommitFiberRoot=="function")try{Ze.onPostCommitFiberRoot(Xl,e)}catch{}r=!0}return r}finally{I=n,ze.transition=t}}return!1}function sa(e,t,n){t=_n(n,t),t=_f(e,t,1),e=Nt(e,t,1),t=de(),e!==null&&(Pr(e,1,t),Ee(e,t))}function X(e,t,n){if(e.tag===3)sa(e,e,n);else for(;t!==null;){if(t.tag===3){sa(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(Rt===null||!Rt.has(r))){e=_n(n,e),e=Pf(t,e,1),t=Nt(t,e,1),e=de(),t!==null&&(Pr(t,1,e),Ee(t,e));break}}t=t.return}}function Zh(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=de(),e.pingedLanes|=e.suspendedLanes&n,ne===e&&(le&n)===n&&(ee===4||ee===3&&(le&130023424)===le&&500>q()-Ds?Wt(e,0):Fs|=n),Ee(e,t)}function Xf(e,t){t===0&&(e.mode&1?(t=Wr,Wr<<=1,!(Wr&130023424)&&(Wr=4194304)):t=1);var n=de();e=at(e,t),e!==null&&(Pr(e,t,n),Ee(e,n))}function bh(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),Xf(e,n)}function em(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(k(314))}r!==null&&r.delete(t),Xf(e,n)}var qf;qf=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||we.current)ge=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return ge=!1,$h(e,t,n);ge=!!(e.flags&131072)}else ge=!1,W&&t.flags&1048576&&Zc(t,Ol,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;fl(e,t),e=t.pendingProps;var l=kn(t,ce.current);Sn(t,n),l=Ps(null,t,r,e,l,n);var o=js();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Se(r)?(o=!0,jl(t)):o=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,ks(t),l.updater=to,t.stateNode=l,l._reactInternals=t,Pi(t,r,e,n),t=Oi(null,t,r,!0,o,n)):(t.tag=0,W&&o&&vs(t),fe(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(fl(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=nm(r),e=Ie(r,e),l){case 0:t=Ti(null,t,r,e,n);break e;case 1:t=Yu(null,t,r,e,n);break e;case 11:t=qu(null,t,r,e,n);break e;case 14:t=Gu(null,t,r,Ie(r.type,e),n);break e}throw Error(k(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),Ti(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),Yu(e,t,r,l,n);case 3:e:{if(Lf(t),e===null)throw Error(k(387));r=t.pendingProps,o=t.memoizedState,l=o.element,lf(e,t),Fl(t,r,null,n);var i=t.memoizedState;if(r=i.element,o.isDehydrated)if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){l=_n(Error(k(423)),t),t=Zu(e,t,r,n,l);break e}else if(r!==l){l=_n(Error(k(424)),t),t=Zu(e,t,r,n,l);break e}else for(Ce=Ct(t.stateNode.containerInfo.firstChild),Ne=t,W=!0,Be=null,n=nf(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(Cn(),r===l){t=ct(e,t,n);break e}fe(e,t,r,n)}t=t.child}return t;case 5:return of(t),e===null&&Ni(t),r=t.type,l=t.pendingProps,o=e!==null?e.memoizedProps:null,i=l.children,Si(r,l)?i=null:o!==null&&Si(r,o)&&(t.flags|=32),Of(e,t),fe(e,t,i,n),t.child;case 6:return e===null&&Ni(t),null;case 13:return zf(e,t,n);case 4:return Cs(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=Nn(t,null,r,n):fe(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),qu(e,t,r,l,n);case 7:return fe(e,t,t.pendingProps,n),t.child;case 8:return fe(e,t,t.pendingProps.children,n),t.child;case 12:return fe(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,o=t.memoizedProps,i=l.value,B(Ll,r._currentValue),r._currentValue=i,o!==null)if(We(o.value,i)){if(o.children===l.children&&!we.current){t=ct(e,t,n);break e}}else for(o=t.child,o!==null&&(o.return=t);o!==null;){var s=o.dependencies;if(s!==null){i=o.child;for(var u=s.firstContext;u!==null;){if(u.context===r){if(o.tag===1){u=it(-1,n&-n),u.tag=2;var a=o.updateQueue;if(a!==null){a=a.shared;var c=a.pending;c===null?u.next=u:(u.next=c.next,c.next=u),a.pending=u}}o.lanes|=n,u=o.alternate,u!==null&&(u.lanes|=n),Ri(o.return,n,t),s.lanes|=n;break}u=u.next}}else if(o.tag===10)i=o.type===t.type?null:o.child;else if(o.tag===18){if(i=o.return,i===null)throw Error(k(341));i.lanes|=n,s=i.alternate,s!==null&&(s.lanes|=n),Ri(i,n,t),i=o.sibling}else i=o.child;if(i!==null)i.return=o;else for(i=o;i!==null;){if(i===t){i=null;break}if(o=i.sibling,o!==null){o.return=i.return,i=o;break}i=i.return}o=i}fe(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,Sn(t,n),l=Fe(l),r=r(l),t.flags|=1,fe(e,t,r,n),t.child;case 14:return r=t.type,l=Ie(r,t.pendingProps),l=Ie(r.type,l),Gu(e,t,r,l,n);case 15:return jf(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Ie(r,l),fl(e,t),t.tag=1,Se(r)?(e=!0,jl(t)):e=!1,Sn(t,n),Rf(t,r,l),Pi(t,r,l,n),Oi(null,t,r,!0,e,n);case 19:return Ff(e,t,n);case 22:return Tf(e,t,n)}throw Error(k(156,t.tag))};function Gf(e,t){return xc(e,t)}function tm(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Le(e,t,n,r){return new tm(e,t,n,r)}function Ms(e){return e=e.prototype,!(!e||!e.isReactComponent)}function nm(e){if(typeof e=="function")return Ms(e)?1:0;if(e!=null){if(e=e.$$typeof,e===ls)return 11;if(e===os)return 14}return 2}function Pt(e,t){var n=e.alternate;return n===null?(n=Le(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function hl(e,t,n,r,l,o){var i=2;if(r=e,typeof e=="function")Ms(e)&&(i=1);else if(typeof e=="string")i=5;else e:switch(e){case ln:return Qt(n.children,l,o,t);case rs:i=8,l|=8;break;case Zo:return e=Le(12,n,t,l|2),e.elementType=Zo,e.lanes=o,e;case bo:return e=Le(13,n,t,l),e.elementType=bo,e.lanes=o,e;case ei:return e=Le(19,n,t,l),e.elementType=ei,e.lanes=o,e;case oc:return lo(n,l,o,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case rc:i=10;break e;case lc:i=9;break e;case ls:i=11;break e;case os:i=14;break e;case ht:i=16,r=null;break e}throw Error(k(130,e==null?e:typeof e,""))}return t=Le(i,n,t,l),t.elementType=e,t.type=r,t.lanes=o,t}function Qt(e,t,n,r){return e=Le(7,e,r,t),e.lanes=n,e}function lo(e,t,n,r){return e=Le(22,e,r,t),e.elementType=oc,e.lanes=n,e.stateNode={isHidden:!1},e}function Vo(e,t,n){return e=Le(6,e,null,t),e.lanes=n,e}function Wo(e,t,n){return t=Le(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function rm(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Co(0),this.expirationTimes=Co(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Co(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function Bs(e,t,n,r,l,o,i,s,u){return e=new rm(e,t,n,s,u),t===1?(t=1,o===!0&&(t|=8)):t=0,o=Le(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},ks(o),e}function lm(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:rn,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function Yf(e){if(!e)return Ot;e=e._reactInternals;e:{if(bt(e)!==e||e.tag!==1)throw Error(k(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Se(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(k(171))}if(e.tag===1){var n=e.type;if(Se(n))return Gc(e,n,t)}return t}function Zf(e,t,n,r,l,o,i,s,u){return e=Bs(n,r,!0,e,l,o,i,s,u),e.context=Yf(null),n=e.current,r=de(),l=_t(n),o=it(r,l),o.callback=t??null,Nt(n,o,l),e.current.lanes=l,Pr(e,l,r),Ee(e,r),e}function oo(e,t,n,r){var l=t.current,o=de(),i=_t(l);return n=Yf(n),t.context===null?t.context=n:t.pendingContext=n,t=it(o,i),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=Nt(l,t,i),e!==null&&(He(e,l,i,o),ul(e,l,i)),i}function Hl(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function ua(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function $s(e,t){ua(e,t),(e=e.alternate)&&ua(e,t)}function om(){return null}var bf=typeof reportError=="function"?reportError:function(e){console.error(e)};function Hs(e){this._internalRoot=e}io.prototype.render=Hs.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(k(409));oo(e,t,null,null)};io.prototype.unmount=Hs.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Gt(function(){oo(null,e,null,null)}),t[ut]=null}};function io(e){this._internalRoot=e}io.prototype.unstable_scheduleHydration=function(e){if(e){var t=jc();e={blockedOn:null,target:e,priority:t};for(var n=0;n<vt.length&&t!==0&&t<vt[n].priority;n++);vt.splice(n,0,e),n===0&&Oc(e)}};function Vs(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function so(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function aa(){}function im(e,t,n,r,l){if(l){if(typeof r=="function"){var o=r;r=function(){var a=Hl(i);o.call(a)}}var i=Zf(t,r,e,0,null,!1,!1,"",aa);return e._reactRootContainer=i,e[ut]=i.current,vr(e.nodeType===8?e.parentNode:e),Gt(),i}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var s=r;r=function(){var a=Hl(u);s.call(a)}}var u=Bs(e,0,!1,null,null,!1,!1,"",aa);return e._reactRootContainer=u,e[ut]=u.current,vr(e.nodeType===8?e.parentNode:e),Gt(function(){oo(t,u,n,r)}),u}function uo(e,t,n,r,l){var o=n._reactRootContainer;if(o){var i=o;if(typeof l=="function"){var s=l;l=function(){var u=Hl(i);s.call(u)}}oo(t,i,e,l)}else i=im(n,t,e,l,r);return Hl(i)}_c=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Yn(t.pendingLanes);n!==0&&(us(t,n|1),Ee(t,q()),!(U&6)&&(Pn=q()+500,Ft()))}break;case 13:Gt(function(){var r=at(e,1);if(r!==null){var l=de();He(r,e,1,l)}}),$s(e,1)}};as=function(e){if(e.tag===13){var t=at(e,134217728);if(t!==null){var n=de();He(t,e,134217728,n)}$s(e,134217728)}};Pc=function(e){if(e.tag===13){var t=_t(e),n=at(e,t);if(n!==null){var r=de();He(n,e,t,r)}$s(e,t)}};jc=function(){return I};Tc=function(e,t){var n=I;try{return I=e,t()}finally{I=n}};ci=function(e,t,n){switch(t){case"input":if(ri(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=Zl(r);if(!l)throw Error(k(90));sc(r),ri(r,l)}}}break;case"textarea":ac(e,n);break;case"select":t=n.value,t!=null&&vn(e,!!n.multiple,t,!1)}};vc=Us;yc=Gt;var sm={usingClientEntryPoint:!1,Events:[Tr,an,Zl,hc,mc,Us]},Kn={findFiberByHostInstance:Bt,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},um={bundleType:Kn.bundleType,version:Kn.version,rendererPackageName:Kn.rendererPackageName,rendererConfig:Kn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:ft.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Sc(e),e===null?null:e.stateNode},findFiberByHostInstance:Kn.findFiberByHostInstance||om,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var tl=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!tl.isDisabled&&tl.supportsFiber)try{Xl=tl.inject(um),Ze=tl}catch{}}_e.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=sm;_e.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Vs(t))throw Error(k(200));return lm(e,t,null,n)};_e.createRoot=function(e,t){if(!Vs(e))throw Error(k(299));var n=!1,r="",l=bf;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=Bs(e,1,!1,null,null,n,!1,r,l),e[ut]=t.current,vr(e.nodeType===8?e.parentNode:e),new Hs(t)};_e.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(k(188)):(e=Object.keys(e).join(","),Error(k(268,e)));return e=Sc(t),e=e===null?null:e.stateNode,e};_e.flushSync=function(e){return Gt(e)};_e.hydrate=function(e,t,n){if(!so(t))throw Error(k(200));return uo(null,e,t,!0,n)};_e.hydrateRoot=function(e,t,n){if(!Vs(e))throw Error(k(405));var r=n!=null&&n.hydratedSources||null,l=!1,o="",i=bf;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(o=n.identifierPrefix),n.onRecoverableError!==void 0&&(i=n.onRecoverableError)),t=Zf(t,null,e,1,n??null,l,!1,o,i),e[ut]=t.current,vr(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new io(t)};_e.render=function(e,t,n){if(!so(t))throw Error(k(200));return uo(null,e,t,!1,n)};_e.unmountComponentAtNode=function(e){if(!so(e))throw Error(k(40));return e._reactRootContainer?(Gt(function(){uo(null,null,e,!1,function(){e._reactRootContainer=null,e[ut]=null})}),!0):!1};_e.unstable_batchedUpdates=Us;_e.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!so(n))throw Error(k(200));if(e==null||e._reactInternals===void 0)throw Error(k(38));return uo(e,t,n,!1,r)};_e.version="18.3.1-next-f1338f8080-20240426";function ed(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(ed)}catch(e){console.error(e)}}ed(),ba.exports=_e;var am=ba.exports,ca=am;Go.createRoot=ca.createRoot,Go.hydrateRoot=ca.hydrateRoot;/**
- * @remix-run/router v1.23.2
- *
- * Copyright (c) Remix Software Inc.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE.md file in the root directory of this source tree.
- *
- * @license MIT
- */function Nr(){return Nr=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Nr.apply(this,arguments)}var St;(function(e){e.Pop="POP",e.Push="PUSH",e.Replace="REPLACE"})(St||(St={}));const fa="popstate";function cm(e){e===void 0&&(e={});function t(r,l){let{pathname:o,search:i,hash:s}=r.location;return Vi("",{pathname:o,search:i,hash:s},l.state&&l.state.usr||null,l.state&&l.state.key||"default")}function n(r,l){return typeof l=="string"?l:Vl(l)}return dm(t,n,null,e)}function G(e,t){if(e===!1||e===null||typeof e>"u")throw new Error(t)}function Ws(e,t){if(!e){typeof console<"u"&&console.warn(t);try{throw new Error(t)}catch{}}}function fm(){return Math.random().toString(36).substr(2,8)}function da(e,t){return{usr:e.state,key:e.key,idx:t}}function Vi(e,t,n,r){return n===void 0&&(n=null),Nr({pathname:typeof e=="string"?e:e.pathname,search:"",hash:""},typeof t=="string"?Dn(t):t,{state:n,key:t&&t.key||r||fm()})}function Vl(e){let{pathname:t="/",search:n="",hash:r=""}=e;return n&&n!=="?"&&(t+=n.charAt(0)==="?"?n:"?"+n),r&&r!=="#"&&(t+=r.charAt(0)==="#"?r:"#"+r),t}function Dn(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substr(n),e=e.substr(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substr(r),e=e.substr(0,r)),e&&(t.pathname=e)}return t}function dm(e,t,n,r){r===void 0&&(r={});let{window:l=document.defaultView,v5Compat:o=!1}=r,i=l.history,s=St.Pop,u=null,a=c();a==null&&(a=0,i.replaceState(Nr({},i.state,{idx:a}),""));function c(){return(i.state||{idx:null}).idx}function f(){s=St.Pop;let E=c(),p=E==null?null:E-a;a=E,u&&u({action:s,location:w.location,delta:p})}function v(E,p){s=St.Push;let d=Vi(w.location,E,p);n&&n(d,E),a=c()+1;let h=da(d,a),x=w.createHref(d);try{i.pushState(h,"",x)}catch(C){if(C instanceof DOMException&&C.name==="DataCloneError")throw C;l.location.assign(x)}o&&u&&u({action:s,location:w.location,delta:1})}function g(E,p){s=St.Replace;let d=Vi(w.location,E,p);n&&n(d,E),a=c();let h=da(d,a),x=w.createHref(d);i.replaceState(h,"",x),o&&u&&u({action:s,location:w.location,delta:0})}function m(E){let p=l.location.origin!=="null"?l.location.origin:l.location.href,d=typeof E=="string"?E:Vl(E);return d=d.replace(/ $/,"%20"),G(p,"No window.location.(origin|href) available to create URL for href: "+d),new URL(d,p)}let w={get action(){return s},get location(){return e(l,i)},listen(E){if(u)throw new Error("A history only accepts one active listener");return l.addEventListener(fa,f),u=E,()=>{l.removeEventListener(fa,f),u=null}},createHref(E){return t(l,E)},createURL:m,encodeLocation(E){let p=m(E);return{pathname:p.pathname,search:p.search,hash:p.hash}},push:v,replace:g,go(E){return i.go(E)}};return w}var pa;(function(e){e.data="data",e.deferred="deferred",e.redirect="redirect",e.error="error"})(pa||(pa={}));function pm(e,t,n){return n===void 0&&(n="/"),hm(e,t,n,!1)}function hm(e,t,n,r){let l=typeof t=="string"?Dn(t):t,o=Qs(l.pathname||"/",n);if(o==null)return null;let i=td(e);mm(i);let s=null;for(let u=0;s==null&&u<i.length;++u){let a=Rm(o);s=Cm(i[u],a,r)}return s}function td(e,t,n,r){t===void 0&&(t=[]),n===void 0&&(n=[]),r===void 0&&(r="");let l=(o,i,s)=>{let u={relativePath:s===void 0?o.path||"":s,caseSensitive:o.caseSensitive===!0,childrenIndex:i,route:o};u.relativePath.startsWith("/")&&(G(u.relativePath.startsWith(r),'Absolute route path "'+u.relativePath+'" nested under path '+('"'+r+'" is not valid. An absolute child route path ')+"must start with the combined path of all its parent routes."),u.relativePath=u.relativePath.slice(r.length));let a=jt([r,u.relativePath]),c=n.concat(u);o.children&&o.children.length>0&&(G(o.index!==!0,"Index routes must not have child routes. Please remove "+('all child routes from route path "'+a+'".')),td(o.children,t,c,a)),!(o.path==null&&!o.index)&&t.push({path:a,score:xm(a,o.index),routesMeta:c})};return e.forEach((o,i)=>{var s;if(o.path===""||!((s=o.path)!=null&&s.includes("?")))l(o,i);else for(let u of nd(o.path))l(o,i,u)}),t}function nd(e){let t=e.split("/");if(t.length===0)return[];let[n,...r]=t,l=n.endsWith("?"),o=n.replace(/\?$/,"");if(r.length===0)return l?[o,""]:[o];let i=nd(r.join("/")),s=[];return s.push(...i.map(u=>u===""?o:[o,u].join("/"))),l&&s.push(...i),s.map(u=>e.startsWith("/")&&u===""?"/":u)}function mm(e){e.sort((t,n)=>t.score!==n.score?n.score-t.score:km(t.routesMeta.map(r=>r.childrenIndex),n.routesMeta.map(r=>r.childrenIndex)))}const vm=/^:[\w-]+$/,ym=3,gm=2,wm=1,Sm=10,Em=-2,ha=e=>e==="*";function xm(e,t){let n=e.split("/"),r=n.length;return n.some(ha)&&(r+=Em),t&&(r+=gm),n.filter(l=>!ha(l)).reduce((l,o)=>l+(vm.test(o)?ym:o===""?wm:Sm),r)}function km(e,t){return e.length===t.length&&e.slice(0,-1).every((r,l)=>r===t[l])?e[e.length-1]-t[t.length-1]:0}function Cm(e,t,n){n===void 0&&(n=!1);let{routesMeta:r}=e,l={},o="/",i=[];for(let s=0;s<r.length;++s){let u=r[s],a=s===r.length-1,c=o==="/"?t:t.slice(o.length)||"/",f=ma({path:u.relativePath,caseSensitive:u.caseSensitive,end:a},c),v=u.route;if(!f&&a&&n&&!r[r.length-1].route.index&&(f=ma({path:u.relativePath,caseSensitive:u.caseSensitive,end:!1},c)),!f)return null;Object.assign(l,f.params),i.push({params:l,pathname:jt([o,f.pathname]),pathnameBase:Om(jt([o,f.pathnameBase])),route:v}),f.pathnameBase!=="/"&&(o=jt([o,f.pathnameBase]))}return i}function ma(e,t){typeof e=="string"&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=Nm(e.path,e.caseSensitive,e.end),l=t.match(n);if(!l)return null;let o=l[0],i=o.replace(/(.)\/+$/,"$1"),s=l.slice(1);return{params:r.reduce((a,c,f)=>{let{paramName:v,isOptional:g}=c;if(v==="*"){let w=s[f]||"";i=o.slice(0,o.length-w.length).replace(/(.)\/+$/,"$1")}const m=s[f];return g&&!m?a[v]=void 0:a[v]=(m||"").replace(/%2F/g,"/"),a},{}),pathname:o,pathnameBase:i,pattern:e}}function Nm(e,t,n){t===void 0&&(t=!1),n===void 0&&(n=!0),Ws(e==="*"||!e.endsWith("*")||e.endsWith("/*"),'Route path "'+e+'" will be treated as if it were '+('"'+e.replace(/\*$/,"/*")+'" because the `*` character must ')+"always follow a `/` in the pattern. To get rid of this warning, "+('please change the route path to "'+e.replace(/\*$/,"/*")+'".'));let r=[],l="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(i,s,u)=>(r.push({paramName:s,isOptional:u!=null}),u?"/?([^\\/]+)?":"/([^\\/]+)"));return e.endsWith("*")?(r.push({paramName:"*"}),l+=e==="*"||e==="/*"?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?l+="\\/*$":e!==""&&e!=="/"&&(l+="(?:(?=\\/|$))"),[new RegExp(l,t?void 0:"i"),r]}function Rm(e){try{return e.split("/").map(t=>decodeURIComponent(t).replace(/\//g,"%2F")).join("/")}catch(t){return Ws(!1,'The URL path "'+e+'" could not be decoded because it is is a malformed URL segment. This is probably due to a bad percent '+("encoding ("+t+").")),e}}function Qs(e,t){if(t==="/")return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&r!=="/"?null:e.slice(n)||"/"}const _m=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,Pm=e=>_m.test(e);function jm(e,t){t===void 0&&(t="/");let{pathname:n,search:r="",hash:l=""}=typeof e=="string"?Dn(e):e,o;if(n)if(Pm(n))o=n;else{if(n.includes("//")){let i=n;n=n.replace(/\/\/+/g,"/"),Ws(!1,"Pathnames cannot have embedded double slashes - normalizing "+(i+" -> "+n))}n.startsWith("/")?o=va(n.substring(1),"/"):o=va(n,t)}else o=t;return{pathname:o,search:Lm(r),hash:zm(l)}}function va(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach(l=>{l===".."?n.length>1&&n.pop():l!=="."&&n.push(l)}),n.length>1?n.join("/"):"/"}function Qo(e,t,n,r){return"Cannot include a '"+e+"' character in a manually specified "+("`to."+t+"` field ["+JSON.stringify(r)+"].  Please separate it out to the ")+("`to."+n+"` field. Alternatively you may provide the full path as ")+'a string in <Link to="..."> and the router will parse it for you.'}function Tm(e){return e.filter((t,n)=>n===0||t.route.path&&t.route.path.length>0)}function Ks(e,t){let n=Tm(e);return t?n.map((r,l)=>l===n.length-1?r.pathname:r.pathnameBase):n.map(r=>r.pathnameBase)}function Js(e,t,n,r){r===void 0&&(r=!1);let l;typeof e=="string"?l=Dn(e):(l=Nr({},e),G(!l.pathname||!l.pathname.includes("?"),Qo("?","pathname","search",l)),G(!l.pathname||!l.pathname.includes("#"),Qo("#","pathname","hash",l)),G(!l.search||!l.search.includes("#"),Qo("#","search","hash",l)));let o=e===""||l.pathname==="",i=o?"/":l.pathname,s;if(i==null)s=n;else{let f=t.length-1;if(!r&&i.startsWith("..")){let v=i.split("/");for(;v[0]==="..";)v.shift(),f-=1;l.pathname=v.join("/")}s=f>=0?t[f]:"/"}let u=jm(l,s),a=i&&i!=="/"&&i.endsWith("/"),c=(o||i===".")&&n.endsWith("/");return!u.pathname.endsWith("/")&&(a||c)&&(u.pathname+="/"),u}const jt=e=>e.join("/").replace(/\/\/+/g,"/"),Om=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),Lm=e=>!e||e==="?"?"":e.startsWith("?")?e:"?"+e,zm=e=>!e||e==="#"?"":e.startsWith("#")?e:"#"+e;function Fm(e){return e!=null&&typeof e.status=="number"&&typeof e.statusText=="string"&&typeof e.internal=="boolean"&&"data"in e}const rd=["post","put","patch","delete"];new Set(rd);const Dm=["get",...rd];new Set(Dm);/**
- * React Router v6.30.3
- *
- * Copyright (c) Remix Software Inc.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE.md file in the root directory of this source tree.
- *
- * @license MIT
- */function Rr(){return Rr=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Rr.apply(this,arguments)}const Xs=N.createContext(null),Um=N.createContext(null),Dt=N.createContext(null),ao=N.createContext(null),Ut=N.createContext({outlet:null,matches:[],isDataRoute:!1}),ld=N.createContext(null);function Am(e,t){let{relative:n}=t===void 0?{}:t;Un()||G(!1);let{basename:r,navigator:l}=N.useContext(Dt),{hash:o,pathname:i,search:s}=id(e,{relative:n}),u=i;return r!=="/"&&(u=i==="/"?r:jt([r,i])),l.createHref({pathname:u,search:s,hash:o})}function Un(){return N.useContext(ao)!=null}function Lr(){return Un()||G(!1),N.useContext(ao).location}function od(e){N.useContext(Dt).static||N.useLayoutEffect(e)}function co(){let{isDataRoute:e}=N.useContext(Ut);return e?Gm():Im()}function Im(){Un()||G(!1);let e=N.useContext(Xs),{basename:t,future:n,navigator:r}=N.useContext(Dt),{matches:l}=N.useContext(Ut),{pathname:o}=Lr(),i=JSON.stringify(Ks(l,n.v7_relativeSplatPath)),s=N.useRef(!1);return od(()=>{s.current=!0}),N.useCallback(function(a,c){if(c===void 0&&(c={}),!s.current)return;if(typeof a=="number"){r.go(a);return}let f=Js(a,JSON.parse(i),o,c.relative==="path");e==null&&t!=="/"&&(f.pathname=f.pathname==="/"?t:jt([t,f.pathname])),(c.replace?r.replace:r.push)(f,c.state,c)},[t,r,i,o,e])}function id(e,t){let{relative:n}=t===void 0?{}:t,{future:r}=N.useContext(Dt),{matches:l}=N.useContext(Ut),{pathname:o}=Lr(),i=JSON.stringify(Ks(l,r.v7_relativeSplatPath));return N.useMemo(()=>Js(e,JSON.parse(i),o,n==="path"),[e,i,o,n])}function Mm(e,t){return Bm(e,t)}function Bm(e,t,n,r){Un()||G(!1);let{navigator:l}=N.useContext(Dt),{matches:o}=N.useContext(Ut),i=o[o.length-1],s=i?i.params:{};i&&i.pathname;let u=i?i.pathnameBase:"/";i&&i.route;let a=Lr(),c;if(t){var f;let E=typeof t=="string"?Dn(t):t;u==="/"||(f=E.pathname)!=null&&f.startsWith(u)||G(!1),c=E}else c=a;let v=c.pathname||"/",g=v;if(u!=="/"){let E=u.replace(/^\//,"").split("/");g="/"+v.replace(/^\//,"").split("/").slice(E.length).join("/")}let m=pm(e,{pathname:g}),w=Qm(m&&m.map(E=>Object.assign({},E,{params:Object.assign({},s,E.params),pathname:jt([u,l.encodeLocation?l.encodeLocation(E.pathname).pathname:E.pathname]),pathnameBase:E.pathnameBase==="/"?u:jt([u,l.encodeLocation?l.encodeLocation(E.pathnameBase).pathname:E.pathnameBase])})),o,n,r);return t&&w?N.createElement(ao.Provider,{value:{location:Rr({pathname:"/",search:"",hash:"",state:null,key:"default"},c),navigationType:St.Pop}},w):w}function $m(){let e=qm(),t=Fm(e)?e.status+" "+e.statusText:e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,l={padding:"0.5rem",backgroundColor:"rgba(200,200,200, 0.5)"},o=null;return N.createElement(N.Fragment,null,N.createElement("h2",null,"Unexpected Application Error!"),N.createElement("h3",{style:{fontStyle:"italic"}},t),n?N.createElement("pre",{style:l},n):null,o)}const Hm=N.createElement($m,null);class Vm extends N.Component{constructor(t){super(t),this.state={location:t.location,revalidation:t.revalidation,error:t.error}}static getDerivedStateFromError(t){return{error:t}}static getDerivedStateFromProps(t,n){return n.location!==t.location||n.revalidation!=="idle"&&t.revalidation==="idle"?{error:t.error,location:t.location,revalidation:t.revalidation}:{error:t.error!==void 0?t.error:n.error,location:n.location,revalidation:t.revalidation||n.revalidation}}componentDidCatch(t,n){console.error("React Router caught the following error during render",t,n)}render(){return this.state.error!==void 0?N.createElement(Ut.Provider,{value:this.props.routeContext},N.createElement(ld.Provider,{value:this.state.error,children:this.props.component})):this.props.children}}function Wm(e){let{routeContext:t,match:n,children:r}=e,l=N.useContext(Xs);return l&&l.static&&l.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(l.staticContext._deepestRenderedBoundaryId=n.route.id),N.createElement(Ut.Provider,{value:t},r)}function Qm(e,t,n,r){var l;if(t===void 0&&(t=[]),n===void 0&&(n=null),r===void 0&&(r=null),e==null){var o;if(!n)return null;if(n.errors)e=n.matches;else if((o=r)!=null&&o.v7_partialHydration&&t.length===0&&!n.initialized&&n.matches.length>0)e=n.matches;else return null}let i=e,s=(l=n)==null?void 0:l.errors;if(s!=null){let c=i.findIndex(f=>f.route.id&&(s==null?void 0:s[f.route.id])!==void 0);c>=0||G(!1),i=i.slice(0,Math.min(i.length,c+1))}let u=!1,a=-1;if(n&&r&&r.v7_partialHydration)for(let c=0;c<i.length;c++){let f=i[c];if((f.route.HydrateFallback||f.route.hydrateFallbackElement)&&(a=c),f.route.id){let{loaderData:v,errors:g}=n,m=f.route.loader&&v[f.route.id]===void 0&&(!g||g[f.route.id]===void 0);if(f.route.lazy||m){u=!0,a>=0?i=i.slice(0,a+1):i=[i[0]];break}}}return i.reduceRight((c,f,v)=>{let g,m=!1,w=null,E=null;n&&(g=s&&f.route.id?s[f.route.id]:void 0,w=f.route.errorElement||Hm,u&&(a<0&&v===0?(Ym("route-fallback",!1),m=!0,E=null):a===v&&(m=!0,E=f.route.hydrateFallbackElement||null)));let p=t.concat(i.slice(0,v+1)),d=()=>{let h;return g?h=w:m?h=E:f.route.Component?h=N.createElement(f.route.Component,null):f.route.element?h=f.route.element:h=c,N.createElement(Wm,{match:f,routeContext:{outlet:c,matches:p,isDataRoute:n!=null},children:h})};return n&&(f.route.ErrorBoundary||f.route.errorElement||v===0)?N.createElement(Vm,{location:n.location,revalidation:n.revalidation,component:w,error:g,children:d(),routeContext:{outlet:null,matches:p,isDataRoute:!0}}):d()},null)}var sd=function(e){return e.UseBlocker="useBlocker",e.UseRevalidator="useRevalidator",e.UseNavigateStable="useNavigate",e}(sd||{}),Wl=function(e){return e.UseBlocker="useBlocker",e.UseLoaderData="useLoaderData",e.UseActionData="useActionData",e.UseRouteError="useRouteError",e.UseNavigation="useNavigation",e.UseRouteLoaderData="useRouteLoaderData",e.UseMatches="useMatches",e.UseRevalidator="useRevalidator",e.UseNavigateStable="useNavigate",e.UseRouteId="useRouteId",e}(Wl||{});function Km(e){let t=N.useContext(Xs);return t||G(!1),t}function Jm(e){let t=N.useContext(Um);return t||G(!1),t}function Xm(e){let t=N.useContext(Ut);return t||G(!1),t}function ud(e){let t=Xm(),n=t.matches[t.matches.length-1];return n.route.id||G(!1),n.route.id}function qm(){var e;let t=N.useContext(ld),n=Jm(Wl.UseRouteError),r=ud(Wl.UseRouteError);return t!==void 0?t:(e=n.errors)==null?void 0:e[r]}function Gm(){let{router:e}=Km(sd.UseNavigateStable),t=ud(Wl.UseNavigateStable),n=N.useRef(!1);return od(()=>{n.current=!0}),N.useCallback(function(l,o){o===void 0&&(o={}),n.current&&(typeof l=="number"?e.navigate(l):e.navigate(l,Rr({fromRouteId:t},o)))},[e,t])}const ya={};function Ym(e,t,n){!t&&!ya[e]&&(ya[e]=!0)}function Zm(e,t){e==null||e.v7_startTransition,(e==null?void 0:e.v7_relativeSplatPath)===void 0&&(!t||t.v7_relativeSplatPath),t&&(t.v7_fetcherPersist,t.v7_normalizeFormMethod,t.v7_partialHydration,t.v7_skipActionErrorRevalidation)}function ga(e){let{to:t,replace:n,state:r,relative:l}=e;Un()||G(!1);let{future:o,static:i}=N.useContext(Dt),{matches:s}=N.useContext(Ut),{pathname:u}=Lr(),a=co(),c=Js(t,Ks(s,o.v7_relativeSplatPath),u,l==="path"),f=JSON.stringify(c);return N.useEffect(()=>a(JSON.parse(f),{replace:n,state:r,relative:l}),[a,f,l,n,r]),null}function et(e){G(!1)}function bm(e){let{basename:t="/",children:n=null,location:r,navigationType:l=St.Pop,navigator:o,static:i=!1,future:s}=e;Un()&&G(!1);let u=t.replace(/^\/*/,"/"),a=N.useMemo(()=>({basename:u,navigator:o,static:i,future:Rr({v7_relativeSplatPath:!1},s)}),[u,s,o,i]);typeof r=="string"&&(r=Dn(r));let{pathname:c="/",search:f="",hash:v="",state:g=null,key:m="default"}=r,w=N.useMemo(()=>{let E=Qs(c,u);return E==null?null:{location:{pathname:E,search:f,hash:v,state:g,key:m},navigationType:l}},[u,c,f,v,g,m,l]);return w==null?null:N.createElement(Dt.Provider,{value:a},N.createElement(ao.Provider,{children:n,value:w}))}function ev(e){let{children:t,location:n}=e;return Mm(Wi(t),n)}new Promise(()=>{});function Wi(e,t){t===void 0&&(t=[]);let n=[];return N.Children.forEach(e,(r,l)=>{if(!N.isValidElement(r))return;let o=[...t,l];if(r.type===N.Fragment){n.push.apply(n,Wi(r.props.children,o));return}r.type!==et&&G(!1),!r.props.index||!r.props.children||G(!1);let i={id:r.props.id||o.join("-"),caseSensitive:r.props.caseSensitive,element:r.props.element,Component:r.props.Component,index:r.props.index,path:r.props.path,loader:r.props.loader,action:r.props.action,errorElement:r.props.errorElement,ErrorBoundary:r.props.ErrorBoundary,hasErrorBoundary:r.props.ErrorBoundary!=null||r.props.errorElement!=null,shouldRevalidate:r.props.shouldRevalidate,handle:r.props.handle,lazy:r.props.lazy};r.props.children&&(i.children=Wi(r.props.children,o)),n.push(i)}),n}/**
- * React Router DOM v6.30.3
- *
- * Copyright (c) Remix Software Inc.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE.md file in the root directory of this source tree.
- *
- * @license MIT
- */function Qi(){return Qi=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Qi.apply(this,arguments)}function tv(e,t){if(e==null)return{};var n={},r=Object.keys(e),l,o;for(o=0;o<r.length;o++)l=r[o],!(t.indexOf(l)>=0)&&(n[l]=e[l]);return n}function nv(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}function rv(e,t){return e.button===0&&(!t||t==="_self")&&!nv(e)}const lv=["onClick","relative","reloadDocument","replace","state","target","to","preventScrollReset","viewTransition"],ov="6";try{window.__reactRouterVersion=ov}catch{}const iv="startTransition",wa=Zd[iv];function sv(e){let{basename:t,children:n,future:r,window:l}=e,o=N.useRef();o.current==null&&(o.current=cm({window:l,v5Compat:!0}));let i=o.current,[s,u]=N.useState({action:i.action,location:i.location}),{v7_startTransition:a}=r||{},c=N.useCallback(f=>{a&&wa?wa(()=>u(f)):u(f)},[u,a]);return N.useLayoutEffect(()=>i.listen(c),[i,c]),N.useEffect(()=>Zm(r),[r]),N.createElement(bm,{basename:t,children:n,location:s.location,navigationType:s.action,navigator:i,future:r})}const uv=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u",av=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,rt=N.forwardRef(function(t,n){let{onClick:r,relative:l,reloadDocument:o,replace:i,state:s,target:u,to:a,preventScrollReset:c,viewTransition:f}=t,v=tv(t,lv),{basename:g}=N.useContext(Dt),m,w=!1;if(typeof a=="string"&&av.test(a)&&(m=a,uv))try{let h=new URL(window.location.href),x=a.startsWith("//")?new URL(h.protocol+a):new URL(a),C=Qs(x.pathname,g);x.origin===h.origin&&C!=null?a=C+x.search+x.hash:w=!0}catch{}let E=Am(a,{relative:l}),p=cv(a,{replace:i,state:s,target:u,preventScrollReset:c,relative:l,viewTransition:f});function d(h){r&&r(h),h.defaultPrevented||p(h)}return N.createElement("a",Qi({},v,{href:m||E,onClick:w||o?r:d,ref:n,target:u}))});var Sa;(function(e){e.UseScrollRestoration="useScrollRestoration",e.UseSubmit="useSubmit",e.UseSubmitFetcher="useSubmitFetcher",e.UseFetcher="useFetcher",e.useViewTransitionState="useViewTransitionState"})(Sa||(Sa={}));var Ea;(function(e){e.UseFetcher="useFetcher",e.UseFetchers="useFetchers",e.UseScrollRestoration="useScrollRestoration"})(Ea||(Ea={}));function cv(e,t){let{target:n,replace:r,state:l,preventScrollReset:o,relative:i,viewTransition:s}=t===void 0?{}:t,u=co(),a=Lr(),c=id(e,{relative:i});return N.useCallback(f=>{if(rv(f,n)){f.preventDefault();let v=r!==void 0?r:Vl(a)===Vl(c);u(e,{replace:v,state:l,preventScrollReset:o,relative:i,viewTransition:s})}},[a,u,c,r,l,n,e,o,i,s])}const xa=e=>{let t;const n=new Set,r=(c,f)=>{const v=typeof c=="function"?c(t):c;if(!Object.is(v,t)){const g=t;t=f??(typeof v!="object"||v===null)?v:Object.assign({},t,v),n.forEach(m=>m(t,g))}},l=()=>t,u={setState:r,getState:l,getInitialState:()=>a,subscribe:c=>(n.add(c),()=>n.delete(c)),destroy:()=>{n.clear()}},a=t=e(r,l,u);return u},fv=e=>e?xa(e):xa;var ad={exports:{}},cd={},fd={exports:{}},dd={};/**
- * @license React
- * use-sync-external-store-shim.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var jn=N;function dv(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var pv=typeof Object.is=="function"?Object.is:dv,hv=jn.useState,mv=jn.useEffect,vv=jn.useLayoutEffect,yv=jn.useDebugValue;function gv(e,t){var n=t(),r=hv({inst:{value:n,getSnapshot:t}}),l=r[0].inst,o=r[1];return vv(function(){l.value=n,l.getSnapshot=t,Ko(l)&&o({inst:l})},[e,n,t]),mv(function(){return Ko(l)&&o({inst:l}),e(function(){Ko(l)&&o({inst:l})})},[e]),yv(n),n}function Ko(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!pv(e,n)}catch{return!0}}function wv(e,t){return t()}var Sv=typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"?wv:gv;dd.useSyncExternalStore=jn.useSyncExternalStore!==void 0?jn.useSyncExternalStore:Sv;fd.exports=dd;var Ev=fd.exports;/**
- * @license React
- * use-sync-external-store-shim/with-selector.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var fo=N,xv=Ev;function kv(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Cv=typeof Object.is=="function"?Object.is:kv,Nv=xv.useSyncExternalStore,Rv=fo.useRef,_v=fo.useEffect,Pv=fo.useMemo,jv=fo.useDebugValue;cd.useSyncExternalStoreWithSelector=function(e,t,n,r,l){var o=Rv(null);if(o.current===null){var i={hasValue:!1,value:null};o.current=i}else i=o.current;o=Pv(function(){function u(g){if(!a){if(a=!0,c=g,g=r(g),l!==void 0&&i.hasValue){var m=i.value;if(l(m,g))return f=m}return f=g}if(m=f,Cv(c,g))return m;var w=r(g);return l!==void 0&&l(m,w)?(c=g,m):(c=g,f=w)}var a=!1,c,f,v=n===void 0?null:n;return[function(){return u(t())},v===null?void 0:function(){return u(v())}]},[t,n,r,l]);var s=Nv(e,o[0],o[1]);return _v(function(){i.hasValue=!0,i.value=s},[s]),jv(s),s};ad.exports=cd;var Tv=ad.exports;const Ov=Ba(Tv),{useDebugValue:Lv}=Ya,{useSyncExternalStoreWithSelector:zv}=Ov;const Fv=e=>e;function Dv(e,t=Fv,n){const r=zv(e.subscribe,e.getState,e.getServerState||e.getInitialState,t,n);return Lv(r),r}const ka=e=>{const t=typeof e=="function"?fv(e):e,n=(r,l)=>Dv(t,r,l);return Object.assign(n,t),n},Uv=e=>e?ka(e):ka,Tn=Uv(e=>({user:null,login:t=>e({user:t}),logout:()=>e({user:null})}));function pd(e,t){return function(){return e.apply(t,arguments)}}const{toString:Av}=Object.prototype,{getPrototypeOf:qs}=Object,{iterator:po,toStringTag:hd}=Symbol,ho=(e=>t=>{const n=Av.call(t);return e[n]||(e[n]=n.slice(8,-1).toLowerCase())})(Object.create(null)),Qe=e=>(e=e.toLowerCase(),t=>ho(t)===e),mo=e=>t=>typeof t===e,{isArray:An}=Array,On=mo("undefined");function zr(e){return e!==null&&!On(e)&&e.constructor!==null&&!On(e.constructor)&&xe(e.constructor.isBuffer)&&e.constructor.isBuffer(e)}const md=Qe("ArrayBuffer");function Iv(e){let t;return typeof ArrayBuffer<"u"&&ArrayBuffer.isView?t=ArrayBuffer.isView(e):t=e&&e.buffer&&md(e.buffer),t}const Mv=mo("string"),xe=mo("function"),vd=mo("number"),Fr=e=>e!==null&&typeof e=="object",Bv=e=>e===!0||e===!1,ml=e=>{if(ho(e)!=="object")return!1;const t=qs(e);return(t===null||t===Object.prototype||Object.getPrototypeOf(t)===null)&&!(hd in e)&&!(po in e)},$v=e=>{if(!Fr(e)||zr(e))return!1;try{return Object.keys(e).length===0&&Object.getPrototypeOf(e)===Object.prototype}catch{return!1}},Hv=Qe("Date"),Vv=Qe("File"),Wv=Qe("Blob"),Qv=Qe("FileList"),Kv=e=>Fr(e)&&xe(e.pipe),Jv=e=>{let t;return e&&(typeof FormData=="function"&&e instanceof FormData||xe(e.append)&&((t=ho(e))==="formdata"||t==="object"&&xe(e.toString)&&e.toString()==="[object FormData]"))},Xv=Qe("URLSearchParams"),[qv,Gv,Yv,Zv]=["ReadableStream","Request","Response","Headers"].map(Qe),bv=e=>e.trim?e.trim():e.replace(/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,"");function Dr(e,t,{allOwnKeys:n=!1}={}){if(e===null||typeof e>"u")return;let r,l;if(typeof e!="object"&&(e=[e]),An(e))for(r=0,l=e.length;r<l;r++)t.call(null,e[r],r,e);else{if(zr(e))return;const o=n?Object.getOwnPropertyNames(e):Object.keys(e),i=o.length;let s;for(r=0;r<i;r++)s=o[r],t.call(null,e[s],s,e)}}function yd(e,t){if(zr(e))return null;t=t.toLowerCase();const n=Object.keys(e);let r=n.length,l;for(;r-- >0;)if(l=n[r],t===l.toLowerCase())return l;return null}const Vt=(()=>typeof globalThis<"u"?globalThis:typeof self<"u"?self:typeof window<"u"?window:global)(),gd=e=>!On(e)&&e!==Vt;function Ki(){const{caseless:e,skipUndefined:t}=gd(this)&&this||{},n={},r=(l,o)=>{const i=e&&yd(n,o)||o;ml(n[i])&&ml(l)?n[i]=Ki(n[i],l):ml(l)?n[i]=Ki({},l):An(l)?n[i]=l.slice():(!t||!On(l))&&(n[i]=l)};for(let l=0,o=arguments.length;l<o;l++)arguments[l]&&Dr(arguments[l],r);return n}const ey=(e,t,n,{allOwnKeys:r}={})=>(Dr(t,(l,o)=>{n&&xe(l)?e[o]=pd(l,n):e[o]=l},{allOwnKeys:r}),e),ty=e=>(e.charCodeAt(0)===65279&&(e=e.slice(1)),e),ny=(e,t,n,r)=>{e.prototype=Object.create(t.prototype,r),e.prototype.constructor=e,Object.defineProperty(e,"super",{value:t.prototype}),n&&Object.assign(e.prototype,n)},ry=(e,t,n,r)=>{let l,o,i;const s={};if(t=t||{},e==null)return t;do{for(l=Object.getOwnPropertyNames(e),o=l.length;o-- >0;)i=l[o],(!r||r(i,e,t))&&!s[i]&&(t[i]=e[i],s[i]=!0);e=n!==!1&&qs(e)}while(e&&(!n||n(e,t))&&e!==Object.prototype);return t},ly=(e,t,n)=>{e=String(e),(n===void 0||n>e.length)&&(n=e.length),n-=t.length;const r=e.indexOf(t,n);return r!==-1&&r===n},oy=e=>{if(!e)return null;if(An(e))return e;let t=e.length;if(!vd(t))return null;const n=new Array(t);for(;t-- >0;)n[t]=e[t];return n},iy=(e=>t=>e&&t instanceof e)(typeof Uint8Array<"u"&&qs(Uint8Array)),sy=(e,t)=>{const r=(e&&e[po]).call(e);let l;for(;(l=r.next())&&!l.done;){const o=l.value;t.call(e,o[0],o[1])}},uy=(e,t)=>{let n;const r=[];for(;(n=e.exec(t))!==null;)r.push(n);return r},ay=Qe("HTMLFormElement"),cy=e=>e.toLowerCase().replace(/[-_\s]([a-z\d])(\w*)/g,function(n,r,l){return r.toUpperCase()+l}),Ca=(({hasOwnProperty:e})=>(t,n)=>e.call(t,n))(Object.prototype),fy=Qe("RegExp"),wd=(e,t)=>{const n=Object.getOwnPropertyDescriptors(e),r={};Dr(n,(l,o)=>{let i;(i=t(l,o,e))!==!1&&(r[o]=i||l)}),Object.defineProperties(e,r)},dy=e=>{wd(e,(t,n)=>{if(xe(e)&&["arguments","caller","callee"].indexOf(n)!==-1)return!1;const r=e[n];if(xe(r)){if(t.enumerable=!1,"writable"in t){t.writable=!1;return}t.set||(t.set=()=>{throw Error("Can not rewrite read-only method '"+n+"'")})}})},py=(e,t)=>{const n={},r=l=>{l.forEach(o=>{n[o]=!0})};return An(e)?r(e):r(String(e).split(t)),n},hy=()=>{},my=(e,t)=>e!=null&&Number.isFinite(e=+e)?e:t;function vy(e){return!!(e&&xe(e.append)&&e[hd]==="FormData"&&e[po])}const yy=e=>{const t=new Array(10),n=(r,l)=>{if(Fr(r)){if(t.indexOf(r)>=0)return;if(zr(r))return r;if(!("toJSON"in r)){t[l]=r;const o=An(r)?[]:{};return Dr(r,(i,s)=>{const u=n(i,l+1);!On(u)&&(o[s]=u)}),t[l]=void 0,o}}return r};return n(e,0)},gy=Qe("AsyncFunction"),wy=e=>e&&(Fr(e)||xe(e))&&xe(e.then)&&xe(e.catch),Sd=((e,t)=>e?setImmediate:t?((n,r)=>(Vt.addEventListener("message",({source:l,data:o})=>{l===Vt&&o===n&&r.length&&r.shift()()},!1),l=>{r.push(l),Vt.postMessage(n,"*")}))(`axios@${Math.random()}`,[]):n=>setTimeout(n))(typeof setImmediate=="function",xe(Vt.postMessage)),Sy=typeof queueMicrotask<"u"?queueMicrotask.bind(Vt):typeof process<"u"&&process.nextTick||Sd,Ey=e=>e!=null&&xe(e[po]),S={isArray:An,isArrayBuffer:md,isBuffer:zr,isFormData:Jv,isArrayBufferView:Iv,isString:Mv,isNumber:vd,isBoolean:Bv,isObject:Fr,isPlainObject:ml,isEmptyObject:$v,isReadableStream:qv,isRequest:Gv,isResponse:Yv,isHeaders:Zv,isUndefined:On,isDate:Hv,isFile:Vv,isBlob:Wv,isRegExp:fy,isFunction:xe,isStream:Kv,isURLSearchParams:Xv,isTypedArray:iy,isFileList:Qv,forEach:Dr,merge:Ki,extend:ey,trim:bv,stripBOM:ty,inherits:ny,toFlatObject:ry,kindOf:ho,kindOfTest:Qe,endsWith:ly,toArray:oy,forEachEntry:sy,matchAll:uy,isHTMLForm:ay,hasOwnProperty:Ca,hasOwnProp:Ca,reduceDescriptors:wd,freezeMethods:dy,toObjectSet:py,toCamelCase:cy,noop:hy,toFiniteNumber:my,findKey:yd,global:Vt,isContextDefined:gd,isSpecCompliantForm:vy,toJSONObject:yy,isAsyncFn:gy,isThenable:wy,setImmediate:Sd,asap:Sy,isIterable:Ey};function L(e,t,n,r,l){Error.call(this),Error.captureStackTrace?Error.captureStackTrace(this,this.constructor):this.stack=new Error().stack,this.message=e,this.name="AxiosError",t&&(this.code=t),n&&(this.config=n),r&&(this.request=r),l&&(this.response=l,this.status=l.status?l.status:null)}S.inherits(L,Error,{toJSON:function(){return{message:this.message,name:this.name,description:this.description,number:this.number,fileName:this.fileName,lineNumber:this.lineNumber,columnNumber:this.columnNumber,stack:this.stack,config:S.toJSONObject(this.config),code:this.code,status:this.status}}});const Ed=L.prototype,xd={};["ERR_BAD_OPTION_VALUE","ERR_BAD_OPTION","ECONNABORTED","ETIMEDOUT","ERR_NETWORK","ERR_FR_TOO_MANY_REDIRECTS","ERR_DEPRECATED","ERR_BAD_RESPONSE","ERR_BAD_REQUEST","ERR_CANCELED","ERR_NOT_SUPPORT","ERR_INVALID_URL"].forEach(e=>{xd[e]={value:e}});Object.defineProperties(L,xd);Object.defineProperty(Ed,"isAxiosError",{value:!0});L.from=(e,t,n,r,l,o)=>{const i=Object.create(Ed);S.toFlatObject(e,i,function(c){return c!==Error.prototype},a=>a!=="isAxiosError");const s=e&&e.message?e.message:"Error",u=t==null&&e?e.code:t;return L.call(i,s,u,n,r,l),e&&i.cause==null&&Object.defineProperty(i,"cause",{value:e,configurable:!0}),i.name=e&&e.name||"Error",o&&Object.assign(i,o),i};const xy=null;function Ji(e){return S.isPlainObject(e)||S.isArray(e)}function kd(e){return S.endsWith(e,"[]")?e.slice(0,-2):e}function Na(e,t,n){return e?e.concat(t).map(function(l,o){return l=kd(l),!n&&o?"["+l+"]":l}).join(n?".":""):t}function ky(e){return S.isArray(e)&&!e.some(Ji)}const Cy=S.toFlatObject(S,{},null,function(t){return/^is[A-Z]/.test(t)});function vo(e,t,n){if(!S.isObject(e))throw new TypeError("target must be an object");t=t||new FormData,n=S.toFlatObject(n,{metaTokens:!0,dots:!1,indexes:!1},!1,function(w,E){return!S.isUndefined(E[w])});const r=n.metaTokens,l=n.visitor||c,o=n.dots,i=n.indexes,u=(n.Blob||typeof Blob<"u"&&Blob)&&S.isSpecCompliantForm(t);if(!S.isFunction(l))throw new TypeError("visitor must be a function");function a(m){if(m===null)return"";if(S.isDate(m))return m.toISOString();if(S.isBoolean(m))return m.toString();if(!u&&S.isBlob(m))throw new L("Blob is not supported. Use a Buffer instead.");return S.isArrayBuffer(m)||S.isTypedArray(m)?u&&typeof Blob=="function"?new Blob([m]):Buffer.from(m):m}function c(m,w,E){let p=m;if(m&&!E&&typeof m=="object"){if(S.endsWith(w,"{}"))w=r?w:w.slice(0,-2),m=JSON.stringify(m);else if(S.isArray(m)&&ky(m)||(S.isFileList(m)||S.endsWith(w,"[]"))&&(p=S.toArray(m)))return w=kd(w),p.forEach(function(h,x){!(S.isUndefined(h)||h===null)&&t.append(i===!0?Na([w],x,o):i===null?w:w+"[]",a(h))}),!1}return Ji(m)?!0:(t.append(Na(E,w,o),a(m)),!1)}const f=[],v=Object.assign(Cy,{defaultVisitor:c,convertValue:a,isVisitable:Ji});function g(m,w){if(!S.isUndefined(m)){if(f.indexOf(m)!==-1)throw Error("Circular reference detected in "+w.join("."));f.push(m),S.forEach(m,function(p,d){(!(S.isUndefined(p)||p===null)&&l.call(t,p,S.isString(d)?d.trim():d,w,v))===!0&&g(p,w?w.concat(d):[d])}),f.pop()}}if(!S.isObject(e))throw new TypeError("data must be an object");return g(e),t}function Ra(e){const t={"!":"%21","'":"%27","(":"%28",")":"%29","~":"%7E","%20":"+","%00":"\0"};return encodeURIComponent(e).replace(/[!'()~]|%20|%00/g,function(r){return t[r]})}function Gs(e,t){this._pairs=[],e&&vo(e,this,t)}const Cd=Gs.prototype;Cd.append=function(t,n){this._pairs.push([t,n])};Cd.toString=function(t){const n=t?function(r){return t.call(this,r,Ra)}:Ra;return this._pairs.map(function(l){return n(l[0])+"="+n(l[1])},"").join("&")};function Ny(e){return encodeURIComponent(e).replace(/%3A/gi,":").replace(/%24/g,"$").replace(/%2C/gi,",").replace(/%20/g,"+")}function Nd(e,t,n){if(!t)return e;const r=n&&n.encode||Ny;S.isFunction(n)&&(n={serialize:n});const l=n&&n.serialize;let o;if(l?o=l(t,n):o=S.isURLSearchParams(t)?t.toString():new Gs(t,n).toString(r),o){const i=e.indexOf("#");i!==-1&&(e=e.slice(0,i)),e+=(e.indexOf("?")===-1?"?":"&")+o}return e}class Ry{constructor(){this.handlers=[]}use(t,n,r){return this.handlers.push({fulfilled:t,rejected:n,synchronous:r?r.synchronous:!1,runWhen:r?r.runWhen:null}),this.handlers.length-1}eject(t){this.handlers[t]&&(this.handlers[t]=null)}clear(){this.handlers&&(this.handlers=[])}forEach(t){S.forEach(this.handlers,function(r){r!==null&&t(r)})}}const _a=Ry,Rd={silentJSONParsing:!0,forcedJSONParsing:!0,clarifyTimeoutError:!1},_y=typeof URLSearchParams<"u"?URLSearchParams:Gs,Py=typeof FormData<"u"?FormData:null,jy=typeof Blob<"u"?Blob:null,Ty={isBrowser:!0,classes:{URLSearchParams:_y,FormData:Py,Blob:jy},protocols:["http","https","file","blob","url","data"]},Ys=typeof window<"u"&&typeof document<"u",Xi=typeof navigator=="object"&&navigator||void 0,Oy=Ys&&(!Xi||["ReactNative","NativeScript","NS"].indexOf(Xi.product)<0),Ly=(()=>typeof WorkerGlobalScope<"u"&&self instanceof WorkerGlobalScope&&typeof self.importScripts=="function")(),zy=Ys&&window.location.href||"http://localhost",Fy=Object.freeze(Object.defineProperty({__proto__:null,hasBrowserEnv:Ys,hasStandardBrowserEnv:Oy,hasStandardBrowserWebWorkerEnv:Ly,navigator:Xi,origin:zy},Symbol.toStringTag,{value:"Module"})),ae={...Fy,...Ty};function Dy(e,t){return vo(e,new ae.classes.URLSearchParams,{visitor:function(n,r,l,o){return ae.isNode&&S.isBuffer(n)?(this.append(r,n.toString("base64")),!1):o.defaultVisitor.apply(this,arguments)},...t})}function Uy(e){return S.matchAll(/\w+|\[(\w*)]/g,e).map(t=>t[0]==="[]"?"":t[1]||t[0])}function Ay(e){const t={},n=Object.keys(e);let r;const l=n.length;let o;for(r=0;r<l;r++)o=n[r],t[o]=e[o];return t}function _d(e){function t(n,r,l,o){let i=n[o++];if(i==="__proto__")return!0;const s=Number.isFinite(+i),u=o>=n.length;return i=!i&&S.isArray(l)?l.length:i,u?(S.hasOwnProp(l,i)?l[i]=[l[i],r]:l[i]=r,!s):((!l[i]||!S.isObject(l[i]))&&(l[i]=[]),t(n,r,l[i],o)&&S.isArray(l[i])&&(l[i]=Ay(l[i])),!s)}if(S.isFormData(e)&&S.isFunction(e.entries)){const n={};return S.forEachEntry(e,(r,l)=>{t(Uy(r),l,n,0)}),n}return null}function Iy(e,t,n){if(S.isString(e))try{return(t||JSON.parse)(e),S.trim(e)}catch(r){if(r.name!=="SyntaxError")throw r}return(n||JSON.stringify)(e)}const Zs={transitional:Rd,adapter:["xhr","http","fetch"],transformRequest:[function(t,n){const r=n.getContentType()||"",l=r.indexOf("application/json")>-1,o=S.isObject(t);if(o&&S.isHTMLForm(t)&&(t=new FormData(t)),S.isFormData(t))return l?JSON.stringify(_d(t)):t;if(S.isArrayBuffer(t)||S.isBuffer(t)||S.isStream(t)||S.isFile(t)||S.isBlob(t)||S.isReadableStream(t))return t;if(S.isArrayBufferView(t))return t.buffer;if(S.isURLSearchParams(t))return n.setContentType("application/x-www-form-urlencoded;charset=utf-8",!1),t.toString();let s;if(o){if(r.indexOf("application/x-www-form-urlencoded")>-1)return Dy(t,this.formSerializer).toString();if((s=S.isFileList(t))||r.indexOf("multipart/form-data")>-1){const u=this.env&&this.env.FormData;return vo(s?{"files[]":t}:t,u&&new u,this.formSerializer)}}return o||l?(n.setContentType("application/json",!1),Iy(t)):t}],transformResponse:[function(t){const n=this.transitional||Zs.transitional,r=n&&n.forcedJSONParsing,l=this.responseType==="json";if(S.isResponse(t)||S.isReadableStream(t))return t;if(t&&S.isString(t)&&(r&&!this.responseType||l)){const i=!(n&&n.silentJSONParsing)&&l;try{return JSON.parse(t,this.parseReviver)}catch(s){if(i)throw s.name==="SyntaxError"?L.from(s,L.ERR_BAD_RESPONSE,this,null,this.response):s}}return t}],timeout:0,xsrfCookieName:"XSRF-TOKEN",xsrfHeaderName:"X-XSRF-TOKEN",maxContentLength:-1,maxBodyLength:-1,env:{FormData:ae.classes.FormData,Blob:ae.classes.Blob},validateStatus:function(t){return t>=200&&t<300},headers:{common:{Accept:"application/json, text/plain, */*","Content-Type":void 0}}};S.forEach(["delete","get","head","post","put","patch"],e=>{Zs.headers[e]={}});const bs=Zs,My=S.toObjectSet(["age","authorization","content-length","content-type","etag","expires","from","host","if-modified-since","if-unmodified-since","last-modified","location","max-forwards","proxy-authorization","referer","retry-after","user-agent"]),By=e=>{const t={};let n,r,l;return e&&e.split(`
-`).forEach(function(i){l=i.indexOf(":"),n=i.substring(0,l).trim().toLowerCase(),r=i.substring(l+1).trim(),!(!n||t[n]&&My[n])&&(n==="set-cookie"?t[n]?t[n].push(r):t[n]=[r]:t[n]=t[n]?t[n]+", "+r:r)}),t},Pa=Symbol("internals");function Jn(e){return e&&String(e).trim().toLowerCase()}function vl(e){return e===!1||e==null?e:S.isArray(e)?e.map(vl):String(e)}function $y(e){const t=Object.create(null),n=/([^\s,;=]+)\s*(?:=\s*([^,;]+))?/g;let r;for(;r=n.exec(e);)t[r[1]]=r[2];return t}const Hy=e=>/^[-_a-zA-Z0-9^`|~,!#$%&'*+.]+$/.test(e.trim());function Jo(e,t,n,r,l){if(S.isFunction(r))return r.call(this,t,n);if(l&&(t=n),!!S.isString(t)){if(S.isString(r))return t.indexOf(r)!==-1;if(S.isRegExp(r))return r.test(t)}}function Vy(e){return e.trim().toLowerCase().replace(/([a-z\d])(\w*)/g,(t,n,r)=>n.toUpperCase()+r)}function Wy(e,t){const n=S.toCamelCase(" "+t);["get","set","has"].forEach(r=>{Object.defineProperty(e,r+n,{value:function(l,o,i){return this[r].call(this,t,l,o,i)},configurable:!0})})}class yo{constructor(t){t&&this.set(t)}set(t,n,r){const l=this;function o(s,u,a){const c=Jn(u);if(!c)throw new Error("header name must be a non-empty string");const f=S.findKey(l,c);(!f||l[f]===void 0||a===!0||a===void 0&&l[f]!==!1)&&(l[f||u]=vl(s))}const i=(s,u)=>S.forEach(s,(a,c)=>o(a,c,u));if(S.isPlainObject(t)||t instanceof this.constructor)i(t,n);else if(S.isString(t)&&(t=t.trim())&&!Hy(t))i(By(t),n);else if(S.isObject(t)&&S.isIterable(t)){let s={},u,a;for(const c of t){if(!S.isArray(c))throw TypeError("Object iterator must return a key-value pair");s[a=c[0]]=(u=s[a])?S.isArray(u)?[...u,c[1]]:[u,c[1]]:c[1]}i(s,n)}else t!=null&&o(n,t,r);return this}get(t,n){if(t=Jn(t),t){const r=S.findKey(this,t);if(r){const l=this[r];if(!n)return l;if(n===!0)return $y(l);if(S.isFunction(n))return n.call(this,l,r);if(S.isRegExp(n))return n.exec(l);throw new TypeError("parser must be boolean|regexp|function")}}}has(t,n){if(t=Jn(t),t){const r=S.findKey(this,t);return!!(r&&this[r]!==void 0&&(!n||Jo(this,this[r],r,n)))}return!1}delete(t,n){const r=this;let l=!1;function o(i){if(i=Jn(i),i){const s=S.findKey(r,i);s&&(!n||Jo(r,r[s],s,n))&&(delete r[s],l=!0)}}return S.isArray(t)?t.forEach(o):o(t),l}clear(t){const n=Object.keys(this);let r=n.length,l=!1;for(;r--;){const o=n[r];(!t||Jo(this,this[o],o,t,!0))&&(delete this[o],l=!0)}return l}normalize(t){const n=this,r={};return S.forEach(this,(l,o)=>{const i=S.findKey(r,o);if(i){n[i]=vl(l),delete n[o];return}const s=t?Vy(o):String(o).trim();s!==o&&delete n[o],n[s]=vl(l),r[s]=!0}),this}concat(...t){return this.constructor.concat(this,...t)}toJSON(t){const n=Object.create(null);return S.forEach(this,(r,l)=>{r!=null&&r!==!1&&(n[l]=t&&S.isArray(r)?r.join(", "):r)}),n}[Symbol.iterator](){return Object.entries(this.toJSON())[Symbol.iterator]()}toString(){return Object.entries(this.toJSON()).map(([t,n])=>t+": "+n).join(`
-`)}getSetCookie(){return this.get("set-cookie")||[]}get[Symbol.toStringTag](){return"AxiosHeaders"}static from(t){return t instanceof this?t:new this(t)}static concat(t,...n){const r=new this(t);return n.forEach(l=>r.set(l)),r}static accessor(t){const r=(this[Pa]=this[Pa]={accessors:{}}).accessors,l=this.prototype;function o(i){const s=Jn(i);r[s]||(Wy(l,i),r[s]=!0)}return S.isArray(t)?t.forEach(o):o(t),this}}yo.accessor(["Content-Type","Content-Length","Accept","Accept-Encoding","User-Agent","Authorization"]);S.reduceDescriptors(yo.prototype,({value:e},t)=>{let n=t[0].toUpperCase()+t.slice(1);return{get:()=>e,set(r){this[n]=r}}});S.freezeMethods(yo);const Ve=yo;function Xo(e,t){const n=this||bs,r=t||n,l=Ve.from(r.headers);let o=r.data;return S.forEach(e,function(s){o=s.call(n,o,l.normalize(),t?t.status:void 0)}),l.normalize(),o}function Pd(e){return!!(e&&e.__CANCEL__)}function In(e,t,n){L.call(this,e??"canceled",L.ERR_CANCELED,t,n),this.name="CanceledError"}S.inherits(In,L,{__CANCEL__:!0});function jd(e,t,n){const r=n.config.validateStatus;!n.status||!r||r(n.status)?e(n):t(new L("Request failed with status code "+n.status,[L.ERR_BAD_REQUEST,L.ERR_BAD_RESPONSE][Math.floor(n.status/100)-4],n.config,n.request,n))}function Qy(e){const t=/^([-+\w]{1,25})(:?\/\/|:)/.exec(e);return t&&t[1]||""}function Ky(e,t){e=e||10;const n=new Array(e),r=new Array(e);let l=0,o=0,i;return t=t!==void 0?t:1e3,function(u){const a=Date.now(),c=r[o];i||(i=a),n[l]=u,r[l]=a;let f=o,v=0;for(;f!==l;)v+=n[f++],f=f%e;if(l=(l+1)%e,l===o&&(o=(o+1)%e),a-i<t)return;const g=c&&a-c;return g?Math.round(v*1e3/g):void 0}}function Jy(e,t){let n=0,r=1e3/t,l,o;const i=(a,c=Date.now())=>{n=c,l=null,o&&(clearTimeout(o),o=null),e(...a)};return[(...a)=>{const c=Date.now(),f=c-n;f>=r?i(a,c):(l=a,o||(o=setTimeout(()=>{o=null,i(l)},r-f)))},()=>l&&i(l)]}const Ql=(e,t,n=3)=>{let r=0;const l=Ky(50,250);return Jy(o=>{const i=o.loaded,s=o.lengthComputable?o.total:void 0,u=i-r,a=l(u),c=i<=s;r=i;const f={loaded:i,total:s,progress:s?i/s:void 0,bytes:u,rate:a||void 0,estimated:a&&s&&c?(s-i)/a:void 0,event:o,lengthComputable:s!=null,[t?"download":"upload"]:!0};e(f)},n)},ja=(e,t)=>{const n=e!=null;return[r=>t[0]({lengthComputable:n,total:e,loaded:r}),t[1]]},Ta=e=>(...t)=>S.asap(()=>e(...t)),Xy=ae.hasStandardBrowserEnv?((e,t)=>n=>(n=new URL(n,ae.origin),e.protocol===n.protocol&&e.host===n.host&&(t||e.port===n.port)))(new URL(ae.origin),ae.navigator&&/(msie|trident)/i.test(ae.navigator.userAgent)):()=>!0,qy=ae.hasStandardBrowserEnv?{write(e,t,n,r,l,o,i){if(typeof document>"u")return;const s=[`${e}=${encodeURIComponent(t)}`];S.isNumber(n)&&s.push(`expires=${new Date(n).toUTCString()}`),S.isString(r)&&s.push(`path=${r}`),S.isString(l)&&s.push(`domain=${l}`),o===!0&&s.push("secure"),S.isString(i)&&s.push(`SameSite=${i}`),document.cookie=s.join("; ")},read(e){if(typeof document>"u")return null;const t=document.cookie.match(new RegExp("(?:^|; )"+e+"=([^;]*)"));return t?decodeURIComponent(t[1]):null},remove(e){this.write(e,"",Date.now()-864e5,"/")}}:{write(){},read(){return null},remove(){}};function Gy(e){return/^([a-z][a-z\d+\-.]*:)?\/\//i.test(e)}function Yy(e,t){return t?e.replace(/\/?\/$/,"")+"/"+t.replace(/^\/+/,""):e}function Td(e,t,n){let r=!Gy(t);return e&&(r||n==!1)?Yy(e,t):t}const Oa=e=>e instanceof Ve?{...e}:e;function Yt(e,t){t=t||{};const n={};function r(a,c,f,v){return S.isPlainObject(a)&&S.isPlainObject(c)?S.merge.call({caseless:v},a,c):S.isPlainObject(c)?S.merge({},c):S.isArray(c)?c.slice():c}function l(a,c,f,v){if(S.isUndefined(c)){if(!S.isUndefined(a))return r(void 0,a,f,v)}else return r(a,c,f,v)}function o(a,c){if(!S.isUndefined(c))return r(void 0,c)}function i(a,c){if(S.isUndefined(c)){if(!S.isUndefined(a))return r(void 0,a)}else return r(void 0,c)}function s(a,c,f){if(f in t)return r(a,c);if(f in e)return r(void 0,a)}const u={url:o,method:o,data:o,baseURL:i,transformRequest:i,transformResponse:i,paramsSerializer:i,timeout:i,timeoutMessage:i,withCredentials:i,withXSRFToken:i,adapter:i,responseType:i,xsrfCookieName:i,xsrfHeaderName:i,onUploadProgress:i,onDownloadProgress:i,decompress:i,maxContentLength:i,maxBodyLength:i,beforeRedirect:i,transport:i,httpAgent:i,httpsAgent:i,cancelToken:i,socketPath:i,responseEncoding:i,validateStatus:s,headers:(a,c,f)=>l(Oa(a),Oa(c),f,!0)};return S.forEach(Object.keys({...e,...t}),function(c){const f=u[c]||l,v=f(e[c],t[c],c);S.isUndefined(v)&&f!==s||(n[c]=v)}),n}const Od=e=>{const t=Yt({},e);let{data:n,withXSRFToken:r,xsrfHeaderName:l,xsrfCookieName:o,headers:i,auth:s}=t;if(t.headers=i=Ve.from(i),t.url=Nd(Td(t.baseURL,t.url,t.allowAbsoluteUrls),e.params,e.paramsSerializer),s&&i.set("Authorization","Basic "+btoa((s.username||"")+":"+(s.password?unescape(encodeURIComponent(s.password)):""))),S.isFormData(n)){if(ae.hasStandardBrowserEnv||ae.hasStandardBrowserWebWorkerEnv)i.setContentType(void 0);else if(S.isFunction(n.getHeaders)){const u=n.getHeaders(),a=["content-type","content-length"];Object.entries(u).forEach(([c,f])=>{a.includes(c.toLowerCase())&&i.set(c,f)})}}if(ae.hasStandardBrowserEnv&&(r&&S.isFunction(r)&&(r=r(t)),r||r!==!1&&Xy(t.url))){const u=l&&o&&qy.read(o);u&&i.set(l,u)}return t},Zy=typeof XMLHttpRequest<"u",by=Zy&&function(e){return new Promise(function(n,r){const l=Od(e);let o=l.data;const i=Ve.from(l.headers).normalize();let{responseType:s,onUploadProgress:u,onDownloadProgress:a}=l,c,f,v,g,m;function w(){g&&g(),m&&m(),l.cancelToken&&l.cancelToken.unsubscribe(c),l.signal&&l.signal.removeEventListener("abort",c)}let E=new XMLHttpRequest;E.open(l.method.toUpperCase(),l.url,!0),E.timeout=l.timeout;function p(){if(!E)return;const h=Ve.from("getAllResponseHeaders"in E&&E.getAllResponseHeaders()),C={data:!s||s==="text"||s==="json"?E.responseText:E.response,status:E.status,statusText:E.statusText,headers:h,config:e,request:E};jd(function(_){n(_),w()},function(_){r(_),w()},C),E=null}"onloadend"in E?E.onloadend=p:E.onreadystatechange=function(){!E||E.readyState!==4||E.status===0&&!(E.responseURL&&E.responseURL.indexOf("file:")===0)||setTimeout(p)},E.onabort=function(){E&&(r(new L("Request aborted",L.ECONNABORTED,e,E)),E=null)},E.onerror=function(x){const C=x&&x.message?x.message:"Network Error",j=new L(C,L.ERR_NETWORK,e,E);j.event=x||null,r(j),E=null},E.ontimeout=function(){let x=l.timeout?"timeout of "+l.timeout+"ms exceeded":"timeout exceeded";const C=l.transitional||Rd;l.timeoutErrorMessage&&(x=l.timeoutErrorMessage),r(new L(x,C.clarifyTimeoutError?L.ETIMEDOUT:L.ECONNABORTED,e,E)),E=null},o===void 0&&i.setContentType(null),"setRequestHeader"in E&&S.forEach(i.toJSON(),function(x,C){E.setRequestHeader(C,x)}),S.isUndefined(l.withCredentials)||(E.withCredentials=!!l.withCredentials),s&&s!=="json"&&(E.responseType=l.responseType),a&&([v,m]=Ql(a,!0),E.addEventListener("progress",v)),u&&E.upload&&([f,g]=Ql(u),E.upload.addEventListener("progress",f),E.upload.addEventListener("loadend",g)),(l.cancelToken||l.signal)&&(c=h=>{E&&(r(!h||h.type?new In(null,e,E):h),E.abort(),E=null)},l.cancelToken&&l.cancelToken.subscribe(c),l.signal&&(l.signal.aborted?c():l.signal.addEventListener("abort",c)));const d=Qy(l.url);if(d&&ae.protocols.indexOf(d)===-1){r(new L("Unsupported protocol "+d+":",L.ERR_BAD_REQUEST,e));return}E.send(o||null)})},eg=(e,t)=>{const{length:n}=e=e?e.filter(Boolean):[];if(t||n){let r=new AbortController,l;const o=function(a){if(!l){l=!0,s();const c=a instanceof Error?a:this.reason;r.abort(c instanceof L?c:new In(c instanceof Error?c.message:c))}};let i=t&&setTimeout(()=>{i=null,o(new L(`timeout ${t} of ms exceeded`,L.ETIMEDOUT))},t);const s=()=>{e&&(i&&clearTimeout(i),i=null,e.forEach(a=>{a.unsubscribe?a.unsubscribe(o):a.removeEventListener("abort",o)}),e=null)};e.forEach(a=>a.addEventListener("abort",o));const{signal:u}=r;return u.unsubscribe=()=>S.asap(s),u}},tg=eg,ng=function*(e,t){let n=e.byteLength;if(!t||n<t){yield e;return}let r=0,l;for(;r<n;)l=r+t,yield e.slice(r,l),r=l},rg=async function*(e,t){for await(const n of lg(e))yield*ng(n,t)},lg=async function*(e){if(e[Symbol.asyncIterator]){yield*e;return}const t=e.getReader();try{for(;;){const{done:n,value:r}=await t.read();if(n)break;yield r}}finally{await t.cancel()}},La=(e,t,n,r)=>{const l=rg(e,t);let o=0,i,s=u=>{i||(i=!0,r&&r(u))};return new ReadableStream({async pull(u){try{const{done:a,value:c}=await l.next();if(a){s(),u.close();return}let f=c.byteLength;if(n){let v=o+=f;n(v)}u.enqueue(new Uint8Array(c))}catch(a){throw s(a),a}},cancel(u){return s(u),l.return()}},{highWaterMark:2})},za=64*1024,{isFunction:nl}=S,og=(({Request:e,Response:t})=>({Request:e,Response:t}))(S.global),{ReadableStream:Fa,TextEncoder:Da}=S.global,Ua=(e,...t)=>{try{return!!e(...t)}catch{return!1}},ig=e=>{e=S.merge.call({skipUndefined:!0},og,e);const{fetch:t,Request:n,Response:r}=e,l=t?nl(t):typeof fetch=="function",o=nl(n),i=nl(r);if(!l)return!1;const s=l&&nl(Fa),u=l&&(typeof Da=="function"?(m=>w=>m.encode(w))(new Da):async m=>new Uint8Array(await new n(m).arrayBuffer())),a=o&&s&&Ua(()=>{let m=!1;const w=new n(ae.origin,{body:new Fa,method:"POST",get duplex(){return m=!0,"half"}}).headers.has("Content-Type");return m&&!w}),c=i&&s&&Ua(()=>S.isReadableStream(new r("").body)),f={stream:c&&(m=>m.body)};l&&["text","arrayBuffer","blob","formData","stream"].forEach(m=>{!f[m]&&(f[m]=(w,E)=>{let p=w&&w[m];if(p)return p.call(w);throw new L(`Response type '${m}' is not supported`,L.ERR_NOT_SUPPORT,E)})});const v=async m=>{if(m==null)return 0;if(S.isBlob(m))return m.size;if(S.isSpecCompliantForm(m))return(await new n(ae.origin,{method:"POST",body:m}).arrayBuffer()).byteLength;if(S.isArrayBufferView(m)||S.isArrayBuffer(m))return m.byteLength;if(S.isURLSearchParams(m)&&(m=m+""),S.isString(m))return(await u(m)).byteLength},g=async(m,w)=>{const E=S.toFiniteNumber(m.getContentLength());return E??v(w)};return async m=>{let{url:w,method:E,data:p,signal:d,cancelToken:h,timeout:x,onDownloadProgress:C,onUploadProgress:j,responseType:_,headers:T,withCredentials:M="same-origin",fetchOptions:F}=Od(m),me=t||fetch;_=_?(_+"").toLowerCase():"text";let Ke=tg([d,h&&h.toAbortSignal()],x),Ue=null;const Je=Ke&&Ke.unsubscribe&&(()=>{Ke.unsubscribe()});let Ar;try{if(j&&a&&E!=="get"&&E!=="head"&&(Ar=await g(T,p))!==0){let A=new n(w,{method:"POST",body:p,duplex:"half"}),$;if(S.isFormData(p)&&($=A.headers.get("content-type"))&&T.setContentType($),A.body){const[dt,je]=ja(Ar,Ql(Ta(j)));p=La(A.body,za,dt,je)}}S.isString(M)||(M=M?"include":"omit");const ve=o&&"credentials"in n.prototype,en={...F,signal:Ke,method:E.toUpperCase(),headers:T.normalize().toJSON(),body:p,duplex:"half",credentials:ve?M:void 0};Ue=o&&new n(w,en);let R=await(o?me(Ue,F):me(w,en));const O=c&&(_==="stream"||_==="response");if(c&&(C||O&&Je)){const A={};["status","statusText","headers"].forEach(tn=>{A[tn]=R[tn]});const $=S.toFiniteNumber(R.headers.get("content-length")),[dt,je]=C&&ja($,Ql(Ta(C),!0))||[];R=new r(La(R.body,za,dt,()=>{je&&je(),Je&&Je()}),A)}_=_||"text";let z=await f[S.findKey(f,_)||"text"](R,m);return!O&&Je&&Je(),await new Promise((A,$)=>{jd(A,$,{data:z,headers:Ve.from(R.headers),status:R.status,statusText:R.statusText,config:m,request:Ue})})}catch(ve){throw Je&&Je(),ve&&ve.name==="TypeError"&&/Load failed|fetch/i.test(ve.message)?Object.assign(new L("Network Error",L.ERR_NETWORK,m,Ue),{cause:ve.cause||ve}):L.from(ve,ve&&ve.code,m,Ue)}}},sg=new Map,Ld=e=>{let t=e&&e.env||{};const{fetch:n,Request:r,Response:l}=t,o=[r,l,n];let i=o.length,s=i,u,a,c=sg;for(;s--;)u=o[s],a=c.get(u),a===void 0&&c.set(u,a=s?new Map:ig(t)),c=a;return a};Ld();const eu={http:xy,xhr:by,fetch:{get:Ld}};S.forEach(eu,(e,t)=>{if(e){try{Object.defineProperty(e,"name",{value:t})}catch{}Object.defineProperty(e,"adapterName",{value:t})}});const Aa=e=>`- ${e}`,ug=e=>S.isFunction(e)||e===null||e===!1;function ag(e,t){e=S.isArray(e)?e:[e];const{length:n}=e;let r,l;const o={};for(let i=0;i<n;i++){r=e[i];let s;if(l=r,!ug(r)&&(l=eu[(s=String(r)).toLowerCase()],l===void 0))throw new L(`Unknown adapter '${s}'`);if(l&&(S.isFunction(l)||(l=l.get(t))))break;o[s||"#"+i]=l}if(!l){const i=Object.entries(o).map(([u,a])=>`adapter ${u} `+(a===!1?"is not supported by the environment":"is not available in the build"));let s=n?i.length>1?`since :
-`+i.map(Aa).join(`
-`):" "+Aa(i[0]):"as no adapter specified";throw new L("There is no suitable adapter to dispatch the request "+s,"ERR_NOT_SUPPORT")}return l}const zd={getAdapter:ag,adapters:eu};function qo(e){if(e.cancelToken&&e.cancelToken.throwIfRequested(),e.signal&&e.signal.aborted)throw new In(null,e)}function Ia(e){return qo(e),e.headers=Ve.from(e.headers),e.data=Xo.call(e,e.transformRequest),["post","put","patch"].indexOf(e.method)!==-1&&e.headers.setContentType("application/x-www-form-urlencoded",!1),zd.getAdapter(e.adapter||bs.adapter,e)(e).then(function(r){return qo(e),r.data=Xo.call(e,e.transformResponse,r),r.headers=Ve.from(r.headers),r},function(r){return Pd(r)||(qo(e),r&&r.response&&(r.response.data=Xo.call(e,e.transformResponse,r.response),r.response.headers=Ve.from(r.response.headers))),Promise.reject(r)})}const Fd="1.13.2",go={};["object","boolean","number","function","string","symbol"].forEach((e,t)=>{go[e]=function(r){return typeof r===e||"a"+(t<1?"n ":" ")+e}});const Ma={};go.transitional=function(t,n,r){function l(o,i){return"[Axios v"+Fd+"] Transitional option '"+o+"'"+i+(r?". "+r:"")}return(o,i,s)=>{if(t===!1)throw new L(l(i," has been removed"+(n?" in "+n:"")),L.ERR_DEPRECATED);return n&&!Ma[i]&&(Ma[i]=!0,console.warn(l(i," has been deprecated since v"+n+" and will be removed in the near future"))),t?t(o,i,s):!0}};go.spelling=function(t){return(n,r)=>(console.warn(`${r} is likely a misspelling of ${t}`),!0)};function cg(e,t,n){if(typeof e!="object")throw new L("options must be an object",L.ERR_BAD_OPTION_VALUE);const r=Object.keys(e);let l=r.length;for(;l-- >0;){const o=r[l],i=t[o];if(i){const s=e[o],u=s===void 0||i(s,o,e);if(u!==!0)throw new L("option "+o+" must be "+u,L.ERR_BAD_OPTION_VALUE);continue}if(n!==!0)throw new L("Unknown option "+o,L.ERR_BAD_OPTION)}}const yl={assertOptions:cg,validators:go},qe=yl.validators;class Kl{constructor(t){this.defaults=t||{},this.interceptors={request:new _a,response:new _a}}async request(t,n){try{return await this._request(t,n)}catch(r){if(r instanceof Error){let l={};Error.captureStackTrace?Error.captureStackTrace(l):l=new Error;const o=l.stack?l.stack.replace(/^.+\n/,""):"";try{r.stack?o&&!String(r.stack).endsWith(o.replace(/^.+\n.+\n/,""))&&(r.stack+=`
-`+o):r.stack=o}catch{}}throw r}}_request(t,n){typeof t=="string"?(n=n||{},n.url=t):n=t||{},n=Yt(this.defaults,n);const{transitional:r,paramsSerializer:l,headers:o}=n;r!==void 0&&yl.assertOptions(r,{silentJSONParsing:qe.transitional(qe.boolean),forcedJSONParsing:qe.transitional(qe.boolean),clarifyTimeoutError:qe.transitional(qe.boolean)},!1),l!=null&&(S.isFunction(l)?n.paramsSerializer={serialize:l}:yl.assertOptions(l,{encode:qe.function,serialize:qe.function},!0)),n.allowAbsoluteUrls!==void 0||(this.defaults.allowAbsoluteUrls!==void 0?n.allowAbsoluteUrls=this.defaults.allowAbsoluteUrls:n.allowAbsoluteUrls=!0),yl.assertOptions(n,{baseUrl:qe.spelling("baseURL"),withXsrfToken:qe.spelling("withXSRFToken")},!0),n.method=(n.method||this.defaults.method||"get").toLowerCase();let i=o&&S.merge(o.common,o[n.method]);o&&S.forEach(["delete","get","head","post","put","patch","common"],m=>{delete o[m]}),n.headers=Ve.concat(i,o);const s=[];let u=!0;this.interceptors.request.forEach(function(w){typeof w.runWhen=="function"&&w.runWhen(n)===!1||(u=u&&w.synchronous,s.unshift(w.fulfilled,w.rejected))});const a=[];this.interceptors.response.forEach(function(w){a.push(w.fulfilled,w.rejected)});let c,f=0,v;if(!u){const m=[Ia.bind(this),void 0];for(m.unshift(...s),m.push(...a),v=m.length,c=Promise.resolve(n);f<v;)c=c.then(m[f++],m[f++]);return c}v=s.length;let g=n;for(;f<v;){const m=s[f++],w=s[f++];try{g=m(g)}catch(E){w.call(this,E);break}}try{c=Ia.call(this,g)}catch(m){return Promise.reject(m)}for(f=0,v=a.length;f<v;)c=c.then(a[f++],a[f++]);return c}getUri(t){t=Yt(this.defaults,t);const n=Td(t.baseURL,t.url,t.allowAbsoluteUrls);return Nd(n,t.params,t.paramsSerializer)}}S.forEach(["delete","get","head","options"],function(t){Kl.prototype[t]=function(n,r){return this.request(Yt(r||{},{method:t,url:n,data:(r||{}).data}))}});S.forEach(["post","put","patch"],function(t){function n(r){return function(o,i,s){return this.request(Yt(s||{},{method:t,headers:r?{"Content-Type":"multipart/form-data"}:{},url:o,data:i}))}}Kl.prototype[t]=n(),Kl.prototype[t+"Form"]=n(!0)});const gl=Kl;class tu{constructor(t){if(typeof t!="function")throw new TypeError("executor must be a function.");let n;this.promise=new Promise(function(o){n=o});const r=this;this.promise.then(l=>{if(!r._listeners)return;let o=r._listeners.length;for(;o-- >0;)r._listeners[o](l);r._listeners=null}),this.promise.then=l=>{let o;const i=new Promise(s=>{r.subscribe(s),o=s}).then(l);return i.cancel=function(){r.unsubscribe(o)},i},t(function(o,i,s){r.reason||(r.reason=new In(o,i,s),n(r.reason))})}throwIfRequested(){if(this.reason)throw this.reason}subscribe(t){if(this.reason){t(this.reason);return}this._listeners?this._listeners.push(t):this._listeners=[t]}unsubscribe(t){if(!this._listeners)return;const n=this._listeners.indexOf(t);n!==-1&&this._listeners.splice(n,1)}toAbortSignal(){const t=new AbortController,n=r=>{t.abort(r)};return this.subscribe(n),t.signal.unsubscribe=()=>this.unsubscribe(n),t.signal}static source(){let t;return{token:new tu(function(l){t=l}),cancel:t}}}const fg=tu;function dg(e){return function(n){return e.apply(null,n)}}function pg(e){return S.isObject(e)&&e.isAxiosError===!0}const qi={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511,WebServerIsDown:521,ConnectionTimedOut:522,OriginIsUnreachable:523,TimeoutOccurred:524,SslHandshakeFailed:525,InvalidSslCertificate:526};Object.entries(qi).forEach(([e,t])=>{qi[t]=e});const hg=qi;function Dd(e){const t=new gl(e),n=pd(gl.prototype.request,t);return S.extend(n,gl.prototype,t,{allOwnKeys:!0}),S.extend(n,t,null,{allOwnKeys:!0}),n.create=function(l){return Dd(Yt(e,l))},n}const Z=Dd(bs);Z.Axios=gl;Z.CanceledError=In;Z.CancelToken=fg;Z.isCancel=Pd;Z.VERSION=Fd;Z.toFormData=vo;Z.AxiosError=L;Z.Cancel=Z.CanceledError;Z.all=function(t){return Promise.all(t)};Z.spread=dg;Z.isAxiosError=pg;Z.mergeConfig=Yt;Z.AxiosHeaders=Ve;Z.formToJSON=e=>_d(S.isHTMLForm(e)?new FormData(e):e);Z.getAdapter=zd.getAdapter;Z.HttpStatusCode=hg;Z.default=Z;const mg=Z,Ur=mg.create({baseURL:"https://studycore-backend-sz7i.onrender.com"}),vg=e=>(console.log("Sending login request with password:",e),Ur.post("/login",{password:e}).then(t=>(console.log("Login response:",t.data),t)).catch(t=>{var n;throw console.error("Login error response:",(n=t.response)==null?void 0:n.data),t}));const yg=()=>{const[e,t]=N.useState(""),[n,r]=N.useState(!1),[l,o]=N.useState(""),i=co(),s=Tn(a=>a.login),u=async()=>{if(!e){o("Введите пароль!");return}r(!0);try{const c=(await vg(e.trim())).data;r(!1),c.id?(s({id:c.id,name:c.name,role:c.role,gender:c.gender}),i("/menu")):c.error?o(c.error):o("Неверный пароль")}catch(a){r(!1),console.error("Login error:",a),a.response&&a.response.status===401?o("Неверный пароль"):a.response&&a.response.data&&a.response.data.error?o(a.response.data.error):o("Ошибка сервера")}};return y.jsxs("div",{className:"login-page",children:[y.jsx("h2",{children:"Вход"}),y.jsx("input",{type:"password",placeholder:"Введите пароль",value:e,onChange:a=>t(a.target.value),onKeyPress:a=>a.key==="Enter"&&u()}),y.jsx("button",{onClick:u,children:n?"Вход...":"Войти"}),l&&y.jsxs("div",{className:"toast show",children:[y.jsx("span",{children:l}),y.jsx("button",{onClick:()=>o(""),children:"×"})]})]})};const gg=()=>{const e=Tn(t=>t.user);return y.jsx("div",{className:"menu-page",children:y.jsxs("div",{className:"menu-container",children:[y.jsxs("div",{className:"menu-header",children:[y.jsx("h2",{children:"Главное меню"}),e&&y.jsxs("p",{children:["Добро пожаловать, ",y.jsx("strong",{children:e.name}),y.jsx("span",{className:"role-badge",children:e.role})]})]}),y.jsx("nav",{children:y.jsxs("ul",{className:"menu-nav",children:[y.jsx("li",{children:y.jsxs(rt,{to:"/profile",children:[y.jsx("span",{className:"menu-icon icon-profile"}),y.jsx("span",{children:"Профиль"})]})}),y.jsx("li",{children:y.jsxs(rt,{to:"/homework",children:[y.jsx("span",{className:"menu-icon icon-homework"}),y.jsx("span",{children:"Домашние задания"})]})}),y.jsx("li",{children:y.jsxs(rt,{to:"/journal",children:[y.jsx("span",{className:"menu-icon icon-journal"}),y.jsx("span",{children:"Журнал учеников"})]})}),y.jsx("li",{children:y.jsxs(rt,{to:"/ai",children:[y.jsx("span",{className:"menu-icon icon-ai"}),y.jsx("span",{children:"ИИ (в разработке)"})]})})]})})]})})};const wg=()=>{const e=Tn(l=>l.user),t=Tn(l=>l.logout),n=co(),r=()=>{t(),n("/login")};return y.jsx("div",{className:"profile-page",children:y.jsxs("div",{className:"profile-container",children:[y.jsx("div",{className:"profile-header",children:y.jsx("h2",{children:"Мой профиль"})}),y.jsxs("div",{className:"profile-card",children:[y.jsx("div",{className:"profile-avatar",children:"👤"}),y.jsx("div",{className:"profile-info",children:e?y.jsxs(y.Fragment,{children:[y.jsx("h3",{children:e.name}),y.jsxs("div",{className:"profile-row",children:[y.jsxs("div",{className:"profile-field",children:[y.jsx("div",{className:"profile-field-label",children:"Роль"}),y.jsx("div",{className:"profile-field-value",children:e.role})]}),y.jsxs("div",{className:"profile-field",children:[y.jsx("div",{className:"profile-field-label",children:"Статус"}),y.jsx("div",{className:"profile-field-value",children:"✓ Активен"})]})]}),y.jsx("button",{className:"btn-logout",onClick:r,children:"Выйти"})]}):y.jsx("p",{children:"Пожалуйста, войдите в систему"})})]})]})})},Sg=()=>Ur.get("/homework"),Eg=(e,t)=>Ur.post("/homework",{title:e,description:t}),xg=e=>Ur.delete(`/homework/${e}`);function kg(){const e=Tn(g=>g.user),[t,n]=N.useState([]),[r,l]=N.useState(""),[o,i]=N.useState(""),[s,u]=N.useState(!0);N.useEffect(()=>{a()},[]);const a=async()=>{try{const g=await Sg();n(g.data)}catch(g){console.error("Ошибка загрузки ДЗ:",g),n([])}finally{u(!1)}},c=async()=>{if(!r||!o){alert("Заполните все поля!");return}try{const g=await Eg(r,o);n([...t,g.data]),l(""),i("")}catch(g){console.error("Ошибка при добавлении ДЗ:",g),alert("Ошибка при добавлении задания")}},f=async g=>{if(window.confirm("Вы уверены, что хотите удалить это задание?"))try{await xg(g),n(t.filter(m=>m.id!==g))}catch(m){console.error("Ошибка при удалении ДЗ:",m),alert("Ошибка при удалении задания")}},v=e&&(e.role==="Moderator"||e.role==="Admin");return s?y.jsx("div",{className:"homework-page",children:y.jsx("p",{children:"Загрузка..."})}):y.jsx("div",{className:"homework-page",children:y.jsxs("div",{className:"homework-container",children:[y.jsx("div",{className:"homework-header",children:y.jsx("h2",{children:"📚 Домашние задания"})}),v&&y.jsxs("div",{className:"homework-form",children:[y.jsxs("div",{className:"form-row",children:[y.jsxs("div",{className:"form-group",children:[y.jsx("label",{children:"Название задания"}),y.jsx("input",{type:"text",placeholder:"Введите название",value:r,onChange:g=>l(g.target.value)})]}),y.jsxs("div",{className:"form-group",children:[y.jsx("label",{children:"Описание"}),y.jsx("input",{type:"text",placeholder:"Введите описание",value:o,onChange:g=>i(g.target.value)})]})]}),y.jsx("button",{className:"btn-add",onClick:c,children:"➕ Добавить задание"})]}),t.length===0?y.jsx("div",{className:"empty-message",children:"Заданий пока нет"}):y.jsx("div",{className:"homework-list",children:t.map((g,m)=>y.jsxs("div",{className:"homework-item",style:{animationDelay:`${m*.1}s`},children:[y.jsxs("div",{className:"homework-item-content",children:[y.jsx("h3",{children:g.title}),y.jsx("p",{children:g.description})]}),v&&y.jsx("button",{className:"btn-delete",onClick:()=>f(g.id),title:"Удалить задание",children:"🗑️"})]},g.id))})]})})}const Cg=()=>{const e=Tn(i=>i.user),[t,n]=N.useState([]);N.useEffect(()=>{Ur.get("/users").then(i=>n(i.data)).catch(i=>{console.error("Ошибка загрузки:",i),n([{id:1,name:"Мырзабек",role:"Student",gender:"Male",login:"bb34_01"},{id:2,name:"Алинур",role:"Student",gender:"Male",login:"bb34_02"},{id:14,name:"Бектур",role:"Moderator",gender:"Male",login:"bb34_14"},{id:15,name:"Даткайым",role:"Admin",gender:"Female",login:"bb34_15"}])})},[]);const r={total:t.length,students:t.filter(i=>i.role==="Student").length,moderators:t.filter(i=>i.role==="Moderator").length,admins:t.filter(i=>i.role==="Admin").length},l=i=>{switch(i){case"Admin":return"role-admin";case"Moderator":return"role-moderator";default:return"role-student"}},o=i=>i==="Female"?"👩":"👨";return y.jsx("div",{className:"journal-page",children:y.jsxs("div",{className:"journal-container",children:[y.jsxs("div",{className:"journal-header",children:[y.jsx("h2",{children:"📖 Журнал учеников"}),e&&y.jsxs("p",{children:["Добро пожаловать, ",e.role," ",e.name,"!"]})]}),y.jsxs("div",{className:"stats-row",children:[y.jsxs("div",{className:"stat-card",children:[y.jsx("div",{className:"stat-card-number",children:r.total}),y.jsx("div",{className:"stat-card-label",children:"Всего пользователей"})]}),y.jsxs("div",{className:"stat-card",children:[y.jsx("div",{className:"stat-card-number",children:r.students}),y.jsx("div",{className:"stat-card-label",children:"Студентов"})]}),y.jsxs("div",{className:"stat-card",children:[y.jsx("div",{className:"stat-card-number",children:r.moderators}),y.jsx("div",{className:"stat-card-label",children:"Модераторов"})]}),y.jsxs("div",{className:"stat-card",children:[y.jsx("div",{className:"stat-card-number",children:r.admins}),y.jsx("div",{className:"stat-card-label",children:"Администраторов"})]})]}),t.length===0?y.jsx("div",{className:"empty-message",children:"Пользователей пока нет"}):y.jsx("div",{className:"journal-table-wrapper",children:y.jsxs("table",{className:"journal-table",children:[y.jsx("thead",{children:y.jsxs("tr",{children:[y.jsx("th",{children:"ID"}),y.jsx("th",{children:"Логин"}),y.jsx("th",{children:"Имя"}),y.jsx("th",{children:"Роль"}),y.jsx("th",{children:"Пол"})]})}),y.jsx("tbody",{children:t.map((i,s)=>y.jsxs("tr",{style:{animationDelay:`${s*.05}s`},children:[y.jsx("td",{children:i.id}),y.jsx("td",{children:i.login}),y.jsxs("td",{children:[y.jsx("span",{className:"gender-icon",children:o(i.gender)}),i.name]}),y.jsx("td",{children:y.jsx("span",{className:`role-badge ${l(i.role)}`,children:i.role})}),y.jsx("td",{children:i.gender==="Female"?"Женский":"Мужской"})]},i.id))})]})})]})})};const Ng=()=>y.jsx("div",{className:"ai-page",children:y.jsxs("div",{className:"ai-container",children:[y.jsx("div",{className:"ai-header",children:y.jsx("h2",{children:"🤖 Искусственный интеллект"})}),y.jsxs("div",{className:"ai-card",children:[y.jsx("div",{className:"ai-icon",children:"🚀"}),y.jsxs("div",{className:"ai-text",children:[y.jsx("strong",{children:"Эта функция в разработке"}),y.jsx("br",{}),"Мы активно работаем над интеграцией мощных ИИ инструментов для помощи в обучении"]}),y.jsxs("div",{className:"feature-grid",children:[y.jsxs("div",{className:"feature-item",children:[y.jsx("span",{className:"feature-icon",children:"📝"}),y.jsx("div",{className:"feature-title",children:"Проверка ДЗ"}),y.jsx("div",{className:"feature-desc",children:"Автоматическая проверка домашних заданий"})]}),y.jsxs("div",{className:"feature-item",children:[y.jsx("span",{className:"feature-icon",children:"💡"}),y.jsx("div",{className:"feature-title",children:"Подсказки"}),y.jsx("div",{className:"feature-desc",children:"Интеллектуальные подсказки при затруднениях"})]}),y.jsxs("div",{className:"feature-item",children:[y.jsx("span",{className:"feature-icon",children:"📊"}),y.jsx("div",{className:"feature-title",children:"Аналитика"}),y.jsx("div",{className:"feature-desc",children:"Анализ прогресса и рекомендации"})]})]}),y.jsx("button",{className:"btn-coming-soon",disabled:!0,children:"⏳ Скоро доступно"})]})]})});const Xn=()=>{const[e,t]=N.useState(!0),n=()=>t(!e);return y.jsxs("div",{className:`sidebar ${e?"open":"closed"}`,children:[y.jsxs("div",{className:"sidebar-header",children:[y.jsx("h2",{children:"StudyCore"}),y.jsx("button",{className:"toggle-btn",onClick:n,children:e?"⮜":"⮞"})]}),y.jsxs("nav",{className:"sidebar-nav",children:[y.jsx(rt,{to:"/menu",className:"nav-link",children:"Главное меню"}),y.jsx(rt,{to:"/profile",className:"nav-link",children:"Профиль"}),y.jsx(rt,{to:"/homework",className:"nav-link",children:"ДЗ"}),y.jsx(rt,{to:"/journal",className:"nav-link",children:"Журнал"}),y.jsx(rt,{to:"/ai",className:"nav-link",children:"ИИ"})]})]})},Rg=()=>y.jsx(sv,{children:y.jsxs(ev,{children:[y.jsx(et,{path:"/",element:y.jsx(ga,{to:"/login",replace:!0})}),y.jsx(et,{path:"/login",element:y.jsx(yg,{})}),y.jsx(et,{path:"/menu",element:y.jsxs(y.Fragment,{children:[y.jsx(Xn,{}),y.jsx("div",{style:{marginLeft:"220px"},children:y.jsx(gg,{})})]})}),y.jsx(et,{path:"/profile",element:y.jsxs(y.Fragment,{children:[y.jsx(Xn,{}),y.jsx("div",{style:{marginLeft:"220px"},children:y.jsx(wg,{})})]})}),y.jsx(et,{path:"/homework",element:y.jsxs(y.Fragment,{children:[y.jsx(Xn,{}),y.jsx("div",{style:{marginLeft:"220px"},children:y.jsx(kg,{})})]})}),y.jsx(et,{path:"/journal",element:y.jsxs(y.Fragment,{children:[y.jsx(Xn,{}),y.jsx("div",{style:{marginLeft:"220px"},children:y.jsx(Cg,{})})]})}),y.jsx(et,{path:"/ai",element:y.jsxs(y.Fragment,{children:[y.jsx(Xn,{}),y.jsx("div",{style:{marginLeft:"220px"},children:y.jsx(Ng,{})})]})}),y.jsx(et,{path:"*",element:y.jsx(ga,{to:"/login",replace:!0})})]})});function _g(){return y.jsx(Rg,{})}Go.createRoot(document.getElementById("root")).render(y.jsx(_g,{}));
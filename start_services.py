@@ -10,8 +10,31 @@ import signal
 import time
 from threading import Thread
 
+# Режим веб-сервера: dev (Flask dev server), wsgi (gunicorn), asgi (gunicorn + uvicorn workers)
+SERVER_MODE = os.environ.get("SERVER_MODE", "dev").lower()
+# Какое приложение запускать - одно и то же в любом SERVER_MODE:
+# json (корневой app.py, данные в JSON-файлах) или supabase (StudyCore/backend/app.py)
+STUDYCORE_APP = os.environ.get("STUDYCORE_APP", "json").lower()
+APP_DIRS = {"json": ".", "supabase": os.path.join("StudyCore", "backend")}
+# ASGI-обёртка (asgi.py) лежит рядом с бэкендом и загружает приложение по STUDYCORE_APP
+ASGI_DIR = APP_DIRS["supabase"]
+# Число воркеров: WEB_CONCURRENCY или 2 * CPU + 1
+WEB_CONCURRENCY = int(os.environ.get("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+# Потоков на воркер в режиме wsgi (долгие запросы к OpenAI не блокируют воркер)
+WEB_THREADS = int(os.environ.get("WEB_THREADS", "8"))
+# Перезапуск воркера после N запросов (с разбросом, чтобы не все сразу)
+MAX_REQUESTS = int(os.environ.get("MAX_REQUESTS", "1000"))
+MAX_REQUESTS_JITTER = int(os.environ.get("MAX_REQUESTS_JITTER", "100"))
+GRACEFUL_TIMEOUT = int(os.environ.get("GRACEFUL_TIMEOUT", "30"))
+
+if SERVER_MODE not in ("dev", "wsgi", "asgi"):
+    sys.exit(f"Unknown SERVER_MODE: {SERVER_MODE} (expected: dev, wsgi, asgi)")
+if STUDYCORE_APP not in APP_DIRS:
+    sys.exit(f"Unknown STUDYCORE_APP: {STUDYCORE_APP} (expected: {', '.join(APP_DIRS)})")
+
 # Процессы для отслеживания
 processes = []
+server_process = None
 
 def signal_handler(sig, frame):
     """Обработчик сигналов для корректного завершения"""
@@ -21,38 +44,70 @@ def signal_handler(sig, frame):
             print(f"Останавливаем процесс {process.pid}...")
             process.terminate()
             try:
-                process.wait(timeout=5)
+                process.wait(timeout=GRACEFUL_TIMEOUT + 5)
             except subprocess.TimeoutExpired:
                 print(f"Принудительно завершаем процесс {process.pid}...")
                 process.kill()
     sys.exit(0)
 
+def reload_handler(sig, frame):
+    """SIGHUP: плавный перезапуск воркеров gunicorn без разрыва соединений"""
+    if server_process and server_process.poll() is None:
+        print("🔄 Перезапускаем воркеры веб-сервера...")
+        server_process.send_signal(signal.SIGHUP)
+
 # Регистрируем обработчики сигналов
 signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
+signal.signal(signal.SIGHUP, reload_handler)
+
+def server_command(port):
+    """Команда запуска веб-сервера для выбранного SERVER_MODE; (команда, рабочая папка)"""
+    app_dir = APP_DIRS[STUDYCORE_APP]
+
+    if SERVER_MODE == "dev":
+        return [sys.executable, "app.py"], app_dir
+
+    if SERVER_MODE == "asgi":
+        app_dir, app_module = ASGI_DIR, "asgi:application"
+        worker_args = ["--worker-class", "uvicorn_worker.UvicornWorker"]
+    else:
+        app_module = "app:app"
+        worker_args = ["--worker-class", "gthread", "--threads", str(WEB_THREADS)]
+
+    # Без --preload: фоновые потоки (очередь посещаемости и т.п.) стартуют в каждом воркере
+    return [
+        sys.executable, "-m", "gunicorn",
+        "--bind", f"0.0.0.0:{port}",
+        "--workers", str(WEB_CONCURRENCY),
+        *worker_args,
+        "--max-requests", str(MAX_REQUESTS),
+        "--max-requests-jitter", str(MAX_REQUESTS_JITTER),
+        "--graceful-timeout", str(GRACEFUL_TIMEOUT),
+        "--timeout", "120",
+        "--access-logfile", "-",
+        "--chdir", app_dir,
+        app_module,
+    ], "."
 
 def run_flask():
-    """Запускает Flask сервер"""
-    print("🌐 Запускаем Flask сервер...")
+    """Запускает веб-сервер (Flask dev server или gunicorn)"""
+    global server_process
+    print(f"🌐 Запускаем веб-сервер (режим {SERVER_MODE})...")
     port = os.environ.get("PORT", "5000")
     
-    # Запускаем Flask приложение
+    command, cwd = server_command(port)
+    # Логи сервера идут напрямую в наш stdout - без построчной пересылки через pipe
     flask_process = subprocess.Popen(
-        [sys.executable, "app.py"],
-        env={**os.environ, "PORT": port},
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        universal_newlines=True,
-        bufsize=1
+        command,
+        cwd=cwd,
+        env={**os.environ, "PORT": port, "STUDYCORE_APP": STUDYCORE_APP, "PYTHONUNBUFFERED": "1"}
     )
     processes.append(flask_process)
-    
-    # Выводим логи Flask
-    for line in flask_process.stdout:
-        print(f"[FLASK] {line.strip()}")
+    server_process = flask_process
     
     flask_process.wait()
-    print("❌ Flask сервер остановлен")
+    print("❌ Веб-сервер остановлен")
 
 def run_telegram_bot():
     """Запускает Telegram бота"""
@@ -92,7 +147,10 @@ def main():
     print("🚀 STUDYCORE - Запуск всех сервисов")
     print("=" * 60)
     print("Сервисы:")
-    print("  1. Flask Backend + Frontend (порт {})".format(os.environ.get("PORT", "5000")))
+    print("  1. Flask Backend + Frontend (порт {}, режим {}, приложение {})".format(
+        os.environ.get("PORT", "5000"), SERVER_MODE, STUDYCORE_APP))
+    if SERVER_MODE != "dev":
+        print("     Воркеров: {}".format(WEB_CONCURRENCY))
     print("  2. Telegram Bot")
     print("=" * 60)
     